@@ -0,0 +1,59 @@
+"""add_service_review_counters
+
+Denormalized logging gap, metrics gap and SLI counts on service_reviews,
+written with the review results, plus an index for picking the latest
+review per service. Health review dashboards read these instead of
+running COUNT(*) queries per review.
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a7b8c9d0e1f2"
+down_revision: Union[str, Sequence[str], None] = "f6a7b8c9d0e1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTERS = {
+    "logging_gaps_count": "review_logging_gaps",
+    "metrics_gaps_count": "review_metrics_gaps",
+    "slis_count": "review_slis",
+}
+
+
+def upgrade() -> None:
+    for column, child_table in COUNTERS.items():
+        op.add_column(
+            "service_reviews",
+            sa.Column(column, sa.Integer(), nullable=False, server_default="0"),
+        )
+        # Backfill existing reviews
+        op.execute(
+            f"""
+            UPDATE service_reviews SET {column} = counts.cnt
+            FROM (
+                SELECT review_id, COUNT(*) AS cnt FROM {child_table} GROUP BY review_id
+            ) AS counts
+            WHERE counts.review_id = service_reviews.id
+            """
+        )
+
+    op.create_index(
+        "idx_service_reviews_service_latest",
+        "service_reviews",
+        ["service_id", sa.text("review_week_end DESC"), sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_service_reviews_service_latest", table_name="service_reviews")
+    for column in COUNTERS:
+        op.drop_column("service_reviews", column)
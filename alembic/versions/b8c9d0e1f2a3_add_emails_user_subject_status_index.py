@@ -0,0 +1,43 @@
+"""add_emails_user_subject_status_index
+
+Composite index for lifecycle email eligibility, which checks each
+candidate user's successfully sent emails of one subject in a single
+set-based query.
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, Sequence[str], None] = "a7b8c9d0e1f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; avoids locking email writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_emails_user_subject_status",
+            "emails",
+            ["user_id", "subject", "status"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_emails_user_subject_status",
+            table_name="emails",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
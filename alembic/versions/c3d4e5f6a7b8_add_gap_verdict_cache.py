@@ -0,0 +1,63 @@
+"""add_gap_verdict_cache
+
+Add gap_verdict_cache table so unchanged gaps reuse their previous
+verification verdict instead of being re-verified by the LLM agent.
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c3d4e5f6a7b8"
+down_revision: Union[str, Sequence[str], None] = "b2c3d4e5f6a7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "gap_verdict_cache",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("workspace_id", sa.String(), nullable=False),
+        sa.Column("repo_full_name", sa.String(255), nullable=False),
+        sa.Column("rule_id", sa.String(50), nullable=False),
+        sa.Column("gap_fingerprint", sa.String(64), nullable=False),
+        sa.Column("cache_key", sa.String(64), nullable=False),
+        sa.Column("verdict_json", sa.JSON(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"],
+            ["workspaces.id"],
+            ondelete="CASCADE",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_gap_verdict_cache_workspace", "gap_verdict_cache", ["workspace_id"]
+    )
+    op.create_index(
+        "idx_gap_verdict_cache_lookup",
+        "gap_verdict_cache",
+        ["workspace_id", "repo_full_name", "cache_key"],
+    )
+    op.create_index(
+        "idx_gap_verdict_cache_created_at", "gap_verdict_cache", ["created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_gap_verdict_cache_created_at", table_name="gap_verdict_cache")
+    op.drop_index("idx_gap_verdict_cache_lookup", table_name="gap_verdict_cache")
+    op.drop_index("idx_gap_verdict_cache_workspace", table_name="gap_verdict_cache")
+    op.drop_table("gap_verdict_cache")
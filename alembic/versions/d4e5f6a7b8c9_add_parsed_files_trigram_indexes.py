@@ -0,0 +1,63 @@
+"""add_parsed_files_trigram_indexes
+
+Enable pg_trgm and add GIN trigram indexes on parsed_files.content and
+parsed_files.file_path so substring searches (ILIKE '%term%') used by the
+health review search_files / list_files tools are index-assisted instead
+of scanning every file in the repository.
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e5f6a7b8c9"
+down_revision: Union[str, Sequence[str], None] = "c3d4e5f6a7b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY can't run inside a transaction; parsed_files can be large
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_parsed_files_content_trgm",
+            "parsed_files",
+            ["content"],
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "idx_parsed_files_path_trgm",
+            "parsed_files",
+            ["file_path"],
+            postgresql_using="gin",
+            postgresql_ops={"file_path": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_parsed_files_path_trgm",
+            table_name="parsed_files",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "idx_parsed_files_content_trgm",
+            table_name="parsed_files",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
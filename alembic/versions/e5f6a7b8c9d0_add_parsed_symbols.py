@@ -0,0 +1,88 @@
+"""add_parsed_symbols
+
+Add the parsed_symbols table: one row per function/class extracted from a
+parsed file, indexed for exact and substring (trigram) name lookups so symbol
+search no longer loads and scans every ParsedFile row. Existing parses are
+backfilled from the parsed_files.functions / classes JSON arrays.
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6a7b8c9d0"
+down_revision: Union[str, Sequence[str], None] = "d4e5f6a7b8c9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "parsed_symbols",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("repository_id", sa.String(), nullable=False),
+        sa.Column("file_id", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("name", sa.String(255), nullable=False),
+        sa.Column("name_lower", sa.String(255), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("language", sa.String(50), nullable=False),
+        sa.Column("line_start", sa.Integer(), nullable=True),
+        sa.Column("line_end", sa.Integer(), nullable=True),
+        sa.Column("info", sa.JSON(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["repository_id"], ["parsed_repositories.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["file_id"], ["parsed_files.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Backfill from the JSON arrays of existing parses
+    for kind, column in (("function", "functions"), ("class", "classes")):
+        op.execute(
+            f"""
+            INSERT INTO parsed_symbols (
+                id, repository_id, file_id, kind, name, name_lower,
+                file_path, language, line_start, line_end, info
+            )
+            SELECT gen_random_uuid()::text, f.repository_id, f.id, '{kind}',
+                   left(s.value->>'name', 255), lower(left(s.value->>'name', 255)),
+                   f.file_path, f.language,
+                   (s.value->>'line_start')::int, (s.value->>'line_end')::int,
+                   s.value
+            FROM parsed_files f
+            CROSS JOIN LATERAL json_array_elements(f.{column}) AS s(value)
+            WHERE f.{column} IS NOT NULL
+              AND json_typeof(f.{column}) = 'array'
+              AND coalesce(s.value->>'name', '') <> ''
+            """
+        )
+
+    op.create_index("idx_parsed_symbols_file", "parsed_symbols", ["file_id"])
+    op.create_index(
+        "idx_parsed_symbols_repo_kind_name",
+        "parsed_symbols",
+        ["repository_id", "kind", "name"],
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "idx_parsed_symbols_name_lower_trgm",
+        "parsed_symbols",
+        ["name_lower"],
+        postgresql_using="gin",
+        postgresql_ops={"name_lower": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_parsed_symbols_name_lower_trgm", table_name="parsed_symbols")
+    op.drop_index("idx_parsed_symbols_repo_kind_name", table_name="parsed_symbols")
+    op.drop_index("idx_parsed_symbols_file", table_name="parsed_symbols")
+    op.drop_table("parsed_symbols")
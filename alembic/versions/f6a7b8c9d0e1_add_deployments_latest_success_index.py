@@ -0,0 +1,46 @@
+"""add_deployments_latest_success_index
+
+Partial composite index for the RCA environment context query, which
+picks the latest successful deployment per (environment, repository)
+with DISTINCT ON ... ORDER BY deployed_at DESC in a single statement.
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-18 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "f6a7b8c9d0e1"
+down_revision: Union[str, Sequence[str], None] = "e5f6a7b8c9d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY can't run inside a transaction; avoids locking deployment webhooks
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_deployments_latest_success",
+            "deployments",
+            ["environment_id", "repo_full_name", sa.text("deployed_at DESC")],
+            postgresql_where=sa.text("status = 'SUCCESS'"),
+            postgresql_include=["commit_sha"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_deployments_latest_success",
+            table_name="deployments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -5,10 +5,12 @@ Account management router for deletion preview and execution.
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.google.service import AuthService
 from app.core.database import get_db
+from app.models import User
 
 from .schemas import (
     AccountDeleteRequest,
@@ -28,14 +30,19 @@ auth_service = AuthService()
 account_service = AccountService()
 
 
-def get_auth_provider(user) -> str:
+async def get_auth_provider(db: AsyncSession, user) -> str:
     """Determine auth provider based on whether user has a password."""
-    return "credentials" if user.password_hash else "google"
+    # The password hash isn't part of the cached principal, so ask the DB
+    has_password = await db.scalar(
+        select(User.password_hash.isnot(None)).where(User.id == user.id)
+    )
+    return "credentials" if has_password else "google"
 
 
 @router.get("/", response_model=AccountProfileResponse)
 async def get_account_profile(
     current_user=Depends(auth_service.get_current_user),
+    db: AsyncSession = Depends(get_db),
 ) -> AccountProfileResponse:
     """
     Get the current user's account profile.
@@ -48,7 +55,7 @@ async def get_account_profile(
         email=current_user.email,
         is_verified=current_user.is_verified,
         newsletter_subscribed=current_user.newsletter_subscribed,
-        auth_provider=get_auth_provider(current_user),
+        auth_provider=await get_auth_provider(db, current_user),
         created_at=current_user.created_at,
     )
 
@@ -83,7 +90,7 @@ async def update_account_profile(
             email=current_user.email,
             is_verified=current_user.is_verified,
             newsletter_subscribed=current_user.newsletter_subscribed,
-            auth_provider=get_auth_provider(current_user),
+            auth_provider=await get_auth_provider(db, current_user),
             created_at=current_user.created_at,
         )
     except Exception as e:
@@ -9,6 +9,7 @@ from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.auth.principal_cache import invalidate_principal
 from app.models import (
     ChatFile,
     ChatSession,
@@ -305,9 +306,13 @@ class AccountService:
             db: Database session
         """
         # Delete all memberships first
-        await db.execute(
-            delete(Membership).where(Membership.workspace_id == workspace_id)
+        member_ids = await db.execute(
+            delete(Membership)
+            .where(Membership.workspace_id == workspace_id)
+            .returning(Membership.user_id)
         )
+        for member_id in member_ids.scalars():
+            invalidate_principal(db, member_id)
 
         # Get and delete the workspace
         # Note: Many tables have CASCADE delete on workspace_id, so they'll be auto-deleted
@@ -342,6 +347,7 @@ class AccountService:
                 Membership.workspace_id == workspace_id,
             )
         )
+        invalidate_principal(db, user_id)
         await db.flush()
 
     async def _delete_user_data(
@@ -14,6 +14,7 @@ from jose import JWTError, jwt
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.principal_cache import get_principal_user
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.otel_metrics import AUTH_METRICS
@@ -341,9 +342,8 @@ class GitHubAuthService:
                 detail="Could not validate credentials",
             )
 
-        # Get user from database
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        # User and memberships, from the principal cache when fresh
+        user = await get_principal_user(db, user_id)
 
         if user is None:
             raise HTTPException(
@@ -0,0 +1,154 @@
+"""
+Authenticated-principal cache.
+
+Every authenticated request resolves its JWT subject to a User, and most
+routes then look up the caller's Membership in the target workspace. The
+principal (the user's profile columns plus {workspace_id: role}) is cached
+per user in Redis, so both come from one cache read instead of two DB round
+trips.
+
+ORM writes to User and Membership invalidate the user's entry when the
+transaction commits (after_flush listener, as in
+app.workspace.context_cache). Bulk DELETE/UPDATE statements bypass the
+listener and must call invalidate_principal() themselves.
+"""
+
+from datetime import datetime
+from typing import Dict, Optional
+
+from sqlalchemy import DateTime, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.core.config import settings
+from app.models import Membership, Role, User
+from app.utils.versioned_cache import VersionedCache
+
+principal_cache = VersionedCache(
+    "auth:principal",
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    enabled=settings.PRINCIPAL_CACHE_ENABLED,
+)
+
+# session.info key: {user_id: {workspace_id: Role}} for the current request
+_MEMBERSHIPS = "principal_memberships"
+
+
+# User columns cached with the principal. Credentials (password_hash) are
+# never written to Redis; a restored User leaves them unloaded.
+_USER_FIELDS = (
+    "id",
+    "name",
+    "email",
+    "is_verified",
+    "newsletter_subscribed",
+    "is_onboarded",
+    "last_visited_workspace_id",
+    "created_at",
+    "updated_at",
+)
+
+
+def _dump_user(user: User) -> dict:
+    data = {}
+    for field in _USER_FIELDS:
+        value = getattr(user, field)
+        data[field] = value.isoformat() if isinstance(value, datetime) else value
+    return data
+
+
+def _restore_user(data: dict) -> User:
+    values = {field: data.get(field) for field in _USER_FIELDS}
+    for field in _USER_FIELDS:
+        if isinstance(User.__table__.columns[field].type, DateTime) and values[field]:
+            values[field] = datetime.fromisoformat(values[field])
+    return User(**values)
+
+
+async def _load_principal(db: AsyncSession, user_id: str) -> Optional[dict]:
+    """User and all of its memberships in one query."""
+    result = await db.execute(
+        select(User, Membership.workspace_id, Membership.role)
+        .outerjoin(Membership, Membership.user_id == User.id)
+        .where(User.id == user_id)
+    )
+    rows = result.all()
+    if not rows:
+        return None
+    return {
+        "user": _dump_user(rows[0][0]),
+        "memberships": {
+            workspace_id: role.value for _, workspace_id, role in rows if workspace_id
+        },
+    }
+
+
+async def get_principal_user(db: AsyncSession, user_id: str) -> Optional[User]:
+    """
+    Resolve a token subject to a User attached to db, or None if it doesn't exist.
+
+    The caller's memberships are kept on the session for get_membership_role().
+    """
+    principal = await principal_cache.get_or_load(
+        user_id,
+        lambda: _load_principal(db, user_id),
+        should_cache=lambda value: value is not None,
+    )
+    if principal is None:
+        return None
+
+    db.info.setdefault(_MEMBERSHIPS, {})[user_id] = {
+        workspace_id: Role(role)
+        for workspace_id, role in principal["memberships"].items()
+    }
+
+    # On a miss the loader already put the row in the session
+    user = db.sync_session.identity_map.get(Session.identity_key(User, user_id))
+    if user is not None:
+        return user
+
+    # Attach the cached row as persistent without a SELECT
+    user = _restore_user(principal["user"])
+    make_transient_to_detached(user)
+    return await db.merge(user, load=False)
+
+
+async def get_membership_role(
+    db: AsyncSession, user_id: str, workspace_id: str
+) -> Optional[Role]:
+    """
+    The user's role in workspace_id, or None if they aren't a member.
+
+    Answered from the principal resolved for this request when available.
+    """
+    memberships: Optional[Dict[str, Role]] = db.info.get(_MEMBERSHIPS, {}).get(user_id)
+    if memberships is not None:
+        return memberships.get(workspace_id)
+
+    result = await db.execute(
+        select(Membership.role).where(
+            Membership.workspace_id == workspace_id,
+            Membership.user_id == user_id,
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+def invalidate_principal(db: AsyncSession, user_id: str) -> None:
+    """Invalidate user_id's cached principal when db commits."""
+    db.info.get(_MEMBERSHIPS, {}).pop(user_id, None)
+    principal_cache.invalidate_on_commit(db, user_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_principal_changes(session: Session, flush_context) -> None:
+    user_ids = set()
+    for instance in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(instance, User):
+            user_ids.add(instance.id)
+        elif isinstance(instance, Membership):
+            user_ids.add(instance.user_id)
+
+    for user_id in user_ids:
+        if user_id:
+            invalidate_principal(session, user_id)
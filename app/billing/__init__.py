@@ -1,5 +1,16 @@
 # Billing domain module
-from app.billing.services.stripe_service import stripe_service
-from app.billing.services.subscription_service import subscription_service
-
+# Services are resolved on first access so that importing a billing submodule
+# doesn't load the Stripe SDK
 __all__ = ["stripe_service", "subscription_service"]
+
+
+def __getattr__(name):
+    if name == "stripe_service":
+        from app.billing.services.stripe_service import stripe_service
+
+        return stripe_service
+    if name == "subscription_service":
+        from app.billing.services.subscription_service import subscription_service
+
+        return subscription_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,10 +2,17 @@
 Stripe API service for handling all Stripe interactions.
 Wraps the Stripe SDK for subscription management, customer creation,
 and webhook handling.
+
+The SDK is synchronous, so every call runs on a small dedicated thread
+pool instead of the event loop. Pool threads are long-lived and the SDK
+keeps one HTTP session per thread, so connections are reused across calls.
 """
 
+import asyncio
+import functools
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
 
 import stripe
 from stripe import Customer
@@ -14,10 +21,28 @@ from stripe.billing_portal import Session as BillingPortalSession
 
 from app.billing.stripe_instrumentation import stripe_api_metric
 from app.core.config import settings
+from app.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """Dedicated pool so slow Stripe calls never tie up the default executor."""
+    return ThreadPoolExecutor(
+        max_workers=max(1, settings.STRIPE_API_THREADS),
+        thread_name_prefix="stripe-api",
+    )
+
+
+async def _call(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking Stripe SDK call on the Stripe thread pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
 class StripeService:
     """Handles all Stripe API interactions."""
 
@@ -29,6 +54,18 @@ class StripeService:
             logger.warning(
                 "STRIPE_SECRET_KEY not configured - Stripe operations will fail"
             )
+        # Short-lived caches for read-only lookups; writes through this
+        # service and webhooks evict the affected entries
+        self._customers = TTLCache(settings.STRIPE_READ_CACHE_TTL_SECONDS, maxsize=1000)
+        self._subscriptions = TTLCache(
+            settings.STRIPE_READ_CACHE_TTL_SECONDS, maxsize=1000
+        )
+
+    def invalidate_customer(self, customer_id: str) -> None:
+        self._customers.pop(customer_id)
+
+    def invalidate_subscription(self, subscription_id: str) -> None:
+        self._subscriptions.pop(subscription_id)
 
     @stripe_api_metric("create_customer")
     async def create_customer(
@@ -55,7 +92,8 @@ class StripeService:
             customer_metadata.update(metadata)
 
         try:
-            customer = stripe.Customer.create(
+            customer = await _call(
+                stripe.Customer.create,
                 email=email,
                 name=name,
                 metadata=customer_metadata,
@@ -70,7 +108,7 @@ class StripeService:
 
     async def get_customer(self, customer_id: str) -> Optional[Customer]:
         """
-        Retrieve a Stripe customer by ID.
+        Retrieve a Stripe customer by ID (cached for STRIPE_READ_CACHE_TTL_SECONDS).
 
         Args:
             customer_id: Stripe customer ID (cus_...)
@@ -78,8 +116,18 @@ class StripeService:
         Returns:
             stripe.Customer object or None if not found
         """
+        cached = self._customers.get(customer_id)
+        if cached is not None:
+            return cached
+        customer = await self._retrieve_customer(customer_id)
+        if customer is not None:
+            self._customers.set(customer_id, customer)
+        return customer
+
+    @stripe_api_metric("retrieve_customer")
+    async def _retrieve_customer(self, customer_id: str) -> Optional[Customer]:
         try:
-            return stripe.Customer.retrieve(customer_id)
+            return await _call(stripe.Customer.retrieve, customer_id)
         except stripe.error.InvalidRequestError:
             logger.warning(f"Stripe customer {customer_id} not found")
             return None
@@ -137,7 +185,8 @@ class StripeService:
             stripe.Subscription object
         """
         try:
-            subscription = stripe.Subscription.create(
+            subscription = await _call(
+                stripe.Subscription.create,
                 customer=customer_id,
                 items=[{"price": price_id, "quantity": quantity}],
                 metadata=metadata or {},
@@ -156,7 +205,7 @@ class StripeService:
         self, subscription_id: str
     ) -> Optional[StripeSubscription]:
         """
-        Retrieve a Stripe subscription by ID.
+        Retrieve a Stripe subscription by ID (cached for STRIPE_READ_CACHE_TTL_SECONDS).
 
         Args:
             subscription_id: Stripe subscription ID (sub_...)
@@ -164,8 +213,20 @@ class StripeService:
         Returns:
             stripe.Subscription object or None if not found
         """
+        cached = self._subscriptions.get(subscription_id)
+        if cached is not None:
+            return cached
+        subscription = await self._retrieve_subscription(subscription_id)
+        if subscription is not None:
+            self._subscriptions.set(subscription_id, subscription)
+        return subscription
+
+    @stripe_api_metric("retrieve_subscription")
+    async def _retrieve_subscription(
+        self, subscription_id: str
+    ) -> Optional[StripeSubscription]:
         try:
-            return stripe.Subscription.retrieve(subscription_id)
+            return await _call(stripe.Subscription.retrieve, subscription_id)
         except stripe.error.InvalidRequestError:
             logger.warning(f"Stripe subscription {subscription_id} not found")
             return None
@@ -193,8 +254,9 @@ class StripeService:
         Returns:
             Updated stripe.Subscription object
         """
+        self.invalidate_subscription(subscription_id)
         try:
-            subscription = stripe.Subscription.retrieve(subscription_id)
+            subscription = await _call(stripe.Subscription.retrieve, subscription_id)
 
             update_params = {}
 
@@ -211,7 +273,8 @@ class StripeService:
                     update_params["items"] = [item_update]
 
             if update_params:
-                subscription = stripe.Subscription.modify(
+                subscription = await _call(
+                    stripe.Subscription.modify,
                     subscription_id,
                     proration_behavior="create_prorations",
                     **update_params,
@@ -244,11 +307,13 @@ class StripeService:
         Returns:
             Updated stripe.Subscription object
         """
+        self.invalidate_subscription(subscription_id)
         try:
             # Retrieve subscription with items expanded
-            subscription = stripe.Subscription.retrieve(
+            subscription = await _call(
+                stripe.Subscription.retrieve,
                 subscription_id,
-                expand=["items.data.price"]
+                expand=["items.data.price"],
             )
 
             # Find the additional services item if it exists
@@ -261,12 +326,15 @@ class StripeService:
             if quantity > 0:
                 if additional_services_item:
                     # Update existing item
-                    subscription = stripe.Subscription.modify(
+                    subscription = await _call(
+                        stripe.Subscription.modify,
                         subscription_id,
-                        items=[{
-                            "id": additional_services_item["id"],
-                            "quantity": quantity,
-                        }],
+                        items=[
+                            {
+                                "id": additional_services_item["id"],
+                                "quantity": quantity,
+                            }
+                        ],
                         proration_behavior="create_prorations",
                     )
                     logger.info(
@@ -275,12 +343,15 @@ class StripeService:
                     )
                 else:
                     # Add new item for additional services
-                    subscription = stripe.Subscription.modify(
+                    subscription = await _call(
+                        stripe.Subscription.modify,
                         subscription_id,
-                        items=[{
-                            "price": additional_service_price_id,
-                            "quantity": quantity,
-                        }],
+                        items=[
+                            {
+                                "price": additional_service_price_id,
+                                "quantity": quantity,
+                            }
+                        ],
                         proration_behavior="create_prorations",
                     )
                     logger.info(
@@ -289,12 +360,15 @@ class StripeService:
                     )
             elif additional_services_item:
                 # Remove the additional services item if quantity is 0
-                subscription = stripe.Subscription.modify(
+                subscription = await _call(
+                    stripe.Subscription.modify,
                     subscription_id,
-                    items=[{
-                        "id": additional_services_item["id"],
-                        "deleted": True,
-                    }],
+                    items=[
+                        {
+                            "id": additional_services_item["id"],
+                            "deleted": True,
+                        }
+                    ],
                     proration_behavior="create_prorations",
                 )
                 logger.info(
@@ -334,11 +408,12 @@ class StripeService:
         Returns:
             New stripe.Subscription object with reset billing cycle
         """
+        self.invalidate_subscription(subscription_id)
         try:
             from datetime import datetime, timezone
 
             # Get current subscription to calculate credit
-            old_sub = stripe.Subscription.retrieve(subscription_id)
+            old_sub = await _call(stripe.Subscription.retrieve, subscription_id)
             customer_id = old_sub.customer
 
             # Calculate unused days credit
@@ -360,7 +435,7 @@ class StripeService:
             )
 
             # Cancel old subscription immediately (no proration since we're doing manual credit)
-            stripe.Subscription.delete(subscription_id)
+            await _call(stripe.Subscription.delete, subscription_id)
             logger.info(f"Canceled old subscription {subscription_id}")
 
             # Build new subscription items
@@ -374,7 +449,8 @@ class StripeService:
             # Create new subscription starting immediately (Stripe handles billing anchor)
             # Don't set billing_cycle_anchor explicitly - it causes "timestamp in the past" errors
             # due to processing delays. Stripe will anchor to subscription creation time.
-            new_sub = stripe.Subscription.create(
+            new_sub = await _call(
+                stripe.Subscription.create,
                 customer=customer_id,
                 items=new_items,
                 proration_behavior="none",  # No proration, we handle credit manually
@@ -387,7 +463,8 @@ class StripeService:
 
             # Apply credit as invoice item (negative amount = credit)
             if credit_amount_cents > 0:
-                stripe.InvoiceItem.create(
+                await _call(
+                    stripe.InvoiceItem.create,
                     customer=customer_id,
                     amount=-credit_amount_cents,  # Negative for credit
                     currency="usd",
@@ -419,16 +496,19 @@ class StripeService:
         Returns:
             Updated stripe.Subscription object
         """
+        self.invalidate_subscription(subscription_id)
         try:
             if immediate:
                 # Cancel immediately with proration
-                subscription = stripe.Subscription.cancel(
+                subscription = await _call(
+                    stripe.Subscription.cancel,
                     subscription_id,
                     prorate=True,
                 )
             else:
                 # Cancel at end of billing period
-                subscription = stripe.Subscription.modify(
+                subscription = await _call(
+                    stripe.Subscription.modify,
                     subscription_id,
                     cancel_at_period_end=True,
                 )
@@ -441,6 +521,7 @@ class StripeService:
             logger.error(f"Failed to cancel Stripe subscription: {e}")
             raise
 
+    @stripe_api_metric("reactivate_subscription")
     async def reactivate_subscription(
         self,
         subscription_id: str,
@@ -454,8 +535,10 @@ class StripeService:
         Returns:
             Updated stripe.Subscription object
         """
+        self.invalidate_subscription(subscription_id)
         try:
-            subscription = stripe.Subscription.modify(
+            subscription = await _call(
+                stripe.Subscription.modify,
                 subscription_id,
                 cancel_at_period_end=False,
             )
@@ -482,7 +565,8 @@ class StripeService:
             stripe.billing_portal.Session object with URL
         """
         try:
-            session = stripe.billing_portal.Session.create(
+            session = await _call(
+                stripe.billing_portal.Session.create,
                 customer=customer_id,
                 return_url=return_url,
             )
@@ -517,7 +601,8 @@ class StripeService:
             stripe.checkout.Session object with URL
         """
         try:
-            session = stripe.checkout.Session.create(
+            session = await _call(
+                stripe.checkout.Session.create,
                 customer=customer_id,
                 mode="subscription",
                 line_items=[{"price": price_id, "quantity": quantity}],
@@ -537,6 +622,7 @@ class StripeService:
             logger.error(f"Failed to create checkout session: {e}")
             raise
 
+    @stripe_api_metric("list_invoices")
     async def list_invoices(
         self,
         customer_id: str,
@@ -553,7 +639,8 @@ class StripeService:
             List of stripe.Invoice objects
         """
         try:
-            invoices = stripe.Invoice.list(
+            invoices = await _call(
+                stripe.Invoice.list,
                 customer=customer_id,
                 limit=limit,
             )
@@ -579,9 +666,11 @@ class StripeService:
         Returns:
             stripe.SubscriptionSchedule object
         """
+        self.invalidate_subscription(subscription_id)
         try:
             # Step 1: Create schedule from subscription (without phases parameter)
-            schedule = stripe.SubscriptionSchedule.create(
+            schedule = await _call(
+                stripe.SubscriptionSchedule.create,
                 from_subscription=subscription_id,
             )
             logger.info(f"Created subscription schedule {schedule.id} from subscription {subscription_id}")
@@ -601,7 +690,8 @@ class StripeService:
                 updated_phases[0] = {**updated_phases[0], "start_date": actual_start_date}
 
             # Step 4: Modify schedule with corrected phases
-            schedule = stripe.SubscriptionSchedule.modify(
+            schedule = await _call(
+                stripe.SubscriptionSchedule.modify,
                 schedule.id,
                 phases=updated_phases,
             )
@@ -611,7 +701,10 @@ class StripeService:
             logger.error(f"Failed to create subscription schedule: {e}")
             raise
 
-    async def cancel_subscription_schedule(self, schedule_id: str) -> stripe.SubscriptionSchedule:
+    @stripe_api_metric("cancel_subscription_schedule")
+    async def cancel_subscription_schedule(
+        self, schedule_id: str
+    ) -> stripe.SubscriptionSchedule:
         """
         Cancel a subscription schedule and release the subscription.
 
@@ -623,13 +716,14 @@ class StripeService:
         """
         try:
             # Release the subscription by canceling the schedule
-            schedule = stripe.SubscriptionSchedule.release(schedule_id)
+            schedule = await _call(stripe.SubscriptionSchedule.release, schedule_id)
             logger.info(f"Released subscription schedule {schedule_id}")
             return schedule
         except stripe.error.StripeError as e:
             logger.error(f"Failed to release subscription schedule: {e}")
             raise
 
+    @stripe_api_metric("update_subscription_schedule")
     async def update_subscription_schedule(
         self,
         schedule_id: str,
@@ -646,7 +740,8 @@ class StripeService:
             stripe.SubscriptionSchedule object
         """
         try:
-            schedule = stripe.SubscriptionSchedule.modify(
+            schedule = await _call(
+                stripe.SubscriptionSchedule.modify,
                 schedule_id,
                 phases=phases,
             )
@@ -656,6 +751,7 @@ class StripeService:
             logger.error(f"Failed to update subscription schedule: {e}")
             raise
 
+    @stripe_api_metric("get_subscription_schedule")
     async def get_subscription_schedule_for_subscription(
         self,
         subscription_id: str,
@@ -670,7 +766,7 @@ class StripeService:
             Schedule ID or None
         """
         try:
-            subscription = stripe.Subscription.retrieve(subscription_id)
+            subscription = await _call(stripe.Subscription.retrieve, subscription_id)
             schedule_id = subscription.get('schedule')
             if schedule_id:
                 logger.info(f"Found schedule {schedule_id} for subscription {subscription_id}")
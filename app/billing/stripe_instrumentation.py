@@ -77,12 +77,13 @@ def stripe_api_metric(operation_name: str):
 
                 # Only record metrics if OpenTelemetry is enabled
                 if settings.OTEL_ENABLED and STRIPE_METRICS:
-                    STRIPE_METRICS["stripe_api_calls_total"].add(
-                        1,
-                        {
-                            "operation": operation_name,
-                            "status": "success" if success else "error",
-                        },
+                    attributes = {
+                        "operation": operation_name,
+                        "status": "success" if success else "error",
+                    }
+                    STRIPE_METRICS["stripe_api_calls_total"].add(1, attributes)
+                    STRIPE_METRICS["stripe_api_duration_seconds"].record(
+                        duration, attributes
                     )
 
                 logger.debug(f"Stripe {operation_name} took {duration:.3f}s")
@@ -61,6 +61,14 @@ async def handle_stripe_webhook(
 
     logger.info(f"Received Stripe webhook: {event_type}")
 
+    # Drop cached reads of the object this event changed
+    if event_type.startswith("customer.subscription."):
+        stripe_service.invalidate_subscription(data.id)
+    elif event_type.startswith("invoice.") and data.get("subscription"):
+        stripe_service.invalidate_subscription(data.get("subscription"))
+    elif event_type.startswith("customer."):
+        stripe_service.invalidate_customer(data.id)
+
     try:
         if event_type == "customer.subscription.created":
             await subscription_service.handle_subscription_created(db, data)
@@ -5,8 +5,17 @@ Provides:
 - Chat sessions and turns management
 - SSE streaming for real-time updates
 - Feedback collection at turn level
-"""
 
-from app.chat.router import router
+The router is resolved on first access so that importing a submodule (the
+worker imports app.chat.notifiers) doesn't pull in the whole API import graph.
+"""
 
 __all__ = ["router"]
+
+
+def __getattr__(name):
+    if name == "router":
+        from app.chat.router import router
+
+        return router
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -152,6 +152,23 @@ class WebNotifier(BaseNotifier):
         )
         logger.info(f"[Turn {self.turn_id}] Processing complete")
 
+    async def on_delta(self, content: str, reset: bool = False) -> None:
+        """
+        Stream part of the final response as it is generated.
+
+        Not persisted; on_complete delivers and stores the full response.
+        reset=True means the response restarted and content replaces what was
+        streamed so far.
+        """
+        await publish_event(
+            self.channel,
+            {
+                "event": "delta",
+                "content": content,
+                "reset": reset,
+            },
+        )
+
     async def on_error(self, message: str, action_url: Optional[str] = None) -> None:
         """Notify that an error occurred."""
         # Update turn status to failed and save error message
@@ -6,7 +6,8 @@ for the RCA agent.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 from langchain.callbacks.base import AsyncCallbackHandler
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,6 +15,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.chat.notifiers.web import WebNotifier
 from app.core.config import settings
 from app.services.rca.get_service_name.enums import TOOL_NAME_TO_MESSAGE
+from app.services.rca.streaming import AnswerStream, is_final_answer_run
+from app.utils.data_masker import PIIMapper
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,7 @@ class WebProgressCallback(AsyncCallbackHandler):
         self,
         turn_id: str,
         db: AsyncSession,
+        pii_mapper: Optional[PIIMapper] = None,
     ):
         """
         Initialize web progress callback.
@@ -36,6 +40,7 @@ class WebProgressCallback(AsyncCallbackHandler):
         Args:
             turn_id: Chat turn ID for routing events
             db: Database session for persisting steps
+            pii_mapper: Restores PII placeholders in the streamed answer
         """
         self.turn_id = turn_id
         self.db = db
@@ -46,6 +51,12 @@ class WebProgressCallback(AsyncCallbackHandler):
         self._current_tool_display_name: str | None = None
         # Counter for suppressed retryable chain errors
         self._suppressed_error_count: int = 0
+        self._answer_stream: Optional[AnswerStream] = None
+        if settings.RCA_STREAM_FINAL_ANSWER:
+            self._answer_stream = AnswerStream(
+                settings.RCA_WEB_STREAM_INTERVAL_SECONDS,
+                unmask=pii_mapper.unmask if pii_mapper else None,
+            )
 
     async def on_tool_start(
         self,
@@ -116,6 +127,37 @@ class WebProgressCallback(AsyncCallbackHandler):
         self._current_step_id = None
         self._current_tool_display_name = None
 
+    async def on_llm_new_token(
+        self,
+        token: str,
+        *,
+        run_id: UUID,
+        tags: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Stream final-answer tokens as SSE delta events."""
+        if self._answer_stream is None or not is_final_answer_run(tags):
+            return
+        self._answer_stream.add(run_id, token)
+        await self._publish_answer()
+
+    async def on_llm_end(
+        self,
+        response: Any,
+        *,
+        tags: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Flush the rest of a final-answer run."""
+        if self._answer_stream is None or not is_final_answer_run(tags):
+            return
+        await self._publish_answer(final=True)
+
+    async def _publish_answer(self, final: bool = False) -> None:
+        update = self._answer_stream.take(final=final)
+        if update:
+            await self.notifier.on_delta(update.delta, reset=update.reset)
+
     async def on_agent_action(
         self,
         action: Any,
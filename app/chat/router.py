@@ -10,6 +10,8 @@ from typing import AsyncIterator, List, Optional
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import attributes
 
@@ -21,17 +23,26 @@ from app.chat.schemas import (
     ChatSessionResponse,
     ChatSessionSummary,
     ChatTurnResponse,
+    CreateUploadsRequest,
+    CreateUploadsResponse,
     FeedbackResponse,
     FileDownloadResponse,
     SendMessageResponse,
     SubmitFeedbackRequest,
     UpdateSessionRequest,
+    UploadedFileRef,
 )
 from app.chat.service import ChatService
+from app.chat.uploads import (
+    build_upload_key,
+    guess_content_type,
+    is_workspace_upload_key,
+    sanitize_upload_filename,
+)
 from app.core.config import settings
 from app.core.database import get_db
 from app.core.redis import subscribe_to_channel
-from app.models import ChatFile, JobStatus, TurnStatus, User
+from app.models import ChatFile, JobStatus, Membership, TurnStatus, User
 from app.services.s3.client import s3_client
 from app.services.storage import FileValidationError, FileValidator, TextExtractor
 from app.utils.rate_limiter import ResourceType, check_rate_limit_with_byollm_bypass
@@ -98,11 +109,224 @@ def validate_relative_path(path: Optional[str]) -> Optional[str]:
     return sanitized if sanitized else None
 
 
+async def _check_upload_quota(
+    db: AsyncSession, workspace_id: str, total_upload_bytes: int
+) -> None:
+    """
+    Charge total_upload_bytes against the workspace's daily upload limit.
+
+    BYOLLM workspaces are unlimited. Fails open on unexpected errors.
+
+    Raises:
+        HTTPException: 429 if the daily limit would be exceeded
+    """
+    if total_upload_bytes > 0:
+        try:
+            (
+                allowed,
+                bytes_used,
+                bytes_limit,
+            ) = await check_rate_limit_with_byollm_bypass(
+                session=db,
+                workspace_id=workspace_id,
+                resource_type=ResourceType.FILE_UPLOAD_BYTES,
+                limit=settings.DAILY_UPLOAD_LIMIT_BYTES,
+                increment=total_upload_bytes,
+            )
+
+            if not allowed:
+                # Convert to MB for user-friendly error message
+                bytes_used_mb = bytes_used / (1024 * 1024)
+                bytes_limit_mb = bytes_limit / (1024 * 1024)
+                upload_mb = total_upload_bytes / (1024 * 1024)
+
+                logger.warning(
+                    f"File upload rate limit exceeded for workspace {workspace_id}: "
+                    f"{bytes_used_mb:.1f}MB/{bytes_limit_mb:.1f}MB used, attempted +{upload_mb:.1f}MB"
+                )
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail={
+                        "message": "Daily file upload limit reached",
+                        "used_mb": round(bytes_used_mb, 2),
+                        "limit_mb": round(bytes_limit_mb, 2),
+                        "attempted_mb": round(upload_mb, 2),
+                        "tip": "Configure your own LLM (OpenAI, Azure, or Gemini) to remove limits",
+                    },
+                )
+
+            # Log rate limit status
+            if bytes_limit == -1:
+                logger.info(f"BYOLLM workspace {workspace_id} - unlimited file uploads")
+            else:
+                logger.info(
+                    f"File upload rate limit check passed for workspace {workspace_id}: "
+                    f"{bytes_used / (1024 * 1024):.1f}MB/{bytes_limit / (1024 * 1024):.1f}MB used "
+                    f"(+{total_upload_bytes / (1024 * 1024):.1f}MB)"
+                )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            # Fail open: allow the request but log the error
+            logger.exception(f"Unexpected error in file upload rate limit check: {e}")
+            logger.warning(
+                f"File upload rate limit check failed for workspace {workspace_id}, "
+                f"allowing request to proceed"
+            )
+
+
+def _parse_uploaded_files(
+    workspace_id: str, uploaded_files: Optional[str]
+) -> List[dict]:
+    """
+    Parse and validate the uploaded_files form field.
+
+    Keys must come from this workspace's presigned upload prefix. MIME type
+    and size are provisional until the worker inspects the object.
+
+    Returns:
+        Job file entries (without file_id) for the referenced objects
+    """
+    if not uploaded_files:
+        return []
+
+    try:
+        refs = TypeAdapter(List[UploadedFileRef]).validate_json(uploaded_files)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid uploaded_files JSON: {e.errors()[0]['msg']}",
+        )
+
+    entries = []
+    seen_keys = set()
+    for ref in refs:
+        if (
+            not is_workspace_upload_key(workspace_id, ref.s3_key)
+            or ref.s3_key in seen_keys
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid uploaded file reference",
+            )
+        seen_keys.add(ref.s3_key)
+
+        filename = ref.s3_key.rsplit("/", 1)[-1]
+        file_category = FileValidator.validate_metadata(
+            filename=filename,
+            file_size=ref.size_bytes,
+            max_size_bytes=settings.MAX_FILE_SIZE_BYTES,
+            allowed_extensions=settings.ALLOWED_FILE_EXTENSIONS,
+        )
+        entries.append(
+            {
+                "s3_key": ref.s3_key,
+                "filename": filename,
+                "file_type": file_category,
+                "mime_type": guess_content_type(filename),
+                "size": ref.size_bytes,
+                "relative_path": validate_relative_path(ref.relative_path),
+            }
+        )
+    return entries
+
+
 auth_service = AuthService()
 
 router = APIRouter(prefix="/workspaces/{workspace_id}", tags=["chat"])
 
 
+@router.post("/chat/uploads", response_model=CreateUploadsResponse)
+async def create_uploads(
+    workspace_id: str,
+    request: CreateUploadsRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(auth_service.get_current_user),
+):
+    """
+    Issue presigned S3 PUT URLs for chat attachments.
+
+    The client PUTs each file to its upload_url (with the returned
+    Content-Type), then passes the s3_keys to POST /chat as uploaded_files.
+    Size and extension are checked here against the declared metadata; the
+    declared size is signed into the URL so S3 rejects any other body.
+    MIME sniffing and text extraction happen in the worker.
+
+    Upload bytes count against the daily limit when URLs are issued.
+    """
+    # Keys and quota belong to the workspace, so only its members may upload
+    membership_result = await db.execute(
+        select(Membership).where(
+            Membership.workspace_id == workspace_id,
+            Membership.user_id == current_user.id,
+        )
+    )
+    if not membership_result.scalar_one_or_none():
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied",
+        )
+
+    if len(request.files) > settings.MAX_FILES_PER_MESSAGE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Too many files. Maximum {settings.MAX_FILES_PER_MESSAGE} files per message.",
+        )
+
+    if settings.CHAT_UPLOADS_BUCKET is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="File uploads are not configured. Please contact support.",
+        )
+
+    specs = []
+    for spec in request.files:
+        filename = sanitize_upload_filename(spec.filename)
+        FileValidator.validate_metadata(
+            filename=filename,
+            file_size=spec.size_bytes,
+            max_size_bytes=settings.MAX_FILE_SIZE_BYTES,
+            allowed_extensions=settings.ALLOWED_FILE_EXTENSIONS,
+        )
+        specs.append((spec, filename, validate_relative_path(spec.relative_path)))
+
+    await _check_upload_quota(
+        db, workspace_id, sum(spec.size_bytes for spec in request.files)
+    )
+
+    uploads = []
+    for spec, filename, relative_path in specs:
+        s3_key = build_upload_key(workspace_id, filename)
+        content_type = spec.content_type or guess_content_type(filename)
+        upload_url = await s3_client.generate_upload_url(
+            s3_key, content_type=content_type, content_length=spec.size_bytes
+        )
+        if not upload_url:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Failed to prepare file upload",
+            )
+        uploads.append(
+            {
+                "filename": filename,
+                "s3_key": s3_key,
+                "upload_url": upload_url,
+                "content_type": content_type,
+                "size_bytes": spec.size_bytes,
+                "relative_path": relative_path,
+            }
+        )
+
+    logger.info(
+        f"Issued {len(uploads)} presigned upload URLs for workspace {workspace_id}"
+    )
+    return {
+        "uploads": uploads,
+        "expires_in_seconds": settings.CHAT_UPLOADS_URL_EXPIRY_SECONDS,
+    }
+
+
 @router.post("/chat", response_model=SendMessageResponse)
 async def send_message(
     workspace_id: str,
@@ -110,6 +334,7 @@ async def send_message(
     session_id: Optional[str] = Form(None),
     files: Optional[List[UploadFile]] = File(None),
     file_paths: Optional[str] = Form(None),  # JSON array of relative paths
+    uploaded_files: Optional[str] = Form(None),  # JSON array of UploadedFileRef
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(auth_service.get_current_user),
 ):
@@ -125,6 +350,9 @@ async def send_message(
     - Up to 10 files per message
     - Max 50MB per file
     - Supported types: images, videos, documents, code files, data
+    - Preferred: upload via POST /chat/uploads presigned URLs and pass the
+      keys in uploaded_files; validation and extraction run in the worker
+    - Legacy: multipart files, validated and extracted inline
 
     **Rate Limiting:**
     - VibeMonitor AI users are subject to workspace daily limits
@@ -134,15 +362,17 @@ async def send_message(
     if files is None:
         files = []
 
+    uploaded_refs = _parse_uploaded_files(workspace_id, uploaded_files)
+
     # Validate file count
-    if len(files) > settings.MAX_FILES_PER_MESSAGE:
+    if len(files) + len(uploaded_refs) > settings.MAX_FILES_PER_MESSAGE:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Too many files. Maximum {settings.MAX_FILES_PER_MESSAGE} files per message.",
         )
 
     # Validate S3 bucket is configured
-    if files and settings.CHAT_UPLOADS_BUCKET is None:
+    if (files or uploaded_refs) and settings.CHAT_UPLOADS_BUCKET is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="File uploads are not configured. Please contact support.",
@@ -208,64 +438,7 @@ async def send_message(
 
         # Check file upload rate limit (total bytes per day)
         # BYOLLM users bypass this limit
-        if total_upload_bytes > 0:
-            try:
-                (
-                    allowed,
-                    bytes_used,
-                    bytes_limit,
-                ) = await check_rate_limit_with_byollm_bypass(
-                    session=db,
-                    workspace_id=workspace_id,
-                    resource_type=ResourceType.FILE_UPLOAD_BYTES,
-                    limit=settings.DAILY_UPLOAD_LIMIT_BYTES,
-                    increment=total_upload_bytes,
-                )
-
-                if not allowed:
-                    # Convert to MB for user-friendly error message
-                    bytes_used_mb = bytes_used / (1024 * 1024)
-                    bytes_limit_mb = bytes_limit / (1024 * 1024)
-                    upload_mb = total_upload_bytes / (1024 * 1024)
-
-                    logger.warning(
-                        f"File upload rate limit exceeded for workspace {workspace_id}: "
-                        f"{bytes_used_mb:.1f}MB/{bytes_limit_mb:.1f}MB used, attempted +{upload_mb:.1f}MB"
-                    )
-                    raise HTTPException(
-                        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                        detail={
-                            "message": "Daily file upload limit reached",
-                            "used_mb": round(bytes_used_mb, 2),
-                            "limit_mb": round(bytes_limit_mb, 2),
-                            "attempted_mb": round(upload_mb, 2),
-                            "tip": "Configure your own LLM (OpenAI, Azure, or Gemini) to remove limits",
-                        },
-                    )
-
-                # Log rate limit status
-                if bytes_limit == -1:
-                    logger.info(
-                        f"BYOLLM workspace {workspace_id} - unlimited file uploads"
-                    )
-                else:
-                    logger.info(
-                        f"File upload rate limit check passed for workspace {workspace_id}: "
-                        f"{bytes_used / (1024 * 1024):.1f}MB/{bytes_limit / (1024 * 1024):.1f}MB used "
-                        f"(+{total_upload_bytes / (1024 * 1024):.1f}MB)"
-                    )
-
-            except HTTPException:
-                raise
-            except Exception as e:
-                # Fail open: allow the request but log the error
-                logger.exception(
-                    f"Unexpected error in file upload rate limit check: {e}"
-                )
-                logger.warning(
-                    f"File upload rate limit check failed for workspace {workspace_id}, "
-                    f"allowing request to proceed"
-                )
+        await _check_upload_quota(db, workspace_id, total_upload_bytes)
 
     service = ChatService(db)
 
@@ -395,6 +568,32 @@ async def send_message(
                     await s3_client.delete_files(uploaded_s3_keys)
                 raise
 
+        # Files already in S3: record them now, validate/extract in the worker
+        for ref in uploaded_refs:
+            file_id = str(uuid.uuid4())
+            db.add(
+                ChatFile(
+                    id=file_id,
+                    turn_id=turn.id,
+                    s3_bucket=settings.CHAT_UPLOADS_BUCKET,
+                    s3_key=ref["s3_key"],
+                    filename=ref["filename"],
+                    file_type=ref["file_type"],
+                    mime_type=ref["mime_type"],
+                    size_bytes=ref["size"],
+                    relative_path=ref["relative_path"],
+                    uploaded_by=current_user.id,
+                )
+            )
+            processed_files_for_job.append(
+                {
+                    **ref,
+                    "file_id": file_id,
+                    "extracted_text": None,
+                    "pending_extraction": True,
+                }
+            )
+
         # Create and enqueue job
         job = await service.create_job_for_turn(turn, workspace_id)
 
@@ -467,9 +666,7 @@ async def get_file_download_url(
     - User owns the chat session (files are private to session owner)
     - User has access to the workspace
     """
-    from sqlalchemy import select
-
-    from app.models import ChatSession, ChatTurn, Membership
+    from app.models import ChatSession, ChatTurn
 
     # Query file with session ownership check
     # Users can only download files from their own chat sessions
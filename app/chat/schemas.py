@@ -22,6 +22,31 @@ class SendMessageRequest(BaseModel):
     )
 
 
+class UploadFileSpec(BaseModel):
+    """A file the client intends to upload directly to S3."""
+
+    filename: str = Field(..., min_length=1, max_length=255)
+    size_bytes: int = Field(..., gt=0, description="Exact size of the file in bytes")
+    content_type: Optional[str] = Field(
+        None, max_length=100, description="MIME type; guessed from filename if omitted"
+    )
+    relative_path: Optional[str] = Field(None, max_length=500)
+
+
+class CreateUploadsRequest(BaseModel):
+    """Request presigned URLs for direct-to-S3 chat uploads."""
+
+    files: List[UploadFileSpec] = Field(..., min_length=1)
+
+
+class UploadedFileRef(BaseModel):
+    """Reference to a file already uploaded via a presigned URL."""
+
+    s3_key: str = Field(..., min_length=1, max_length=1024)
+    size_bytes: int = Field(..., gt=0)
+    relative_path: Optional[str] = Field(None, max_length=500)
+
+
 class UpdateSessionRequest(BaseModel):
     """Request to update a session (e.g., rename)."""
 
@@ -134,6 +159,24 @@ class SendMessageResponse(BaseModel):
     message: str = "Message received. Connect to SSE endpoint to stream response."
 
 
+class PresignedUpload(BaseModel):
+    """Presigned PUT target for one file."""
+
+    filename: str
+    s3_key: str
+    upload_url: str
+    content_type: str = Field(..., description="Content-Type header the PUT must send")
+    size_bytes: int
+    relative_path: Optional[str] = None
+
+
+class CreateUploadsResponse(BaseModel):
+    """Presigned upload URLs, in request order."""
+
+    uploads: List[PresignedUpload]
+    expires_in_seconds: int
+
+
 class FeedbackResponse(BaseModel):
     """Response after submitting feedback."""
 
@@ -0,0 +1,219 @@
+"""
+Direct-to-S3 chat uploads.
+
+Clients ask the API for presigned PUT URLs, upload the bytes straight to S3,
+then reference the resulting object keys when sending the message. The API
+never holds file content; validation and text extraction run in the worker
+as a pre-processing stage (process_uploaded_files) before RCA starts.
+
+Extraction results are cached in Redis per object key + ETag, so retried
+jobs and re-sent attachments don't download and parse the same object again.
+"""
+
+import asyncio
+import json
+import logging
+import mimetypes
+import uuid
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.redis import get_redis
+from app.models import ChatFile
+from app.services.s3.client import s3_client
+from app.services.storage import FileValidationError, FileValidator, TextExtractor
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_CACHE_PREFIX = "chat_upload:extraction:"
+
+
+def upload_key_prefix(workspace_id: str) -> str:
+    """S3 prefix under which a workspace's direct uploads live."""
+    return f"{workspace_id}/uploads/"
+
+
+def sanitize_upload_filename(filename: str) -> str:
+    """Keep only the final path segment so a filename can't add key segments."""
+    name = filename.replace("\\", "/").rsplit("/", 1)[-1].strip()
+    if not name or name in (".", "..") or "\x00" in name:
+        raise FileValidationError(f"Invalid filename '{filename}'.")
+    return name
+
+
+def build_upload_key(workspace_id: str, filename: str) -> str:
+    """Unique S3 key for a new direct upload."""
+    return f"{upload_key_prefix(workspace_id)}{uuid.uuid4()}/{filename}"
+
+
+def is_workspace_upload_key(workspace_id: str, s3_key: str) -> bool:
+    """True if s3_key was issued by build_upload_key for this workspace."""
+    prefix = upload_key_prefix(workspace_id)
+    if not s3_key.startswith(prefix):
+        return False
+    parts = s3_key[len(prefix) :].split("/")
+    return len(parts) == 2 and all(p and p not in (".", "..") for p in parts)
+
+
+def guess_content_type(filename: str) -> str:
+    return mimetypes.guess_type(filename)[0] or "application/octet-stream"
+
+
+async def _get_cached_extraction(s3_key: str, etag: str) -> Optional[dict]:
+    if not settings.REDIS_URL or not etag:
+        return None
+    try:
+        redis_client = await get_redis()
+        cached = await redis_client.get(f"{EXTRACTION_CACHE_PREFIX}{s3_key}:{etag}")
+    except Exception as e:
+        logger.warning(f"Upload extraction cache read failed: {e}")
+        return None
+    return json.loads(cached) if cached else None
+
+
+async def _cache_extraction(s3_key: str, etag: str, result: dict) -> None:
+    if not settings.REDIS_URL or not etag:
+        return
+    try:
+        redis_client = await get_redis()
+        await redis_client.set(
+            f"{EXTRACTION_CACHE_PREFIX}{s3_key}:{etag}",
+            json.dumps(result),
+            ex=settings.CHAT_UPLOAD_EXTRACTION_CACHE_TTL_SECONDS,
+        )
+    except Exception as e:
+        logger.warning(f"Upload extraction cache write failed: {e}")
+
+
+async def _validate_and_extract(file_entry: dict) -> Optional[dict]:
+    """
+    Validate one uploaded object and extract its text.
+
+    Returns:
+        Dict with file_type, mime_type, size and extracted_text, or None if
+        the object is missing or unreadable
+
+    Raises:
+        FileValidationError: If the object fails size/extension/MIME checks
+    """
+    s3_key = file_entry["s3_key"]
+    filename = file_entry["filename"]
+
+    head = await s3_client.head_file(s3_key)
+    if head is None:
+        return None
+
+    cached = await _get_cached_extraction(s3_key, head["etag"])
+    if cached is not None:
+        logger.info(f"Upload extraction cache hit: {s3_key}")
+        return cached
+
+    file_category = FileValidator.validate_metadata(
+        filename=filename,
+        file_size=head["size_bytes"],
+        max_size_bytes=settings.MAX_FILE_SIZE_BYTES,
+        allowed_extensions=settings.ALLOWED_FILE_EXTENSIONS,
+    )
+
+    # Media is only sniffed; text-bearing files are needed whole for extraction
+    is_media = file_category in ("image", "video")
+    content = await s3_client.download_file(
+        s3_key, max_bytes=settings.CHAT_UPLOAD_SNIFF_BYTES if is_media else None
+    )
+    if content is None:
+        return None
+
+    mime_type = FileValidator.validate_content(filename, content, file_category)
+
+    extracted_text = None
+    if not is_media:
+        extracted_text = await TextExtractor.extract_text(
+            file_content=content,
+            mime_type=mime_type,
+            filename=filename,
+        )
+
+    result = {
+        "file_type": file_category,
+        "mime_type": mime_type,
+        "size": head["size_bytes"],
+        "extracted_text": extracted_text,
+    }
+    await _cache_extraction(s3_key, head["etag"], result)
+    return result
+
+
+async def process_uploaded_files(db: AsyncSession, files: List[dict]) -> List[dict]:
+    """
+    Worker stage: validate and extract text from files uploaded directly to S3.
+
+    Entries marked pending_extraction are processed concurrently. Valid files
+    get their ChatFile row and job entry updated with the detected MIME type,
+    real size and extracted text. Missing or invalid files are dropped from
+    the returned list, their ChatFile rows deleted and their objects removed.
+    The caller commits.
+
+    Args:
+        db: Database session
+        files: File entries from job.requested_context["files"]
+
+    Returns:
+        The file entries to pass on to RCA
+    """
+    pending = [f for f in files if f.get("pending_extraction")]
+    if not pending:
+        return files
+
+    semaphore = asyncio.Semaphore(settings.CHAT_UPLOAD_EXTRACTION_CONCURRENCY)
+
+    async def run(file_entry: dict) -> Optional[dict]:
+        async with semaphore:
+            try:
+                return await _validate_and_extract(file_entry)
+            except FileValidationError as e:
+                logger.warning(
+                    f"Rejected uploaded file {file_entry['s3_key']}: {e.detail}"
+                )
+                return None
+
+    results = await asyncio.gather(*(run(f) for f in pending))
+    processed = {f["file_id"]: r for f, r in zip(pending, results)}
+
+    chat_files = (
+        (await db.execute(select(ChatFile).where(ChatFile.id.in_(list(processed)))))
+        .scalars()
+        .all()
+    )
+    for chat_file in chat_files:
+        result = processed[chat_file.id]
+        if result is None:
+            await db.delete(chat_file)
+            continue
+        chat_file.file_type = result["file_type"]
+        chat_file.mime_type = result["mime_type"]
+        chat_file.size_bytes = result["size"]
+        chat_file.extracted_text = result["extracted_text"]
+
+    rejected_keys = [f["s3_key"] for f in pending if processed[f["file_id"]] is None]
+    if rejected_keys:
+        logger.warning(
+            f"Dropping {len(rejected_keys)} invalid or missing uploaded files"
+        )
+        await s3_client.delete_files(rejected_keys)
+
+    kept = []
+    for file_entry in files:
+        if not file_entry.get("pending_extraction"):
+            kept.append(file_entry)
+        elif processed[file_entry["file_id"]] is not None:
+            kept.append(
+                {
+                    **file_entry,
+                    **processed[file_entry["file_id"]],
+                    "pending_extraction": False,
+                }
+            )
+    return kept
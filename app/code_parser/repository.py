@@ -10,13 +10,72 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy import and_, delete, func, select, text, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import ParsedFile, ParsedRepository, ParsingStatus
+from app.models import ParsedFile, ParsedRepository, ParsedSymbol, ParsingStatus
 
 logger = logging.getLogger(__name__)
 
+# Content search runs against the pg_trgm GIN index on parsed_files.content
+# (ILIKE '%q%' is index-assisted for queries of 3+ chars). Line number and
+# matching line are computed in SQL so file contents never leave the DB.
+_CONTENT_SEARCH_SQL = text(r"""
+    WITH matches AS (
+        SELECT file_path, language, line_count, content,
+               strpos(lower(content), lower(:query)) AS pos
+        FROM parsed_files
+        WHERE repository_id = :repo_id
+          AND content ILIKE :pattern
+        ORDER BY file_path
+        LIMIT :lim
+    ),
+    located AS (
+        SELECT file_path, language, line_count, content,
+               CASE WHEN pos > 0
+                    THEN array_length(string_to_array(left(content, pos), E'\n'), 1)
+               END AS line_number
+        FROM matches
+    )
+    SELECT file_path, language, line_count, line_number,
+           left(split_part(content, E'\n', COALESCE(line_number, 1)), :line_chars) AS line
+    FROM located
+""")
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE/ILIKE wildcards so the value matches literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _build_symbols(parsed_file: ParsedFile) -> List[ParsedSymbol]:
+    """Build ParsedSymbol rows for a file's functions and classes."""
+    symbols = []
+    for kind, entries in (
+        ("function", parsed_file.functions),
+        ("class", parsed_file.classes),
+    ):
+        for info in entries or []:
+            name = (info.get("name") or "")[:255]
+            if not name:
+                continue
+            symbols.append(
+                ParsedSymbol(
+                    id=str(uuid.uuid4()),
+                    repository_id=parsed_file.repository_id,
+                    file_id=parsed_file.id,
+                    kind=kind,
+                    name=name,
+                    name_lower=name.lower(),
+                    file_path=parsed_file.file_path,
+                    language=parsed_file.language,
+                    line_start=info.get("line_start"),
+                    line_end=info.get("line_end"),
+                    info=info,
+                )
+            )
+    return symbols
+
 
 class ParsedRepositoryRepository:
     """CRUD operations for ParsedRepository model."""
@@ -340,11 +399,203 @@ class ParsedFileRepository:
         row = result.first()
         return row[0] if row else None
 
+    async def get_at_commit(
+        self,
+        workspace_id: str,
+        repo_name: str,
+        commit_sha: str,
+        file_path: str,
+        owner: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get a file's stored content from a completed parse of the given commit.
+
+        Args:
+            workspace_id: Workspace ID
+            repo_name: Repository name, without owner
+            commit_sha: Full or abbreviated commit SHA
+            file_path: File path within the repository
+            owner: Repository owner; any owner matches when omitted
+
+        Returns:
+            {repo_full_name, commit_sha, content, size_bytes} or None
+        """
+        if owner:
+            repo_clause = ParsedRepository.repo_full_name == f"{owner}/{repo_name}"
+        else:
+            repo_clause = ParsedRepository.repo_full_name.endswith(
+                f"/{repo_name}", autoescape=True
+            )
+        if len(commit_sha) < 40:
+            commit_clause = ParsedRepository.commit_sha.startswith(
+                commit_sha, autoescape=True
+            )
+        else:
+            commit_clause = ParsedRepository.commit_sha == commit_sha
+
+        result = await self.db.execute(
+            select(
+                ParsedRepository.repo_full_name,
+                ParsedRepository.commit_sha,
+                ParsedFile.content,
+                ParsedFile.size_bytes,
+            )
+            .join(ParsedRepository, ParsedFile.repository_id == ParsedRepository.id)
+            .where(
+                ParsedRepository.workspace_id == workspace_id,
+                ParsedRepository.status == ParsingStatus.COMPLETED,
+                repo_clause,
+                commit_clause,
+                ParsedFile.file_path == file_path,
+                ParsedFile.content.isnot(None),
+            )
+            .order_by(ParsedRepository.created_at.desc())
+            .limit(1)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return {
+            "repo_full_name": row[0],
+            "commit_sha": row[1],
+            "content": row[2],
+            "size_bytes": row[3],
+        }
+
+    async def get_contents(
+        self,
+        repository_id: str,
+        file_paths: List[str],
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get contents for several files in a single query.
+
+        Args:
+            repository_id: ParsedRepository ID
+            file_paths: File paths within the repository
+
+        Returns:
+            Mapping of file path to content (missing paths omitted)
+        """
+        if not file_paths:
+            return {}
+
+        result = await self.db.execute(
+            select(ParsedFile.file_path, ParsedFile.content).where(
+                and_(
+                    ParsedFile.repository_id == repository_id,
+                    ParsedFile.file_path.in_(file_paths),
+                )
+            )
+        )
+        return {row[0]: row[1] for row in result.fetchall()}
+
+    async def search_content(
+        self,
+        repository_id: str,
+        query: str,
+        limit: int = 10,
+        line_chars: int = 300,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search file contents for a literal, case-insensitive substring.
+
+        Args:
+            repository_id: ParsedRepository ID
+            query: Text to search for
+            limit: Maximum number of files to return
+            line_chars: Maximum characters of the matching line to return
+
+        Returns:
+            List of {file_path, language, line_count, line_number, line}
+            for the first match in each file, ordered by path
+        """
+        result = await self.db.execute(
+            _CONTENT_SEARCH_SQL,
+            {
+                "repo_id": repository_id,
+                "query": query,
+                "pattern": f"%{escape_like(query)}%",
+                "lim": limit,
+                "line_chars": line_chars,
+            },
+        )
+        return [
+            {
+                "file_path": row[0],
+                "language": row[1],
+                "line_count": row[2],
+                "line_number": row[3],
+                "line": row[4] or "",
+            }
+            for row in result.fetchall()
+        ]
+
+    async def list_paths(
+        self,
+        repository_id: str,
+        pattern: str,
+        limit: int = 50,
+    ) -> List[Dict[str, Any]]:
+        """
+        List file paths matching an ILIKE pattern (``*`` is treated as ``%``).
+
+        Args:
+            repository_id: ParsedRepository ID
+            pattern: Path pattern (e.g., '%middleware%', 'app/core/*')
+            limit: Maximum number of results
+
+        Returns:
+            List of {file_path, language, line_count} ordered by path
+        """
+        result = await self.db.execute(
+            select(ParsedFile.file_path, ParsedFile.language, ParsedFile.line_count)
+            .where(
+                ParsedFile.repository_id == repository_id,
+                ParsedFile.file_path.ilike(pattern.replace("*", "%")),
+            )
+            .order_by(ParsedFile.file_path)
+            .limit(limit)
+        )
+        return [
+            {"file_path": row[0], "language": row[1], "line_count": row[2]}
+            for row in result.fetchall()
+        ]
+
+    async def get_content_hashes(
+        self,
+        repository_id: str,
+        file_paths: List[str],
+    ) -> Dict[str, Optional[str]]:
+        """
+        Get content hashes for a set of files without loading their content.
+
+        Args:
+            repository_id: ParsedRepository ID
+            file_paths: File paths within the repository
+
+        Returns:
+            Mapping of file path to SHA-256 content hash (missing paths omitted)
+        """
+        if not file_paths:
+            return {}
+
+        result = await self.db.execute(
+            select(ParsedFile.file_path, ParsedFile.content_hash).where(
+                and_(
+                    ParsedFile.repository_id == repository_id,
+                    ParsedFile.file_path.in_(file_paths),
+                )
+            )
+        )
+        return {row[0]: row[1] for row in result.fetchall()}
+
     async def search_functions(
         self,
         repository_id: str,
         function_name: str,
         exact_match: bool = False,
+        limit: int = 1000,
     ) -> List[Dict[str, Any]]:
         """
         Search for functions by name across all files in a repository.
@@ -353,39 +604,21 @@ class ParsedFileRepository:
             repository_id: ParsedRepository ID
             function_name: Function name to search for
             exact_match: If True, require exact name match
+            limit: Maximum number of results
 
         Returns:
             List of matching functions with file info
         """
-        # Get all files for the repository
-        files = await self.get_by_repository(repository_id)
-
-        results = []
-        for file in files:
-            if not file.functions:
-                continue
-
-            for function_info in file.functions:
-                func_name = function_info.get("name", "")
-                if exact_match:
-                    matches = func_name == function_name
-                else:
-                    matches = function_name.lower() in func_name.lower()
-
-                if matches:
-                    results.append({
-                        "file_path": file.file_path,
-                        "language": file.language,
-                        "function": function_info,
-                    })
-
-        return results
+        return await self._search_symbols(
+            repository_id, "function", function_name, exact_match, limit
+        )
 
     async def search_classes(
         self,
         repository_id: str,
         class_name: str,
         exact_match: bool = False,
+        limit: int = 1000,
     ) -> List[Dict[str, Any]]:
         """
         Search for classes by name across all files in a repository.
@@ -394,32 +627,45 @@ class ParsedFileRepository:
             repository_id: ParsedRepository ID
             class_name: Class name to search for
             exact_match: If True, require exact name match
+            limit: Maximum number of results
 
         Returns:
             List of matching classes with file info
         """
-        files = await self.get_by_repository(repository_id)
-
-        results = []
-        for file in files:
-            if not file.classes:
-                continue
-
-            for cls in file.classes:
-                cls_name = cls.get("name", "")
-                if exact_match:
-                    matches = cls_name == class_name
-                else:
-                    matches = class_name.lower() in cls_name.lower()
+        return await self._search_symbols(
+            repository_id, "class", class_name, exact_match, limit
+        )
 
-                if matches:
-                    results.append({
-                        "file_path": file.file_path,
-                        "language": file.language,
-                        "class": cls,
-                    })
+    async def _search_symbols(
+        self,
+        repository_id: str,
+        kind: str,
+        name: str,
+        exact_match: bool,
+        limit: int,
+    ) -> List[Dict[str, Any]]:
+        """Query the parsed_symbols table (no file contents are loaded)."""
+        if exact_match:
+            name_filter = ParsedSymbol.name == name
+        else:
+            name_filter = ParsedSymbol.name_lower.like(
+                f"%{escape_like(name.lower())}%", escape="\\"
+            )
 
-        return results
+        result = await self.db.execute(
+            select(ParsedSymbol.file_path, ParsedSymbol.language, ParsedSymbol.info)
+            .where(
+                ParsedSymbol.repository_id == repository_id,
+                ParsedSymbol.kind == kind,
+                name_filter,
+            )
+            .order_by(ParsedSymbol.file_path, ParsedSymbol.line_start)
+            .limit(limit)
+        )
+        return [
+            {"file_path": row[0], "language": row[1], kind: row[2]}
+            for row in result.fetchall()
+        ]
 
     async def create_batch(
         self,
@@ -461,6 +707,7 @@ class ParsedFileRepository:
             )
 
             self.db.add(parsed_file)
+            self.db.add_all(_build_symbols(parsed_file))
             created_count += 1
 
         await self.db.flush()
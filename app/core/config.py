@@ -58,6 +58,10 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    PRINCIPAL_CACHE_ENABLED: bool = True  # Cache user + memberships per JWT subject
+    PRINCIPAL_CACHE_TTL_SECONDS: int = (
+        60  # Safety net; user and membership writes invalidate on commit
+    )
 
     # TOKEN_PROCESSOR_KEY
     CRYPTOGRAPHY_SECRET: Optional[str] = None
@@ -71,6 +75,9 @@ class Settings(BaseSettings):
     # Postmark Email Configuration
     POSTMARK_SERVER_TOKEN: Optional[str] = None
     POSTMARK_BROADCAST_STREAM: str = "broadcast"  # Stream for marketing emails
+    EMAIL_BATCH_CONCURRENCY: int = (
+        4  # Postmark batch requests (500 messages each) in flight
+    )
 
     # Company Email Settings (for automated/system emails)
     COMPANY_EMAIL_FROM_ADDRESS: str = "support@vibemonitor.ai"
@@ -110,10 +117,42 @@ class Settings(BaseSettings):
     GROQ_API_KEY: Optional[str] = None
     GROQ_LLM_MODEL: Optional[str] = None
 
+    # Workspace LLM client cache (reuses clients and their connection pools)
+    LLM_CLIENT_CACHE_TTL_SECONDS: int = 3600  # Idle workspaces release their clients
+    LLM_CLIENT_CACHE_MAXSIZE: int = 500  # Max workspaces with cached clients
+
     # LLM Guard Security Settings
     LLM_GUARD_TEMPERATURE: float = 0.0  # Deterministic for security checks
     LLM_GUARD_TIMEOUT: float = 10.0  # Seconds timeout for guard validation
     LLM_GUARD_MAX_TOKENS: Optional[int] = None  # No limit by default
+    LLM_GUARD_CACHE_ENABLED: bool = (
+        True  # Reuse recent verdicts for repeated (normalized) messages
+    )
+    LLM_GUARD_CACHE_TTL_SECONDS: int = 3600  # Verdict cache TTL (in-process and Redis)
+    LLM_GUARD_CACHE_MAXSIZE: int = 5000  # Max verdicts kept in-process
+    LLM_GUARD_PREFILTER_ENABLED: bool = (
+        True  # Local heuristics decide clear-cut messages without the LLM
+    )
+    LLM_GUARD_PREFILTER_SAFE_MAX_CHARS: int = (
+        300  # Longer messages always go to the LLM
+    )
+
+    # PII Masking (Presidio) Settings
+    PII_PRELOAD_ON_STARTUP: bool = (
+        True  # Load the spaCy/Presidio analyzer during app startup
+    )
+    PII_ANALYZER_THREADS: int = (
+        1  # Threads running Presidio analysis off the event loop
+    )
+    PII_BATCH_MAX_SIZE: int = (
+        32  # Max concurrent masking requests analyzed in one batch
+    )
+    PII_BATCH_MAX_WAIT_MS: float = (
+        5.0  # How long a request waits for others to join its batch
+    )
+    PII_FAST_PATH_ENABLED: bool = (
+        True  # Skip NER for text with no digits, '@' or capitalized words
+    )
 
     # Gemini
     GEMINI_API_KEY: Optional[str] = None
@@ -219,6 +258,34 @@ class Settings(BaseSettings):
     RCA_REPO_SCAN_CONCURRENCY: int = (
         5  # Number of repositories to scan in parallel (avoids overwhelming system)
     )
+    ENVIRONMENT_CONTEXT_CACHE_ENABLED: bool = (
+        True  # Cache per-workspace environment/deployment context for RCA jobs in Redis
+    )
+    ENVIRONMENT_CONTEXT_CACHE_TTL_SECONDS: int = (
+        300  # Safety net; deployments and environment changes invalidate on commit
+    )
+    RCA_CONTEXT_SNAPSHOT_ENABLED: bool = (
+        True  # Reuse the per-workspace RCA context snapshot across jobs (Redis)
+    )
+    RCA_CONTEXT_SNAPSHOT_TTL_SECONDS: int = (
+        600  # Safety net; ORM writes to the underlying models invalidate on commit
+    )
+    RCA_INTENT_RULES_ENABLED: bool = True  # Classify unambiguous queries (alerts, stack traces, lookups) without the LLM
+    RCA_RESPONSE_CACHE_ENABLED: bool = True  # Answer repeated conversational questions from Redis until the workspace changes
+    RCA_RESPONSE_CACHE_TTL_SECONDS: int = 3600  # Safety net; ORM writes to services/teams/environments/deployments invalidate on commit
+    RCA_GITHUB_PROBE_TTL_SECONDS: int = (
+        300  # Skip the per-job GitHub liveness probe if it succeeded this recently
+    )
+    RCA_CODE_CACHE_MAXSIZE: int = (
+        512  # Commit-pinned GitHub file/tree reads kept in process by the RCA tools
+    )
+    RCA_CODE_CACHE_TTL_SECONDS: int = 3600  # Pinned reads never go stale; this only bounds memory held by idle entries
+    RCA_TOOL_OUTPUT_MAX_TOKENS: int = 2000  # Default token budget for one log/metrics/code tool result sent to the agent
+    RCA_TOOL_OUTPUT_MAX_CELL_CHARS: int = (
+        500  # Longer values (e.g. log messages) are cut within compacted tool tables
+    )
+    RCA_SCRATCHPAD_KEEP_RECENT: int = 2  # Tool results the agent sees verbatim; older ones are summarized in its scratchpad
+    RCA_SCRATCHPAD_SUMMARY_MAX_CHARS: int = 600  # Size of a summarized scratchpad observation (shorter outputs are kept as is)
     RCA_SLACK_MESSAGE_MAX_LENGTH: int = (
         500  # Maximum length for Slack progress messages
     )
@@ -232,6 +299,13 @@ class Settings(BaseSettings):
     RCA_SLACK_MAX_CONSECUTIVE_FAILURES: int = (
         3  # Max consecutive Slack failures before circuit breaker opens
     )
+    RCA_STREAM_FINAL_ANSWER: bool = True  # Stream the final answer's tokens to web chat (SSE delta) and Slack (chat.update)
+    RCA_WEB_STREAM_INTERVAL_SECONDS: float = (
+        0.05  # Coalesce answer tokens into one SSE delta event per interval
+    )
+    RCA_SLACK_STREAM_INTERVAL_SECONDS: float = (
+        1.5  # Min seconds between streamed Slack edits (chat.update is rate limited)
+    )
 
     # RCA Agent LLM Settings
     RCA_AGENT_TEMPERATURE: float = (
@@ -302,6 +376,23 @@ class Settings(BaseSettings):
     HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE: int = 20  # Gaps sampled per rule type for LLM verification
     HEALTH_REVIEW_VERIFICATION_CONFIDENCE_THRESHOLD: float = 0.75  # ≥75% of samples must pass for group to be marked false_alarm
     HEALTH_REVIEW_VERIFICATION_DELAY_SECONDS: float = 2.0  # Pause between rule-type verifications (rate limit)
+    HEALTH_REVIEW_EXTRACTION_CONCURRENCY: int = (
+        5  # Max candidate config files extracted in parallel (LLM calls in flight)
+    )
+    HEALTH_REVIEW_VERDICT_CACHE_ENABLED: bool = (
+        True  # Reuse verdicts for gaps whose files + infra context are unchanged
+    )
+    HEALTH_REVIEW_VERDICT_CACHE_TTL_DAYS: int = (
+        30  # Cached verdicts older than this are re-verified
+    )
+
+    # Scheduler fan-out
+    HEALTH_REVIEW_SCHEDULER_BATCH_SIZE: int = (
+        500  # Due schedules loaded/inserted/published per transaction
+    )
+    HEALTH_REVIEW_SCHEDULER_JITTER_SECONDS: int = (
+        600  # Spread scheduled job start times over this window (SQS caps delay at 900)
+    )
 
     # LangGraph safety cap — counts graph node executions (most are free, non-LLM steps).
     # This does NOT limit LLM calls or tokens; LLMBudgetCallback handles that.
@@ -329,6 +420,14 @@ class Settings(BaseSettings):
         5  # Maximum redirects to follow when downloading Slack images
     )
 
+    # Rate Limiting (Redis counters, written behind to rate_limit_tracking)
+    RATE_LIMIT_REDIS_ENABLED: bool = (
+        True  # Falls back to row-locked DB counters when off
+    )
+    RATE_LIMIT_FLUSH_INTERVAL_SECONDS: float = (
+        5.0  # How often buffered counter deltas are written to the database
+    )
+
     # File Upload Limits
     MAX_FILES_PER_MESSAGE: int = 10
     MAX_FILE_SIZE_BYTES: int = 50 * 1024 * 1024  # 50MB (increased for video support)
@@ -369,11 +468,37 @@ class Settings(BaseSettings):
     # AWS S3 (Chat File Uploads)
     CHAT_UPLOADS_BUCKET: Optional[str] = None
     CHAT_UPLOADS_URL_EXPIRY_SECONDS: int = 3600  # 1 hour
+    CHAT_UPLOAD_SNIFF_BYTES: int = (
+        8192  # Leading bytes fetched to validate the MIME type of media uploads
+    )
+    CHAT_UPLOAD_EXTRACTION_CONCURRENCY: int = (
+        4  # Uploaded files validated/extracted in parallel per job
+    )
+    CHAT_UPLOAD_EXTRACTION_CACHE_TTL_SECONDS: int = (
+        7 * 24 * 3600  # Extracted text cached per S3 object key + ETag
+    )
 
     # Text Extraction Settings
     TEXT_EXTRACTION_MAX_CHARS: int = (
         50000  # Maximum characters to extract from files (PDFs, text, JSON, YAML)
     )
+    TEXT_EXTRACTION_POOL_ENABLED: bool = (
+        True  # Parse large PDF/JSON/YAML in a process pool
+    )
+    TEXT_EXTRACTION_POOL_WORKERS: int = 2
+    TEXT_EXTRACTION_POOL_MAX_TASKS_PER_CHILD: int = (
+        50  # Recycle workers to bound parser memory growth
+    )
+    TEXT_EXTRACTION_INLINE_MAX_BYTES: int = (
+        256
+        * 1024  # Smaller files are parsed in a thread (IPC costs more than the parse)
+    )
+    TEXT_EXTRACTION_CPU_SECONDS: float = (
+        10.0  # Per-file CPU budget; PDF page iteration stops once exceeded
+    )
+    TEXT_EXTRACTION_TIMEOUT_SECONDS: float = (
+        30.0  # Per-file wall-clock budget; the stuck worker is killed after this
+    )
 
     # Scheduler Authentication
     SCHEDULER_SECRET_TOKEN: Optional[str] = None  # Secret token for scheduler endpoints
@@ -405,6 +530,12 @@ class Settings(BaseSettings):
     STRIPE_ADDITIONAL_SERVICE_PRICE_ID: Optional[str] = (
         None  # price_... for additional services beyond base
     )
+    STRIPE_API_THREADS: int = (
+        8  # Threads running blocking Stripe SDK calls off the event loop
+    )
+    STRIPE_READ_CACHE_TTL_SECONDS: int = (
+        30  # Cache for get_customer/get_subscription lookups
+    )
 
     # New Relic
     NEW_RELIC_LICENSE_KEY: Optional[str] = None
@@ -6,20 +6,42 @@ automatic context propagation using contextvars. Also supports OpenTelemetry log
 
 Includes PII masking filter to automatically sanitize sensitive data in logs.
 
+Records are handed to a QueueHandler on the calling thread (event loop) and
+masked, formatted and exported by a QueueListener thread, so logging never
+blocks the loop on regexes, JSON encoding or stream/OTLP I/O.
+
 Uses ONLY stdlib - no external logging dependencies (except for PII masking).
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
+import queue
 import sys
 import threading
+import time
 from contextvars import ContextVar
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from opentelemetry import context as otel_context
+
 from app.core.config import settings
 from app.utils.data_masker import mask_log_message
 
+try:
+    import orjson  # Installed with langsmith; ~5x faster than json.dumps
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+except ImportError:  # pragma: no cover
+
+    def _dumps(obj: Dict[str, Any]) -> str:
+        return json.dumps(obj, default=str)
+
+
 # Context variables for request_id and job_id
 # These are thread-safe and async-safe context variables
 request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
@@ -158,7 +180,74 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Return JSON string
-        return json.dumps(log_record)
+        return _dumps(log_record)
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that does the minimum on the calling thread.
+
+    Only merges args into the message (so later mutation of args can't
+    change the log line) and captures the OpenTelemetry context for trace
+    correlation. Masking, JSON formatting and exception rendering happen on
+    the listener thread. Time spent enqueueing is tracked in ``stats``.
+    """
+
+    def __init__(self, log_queue: queue.SimpleQueue):
+        super().__init__(log_queue)
+        self.stats = {
+            "records": 0,
+            "enqueue_seconds_total": 0.0,
+            "enqueue_seconds_max": 0.0,
+        }
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        record.otel_context = otel_context.get_current()
+        return record
+
+    def emit(self, record: logging.LogRecord) -> None:
+        start = time.perf_counter()
+        super().emit(record)
+        elapsed = time.perf_counter() - start
+        self.stats["records"] += 1
+        self.stats["enqueue_seconds_total"] += elapsed
+        if elapsed > self.stats["enqueue_seconds_max"]:
+            self.stats["enqueue_seconds_max"] = elapsed
+
+
+class _ContextRestoringListener(logging.handlers.QueueListener):
+    """QueueListener that restores the producer's OTel context per record."""
+
+    def handle(self, record: logging.LogRecord) -> None:
+        ctx = getattr(record, "otel_context", None)
+        token = otel_context.attach(ctx) if ctx is not None else None
+        try:
+            super().handle(record)
+        finally:
+            if token is not None:
+                otel_context.detach(token)
+
+
+_queue_handler: Optional[NonBlockingQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def get_logging_stats() -> Dict[str, Any]:
+    """Return enqueue timing for the calling side of the logging pipeline."""
+    if _queue_handler is None:
+        return {"records": 0, "enqueue_seconds_total": 0.0, "enqueue_seconds_max": 0.0}
+    return dict(_queue_handler.stats)
+
+
+def stop_logging() -> None:
+    """Stop the listener thread, flushing any queued records."""
+    global _queue_listener, _queue_handler
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+    _queue_handler = None
 
 
 def configure_logging(otel_handler: Optional[logging.Handler] = None):
@@ -169,17 +258,21 @@ def configure_logging(otel_handler: Optional[logging.Handler] = None):
         otel_handler: Optional OpenTelemetry LoggingHandler for OTLP log export
 
     This function:
-    1. Configures root logger with JSON formatter
-    2. Adds context filter to automatically inject request_id and job_id from contextvars
-    3. Adds OpenTelemetry handler if provided (OTLP export)
-    4. Configures log level from settings
-    5. Suppresses overly verbose library logs
+    1. Routes the root logger through a QueueHandler/QueueListener pair
+    2. Adds context filter (on the calling thread) to inject request_id and job_id
+    3. Masks, JSON-formats and writes records on the listener thread
+    4. Adds OpenTelemetry handler if provided (OTLP export, also on the listener)
+    5. Configures log level from settings
+    6. Suppresses overly verbose library logs
     """
+    global _queue_handler, _queue_listener
+
     # Get root logger
     root_logger = logging.getLogger()
 
-    # Remove all existing handlers
+    # Remove all existing handlers (and stop a previous listener, flushing it)
     root_logger.handlers.clear()
+    stop_logging()
 
     # Determine log level (required - will fail if not set in environment)
     log_level = getattr(logging, settings.LOG_LEVEL.upper())
@@ -195,20 +288,30 @@ def configure_logging(otel_handler: Optional[logging.Handler] = None):
     # Use custom JSON formatter (stdlib only!)
     json_formatter = JSONFormatter()
     console_handler.setFormatter(json_formatter)
-    # Apply PII masking filter first, then context filter
+    # PII masking runs on the listener thread
     console_handler.addFilter(pii_masking_filter)
-    console_handler.addFilter(context_filter)
-
-    # Add console handler to root logger
-    root_logger.addHandler(console_handler)
-    root_logger.setLevel(log_level)
+    handlers = [console_handler]
 
     # Add OpenTelemetry handler if provided
     if otel_handler:
         otel_handler.setLevel(log_level)
         otel_handler.addFilter(pii_masking_filter)
-        otel_handler.addFilter(context_filter)
-        root_logger.addHandler(otel_handler)
+        handlers.append(otel_handler)
+
+    # Context (request_id/job_id/thread) must be read on the logging thread,
+    # so the context filter sits on the queue handler
+    _queue_handler = NonBlockingQueueHandler(queue.SimpleQueue())
+    _queue_handler.setLevel(log_level)
+    _queue_handler.addFilter(context_filter)
+    _queue_listener = _ContextRestoringListener(
+        _queue_handler.queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    root_logger.addHandler(_queue_handler)
+    root_logger.setLevel(log_level)
+
+    if otel_handler:
         logging.info("OpenTelemetry logging handler configured")
 
     # Set logging level for commonly verbose libraries
@@ -252,6 +355,9 @@ def configure_logging(otel_handler: Optional[logging.Handler] = None):
     logging.info("Logging configured successfully with stdlib logging")
 
 
+atexit.register(stop_logging)
+
+
 def set_request_id(request_id: str):
     """
     Set the request_id for the current context.
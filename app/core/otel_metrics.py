@@ -39,6 +39,8 @@ def _create_noop_metrics() -> Dict[str, NoOpMetric]:
         "rca_agent_invocations_total": noop,
         "rca_agent_duration_seconds": noop,
         "rca_agent_retries_total": noop,
+        "rca_agent_response_cache_total": noop,
+        "rca_agent_intent_classifications_total": noop,
         # LLM metrics
         "rca_llm_provider_usage_total": noop,
         "rca_context_size_bytes": noop,
@@ -47,6 +49,9 @@ def _create_noop_metrics() -> Dict[str, NoOpMetric]:
         "rca_tool_executions_total": noop,
         "rca_tool_execution_duration_seconds": noop,
         "rca_tool_execution_errors_total": noop,
+        "rca_tool_code_reads_total": noop,
+        "rca_tool_output_tokens_saved_total": noop,
+        "rca_tool_scratchpad_tokens_saved_total": noop,
         # Auth metrics
         "auth_failures_total": noop,
         "jwt_tokens_expired_total": noop,
@@ -73,6 +78,7 @@ def _create_noop_metrics() -> Dict[str, NoOpMetric]:
         "github_token_refreshes_total": noop,
         # Stripe metrics
         "stripe_api_calls_total": noop,
+        "stripe_api_duration_seconds": noop,
         "stripe_payment_failures_total": noop,
         "stripe_subscriptions_active": noop,
         # HTTP metrics
@@ -179,6 +185,16 @@ def init_meter(meter: Meter):
                 description="Total number of RCA agent retry attempts",
                 unit="1",
             ),
+            "rca_agent_response_cache_total": meter.create_counter(
+                name="vm_api.rca.agent.response_cache.total",
+                description="Conversational response cache lookups by result (hit, miss)",
+                unit="1",
+            ),
+            "rca_agent_intent_classifications_total": meter.create_counter(
+                name="vm_api.rca.agent.intent_classifications.total",
+                description="Query intent classifications by source (rules, llm) and intent",
+                unit="1",
+            ),
         }
     )
 
@@ -223,6 +239,21 @@ def init_meter(meter: Meter):
                 description="Total number of tool execution errors",
                 unit="1",
             ),
+            "rca_tool_code_reads_total": meter.create_counter(
+                name="vm_api.rca.tool.code_reads.total",
+                description="RCA code reads by kind and source (parsed_store, cache, github)",
+                unit="1",
+            ),
+            "rca_tool_output_tokens_saved_total": meter.create_counter(
+                name="vm_api.rca.tool.output_tokens_saved.total",
+                description="Estimated tokens removed from tool output by compaction, per tool",
+                unit="1",
+            ),
+            "rca_tool_scratchpad_tokens_saved_total": meter.create_counter(
+                name="vm_api.rca.tool.scratchpad_tokens_saved.total",
+                description="Estimated prompt tokens saved by summarizing older tool results in the agent scratchpad",
+                unit="1",
+            ),
         }
     )
 
@@ -390,6 +421,11 @@ def init_meter(meter: Meter):
                 description="Total Stripe API calls for rate limiting and quota tracking",
                 unit="1",
             ),
+            "stripe_api_duration_seconds": meter.create_histogram(
+                name="vm_api.stripe.api.duration",
+                description="Stripe API call duration",
+                unit="s",
+            ),
             "stripe_payment_failures_total": meter.create_counter(
                 name="vm_api.stripe.payment.failures.total",
                 description="Total Stripe payment failures",
@@ -25,12 +25,17 @@ _SENTRY_NAME_MAP: Dict[str, str] = {
     "rca_agent_invocations_total": "vm_api.rca.agent.invocations.total",
     "rca_agent_duration_seconds": "vm_api.rca.agent.duration",
     "rca_agent_retries_total": "vm_api.rca.agent.retries.total",
+    "rca_agent_response_cache_total": "vm_api.rca.agent.response_cache.total",
+    "rca_agent_intent_classifications_total": "vm_api.rca.agent.intent_classifications.total",
     "rca_llm_provider_usage_total": "vm_api.rca.llm.provider.usage.total",
     "rca_context_size_bytes": "vm_api.rca.context.size.bytes",
     "rca_estimated_input_tokens": "vm_api.rca.estimated.input.tokens",
     "rca_tool_executions_total": "vm_api.rca.tool.executions.total",
     "rca_tool_execution_duration_seconds": "vm_api.rca.tool.execution.duration",
     "rca_tool_execution_errors_total": "vm_api.rca.tool.execution.errors.total",
+    "rca_tool_code_reads_total": "vm_api.rca.tool.code_reads.total",
+    "rca_tool_output_tokens_saved_total": "vm_api.rca.tool.output_tokens_saved.total",
+    "rca_tool_scratchpad_tokens_saved_total": "vm_api.rca.tool.scratchpad_tokens_saved.total",
     "auth_failures_total": "vm_api.auth.failures.total",
     "jwt_tokens_expired_total": "vm_api.auth.jwt.tokens.expired.total",
     "llm_guard_blocked_messages_total": "vm_api.security.llm_guard.blocked.total",
@@ -49,6 +54,7 @@ _SENTRY_NAME_MAP: Dict[str, str] = {
     "github_api_rate_limit_remaining": "vm_api.github.api.rate_limit.remaining",
     "github_token_refreshes_total": "vm_api.github.token.refreshes.total",
     "stripe_api_calls_total": "vm_api.stripe.api.calls.total",
+    "stripe_api_duration_seconds": "vm_api.stripe.api.duration",
     "stripe_payment_failures_total": "vm_api.stripe.payment.failures.total",
     "http_requests_total": "vm_api.http.requests.total",
     "http_request_duration_seconds": "vm_api.http.request.duration",
@@ -13,6 +13,7 @@ from fastapi import HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.auth.principal_cache import get_membership_role
 from app.deployments.schemas import (
     ApiKeyCreate,
     DeploymentCreate,
@@ -23,7 +24,6 @@ from app.models import (
     DeploymentSource,
     DeploymentStatus,
     Environment,
-    Membership,
     Role,
     Workspace,
     WorkspaceApiKey,
@@ -38,37 +38,25 @@ class DeploymentService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _get_membership(
-        self, workspace_id: str, user_id: str
-    ) -> Optional[Membership]:
-        """Get membership for user in workspace."""
-        result = await self.db.execute(
-            select(Membership).where(
-                Membership.workspace_id == workspace_id,
-                Membership.user_id == user_id,
-            )
-        )
-        return result.scalar_one_or_none()
-
-    async def _verify_membership(self, workspace_id: str, user_id: str) -> Membership:
-        """Verify user is a member of the workspace."""
-        membership = await self._get_membership(workspace_id, user_id)
-        if not membership:
+    async def _verify_membership(self, workspace_id: str, user_id: str) -> Role:
+        """Verify user is a member of the workspace and return their role."""
+        role = await get_membership_role(self.db, user_id, workspace_id)
+        if role is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not a member of this workspace",
             )
-        return membership
+        return role
 
-    async def _verify_owner(self, workspace_id: str, user_id: str) -> Membership:
+    async def _verify_owner(self, workspace_id: str, user_id: str) -> Role:
         """Verify user is an owner of the workspace."""
-        membership = await self._verify_membership(workspace_id, user_id)
-        if membership.role != Role.OWNER:
+        role = await self._verify_membership(workspace_id, user_id)
+        if role != Role.OWNER:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only workspace owners can perform this action",
             )
-        return membership
+        return role
 
     async def _get_environment(
         self, environment_id: str, workspace_id: str
@@ -0,0 +1,231 @@
+"""
+Lifecycle email campaigns run by the scheduler.
+
+Each campaign selects its recipients with a single query, renders every
+message from a cached template, sends through Postmark's batch endpoint and
+records the outcomes with one bulk Email insert per window of recipients.
+"""
+
+import logging
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, List
+
+from sqlalchemy import and_, exists, func, insert, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.email_service.service import (
+    POSTMARK_BATCH_MAX_MESSAGES,
+    email_service,
+    get_unsubscribe_url,
+)
+from app.models import Email, RefreshToken, User
+
+logger = logging.getLogger(__name__)
+
+
+def _already_sent(subject: str):
+    """EXISTS clause: the user has a successfully sent email with this subject."""
+    return exists().where(
+        Email.user_id == User.id,
+        Email.subject == subject,
+        Email.status == "sent",
+    )
+
+
+async def onboarding_reminder_recipients(db: AsyncSession) -> List[User]:
+    """
+    Not-onboarded newsletter subscribers who are due a reminder.
+
+    Due means fewer than ONBOARDING_REMINDER_MAX_EMAILS reminders sent, and
+    the last one (or the signup, for the first) is older than the interval.
+    """
+    interval_threshold = datetime.now(timezone.utc) - timedelta(
+        days=settings.ONBOARDING_REMINDER_INTERVAL_DAYS
+    )
+    sent = (
+        select(
+            Email.user_id,
+            func.count(Email.id).label("sent_count"),
+            func.max(Email.sent_at).label("last_sent_at"),
+        )
+        .where(
+            Email.subject == settings.ONBOARDING_REMINDER_EMAIL_SUBJECT,
+            Email.status == "sent",
+        )
+        .group_by(Email.user_id)
+        .subquery()
+    )
+    stmt = (
+        select(User)
+        .outerjoin(sent, sent.c.user_id == User.id)
+        .where(
+            User.is_onboarded.is_(False),
+            User.newsletter_subscribed.is_(True),
+            func.coalesce(sent.c.sent_count, 0)
+            < settings.ONBOARDING_REMINDER_MAX_EMAILS,
+            or_(
+                sent.c.last_sent_at < interval_threshold,
+                and_(
+                    sent.c.last_sent_at.is_(None), User.created_at < interval_threshold
+                ),
+            ),
+        )
+    )
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def user_help_recipients(db: AsyncSession) -> List[User]:
+    """Subscribers who signed up in the last 24 hours and haven't had the email."""
+    since = datetime.now(timezone.utc) - timedelta(hours=24)
+    stmt = select(User).where(
+        User.created_at >= since,
+        User.newsletter_subscribed.is_(True),
+        ~_already_sent(settings.USER_HELP_EMAIL_SUBJECT),
+    )
+    return list((await db.execute(stmt)).scalars().all())
+
+
+async def usage_feedback_recipients(db: AsyncSession) -> List[User]:
+    """
+    Subscribers older than 7 days who logged in again after signing up
+    (a refresh token issued more than 5 minutes after signup) and haven't
+    had the email.
+    """
+    seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
+    last_login = (
+        select(
+            RefreshToken.user_id,
+            func.max(RefreshToken.created_at).label("last_login_at"),
+        )
+        .group_by(RefreshToken.user_id)
+        .subquery()
+    )
+    stmt = (
+        select(User, last_login.c.last_login_at)
+        .join(last_login, last_login.c.user_id == User.id)
+        .where(
+            User.created_at <= seven_days_ago,
+            User.newsletter_subscribed.is_(True),
+            ~_already_sent(settings.USAGE_FEEDBACK_EMAIL_SUBJECT),
+        )
+    )
+    rows = (await db.execute(stmt)).all()
+    # Compared here rather than in SQL, where timestamp + interval isn't portable
+    return [
+        user
+        for user, last_login_at in rows
+        if last_login_at > user.created_at + timedelta(minutes=5)
+    ]
+
+
+@dataclass(frozen=True)
+class Campaign:
+    name: str
+    subject_setting: str  # Settings attribute holding the subject
+    template_name: str
+    recipients: Callable[[AsyncSession], Awaitable[List[User]]]
+    html: bool = False  # Template is the HTML body rather than the text body
+    unsubscribe_header: bool = True  # Send List-Unsubscribe headers
+
+    @property
+    def subject(self) -> str:
+        return getattr(settings, self.subject_setting)
+
+
+ONBOARDING_REMINDER = Campaign(
+    name="onboarding reminder",
+    subject_setting="ONBOARDING_REMINDER_EMAIL_SUBJECT",
+    template_name="onboarding_reminder.html",
+    recipients=onboarding_reminder_recipients,
+    html=True,
+    unsubscribe_header=False,
+)
+USER_HELP = Campaign(
+    name="user help",
+    subject_setting="USER_HELP_EMAIL_SUBJECT",
+    template_name="text_body/user_help.txt",
+    recipients=user_help_recipients,
+)
+USAGE_FEEDBACK = Campaign(
+    name="usage feedback",
+    subject_setting="USAGE_FEEDBACK_EMAIL_SUBJECT",
+    template_name="text_body/usage_feedback.txt",
+    recipients=usage_feedback_recipients,
+)
+
+
+def _build_message(campaign: Campaign, user: User) -> dict:
+    unsubscribe_url = get_unsubscribe_url(user.id)
+    body = email_service.render_email(
+        campaign.template_name,
+        sender_name=settings.PERSONAL_EMAIL_FROM_NAME,
+        unsubscribe_url=unsubscribe_url,
+    )
+    return email_service.build_message(
+        to_email=user.email,
+        subject=campaign.subject,
+        text="" if campaign.html else body,
+        html_body=body if campaign.html else None,
+        from_email=settings.PERSONAL_EMAIL_FROM_ADDRESS,
+        from_name=settings.PERSONAL_EMAIL_FROM_NAME,
+        message_stream=settings.POSTMARK_BROADCAST_STREAM,
+        unsubscribe_url=unsubscribe_url if campaign.unsubscribe_header else None,
+    )
+
+
+async def run_campaign(db: AsyncSession, campaign: Campaign) -> dict:
+    """
+    Send a campaign to all of its current recipients.
+
+    Recipients are processed in windows of EMAIL_BATCH_CONCURRENCY Postmark
+    batches; each window's outcomes are inserted and committed together, so
+    a crash mid-run doesn't resend to users already recorded as sent.
+
+    Returns:
+        dict: sent, failed and total_eligible counts
+    """
+    users = await campaign.recipients(db)
+    logger.info(f"Found {len(users)} eligible users for {campaign.name} emails")
+
+    subject = campaign.subject
+    window = POSTMARK_BATCH_MAX_MESSAGES * max(1, settings.EMAIL_BATCH_CONCURRENCY)
+    sent_count = 0
+    failed_count = 0
+
+    for start in range(0, len(users), window):
+        window_users = users[start : start + window]
+        messages = [_build_message(campaign, user) for user in window_users]
+        results = await email_service.send_email_batch(messages)
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for user, result in zip(window_users, results):
+            ok = result.get("ErrorCode") == 0
+            if ok:
+                sent_count += 1
+            else:
+                failed_count += 1
+                logger.error(
+                    f"Failed to send {campaign.name} email to user {user.id}: "
+                    f"{result.get('Message')}"
+                )
+            rows.append(
+                {
+                    "id": str(uuid.uuid4()),
+                    "user_id": user.id,
+                    "sent_at": now,
+                    "subject": subject,
+                    "message_id": result.get("MessageID") if ok else None,
+                    "status": "sent" if ok else "failed",
+                }
+            )
+        await db.execute(insert(Email), rows)
+        await db.commit()
+
+    logger.info(
+        f"{campaign.name.capitalize()} job complete: sent={sent_count}, failed={failed_count}"
+    )
+    return {"sent": sent_count, "failed": failed_count, "total_eligible": len(users)}
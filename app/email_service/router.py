@@ -3,24 +3,29 @@ Email API routes.
 """
 
 import logging
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import HTMLResponse
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.google.service import AuthService
 from app.core.config import settings
 from app.core.database import get_db
+from app.email_service.campaigns import (
+    ONBOARDING_REMINDER,
+    USAGE_FEEDBACK,
+    USER_HELP,
+    run_campaign,
+)
 from app.email_service.schemas import ContactFormRequest, EmailResponse
 from app.email_service.service import (
     decode_unsubscribe_token,
     email_service,
     verify_scheduler_token,
 )
-from app.models import Email, RefreshToken, User
+from app.models import User
 
 logger = logging.getLogger(__name__)
 auth_service = AuthService()
@@ -84,90 +89,12 @@ async def send_onboarding_reminder_emails(
     """
     try:
         logger.info("Starting onboarding reminder email job")
-
-        # Subject for onboarding reminder emails (must match exactly with service.py)
-        onboarding_email_subject = settings.ONBOARDING_REMINDER_EMAIL_SUBJECT
-
-        # Calculate interval threshold
-        interval_threshold = datetime.now(timezone.utc) - timedelta(
-            days=settings.ONBOARDING_REMINDER_INTERVAL_DAYS
-        )
-
-        # Get all users who are not onboarded and subscribed to newsletter
-        users_result = await db.execute(
-            select(User).where(
-                User.is_onboarded.is_(False),
-                User.newsletter_subscribed.is_(True),
-            )
-        )
-        not_onboarded_users = users_result.scalars().all()
-
-        eligible_users = []
-
-        for user in not_onboarded_users:
-            # Count how many SUCCESSFULLY sent onboarding reminder emails this user has received
-            email_count_result = await db.execute(
-                select(func.count(Email.id))
-                .where(Email.user_id == user.id)
-                .where(Email.subject == onboarding_email_subject)
-                .where(Email.status == "sent")  # Only count successful emails
-            )
-            email_count = email_count_result.scalar()
-
-            if email_count >= settings.ONBOARDING_REMINDER_MAX_EMAILS:
-                # User already received max emails, skip
-                continue
-
-            # Get last SUCCESSFULLY sent onboarding reminder email to this user
-            last_email_result = await db.execute(
-                select(Email)
-                .where(Email.user_id == user.id)
-                .where(Email.subject == onboarding_email_subject)
-                .where(Email.status == "sent")  # Only check successful emails
-                .order_by(Email.sent_at.desc())
-                .limit(1)
-            )
-            last_email = last_email_result.scalar_one_or_none()
-
-            # Determine if user is eligible
-            if last_email:
-                # User has received email before, check if interval has passed
-                if last_email.sent_at < interval_threshold:
-                    eligible_users.append(user)
-            else:
-                # User never received this email, check if account is older than interval
-                if user.created_at < interval_threshold:
-                    eligible_users.append(user)
-
-        logger.info(
-            f"Found {len(eligible_users)} eligible users out of {len(not_onboarded_users)} not onboarded"
-        )
-
-        # Send emails to eligible users
-        sent_count = 0
-        failed_count = 0
-
-        for user in eligible_users:
-            try:
-                await email_service.send_onboarding_reminder_email(
-                    user_id=user.id,
-                    db=db,
-                )
-                sent_count += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to send onboarding reminder email to user {user.id}: {str(e)}"
-                )
-                failed_count += 1
-
-        logger.info(f"Onboarding reminder job complete: sent={sent_count}, failed={failed_count}")
+        result = await run_campaign(db, ONBOARDING_REMINDER)
 
         return {
             "success": True,
             "message": "Onboarding reminder emails processed",
-            "sent": sent_count,
-            "failed": failed_count,
-            "total_eligible": len(eligible_users),
+            **result,
         }
 
     except Exception as e:
@@ -222,6 +149,7 @@ async def send_user_help_emails(
     Send help/onboarding emails to users who signed up in the last 24 hours.
 
     Eligibility criteria:
+    - User has newsletter_subscribed = True
     - User signed up within the last 24 hours
     - User has NOT already received this email
 
@@ -229,50 +157,12 @@ async def send_user_help_emails(
         Summary of emails sent
     """
     try:
-        twenty_four_hours_ago = datetime.now(timezone.utc) - timedelta(hours=24)
-
-        users_result = await db.execute(
-            select(User).where(User.created_at >= twenty_four_hours_ago)
-        )
-        new_users = users_result.scalars().all()
-
-        eligible_users = []
-
-        for user in new_users:
-            existing_email = await db.execute(
-                select(Email)
-                .where(Email.user_id == user.id)
-                .where(Email.subject == settings.USER_HELP_EMAIL_SUBJECT)
-                .where(Email.status == "sent")
-                .limit(1)
-            )
-            already_sent = existing_email.scalar_one_or_none() is not None
-
-            if not already_sent:
-                eligible_users.append(user)
-
-        sent_count = 0
-        failed_count = 0
-
-        for user in eligible_users:
-            try:
-                await email_service.send_user_help_email(
-                    user_id=user.id,
-                    db=db,
-                )
-                sent_count += 1
-            except Exception as e:
-                logger.error(
-                    f"Failed to send user help email to user {user.id}: {str(e)}"
-                )
-                failed_count += 1
+        result = await run_campaign(db, USER_HELP)
 
         return {
             "success": True,
             "message": "User help emails processed",
-            "sent": sent_count,
-            "failed": failed_count,
-            "total_eligible": len(eligible_users),
+            **result,
         }
 
     except Exception as e:
@@ -292,6 +182,7 @@ async def send_usage_feedback_emails(
     Send usage feedback emails to active users.
 
     Eligibility criteria:
+    - User has newsletter_subscribed = True
     - User signed up more than 7 days ago
     - User has logged in at least once after signup (has refresh token created after signup)
     - User has NOT already received this email (one-time only)
@@ -300,58 +191,12 @@ async def send_usage_feedback_emails(
         Summary of emails sent
     """
     try:
-        seven_days_ago = datetime.now(timezone.utc) - timedelta(days=7)
-
-        users_result = await db.execute(
-            select(User).where(User.created_at <= seven_days_ago)
-        )
-        users_7_days_old = users_result.scalars().all()
-
-        eligible_users = []
-
-        for user in users_7_days_old:
-            # Check if already received this email
-            already_sent_result = await db.execute(
-                select(Email)
-                .where(Email.user_id == user.id)
-                .where(Email.subject == settings.USAGE_FEEDBACK_EMAIL_SUBJECT)
-                .where(Email.status == "sent")
-                .limit(1)
-            )
-            if already_sent_result.scalar_one_or_none() is not None:
-                continue
-
-            # Check if user has logged in after signup (refresh token created > 5 min after signup)
-            login_after_signup = await db.execute(
-                select(RefreshToken)
-                .where(RefreshToken.user_id == user.id)
-                .where(RefreshToken.created_at > user.created_at + timedelta(minutes=5))
-                .limit(1)
-            )
-            if login_after_signup.scalar_one_or_none() is None:
-                continue
-
-            eligible_users.append(user)
-
-        sent_count = 0
-        failed_count = 0
-
-        for user in eligible_users:
-            try:
-                await email_service.send_usage_feedback_email(
-                    user_id=user.id,
-                    db=db,
-                )
-                sent_count += 1
-            except Exception:
-                failed_count += 1
+        result = await run_campaign(db, USAGE_FEEDBACK)
 
         return {
             "success": True,
             "message": "Usage feedback emails processed",
-            "sent": sent_count,
-            "failed": failed_count,
-            "total_eligible": len(eligible_users),
+            **result,
         }
 
     except Exception as e:
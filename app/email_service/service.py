@@ -2,6 +2,8 @@
 Email service for sending emails via Postmark.
 """
 
+import asyncio
+import functools
 import html
 import jwt
 import logging
@@ -16,15 +18,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models import Email, User
-from app.utils.retry_decorator import retry_external_api
+from app.utils.retry_decorator import retry_external_api, retry_unsent_request
 
 logger = logging.getLogger(__name__)
 
 # Get the templates directory path
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
-# Postmark API endpoint
+# Postmark API endpoints
 POSTMARK_API_URL = "https://api.postmarkapp.com/email"
+POSTMARK_BATCH_API_URL = "https://api.postmarkapp.com/email/batch"
+POSTMARK_BATCH_MAX_MESSAGES = 500  # Postmark's per-request limit for /email/batch
 
 
 def verify_scheduler_token(x_scheduler_token: str = Header(...)):
@@ -110,6 +114,17 @@ def get_unsubscribe_url(user_id: str) -> str:
     return f"{settings.API_BASE_URL}/email-service/unsubscribe/{token}"
 
 
+@functools.lru_cache(maxsize=None)
+def _read_template(template_name: str) -> str:
+    """Read a template once per process; templates ship with the code."""
+    template_path = TEMPLATES_DIR / template_name
+    if not template_path.exists():
+        raise FileNotFoundError(f"Template {template_name} not found")
+
+    with open(template_path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
 class EmailService:
     """Service for sending emails via Postmark API"""
 
@@ -150,6 +165,56 @@ class EmailService:
         if not self.server_token:
             raise ValueError("Postmark server token must be configured")
 
+        payload = self.build_message(
+            to_email=to_email,
+            subject=subject,
+            text=text,
+            html_body=html_body,
+            from_email=from_email,
+            from_name=from_name,
+            message_stream=message_stream,
+            unsubscribe_url=unsubscribe_url,
+        )
+
+        logger.info(f"Sending email - Subject: {payload.get('Subject', 'N/A')}")
+
+        try:
+            async with httpx.AsyncClient() as client:
+                async for attempt in retry_external_api("Postmark"):
+                    with attempt:
+                        response = await client.post(
+                            POSTMARK_API_URL,
+                            json=payload,
+                            headers=self._postmark_headers(),
+                            timeout=10.0,
+                        )
+                        response.raise_for_status()
+                        result = response.json()
+                        # Postmark returns MessageID in the response
+                        return {"id": result.get("MessageID"), **result}
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to send email via Postmark: {str(e)}")
+            logger.error(f"Request details - Subject: {payload.get('Subject', 'N/A')}")
+            logger.error(
+                f"Response status: {e.response.status_code if hasattr(e, 'response') else 'N/A'}"
+            )
+            logger.error(
+                f"Response body: {e.response.text if hasattr(e, 'response') else 'N/A'}"
+            )
+            raise
+
+    def build_message(
+        self,
+        to_email: str,
+        subject: str,
+        text: str,
+        html_body: str = None,
+        from_email: str = None,
+        from_name: str = None,
+        message_stream: str = "outbound",
+        unsubscribe_url: str = None,
+    ) -> dict:
+        """Build a Postmark message payload (see send_email for the arguments)."""
         # Use custom from address if provided, otherwise use company default
         if from_email:
             if from_name:
@@ -187,38 +252,63 @@ class EmailService:
                 },
             ]
 
-        headers = {
+        return payload
+
+    def _postmark_headers(self) -> dict:
+        return {
             "Accept": "application/json",
             "Content-Type": "application/json",
             "X-Postmark-Server-Token": self.server_token,
         }
 
-        logger.info(f"Sending email - Subject: {payload.get('Subject', 'N/A')}")
+    async def send_email_batch(self, messages: list[dict]) -> list[dict]:
+        """
+        Send messages built by build_message through Postmark's batch endpoint.
 
-        try:
-            async with httpx.AsyncClient() as client:
-                async for attempt in retry_external_api("Postmark"):
-                    with attempt:
-                        response = await client.post(
-                            POSTMARK_API_URL,
-                            json=payload,
-                            headers=headers,
-                            timeout=10.0,
+        Messages go out in chunks of POSTMARK_BATCH_MAX_MESSAGES, at most
+        EMAIL_BATCH_CONCURRENCY chunks in flight, over one pooled client.
+        A chunk that fails as a whole yields a failed result per message.
+
+        Args:
+            messages: Postmark message payloads
+
+        Returns:
+            list[dict]: One Postmark result per message, in order
+                (ErrorCode 0 and a MessageID on success)
+        """
+        if not self.server_token:
+            raise ValueError("Postmark server token must be configured")
+
+        chunks = [
+            messages[i : i + POSTMARK_BATCH_MAX_MESSAGES]
+            for i in range(0, len(messages), POSTMARK_BATCH_MAX_MESSAGES)
+        ]
+        semaphore = asyncio.Semaphore(max(1, settings.EMAIL_BATCH_CONCURRENCY))
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+
+            async def send_chunk(chunk: list[dict]) -> list[dict]:
+                async with semaphore:
+                    try:
+                        # A resent batch would deliver every message twice
+                        async for attempt in retry_unsent_request("Postmark"):
+                            with attempt:
+                                response = await client.post(
+                                    POSTMARK_BATCH_API_URL,
+                                    json=chunk,
+                                    headers=self._postmark_headers(),
+                                )
+                                response.raise_for_status()
+                                return response.json()
+                    except httpx.HTTPError as e:
+                        logger.error(
+                            f"Failed to send batch of {len(chunk)} emails via Postmark: {e}"
                         )
-                        response.raise_for_status()
-                        result = response.json()
-                        # Postmark returns MessageID in the response
-                        return {"id": result.get("MessageID"), **result}
-        except httpx.HTTPError as e:
-            logger.error(f"Failed to send email via Postmark: {str(e)}")
-            logger.error(f"Request details - Subject: {payload.get('Subject', 'N/A')}")
-            logger.error(
-                f"Response status: {e.response.status_code if hasattr(e, 'response') else 'N/A'}"
-            )
-            logger.error(
-                f"Response body: {e.response.text if hasattr(e, 'response') else 'N/A'}"
-            )
-            raise
+                        return [{"ErrorCode": -1, "Message": str(e)} for _ in chunk]
+
+            results = await asyncio.gather(*(send_chunk(chunk) for chunk in chunks))
+
+        return [result for chunk_results in results for result in chunk_results]
 
     def _load_template(self, template_name: str) -> str:
         """
@@ -230,12 +320,7 @@ class EmailService:
         Returns:
             str: Template content
         """
-        template_path = TEMPLATES_DIR / template_name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Template {template_name} not found")
-
-        with open(template_path, "r", encoding="utf-8") as f:
-            return f.read()
+        return _read_template(template_name)
 
     def _render_template(self, template: str, **kwargs) -> str:
         """
@@ -256,6 +341,19 @@ class EmailService:
             rendered = rendered.replace(f"{{{{{key}}}}}", escaped_value)
         return rendered
 
+    def render_email(self, template_name: str, **kwargs) -> str:
+        """
+        Load a template and render it with the given (HTML-escaped) variables.
+
+        Args:
+            template_name: Name of the template file (e.g., 'user_help.txt')
+            **kwargs: Variables to replace in the template
+
+        Returns:
+            str: Rendered template
+        """
+        return self._render_template(self._load_template(template_name), **kwargs)
+
     async def send_welcome_email(self, user_id: str, db: AsyncSession) -> dict:
         """
         Send a personalized welcome email to a new user.
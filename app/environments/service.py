@@ -4,7 +4,7 @@ Service layer for environments operations.
 
 import logging
 import uuid
-from typing import List, Optional
+from typing import List
 
 from fastapi import HTTPException, status
 from sqlalchemy import select
@@ -18,7 +18,8 @@ from app.environments.schemas import (
     EnvironmentRepositoryUpdate,
     EnvironmentUpdate,
 )
-from app.models import Environment, EnvironmentRepository, Membership, Role
+from app.auth.principal_cache import get_membership_role
+from app.models import Environment, EnvironmentRepository, Role
 
 logger = logging.getLogger(__name__)
 
@@ -29,37 +30,25 @@ class EnvironmentService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def _get_membership(
-        self, workspace_id: str, user_id: str
-    ) -> Optional[Membership]:
-        """Get membership for user in workspace."""
-        result = await self.db.execute(
-            select(Membership).where(
-                Membership.workspace_id == workspace_id,
-                Membership.user_id == user_id,
-            )
-        )
-        return result.scalar_one_or_none()
-
-    async def _verify_membership(self, workspace_id: str, user_id: str) -> Membership:
-        """Verify user is a member of the workspace."""
-        membership = await self._get_membership(workspace_id, user_id)
-        if not membership:
+    async def _verify_membership(self, workspace_id: str, user_id: str) -> Role:
+        """Verify user is a member of the workspace and return their role."""
+        role = await get_membership_role(self.db, user_id, workspace_id)
+        if role is None:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not a member of this workspace",
             )
-        return membership
+        return role
 
-    async def _verify_owner(self, workspace_id: str, user_id: str) -> Membership:
+    async def _verify_owner(self, workspace_id: str, user_id: str) -> Role:
         """Verify user is an owner of the workspace."""
-        membership = await self._verify_membership(workspace_id, user_id)
-        if membership.role != Role.OWNER:
+        role = await self._verify_membership(workspace_id, user_id)
+        if role != Role.OWNER:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Only workspace owners can perform this action",
             )
-        return membership
+        return role
 
     async def _get_environment_with_workspace_check(
         self, environment_id: str, user_id: str, require_owner: bool = False
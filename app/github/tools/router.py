@@ -209,6 +209,7 @@ async def read_repository_file(
         object(expression: $expression) {
           __typename
           ... on Blob {
+            oid
             byteSize
             text
           }
@@ -247,6 +248,7 @@ async def read_repository_file(
         "expression": expression,
         "byte_size": object_data.get("byteSize"),
         "content": object_data.get("text"),
+        "sha": object_data.get("oid"),
     }
 
 
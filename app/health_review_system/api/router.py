@@ -13,8 +13,9 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import desc, func, select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from app.auth.google.service import AuthService
 from app.core.database import get_db
@@ -253,18 +254,6 @@ async def list_reviews(
     # Build response
     summaries = []
     for review in reviews:
-        # Get gap counts
-        logging_gaps_count = await db.scalar(
-            select(func.count())
-            .select_from(ReviewLoggingGap)
-            .where(ReviewLoggingGap.review_id == review.id)
-        )
-        metrics_gaps_count = await db.scalar(
-            select(func.count())
-            .select_from(ReviewMetricsGap)
-            .where(ReviewMetricsGap.review_id == review.id)
-        )
-
         summaries.append(
             ReviewSummary(
                 id=review.id,
@@ -276,8 +265,8 @@ async def list_reviews(
                 review_week_end=review.review_week_end,
                 generated_at=review.generated_at,
                 error_count_analyzed=review.error_count_analyzed,
-                logging_gaps_count=logging_gaps_count,
-                metrics_gaps_count=metrics_gaps_count,
+                logging_gaps_count=review.logging_gaps_count,
+                metrics_gaps_count=review.metrics_gaps_count,
             )
         )
 
@@ -313,24 +302,6 @@ async def get_review(
 
     service = await db.get(Service, review.service_id)
 
-    # Get counts
-
-    logging_gaps_count = await db.scalar(
-        select(func.count())
-        .select_from(ReviewLoggingGap)
-        .where(ReviewLoggingGap.review_id == review_id)
-    )
-    metrics_gaps_count = await db.scalar(
-        select(func.count())
-        .select_from(ReviewMetricsGap)
-        .where(ReviewMetricsGap.review_id == review_id)
-    )
-    slis_count = await db.scalar(
-        select(func.count())
-        .select_from(ReviewSLI)
-        .where(ReviewSLI.review_id == review_id)
-    )
-
     # Build base response
     response = ReviewDetail(
         id=review.id,
@@ -350,9 +321,9 @@ async def get_review(
         log_volume_analyzed=review.log_volume_analyzed,
         metric_count_analyzed=review.metric_count_analyzed,
         errors_count=review.error_count_analyzed or 0,
-        logging_gaps_count=logging_gaps_count,
-        metrics_gaps_count=metrics_gaps_count,
-        slis_count=slis_count,
+        logging_gaps_count=review.logging_gaps_count,
+        metrics_gaps_count=review.metrics_gaps_count,
+        slis_count=review.slis_count,
     )
 
     # Include child records if requested
@@ -931,90 +902,63 @@ async def get_workspace_reviews(
     Returns:
         WorkspaceReviewsResponse with reviews for all services in the workspace
     """
-    # Fetch all services for the workspace
-    services_stmt = select(Service).where(Service.workspace_id == workspace_id)
-    services_result = await db.execute(services_stmt)
-    services = services_result.scalars().all()
-
-    if not services:
-        return WorkspaceReviewsResponse(
-            workspace_id=workspace_id,
-            total_services=0,
-            services_with_reviews=0,
-            reviews=[],
+    # Latest review per service, ranked in the database so only one row per
+    # service comes back. Gap and SLI counts are stored on the review.
+    ranked = (
+        select(
+            ServiceReview,
+            func.row_number()
+            .over(
+                partition_by=ServiceReview.service_id,
+                order_by=(
+                    ServiceReview.review_week_end.desc(),
+                    ServiceReview.created_at.desc(),
+                ),
+            )
+            .label("rn"),
         )
-
-    # Build a map of service_id -> service for quick lookup
-    service_map = {service.id: service for service in services}
-    service_ids = list(service_map.keys())
-
-    # Get the latest review for each service (subquery for most recent per service)
-    # Using a window function approach to get the latest review per service
-    # Fetch latest reviews for each service
-    reviews_stmt = (
-        select(ServiceReview)
-        .where(ServiceReview.service_id.in_(service_ids))
-        .order_by(ServiceReview.service_id, desc(ServiceReview.review_week_end))
+        .join(Service, Service.id == ServiceReview.service_id)
+        .where(Service.workspace_id == workspace_id)
+        .subquery()
     )
-    reviews_result = await db.execute(reviews_stmt)
-    all_reviews = reviews_result.scalars().all()
-
-    # Group reviews by service and take the latest
-    service_reviews = {}
-    for review in all_reviews:
-        if review.service_id not in service_reviews:
-            service_reviews[review.service_id] = review
-
-    # Build response with gap counts
-    review_summaries = []
-    for service_id, review in service_reviews.items():
-        service = service_map.get(service_id)
-        if not service:
-            continue
+    latest_review = aliased(ServiceReview, ranked)
 
-        # Get gap counts
-        logging_gaps_count = await db.scalar(
-            select(func.count())
-            .select_from(ReviewLoggingGap)
-            .where(ReviewLoggingGap.review_id == review.id)
-        )
-        metrics_gaps_count = await db.scalar(
-            select(func.count())
-            .select_from(ReviewMetricsGap)
-            .where(ReviewMetricsGap.review_id == review.id)
-        )
-        slis_count = await db.scalar(
-            select(func.count())
-            .select_from(ReviewSLI)
-            .where(ReviewSLI.review_id == review.id)
+    stmt = (
+        select(Service.name, latest_review)
+        .outerjoin(
+            latest_review,
+            (latest_review.service_id == Service.id) & (ranked.c.rn == 1),
         )
-
-        review_summaries.append(
-            ServiceReviewSummary(
-                id=review.id,
-                service_id=review.service_id,
-                service_name=service.name,
-                status=review.status.value,
-                overall_health_score=review.overall_health_score,
-                summary=review.summary,
-                review_week_start=review.review_week_start,
-                review_week_end=review.review_week_end,
-                generated_at=review.generated_at,
-                triggered_by=review.triggered_by.value if review.triggered_by else None,
-                error_count_analyzed=review.error_count_analyzed,
-                logging_gaps_count=logging_gaps_count or 0,
-                metrics_gaps_count=metrics_gaps_count or 0,
-                slis_count=slis_count or 0,
-            )
+        .where(Service.workspace_id == workspace_id)
+        .order_by(Service.name)
+    )
+    rows = (await db.execute(stmt)).all()
+
+    review_summaries = [
+        ServiceReviewSummary(
+            id=review.id,
+            service_id=review.service_id,
+            service_name=service_name,
+            status=review.status.value,
+            overall_health_score=review.overall_health_score,
+            summary=review.summary,
+            review_week_start=review.review_week_start,
+            review_week_end=review.review_week_end,
+            generated_at=review.generated_at,
+            triggered_by=review.triggered_by.value if review.triggered_by else None,
+            error_count_analyzed=review.error_count_analyzed,
+            logging_gaps_count=review.logging_gaps_count,
+            metrics_gaps_count=review.metrics_gaps_count,
+            slis_count=review.slis_count,
         )
-
-    # Sort by service name for consistent ordering
-    review_summaries.sort(key=lambda r: r.service_name)
+        for service_name, review in rows
+        if review is not None
+    ]
 
     return WorkspaceReviewsResponse(
         workspace_id=workspace_id,
-        total_services=len(services),
-        services_with_reviews=len(service_reviews),
+        total_services=len(rows),
+        services_with_reviews=len(review_summaries),
         reviews=review_summaries,
     )
 
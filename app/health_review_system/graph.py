@@ -1,8 +1,8 @@
 """
 LangGraph-based health review pipeline.
 
-Progressive verification with per-file extraction loop:
-- Full review: extract → rules → identify_config_files → [extract_single_file loop] → build_context → sample_verify → filter → enrich → score
+Progressive verification with parallel per-file extraction:
+- Full review: extract → rules → identify_config_files → extract_config_files (map) → build_context → sample_verify → filter → enrich → score
 - Incremental (infra unchanged): extract → rules → context_filter → enrich → score
 - No gaps: extract → rules → enrich → score
 """
@@ -26,6 +26,7 @@ from app.health_review_system.rule_engine import RuleEngineService
 from app.health_review_system.rule_engine.schemas import RuleEngineResult
 from app.health_review_system.verification import (
     GapVerdict,
+    VerdictCache,
     VerificationService,
 )
 from app.health_review_system.llm_budget import LLMBudgetCallback, LLMBudgetExceeded
@@ -82,9 +83,8 @@ class HealthReviewState(TypedDict, total=False):
     repo_tree: List[dict]  # [{"file_path", "language", "line_count"}]
     candidate_config_files: List[str]  # File paths identified by LLM
 
-    # Node 2: Per-file extraction loop
-    current_file_index: int  # Tracks which file we're processing
-    file_extractions: List[dict]  # Accumulated extractions from all processed files
+    # Node 2: Per-file extraction (map over candidate files)
+    file_extractions: List[dict]  # Merged extractions from all candidate files
 
     # Node 3: Verification
     codebase_context: Optional[CodebaseContextSchema]
@@ -236,22 +236,22 @@ async def identify_config_files_node(state: HealthReviewState, config: RunnableC
     return {
         "repo_tree": tree,
         "candidate_config_files": candidate_files,
-        "current_file_index": 0,
-        "file_extractions": [],
     }
 
 
 # ---------------------------------------------------------------------------
-# Node 2a: Extract From Single File (processes one file per invocation)
+# Node 2a: Extract From Candidate Files (map over all files, bounded concurrency)
 # ---------------------------------------------------------------------------
 
 
-async def extract_single_file_node(state: HealthReviewState, config: RunnableConfig = None) -> dict:
-    """Node 2a: Read and extract instrumentation from ONE file.
+async def extract_config_files_node(
+    state: HealthReviewState, config: RunnableConfig = None
+) -> dict:
+    """Node 2a: Read and extract instrumentation from all candidate files.
 
-    Called in a loop by the graph. Reads the file at current_file_index,
-    extracts instrumentation patterns via LLM, appends results to
-    file_extractions, and increments the index.
+    Runs one LLM call per file concurrently, capped at
+    HEALTH_REVIEW_EXTRACTION_CONCURRENCY calls in flight, and merges the
+    results. Raises if the LLM budget is exhausted.
     """
     from app.health_review_system.llm_analyzer.providers import get_default_provider
 
@@ -259,14 +259,9 @@ async def extract_single_file_node(state: HealthReviewState, config: RunnableCon
     repository_id = state["repository_id"]
     rule_result: RuleEngineResult = state["rule_result"]
     candidate_files = state.get("candidate_config_files", [])
-    current_index = state.get("current_file_index", 0)
-    existing_extractions = state.get("file_extractions", [])
 
-    if current_index >= len(candidate_files):
-        logger.warning("[extract_single_file] Index out of bounds, skipping")
-        return {"current_file_index": current_index}
-
-    file_path = candidate_files[current_index]
+    if not candidate_files:
+        return {"file_extractions": []}
 
     gap_rule_ids = list({
         g.rule_id
@@ -281,26 +276,18 @@ async def extract_single_file_node(state: HealthReviewState, config: RunnableCon
     service = VerificationService(llm=llm, db=db, repository_id=repository_id)
 
     logger.info(
-        f"[extract_single_file] Processing file {current_index + 1}/{len(candidate_files)}: {file_path}"
+        f"[extract_config_files] Processing {len(candidate_files)} files "
+        f"(concurrency={settings.HEALTH_REVIEW_EXTRACTION_CONCURRENCY})"
     )
 
-    extractions = await service.extract_from_single_file(
-        file_path=file_path,
+    extractions = await service.extract_from_files(
+        file_paths=candidate_files,
         gap_rule_ids=gap_rule_ids,
         callbacks=callbacks,
+        budget=budget,
+        max_concurrency=settings.HEALTH_REVIEW_EXTRACTION_CONCURRENCY,
     )
 
-    # Accumulate and advance index
-    updated_extractions = existing_extractions + extractions
-    return {
-        "current_file_index": current_index + 1,
-        "file_extractions": updated_extractions,
-    }
-
-
-def route_after_file_extraction(state: HealthReviewState) -> str:
-    """Check if more files remain to process. Raises if LLM budget exhausted."""
-    budget = state.get("llm_budget")
     if budget and budget.is_exhausted:
         raise LLMBudgetExceeded(
             f"LLM budget exhausted during file extraction: "
@@ -308,12 +295,7 @@ def route_after_file_extraction(state: HealthReviewState) -> str:
             f"{budget.total_tokens_used}/{budget.max_tokens} tokens"
         )
 
-    candidate_files = state.get("candidate_config_files", [])
-    current_index = state.get("current_file_index", 0)
-
-    if current_index < len(candidate_files):
-        return "extract_next"
-    return "build_context"
+    return {"file_extractions": extractions}
 
 
 # ---------------------------------------------------------------------------
@@ -324,7 +306,7 @@ def route_after_file_extraction(state: HealthReviewState) -> str:
 async def build_codebase_context_node(state: HealthReviewState) -> dict:
     """Node 2b: Combine all per-file extractions into a CodebaseContext.
 
-    Called once after the file extraction loop completes. Builds the final
+    Called once after file extraction completes. Builds the final
     CodebaseContext and saves it to DB for future incremental reviews.
     """
     file_extractions = state.get("file_extractions", [])
@@ -385,10 +367,20 @@ async def sample_verify_gaps_node(state: HealthReviewState, config: RunnableConf
     llm = provider.get_llm()
     service = VerificationService(llm=llm, db=db, repository_id=repository_id)
 
+    verdict_cache = None
+    if settings.HEALTH_REVIEW_VERDICT_CACHE_ENABLED:
+        verdict_cache = VerdictCache(
+            db=db,
+            workspace_id=state["workspace_id"],
+            repo_full_name=state["repo_full_name"],
+            repository_id=repository_id,
+        )
+
     verification_results = await service.verify_gaps(
         raw_gaps=all_gaps,
         codebase_context=codebase_context,
         callbacks=callbacks,
+        verdict_cache=verdict_cache,
     )
 
     logger.info(
@@ -629,7 +621,7 @@ def create_health_review_graph():
     graph.add_node("run_rules", run_rules_node)
     graph.add_node("load_previous_context", load_previous_context_node)
     graph.add_node("identify_config_files", identify_config_files_node)
-    graph.add_node("extract_single_file", extract_single_file_node)
+    graph.add_node("extract_config_files", extract_config_files_node)
     graph.add_node("build_codebase_context", build_codebase_context_node)
     graph.add_node("sample_verify_gaps", sample_verify_gaps_node)
     graph.add_node("filter_gaps", filter_gaps_node)
@@ -653,19 +645,9 @@ def create_health_review_graph():
         },
     )
 
-    # Full verification path: identify → [loop: extract one file at a time] → build context → verify → filter → enrich
-    graph.add_edge("identify_config_files", "extract_single_file")
-
-    # File extraction loop: process one file, check if more remain
-    graph.add_conditional_edges(
-        "extract_single_file",
-        route_after_file_extraction,
-        {
-            "extract_next": "extract_single_file",   # loop back for next file
-            "build_context": "build_codebase_context",  # done, build context
-        },
-    )
-
+    # Full verification path: identify → extract all files (parallel) → build context → verify → filter → enrich
+    graph.add_edge("identify_config_files", "extract_config_files")
+    graph.add_edge("extract_config_files", "build_codebase_context")
     graph.add_edge("build_codebase_context", "sample_verify_gaps")
     graph.add_edge("sample_verify_gaps", "filter_gaps")
     graph.add_edge("filter_gaps", "enrich")
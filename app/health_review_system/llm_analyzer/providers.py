@@ -6,15 +6,17 @@ Supports multiple LLM backends via a provider pattern.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_groq import ChatGroq
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.core.config import settings
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 logger = logging.getLogger(__name__)
 
 
@@ -115,11 +117,13 @@ class GeminiProvider(BaseLLMProvider):
         self.model = model or settings.GEMINI_LLM_MODEL
         if not self.model:
             raise ValueError("GEMINI_LLM_MODEL not configured. Please set it in environment variables.")
-        self._llm: Optional[ChatGoogleGenerativeAI] = None
+        self._llm: Optional["ChatGoogleGenerativeAI"] = None
 
-    def get_llm(self) -> ChatGoogleGenerativeAI:
+    def get_llm(self) -> "ChatGoogleGenerativeAI":
         """Get or create the Gemini LLM instance."""
         if self._llm is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             if not settings.GEMINI_API_KEY:
                 raise ValueError(
                     "GEMINI_API_KEY not configured. Please set it in environment variables."
@@ -37,6 +37,7 @@ from app.health_review_system.rule_engine.schemas import RuleEngineResult
 from app.health_review_system.sli_indicator import SLIIndicatorService
 from app.health_review_system.verification import (
     GapVerdict,
+    VerdictCache,
     VerificationService,
 )
 from app.health_review_system.verification.schemas import CodebaseContext as CodebaseContextSchema
@@ -507,10 +508,20 @@ class ReviewOrchestrator:
         )
 
         # Phase C: Verify gaps against discovered infrastructure
+        verdict_cache = None
+        if settings.HEALTH_REVIEW_VERDICT_CACHE_ENABLED:
+            verdict_cache = VerdictCache(
+                db=self.db,
+                workspace_id=workspace_id,
+                repo_full_name=repo_full_name,
+                repository_id=repository_id,
+            )
+
         verification_results = await verification_service.verify_gaps(
             raw_gaps=all_gaps,
             codebase_context=codebase_context,
             callbacks=callbacks,
+            verdict_cache=verdict_cache,
         )
 
         # Filter out false alarm gaps
@@ -655,6 +666,9 @@ class ReviewOrchestrator:
         review.error_count_analyzed = len(collected_data.errors)
         review.log_volume_analyzed = collected_data.log_count
         review.metric_count_analyzed = collected_data.metric_count
+        review.logging_gaps_count = len(analysis_result.logging_gaps)
+        review.metrics_gaps_count = len(analysis_result.metrics_gaps)
+        review.slis_count = len(sli_result.slis)
 
         # Errors from mock AnalysisResult
         for error in analysis_result.analyzed_errors:
@@ -754,6 +768,9 @@ class ReviewOrchestrator:
         review.error_count_analyzed = len(collected_data.errors)
         review.log_volume_analyzed = collected_data.log_count
         review.metric_count_analyzed = collected_data.metric_count
+        review.logging_gaps_count = len(rule_result.logging_gaps)
+        review.metrics_gaps_count = len(rule_result.metrics_gaps)
+        review.slis_count = len(sli_result.slis)
 
         # Errors from collected data
         for error in collected_data.errors:
@@ -6,13 +6,15 @@ Runs as a background task in the worker, checking hourly for due reviews.
 """
 
 import logging
+import random
 import uuid
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List
+from typing import Dict, List, Set
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
 from app.models import (
     ReviewSchedule,
@@ -21,7 +23,7 @@ from app.models import (
     Service,
     ServiceReview,
 )
-from app.workers.health_review_worker import publish_health_review_job
+from app.workers.health_review_worker import publish_health_review_jobs
 
 logger = logging.getLogger(__name__)
 
@@ -55,23 +57,18 @@ class HealthReviewScheduler:
 
             logger.info(f"Health Review Scheduler: Found {len(due_schedules)} due reviews")
 
-            # Group by workspace for efficient processing
-            workspace_schedules: Dict[str, List[ReviewSchedule]] = {}
-            for schedule in due_schedules:
-                if schedule.workspace_id not in workspace_schedules:
-                    workspace_schedules[schedule.workspace_id] = []
-                workspace_schedules[schedule.workspace_id].append(schedule)
-
-            # Process each workspace
+            # Process in batches: set-based loads, one bulk insert and
+            # batched SQS sends per batch, committed batch by batch
             results = {"triggered": 0, "failed": 0, "skipped": 0}
+            batch_size = max(1, settings.HEALTH_REVIEW_SCHEDULER_BATCH_SIZE)
 
-            for workspace_id, schedules in workspace_schedules.items():
-                workspace_results = await self._trigger_workspace_reviews(
-                    db, workspace_id, schedules
+            for i in range(0, len(due_schedules), batch_size):
+                batch_results = await self._trigger_due_reviews(
+                    db, due_schedules[i : i + batch_size]
                 )
-                results["triggered"] += workspace_results["triggered"]
-                results["failed"] += workspace_results["failed"]
-                results["skipped"] += workspace_results["skipped"]
+                results["triggered"] += batch_results["triggered"]
+                results["failed"] += batch_results["failed"]
+                results["skipped"] += batch_results["skipped"]
 
             logger.info(
                 f"Health Review Scheduler: Completed - "
@@ -95,22 +92,25 @@ class HealthReviewScheduler:
         result = await db.execute(stmt)
         return list(result.scalars().all())
 
-    async def _trigger_workspace_reviews(
+    async def _trigger_due_reviews(
         self,
         db: AsyncSession,
-        workspace_id: str,
         schedules: List[ReviewSchedule],
     ) -> Dict[str, int]:
         """
-        Trigger reviews for all due services in a workspace.
+        Trigger reviews for a batch of due schedules.
+
+        Services and in-progress reviews are loaded with one query each,
+        new reviews are inserted in a single flush, and jobs are published
+        with SQS batch sends. Each job gets a random delay so a tick over
+        many services doesn't stampede the worker fleet.
 
         Args:
             db: Database session
-            workspace_id: Workspace ID
-            schedules: List of due schedules for this workspace
+            schedules: Due schedules (any workspaces)
 
         Returns:
-            Dict with counts for this workspace
+            Dict with counts for this batch
         """
         results = {"triggered": 0, "failed": 0, "skipped": 0}
 
@@ -119,92 +119,114 @@ class HealthReviewScheduler:
         week_end = now
         week_start = now - timedelta(days=7)
 
-        for schedule in schedules:
-            try:
-                # Check if service still exists
-                service = await db.get(Service, schedule.service_id)
-                if not service:
-                    logger.warning(
-                        f"Service {schedule.service_id} not found, skipping schedule"
-                    )
-                    results["skipped"] += 1
-                    await self._update_schedule_next_run(db, schedule, success=False)
-                    continue
+        service_ids = {schedule.service_id for schedule in schedules}
+        service_names = await self._get_service_names(db, service_ids)
+        in_progress = await self._get_services_with_active_review(db, service_ids)
 
-                # Check for existing in-progress review
-                existing = await self._check_existing_review(
-                    db, schedule.service_id, week_start, week_end
+        reviews: Dict[str, ServiceReview] = {}  # schedule.id -> new review
+        for schedule in schedules:
+            if schedule.service_id not in service_names:
+                logger.warning(
+                    f"Service {schedule.service_id} not found, skipping schedule"
                 )
-                if existing:
-                    logger.info(
-                        f"Service {service.name} already has in-progress review, skipping"
-                    )
-                    results["skipped"] += 1
-                    continue
-
-                # Create review record
-                review_id = str(uuid.uuid4())
-                review = ServiceReview(
-                    id=review_id,
-                    service_id=schedule.service_id,
-                    workspace_id=workspace_id,
-                    status=ReviewStatus.QUEUED,
-                    triggered_by=ReviewTriggeredBy.SCHEDULER,
-                    review_week_start=week_start,
-                    review_week_end=week_end,
+                results["skipped"] += 1
+                self._update_schedule_next_run(schedule, success=False)
+                continue
+
+            if schedule.service_id in in_progress:
+                logger.info(
+                    f"Service {service_names[schedule.service_id]} already has "
+                    f"in-progress review, skipping"
                 )
-                db.add(review)
-                await db.flush()
+                results["skipped"] += 1
+                continue
+
+            # Guard against two due schedules for the same service in one batch
+            in_progress.add(schedule.service_id)
+            reviews[schedule.id] = ServiceReview(
+                id=str(uuid.uuid4()),
+                service_id=schedule.service_id,
+                workspace_id=schedule.workspace_id,
+                status=ReviewStatus.QUEUED,
+                triggered_by=ReviewTriggeredBy.SCHEDULER,
+                review_week_start=week_start,
+                review_week_end=week_end,
+            )
 
-                # Publish to SQS
-                published = await publish_health_review_job(
-                    review_id=review_id,
-                    workspace_id=workspace_id,
-                    service_id=schedule.service_id,
-                )
+        if reviews:
+            try:
+                db.add_all(list(reviews.values()))
+                await db.flush()
+                await db.commit()
+            except Exception as e:
+                # Schedules stay due and are retried on the next tick
+                logger.exception(f"Error inserting scheduled reviews: {e}")
+                await db.rollback()
+                results["failed"] += len(reviews)
+                return results
+
+            jitter = min(max(settings.HEALTH_REVIEW_SCHEDULER_JITTER_SECONDS, 0), 900)
+            published = await publish_health_review_jobs(
+                [
+                    {
+                        "review_id": review.id,
+                        "workspace_id": review.workspace_id,
+                        "service_id": review.service_id,
+                        "delay_seconds": random.randint(0, jitter),
+                    }
+                    for review in reviews.values()
+                ]
+            )
 
-                if published:
-                    logger.info(f"Triggered review for service {service.name}")
+            for schedule in schedules:
+                review = reviews.get(schedule.id)
+                if review is None:
+                    continue
+                service_name = service_names[schedule.service_id]
+                if review.id in published:
+                    logger.info(f"Triggered review for service {service_name}")
                     results["triggered"] += 1
-                    await self._update_schedule_next_run(
-                        db, schedule, success=True, review_id=review_id
+                    self._update_schedule_next_run(
+                        schedule, success=True, review_id=review.id
                     )
                 else:
-                    logger.error(f"Failed to publish review for service {service.name}")
+                    logger.error(f"Failed to publish review for service {service_name}")
                     results["failed"] += 1
-                    await self._update_schedule_next_run(
-                        db, schedule, success=False, error="Failed to publish to SQS"
+                    # Don't leave an unpublished QUEUED review blocking the next run
+                    review.status = ReviewStatus.FAILED
+                    review.error_message = "Failed to publish to SQS"
+                    self._update_schedule_next_run(
+                        schedule, success=False, error="Failed to publish to SQS"
                     )
 
-            except Exception as e:
-                logger.exception(f"Error triggering review for schedule {schedule.id}: {e}")
-                results["failed"] += 1
-                await self._update_schedule_next_run(
-                    db, schedule, success=False, error=str(e)
-                )
-
         await db.commit()
         return results
 
-    async def _check_existing_review(
-        self,
-        db: AsyncSession,
-        service_id: str,
-        week_start: datetime,
-        week_end: datetime,
-    ) -> ServiceReview | None:
-        """Check for existing in-progress review."""
-        stmt = (
-            select(ServiceReview)
-            .where(ServiceReview.service_id == service_id)
-            .where(ServiceReview.status.in_([ReviewStatus.QUEUED, ReviewStatus.GENERATING]))
+    async def _get_service_names(
+        self, db: AsyncSession, service_ids: Set[str]
+    ) -> Dict[str, str]:
+        """Return {service_id: name} for the services that still exist."""
+        result = await db.execute(
+            select(Service.id, Service.name).where(Service.id.in_(service_ids))
         )
-        result = await db.execute(stmt)
-        return result.scalar_one_or_none()
+        return {row[0]: row[1] for row in result.all()}
+
+    async def _get_services_with_active_review(
+        self, db: AsyncSession, service_ids: Set[str]
+    ) -> Set[str]:
+        """Return the service IDs that already have a queued/generating review."""
+        result = await db.execute(
+            select(ServiceReview.service_id)
+            .where(ServiceReview.service_id.in_(service_ids))
+            .where(
+                ServiceReview.status.in_([ReviewStatus.QUEUED, ReviewStatus.GENERATING])
+            )
+            .distinct()
+        )
+        return {row[0] for row in result.all()}
 
-    async def _update_schedule_next_run(
+    def _update_schedule_next_run(
         self,
-        db: AsyncSession,
         schedule: ReviewSchedule,
         success: bool,
         review_id: str = None,
@@ -213,6 +235,8 @@ class HealthReviewScheduler:
         """
         Update schedule after triggering (or failing to trigger) a review.
 
+        Changes are written by the caller's next flush/commit.
+
         Calculates next_scheduled_at based on:
         - generation_day_of_week (0=Monday, 6=Sunday)
         - generation_hour_utc (0-23)
@@ -238,8 +262,6 @@ class HealthReviewScheduler:
             schedule.consecutive_failures += 1
             schedule.last_error = error
 
-        await db.flush()
-
     def _calculate_next_scheduled_at(
         self,
         day_of_week: int,
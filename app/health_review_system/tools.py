@@ -11,9 +11,10 @@ import logging
 from typing import Optional
 
 from langchain_core.tools import tool
-from sqlalchemy import select, text
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.code_parser.repository import ParsedFileRepository
 from app.core.config import settings
 from app.models import ParsedFile
 
@@ -77,7 +78,8 @@ async def search_files(
 ) -> str:
     """Search parsed files for a keyword in their content.
 
-    Returns matching file paths with a snippet of the matching line.
+    Returns matching file paths with the line number and text of the
+    first matching line.
     Use this to find files containing middleware registration, metrics setup,
     event listeners, or other patterns.
 
@@ -89,39 +91,24 @@ async def search_files(
 
     logger.info(f"[LLM][search_files] Searching for: '{query}'")
 
-    limit = settings.HEALTH_REVIEW_SEARCH_RESULTS_LIMIT
-
-    # Use ILIKE for case-insensitive search with context
-    result = await db.execute(
-        text("""
-            SELECT file_path, language, line_count,
-                   substring(content from position(lower(:query) in lower(content)) - 50 for 200) as snippet
-            FROM parsed_files
-            WHERE repository_id = :repo_id
-              AND content ILIKE :pattern
-            ORDER BY file_path
-            LIMIT :lim
-        """),
-        {
-            "repo_id": repository_id,
-            "query": query,
-            "pattern": f"%{query}%",
-            "lim": limit,
-        },
+    file_crud = ParsedFileRepository(db)
+    matches = await file_crud.search_content(
+        repository_id, query, limit=settings.HEALTH_REVIEW_SEARCH_RESULTS_LIMIT
     )
-    rows = result.fetchall()
 
-    if not rows:
+    if not matches:
         logger.info(f"[LLM][search_files] No results for: '{query}'")
         return f"No files found containing '{query}'"
 
-    logger.info(f"[LLM][search_files] Found {len(rows)} files for: '{query}'")
-    lines = [f"Found {len(rows)} file(s) containing '{query}':\n"]
-    for row in rows:
-        snippet = (row[3] or "").strip().replace("\n", " ")
-        lines.append(f"  {row[0]} ({row[1]}, {row[2]} lines)")
-        if snippet:
-            lines.append(f"    ...{snippet}...")
+    logger.info(f"[LLM][search_files] Found {len(matches)} files for: '{query}'")
+    lines = [f"Found {len(matches)} file(s) containing '{query}':\n"]
+    for match in matches:
+        lines.append(
+            f"  {match['file_path']} ({match['language']}, {match['line_count']} lines)"
+        )
+        line = match["line"].strip()
+        if match["line_number"] and line:
+            lines.append(f"    L{match['line_number']}: {line}")
     return "\n".join(lines)
 
 
@@ -144,19 +131,8 @@ async def list_files(
 
     logger.info(f"[LLM][list_files] Pattern: '{pattern}'")
 
-    # Convert glob-style patterns to SQL LIKE
-    sql_pattern = pattern.replace("*", "%")
-
-    result = await db.execute(
-        select(ParsedFile.file_path, ParsedFile.language, ParsedFile.line_count)
-        .where(
-            ParsedFile.repository_id == repository_id,
-            ParsedFile.file_path.ilike(sql_pattern),
-        )
-        .order_by(ParsedFile.file_path)
-        .limit(50)
-    )
-    rows = result.fetchall()
+    file_crud = ParsedFileRepository(db)
+    rows = await file_crud.list_paths(repository_id, pattern, limit=50)
 
     if not rows:
         logger.info(f"[LLM][list_files] No matches for: '{pattern}'")
@@ -165,5 +141,7 @@ async def list_files(
     logger.info(f"[LLM][list_files] Found {len(rows)} files for: '{pattern}'")
     lines = [f"Found {len(rows)} file(s) matching '{pattern}':\n"]
     for row in rows:
-        lines.append(f"  {row[0]} ({row[1]}, {row[2]} lines)")
+        lines.append(
+            f"  {row['file_path']} ({row['language']}, {row['line_count']} lines)"
+        )
     return "\n".join(lines)
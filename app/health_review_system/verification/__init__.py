@@ -7,10 +7,12 @@ actual codebase architecture (middleware, global instrumentation, etc.).
 
 from .schemas import CodebaseContext, VerificationResult, GapVerdict
 from .service import VerificationService
+from .cache import VerdictCache
 
 __all__ = [
     "CodebaseContext",
     "VerificationResult",
     "GapVerdict",
     "VerificationService",
+    "VerdictCache",
 ]
@@ -0,0 +1,196 @@
+"""
+Persistent verdict cache for gap verification.
+
+A gap's verdict depends only on the gap itself, the code in its affected
+files and the global infrastructure the agent checks it against. The cache
+key combines all three, so gaps that are unchanged since the last review
+reuse their previous verdict and only changed gaps go to the LLM.
+"""
+
+import hashlib
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.code_parser.repository import ParsedFileRepository
+from app.core.config import settings
+from app.health_review_system.rule_engine.schemas import DetectedProblem
+from app.models import GapVerdictCache
+
+from .schemas import CodebaseContext, GapVerdictResult
+from .service import compute_gap_fingerprint
+
+logger = logging.getLogger(__name__)
+
+
+def compute_context_version(
+    context: CodebaseContext, file_hashes: Dict[str, Optional[str]]
+) -> str:
+    """Compute a stable version of the infrastructure context.
+
+    Only structural fields (type, file, coverage, registration) and the
+    content hashes of infrastructure files are used. LLM-written descriptions
+    and summaries vary between runs and would otherwise invalidate every entry.
+    """
+    instrumentation = (
+        context.global_http_metrics
+        + context.global_db_instrumentation
+        + context.global_tracing
+        + context.global_error_handling
+    )
+    parts = sorted(
+        f"{g.instrumentation_type}|{g.file_path}|{g.coverage}|{g.registration_file or ''}"
+        for g in instrumentation
+    )
+    parts.extend(
+        f"{path}={file_hashes.get(path) or ''}"
+        for path in sorted(set(context.infrastructure_files))
+    )
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def compute_verdict_cache_key(
+    gap_fingerprint: str,
+    affected_files: List[str],
+    file_hashes: Dict[str, Optional[str]],
+    context_version: str,
+) -> str:
+    """Combine gap fingerprint, affected file hashes and context version."""
+    file_parts = "|".join(
+        f"{path}={file_hashes.get(path) or ''}" for path in sorted(set(affected_files))
+    )
+    key = "::".join([gap_fingerprint, file_parts, context_version])
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class VerdictCache:
+    """
+    Read-through cache of gap verdicts for one repository.
+
+    Usage:
+        cache = VerdictCache(db, workspace_id, repo_full_name, repository_id)
+        await cache.prepare(gaps, codebase_context)
+        cached = await cache.lookup(gaps)      # {cache_key: GapVerdictResult}
+        ...verify the rest...
+        await cache.store(verified_gaps, verdicts)
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        workspace_id: str,
+        repo_full_name: str,
+        repository_id: str,
+    ):
+        self.db = db
+        self.workspace_id = workspace_id
+        self.repo_full_name = repo_full_name
+        self.repository_id = repository_id
+        self._keys: Dict[str, str] = {}  # gap fingerprint -> cache key
+
+    async def prepare(
+        self, gaps: List[DetectedProblem], codebase_context: CodebaseContext
+    ) -> None:
+        """Compute cache keys for all gaps (one content-hash query)."""
+        file_paths = {path for gap in gaps for path in gap.affected_files}
+        file_paths.update(codebase_context.infrastructure_files)
+
+        file_crud = ParsedFileRepository(self.db)
+        file_hashes = await file_crud.get_content_hashes(
+            self.repository_id, sorted(file_paths)
+        )
+        context_version = compute_context_version(codebase_context, file_hashes)
+
+        for gap in gaps:
+            fingerprint = compute_gap_fingerprint(gap)
+            self._keys[fingerprint] = compute_verdict_cache_key(
+                fingerprint, gap.affected_files, file_hashes, context_version
+            )
+
+        logger.info(
+            f"[verdict_cache] Prepared {len(self._keys)} keys "
+            f"(context_version={context_version}, {len(file_hashes)} file hashes)"
+        )
+
+    def key_for(self, gap: DetectedProblem) -> Optional[str]:
+        """Return the cache key for a gap, or None if prepare() didn't see it."""
+        return self._keys.get(compute_gap_fingerprint(gap))
+
+    async def lookup(self, gaps: List[DetectedProblem]) -> Dict[str, GapVerdictResult]:
+        """Return non-expired cached verdicts for the given gaps, keyed by cache key."""
+        keys = {key for key in (self.key_for(gap) for gap in gaps) if key}
+        if not keys:
+            return {}
+
+        result = await self.db.execute(
+            select(GapVerdictCache.cache_key, GapVerdictCache.verdict_json)
+            .where(
+                and_(
+                    GapVerdictCache.workspace_id == self.workspace_id,
+                    GapVerdictCache.repo_full_name == self.repo_full_name,
+                    GapVerdictCache.cache_key.in_(keys),
+                    GapVerdictCache.created_at >= self._cutoff(),
+                )
+            )
+            .order_by(GapVerdictCache.created_at)
+        )
+
+        cached: Dict[str, GapVerdictResult] = {}
+        for cache_key, verdict_json in result.fetchall():
+            try:
+                cached[cache_key] = GapVerdictResult(**verdict_json)
+            except Exception:
+                logger.warning(
+                    f"[verdict_cache] Ignoring corrupt entry {cache_key[:12]}"
+                )
+        return cached
+
+    async def store(
+        self, gaps: List[DetectedProblem], verdicts: List[GapVerdictResult]
+    ) -> int:
+        """Persist verdicts for freshly verified gaps. Returns rows written."""
+        verdict_by_title = {v.gap_title: v for v in verdicts}
+
+        rows: Dict[str, GapVerdictCache] = {}
+        for gap in gaps:
+            cache_key = self.key_for(gap)
+            verdict = verdict_by_title.get(gap.title)
+            if not cache_key or not verdict:
+                continue
+            rows[cache_key] = GapVerdictCache(
+                id=str(uuid.uuid4()),
+                workspace_id=self.workspace_id,
+                repo_full_name=self.repo_full_name,
+                rule_id=gap.rule_id,
+                gap_fingerprint=compute_gap_fingerprint(gap),
+                cache_key=cache_key,
+                verdict_json=verdict.model_dump(mode="json"),
+            )
+
+        if not rows:
+            return 0
+
+        # Replace same-key entries and prune expired ones for this repo
+        await self.db.execute(
+            delete(GapVerdictCache).where(
+                and_(
+                    GapVerdictCache.workspace_id == self.workspace_id,
+                    GapVerdictCache.repo_full_name == self.repo_full_name,
+                    GapVerdictCache.cache_key.in_(list(rows.keys()))
+                    | (GapVerdictCache.created_at < self._cutoff()),
+                )
+            )
+        )
+        self.db.add_all(list(rows.values()))
+        await self.db.flush()
+        return len(rows)
+
+    @staticmethod
+    def _cutoff() -> datetime:
+        return datetime.now(timezone.utc) - timedelta(
+            days=settings.HEALTH_REVIEW_VERDICT_CACHE_TTL_DAYS
+        )
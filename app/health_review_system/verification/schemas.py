@@ -115,3 +115,10 @@ class VerificationResult(BaseModel):
     tool_calls_used: int = Field(
         default=0, description="Number of tool calls consumed"
     )
+    cache_hits: int = Field(
+        default=0, description="Verdicts reused from the verdict cache"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Set when the agent run failed (such verdicts are never cached)",
+    )
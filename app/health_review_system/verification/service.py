@@ -16,7 +16,7 @@ import hashlib
 import json
 import logging
 from collections import defaultdict
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 
 from langchain.agents import AgentExecutor, create_tool_calling_agent
 from langchain_core.language_models import BaseChatModel
@@ -25,6 +25,7 @@ from langchain_core.tools import StructuredTool
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.health_review_system.llm_budget import LLMBudgetCallback
 from app.health_review_system.rule_engine.schemas import DetectedProblem
 from app.health_review_system.tools import list_files, read_file, search_files
 
@@ -43,8 +44,15 @@ from .schemas import (
     VerificationResult,
 )
 
+if TYPE_CHECKING:
+    from .cache import VerdictCache
+
 logger = logging.getLogger(__name__)
 
+# Reason attached to verdicts when the agent output could not be parsed
+PARSE_FAILURE_REASON = "Failed to parse verification output"
+NO_VERDICT_REASON = "No individual verdict from agent, using group decision"
+
 
 def compute_gap_fingerprint(problem: DetectedProblem) -> str:
     """Compute a stable fingerprint for cross-review gap tracking."""
@@ -311,7 +319,7 @@ class VerificationService:
             return []
 
     # ------------------------------------------------------------------
-    # Node 2: Extract From Single File (called once per file in graph loop)
+    # Node 2: Extract From Candidate Files (one LLM call per file, run concurrently)
     # ------------------------------------------------------------------
 
     MAX_LINES_PER_FILE = 300
@@ -321,17 +329,22 @@ class VerificationService:
         file_path: str,
         gap_rule_ids: List[str],
         callbacks: list = None,
+        content: Optional[str] = None,
     ) -> List[dict]:
         """Extract instrumentation patterns from a single file.
 
         One LLM call per file. Returns a list of extracted instrumentation
         dicts (may be empty if the file has nothing relevant).
+
+        Pass ``content`` when it was prefetched; the DB session is not safe
+        for concurrent use, so parallel callers must not read it here.
         """
         from app.code_parser.repository import ParsedFileRepository
         from .prompts import EXTRACT_SINGLE_FILE_SYSTEM_PROMPT, EXTRACT_SINGLE_FILE_USER_PROMPT
 
-        file_crud = ParsedFileRepository(self.db)
-        content = await file_crud.get_content(self.repository_id, file_path)
+        if content is None:
+            file_crud = ParsedFileRepository(self.db)
+            content = await file_crud.get_content(self.repository_id, file_path)
 
         if not content:
             logger.warning(f"[LLM][extract] Could not read {file_path}")
@@ -381,6 +394,48 @@ class VerificationService:
             logger.error(f"[LLM][extract] {file_path} failed: {e}", exc_info=True)
             return []
 
+    async def extract_from_files(
+        self,
+        file_paths: List[str],
+        gap_rule_ids: List[str],
+        callbacks: list = None,
+        budget: Optional[LLMBudgetCallback] = None,
+        max_concurrency: int = 1,
+    ) -> List[dict]:
+        """Extract instrumentation patterns from several files concurrently.
+
+        File contents are loaded in one query up front, then at most
+        ``max_concurrency`` LLM calls run at a time. Files not yet started
+        when the budget runs out are skipped. Results keep file order.
+        """
+        from app.code_parser.repository import ParsedFileRepository
+
+        file_crud = ParsedFileRepository(self.db)
+        contents = await file_crud.get_contents(self.repository_id, file_paths)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _extract(index: int, file_path: str) -> List[dict]:
+            async with semaphore:
+                if budget and budget.is_exhausted:
+                    logger.warning(
+                        f"[LLM][extract] Budget exhausted, skipping {file_path}"
+                    )
+                    return []
+                logger.info(
+                    f"[LLM][extract] File {index + 1}/{len(file_paths)}: {file_path}"
+                )
+                return await self.extract_from_single_file(
+                    file_path=file_path,
+                    gap_rule_ids=gap_rule_ids,
+                    callbacks=callbacks,
+                    content=contents.get(file_path) or "",
+                )
+
+        per_file = await asyncio.gather(
+            *(_extract(i, path) for i, path in enumerate(file_paths))
+        )
+        return [extraction for extractions in per_file for extraction in extractions]
+
     @staticmethod
     def build_codebase_context(
         all_extractions: List[dict],
@@ -454,12 +509,17 @@ class VerificationService:
         raw_gaps: List[DetectedProblem],
         codebase_context: CodebaseContext,
         callbacks: list = None,
+        verdict_cache: Optional["VerdictCache"] = None,
     ) -> Dict[str, VerificationResult]:
         """Verify gaps by backtracking through the codebase.
 
         For each rule group, one AgentExecutor call with 20 sample gaps.
         Agent reads each gap's source file and traces it back to see if
         infrastructure covers it. Confidence threshold decides the group verdict.
+
+        With a verdict_cache, gaps whose fingerprint, affected files and
+        infrastructure context are unchanged reuse their cached verdict; only
+        the remaining gaps are sampled and sent to the agent.
         """
         gaps_by_rule: Dict[str, List[DetectedProblem]] = defaultdict(list)
         for gap in raw_gaps:
@@ -468,18 +528,47 @@ class VerificationService:
         logger.info(
             f"Verifying {len(raw_gaps)} gaps across {len(gaps_by_rule)} rule types "
             f"(sample_size={settings.HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE}, "
-            f"confidence_threshold={settings.HEALTH_REVIEW_VERIFICATION_CONFIDENCE_THRESHOLD})"
+            f"confidence_threshold={settings.HEALTH_REVIEW_VERIFICATION_CONFIDENCE_THRESHOLD}, "
+            f"verdict_cache={'on' if verdict_cache else 'off'})"
         )
 
+        cached_by_key: Dict[str, GapVerdictResult] = {}
+        if verdict_cache:
+            await verdict_cache.prepare(raw_gaps, codebase_context)
+            cached_by_key = await verdict_cache.lookup(raw_gaps)
+
         context_text = codebase_context.model_dump_json(indent=2)
         results: Dict[str, VerificationResult] = {}
 
         for rule_id, gaps in gaps_by_rule.items():
-            sample = gaps[:settings.HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE]
+            cached_verdicts: List[GapVerdictResult] = []
+            pending: List[DetectedProblem] = []
+            for gap in gaps:
+                cache_key = verdict_cache.key_for(gap) if verdict_cache else None
+                cached = cached_by_key.get(cache_key) if cache_key else None
+                if cached:
+                    cached_verdicts.append(
+                        cached.model_copy(update={"gap_title": gap.title})
+                    )
+                else:
+                    pending.append(gap)
+
+            if not pending:
+                logger.info(
+                    f"[{rule_id}] All {len(gaps)} gaps unchanged, reusing cached verdicts"
+                )
+                results[rule_id] = VerificationResult(
+                    rule_id=rule_id,
+                    verdicts=cached_verdicts,
+                    cache_hits=len(cached_verdicts),
+                )
+                continue
+
+            sample = pending[: settings.HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE]
 
             logger.info(
                 f"[LLM][{rule_id}] Verifying {len(sample)} samples "
-                f"(of {len(gaps)} total gaps)"
+                f"(of {len(pending)} changed gaps, {len(cached_verdicts)} cached)"
             )
 
             result = await self._verify_rule_group(
@@ -489,9 +578,24 @@ class VerificationService:
                 callbacks=callbacks,
             )
 
-            # Apply confidence threshold and extend to all gaps
-            if len(gaps) > len(sample):
-                result = self._extend_verdicts_to_all(result, gaps, rule_id)
+            # Cache only what the agent judged: verdicts extended from the
+            # sample must not stand in for a real verification next time
+            if verdict_cache and not result.error:
+                judged = [v for v in result.verdicts if v.reason != NO_VERDICT_REASON]
+                stored = await verdict_cache.store(sample, judged)
+                logger.info(f"[{rule_id}] Cached {stored} verdicts")
+
+            # Apply confidence threshold and extend to all changed gaps
+            if len(pending) > len(sample):
+                result = self._extend_verdicts_to_all(result, pending, rule_id)
+
+            if cached_verdicts:
+                result = result.model_copy(
+                    update={
+                        "verdicts": cached_verdicts + result.verdicts,
+                        "cache_hits": len(cached_verdicts),
+                    }
+                )
 
             results[rule_id] = result
 
@@ -516,8 +620,10 @@ class VerificationService:
             sum(1 for v in r.verdicts if v.verdict == GapVerdict.GENUINE)
             for r in results.values()
         )
+        total_cached = sum(r.cache_hits for r in results.values())
         logger.info(
-            f"Verification complete: genuine={total_genuine} false_alarm={total_fa}"
+            f"Verification complete: genuine={total_genuine} false_alarm={total_fa} "
+            f"cached={total_cached}"
         )
         return results
 
@@ -593,12 +699,14 @@ class VerificationService:
             verdicts = self._parse_pass_fail_verdicts(
                 output_text, sample_gaps, rule_id
             )
+            parse_failed = any(v.reason == PARSE_FAILURE_REASON for v in verdicts)
 
             return VerificationResult(
                 rule_id=rule_id,
                 verdicts=verdicts,
                 files_read=files_read,
                 tool_calls_used=len(intermediate_steps),
+                error=PARSE_FAILURE_REASON if parse_failed else None,
             )
 
         except Exception as e:
@@ -614,6 +722,7 @@ class VerificationService:
                     )
                     for gap in sample_gaps
                 ],
+                error=str(e)[:200],
             )
 
     # ------------------------------------------------------------------
@@ -650,7 +759,7 @@ class VerificationService:
                     gap_title=gap.title,
                     rule_id=rule_id,
                     verdict=GapVerdict.GENUINE,
-                    reason="Failed to parse verification output",
+                    reason=PARSE_FAILURE_REASON,
                 )
                 for gap in gaps
             ]
@@ -713,7 +822,7 @@ class VerificationService:
                             gap_title=gap.title,
                             rule_id=rule_id,
                             verdict=group_verdict,
-                            reason="No individual verdict from agent, using group decision",
+                            reason=NO_VERDICT_REASON,
                         )
                     )
 
@@ -762,6 +871,7 @@ class VerificationService:
             verdicts=extended,
             files_read=result.files_read,
             tool_calls_used=result.tool_calls_used,
+            error=result.error,
         )
 
     def _parse_codebase_context(self, output_text: str) -> CodebaseContext:
@@ -9,27 +9,61 @@ Supported providers:
 - openai: OpenAI API (requires api_key)
 - azure_openai: Azure OpenAI (requires api_key, endpoint, deployment_name)
 - gemini: Google Gemini (requires api_key)
+
+Clients are cached per workspace and keyed by a fingerprint of the stored
+config, so jobs reuse warm HTTP connection pools and a config change is
+picked up on the next call in every process. LLMConfigService drops a
+workspace's clients when its config changes to release them early.
 """
 
+import hashlib
 import json
 import logging
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_groq import ChatGroq
-from langchain_openai import AzureChatOpenAI, ChatOpenAI
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.models import LLMProvider, LLMProviderConfig
 from app.utils.token_processor import token_processor
+from app.utils.ttl_cache import TTLCache
+
+# BYOLLM provider SDKs are imported when a workspace first uses them; only the
+# default (Groq) client is needed by every process
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+    from langchain_openai import AzureChatOpenAI, ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
+# workspace_id -> (config fingerprint, {(temperature, max_tokens): client})
+_workspace_clients = TTLCache(
+    ttl_seconds=settings.LLM_CLIENT_CACHE_TTL_SECONDS,
+    maxsize=settings.LLM_CLIENT_CACHE_MAXSIZE,
+)
+# (temperature, max_tokens) -> VibeMonitor default client, shared by all workspaces
+_default_clients: Dict[Tuple[float, int], BaseChatModel] = {}
+
+
+def _config_fingerprint(config: LLMProviderConfig) -> str:
+    raw = f"{config.provider.value}|{config.model_name}|{config.config_encrypted}"
+    return hashlib.sha256(raw.encode()).hexdigest()
 
 
+def invalidate_workspace_llm(workspace_id: str) -> None:
+    """Drop cached clients for a workspace (call when its LLM config changes)."""
+    _workspace_clients.pop(workspace_id)
+
+
+def _get_default_llm(temperature: float, max_tokens: int) -> BaseChatModel:
+    key = (temperature, max_tokens)
+    llm = _default_clients.get(key)
+    if llm is None:
+        llm = _default_clients[key] = _create_groq_llm(temperature, max_tokens)
+    return llm
 
 
 async def get_llm_for_workspace(
@@ -72,13 +106,36 @@ async def get_llm_for_workspace(
         logger.info(
             f"Using VibeMonitor default LLM (Groq) for workspace {workspace_id}"
         )
-        return _create_groq_llm(temperature, max_tokens)
+        return _get_default_llm(temperature, max_tokens)
 
     # Custom provider configured
     logger.info(
         f"Using custom LLM provider '{config.provider.value}' for workspace {workspace_id}"
     )
 
+    fingerprint = _config_fingerprint(config)
+    cached = _workspace_clients.get(workspace_id)
+    if cached is None or cached[0] != fingerprint:
+        cached = (fingerprint, {})
+        _workspace_clients.set(workspace_id, cached)
+    clients = cached[1]
+
+    llm = clients.get((temperature, max_tokens))
+    if llm is None:
+        llm = _create_workspace_llm(workspace_id, config, temperature, max_tokens)
+        if llm is None:
+            return _get_default_llm(temperature, max_tokens)
+        clients[(temperature, max_tokens)] = llm
+    return llm
+
+
+def _create_workspace_llm(
+    workspace_id: str,
+    config: LLMProviderConfig,
+    temperature: float,
+    max_tokens: int,
+) -> Optional[BaseChatModel]:
+    """Build the client for a custom provider config, or None to use the default."""
     try:
         # Decrypt config
         decrypted_config = {}
@@ -117,14 +174,14 @@ async def get_llm_for_workspace(
                 f"Unknown provider '{config.provider}' for workspace {workspace_id}, "
                 f"falling back to VibeMonitor default"
             )
-            return _create_groq_llm(temperature, max_tokens)
+            return None
 
     except Exception as e:
         logger.error(
             f"Error creating LLM for workspace {workspace_id}: {e}. "
             f"Falling back to VibeMonitor default."
         )
-        return _create_groq_llm(temperature, max_tokens)
+        return None
 
 
 def _create_groq_llm(temperature: float, max_tokens: int) -> ChatGroq:
@@ -134,7 +191,7 @@ def _create_groq_llm(temperature: float, max_tokens: int) -> ChatGroq:
 
     return ChatGroq(
         api_key=settings.GROQ_API_KEY,
-        model=settings.GROQ_LLM_MODEL,
+        model=settings.GROQ_LLM_MODEL or "llama-3.3-70b-versatile",
         temperature=temperature,
         max_tokens=max_tokens,
     )
@@ -145,8 +202,10 @@ def _create_openai_llm(
     model_name: str,
     temperature: float,
     max_tokens: int,
-) -> ChatOpenAI:
+) -> "ChatOpenAI":
     """Create OpenAI LLM."""
+    from langchain_openai import ChatOpenAI
+
     api_key = config.get("api_key")
     if not api_key:
         raise ValueError("OpenAI API key not configured")
@@ -164,8 +223,10 @@ def _create_azure_openai_llm(
     model_name: str,
     temperature: float,
     max_tokens: int,
-) -> AzureChatOpenAI:
+) -> "AzureChatOpenAI":
     """Create Azure OpenAI LLM."""
+    from langchain_openai import AzureChatOpenAI
+
     api_key = config.get("api_key")
     endpoint = config.get("endpoint")
     deployment_name = config.get("deployment_name") or model_name
@@ -193,8 +254,10 @@ def _create_gemini_llm(
     model_name: str,
     temperature: float,
     max_tokens: int,
-) -> ChatGoogleGenerativeAI:
+) -> "ChatGoogleGenerativeAI":
     """Create Google Gemini LLM."""
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     api_key = config.get("api_key")
     if not api_key:
         raise ValueError("Gemini API key not configured")
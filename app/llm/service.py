@@ -12,7 +12,6 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
-from openai import OpenAI
 from app.core.config import settings
 
 from fastapi import HTTPException
@@ -23,6 +22,7 @@ from app.models import LLMConfigStatus, LLMProvider, LLMProviderConfig, Membersh
 from app.utils.token_processor import token_processor
  
 
+from .providers import invalidate_workspace_llm
 from .schemas import (
     LLMConfigCreate,
     LLMConfigResponse,
@@ -137,6 +137,7 @@ class LLMConfigService:
 
             await db.commit()
             await db.refresh(existing_config)
+            invalidate_workspace_llm(workspace_id)
 
             logger.info(
                 f"Updated LLM config for workspace {workspace_id}: "
@@ -167,6 +168,7 @@ class LLMConfigService:
             db.add(new_config)
             await db.commit()
             await db.refresh(new_config)
+            invalidate_workspace_llm(workspace_id)
 
             logger.info(
                 f"Created LLM config for workspace {workspace_id}: "
@@ -207,6 +209,7 @@ class LLMConfigService:
 
         await db.delete(config)
         await db.commit()
+        invalidate_workspace_llm(workspace_id)
 
         logger.info(f"Deleted LLM config for workspace {workspace_id}")
         return True
@@ -319,7 +322,7 @@ class LLMConfigService:
             return LLMVerifyResponse(success=False, error="API key is required")
 
         try:
-            
+            from openai import OpenAI
 
             client = OpenAI(api_key=verify_request.api_key)
             # Simple models list call to verify API key
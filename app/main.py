@@ -21,7 +21,10 @@ from app.core.redis import close_redis, get_redis
 from app.github.webhook.router import limiter
 from app.middleware import HTTPMetricsMiddleware, RequestIDMiddleware
 from app.services.s3.client import s3_client
+from app.services.storage.extraction_engine import extraction_engine
 from app.services.sqs.client import sqs_client
+from app.utils.data_masker import warm_pii_analyzer
+from app.utils.rate_limiter import flush_pending_usage, run_usage_flusher
 from app.worker import RCAOrchestratorWorker
 from app.workers.health_review_worker import HealthReviewWorker, health_review_sqs_client
 
@@ -50,6 +53,7 @@ async def lifespan(app: FastAPI):
     worker = RCAOrchestratorWorker()
     health_review_worker = HealthReviewWorker()
     metrics_updater_task = None
+    usage_flusher_task = None
 
     try:
 
@@ -64,6 +68,18 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.error(f"Redis connection failed: {e}")
 
+            # Write rate limit counters behind to rate_limit_tracking
+            if settings.RATE_LIMIT_REDIS_ENABLED:
+                usage_flusher_task = asyncio.create_task(run_usage_flusher())
+                logger.info("Rate limit flusher started")
+
+        # Preload Presidio/spaCy so the first masked query doesn't pay model load
+        if settings.PII_PRELOAD_ON_STARTUP:
+            try:
+                await warm_pii_analyzer()
+            except Exception as e:
+                logger.error(f"Presidio analyzer preload failed: {e}")
+
         # Validate S3 configuration for chat file uploads
         if settings.CHAT_UPLOADS_BUCKET is None:
             logger.warning(
@@ -149,6 +165,16 @@ async def lifespan(app: FastAPI):
                     pass
                 logger.info("Metrics updater task stopped")
 
+            # Stop the rate limit flusher and write out what it buffered
+            if usage_flusher_task:
+                usage_flusher_task.cancel()
+                try:
+                    await usage_flusher_task
+                except asyncio.CancelledError:
+                    pass
+                await flush_pending_usage()
+                logger.info("Rate limit flusher stopped")
+
             # Shutdown OpenTelemetry first (flush remaining data)
             if settings.OTEL_ENABLED:
                 shutdown_otel()
@@ -173,6 +199,9 @@ async def lifespan(app: FastAPI):
             await s3_client.close()
             logger.info("S3 client closed")
 
+            # Stop text extraction worker processes
+            extraction_engine.shutdown()
+
             # Close Redis client
             await close_redis()
             logger.info("Redis client closed")
@@ -767,6 +767,8 @@ class Email(Base):
         Index("idx_emails_user", "user_id"),
         Index("idx_emails_sent_at", "sent_at"),
         Index("idx_emails_status", "status"),
+        # Campaign eligibility: sent emails of one subject per user
+        Index("idx_emails_user_subject_status", "user_id", "subject", "status"),
     )
 
 
@@ -1654,6 +1656,16 @@ class Deployment(Base):
             "deployed_at",
         ),
         Index("ix_deployments_environment_id", "environment_id"),
+        # Matches DISTINCT ON (environment_id, repo_full_name) ORDER BY deployed_at DESC
+        # for the RCA environment context; commit_sha included for index-only scans
+        Index(
+            "ix_deployments_latest_success",
+            "environment_id",
+            "repo_full_name",
+            deployed_at.desc(),
+            postgresql_where=text("status = 'SUCCESS'"),
+            postgresql_include=["commit_sha"],
+        ),
     )
 
 
@@ -1749,6 +1761,11 @@ class ServiceReview(Base):
     log_volume_analyzed = Column(Integer, nullable=True)
     metric_count_analyzed = Column(Integer, nullable=True)
 
+    # Child row counts, written with the results so dashboards don't COUNT(*)
+    logging_gaps_count = Column(Integer, nullable=False, default=0, server_default="0")
+    metrics_gaps_count = Column(Integer, nullable=False, default=0, server_default="0")
+    slis_count = Column(Integer, nullable=False, default=0, server_default="0")
+
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -1786,6 +1803,13 @@ class ServiceReview(Base):
             "review_week_start",
             unique=True,
         ),
+        # Latest review per service for the workspace dashboard
+        Index(
+            "idx_service_reviews_service_latest",
+            "service_id",
+            review_week_end.desc(),
+            created_at.desc(),
+        ),
     )
 
 
@@ -2283,6 +2307,64 @@ class ParsedFile(Base):
         Index("idx_parsed_files_path", "file_path"),
         Index("idx_parsed_files_content_hash", "content_hash"),
         Index("idx_parsed_files_repo_path", "repository_id", "file_path"),
+        # pg_trgm GIN indexes so ILIKE '%term%' searches don't scan every row
+        Index(
+            "idx_parsed_files_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
+        Index(
+            "idx_parsed_files_path_trgm",
+            "file_path",
+            postgresql_using="gin",
+            postgresql_ops={"file_path": "gin_trgm_ops"},
+        ),
+    )
+
+
+class ParsedSymbol(Base):
+    """
+    Normalized function/class symbol extracted from a parsed file.
+
+    Mirrors the entries of ParsedFile.functions / ParsedFile.classes so
+    symbol searches can use indexes instead of scanning the JSON arrays
+    of every file. Populated by ParsedFileRepository.create_batch.
+    """
+
+    __tablename__ = "parsed_symbols"
+
+    id = Column(String, primary_key=True)  # UUID
+    repository_id = Column(
+        String, ForeignKey("parsed_repositories.id", ondelete="CASCADE"), nullable=False
+    )
+    file_id = Column(
+        String, ForeignKey("parsed_files.id", ondelete="CASCADE"), nullable=False
+    )
+
+    kind = Column(String(20), nullable=False)  # "function" or "class"
+    name = Column(String(255), nullable=False)
+    name_lower = Column(String(255), nullable=False)  # For case-insensitive lookups
+
+    # Denormalized from ParsedFile so searches don't need a join
+    file_path = Column(String(500), nullable=False)
+    language = Column(String(50), nullable=False)
+
+    line_start = Column(Integer, nullable=True)
+    line_end = Column(Integer, nullable=True)
+    info = Column(JSON, nullable=True)  # Original FunctionInfo / ClassInfo dict
+
+    # Indexes
+    __table_args__ = (
+        Index("idx_parsed_symbols_file", "file_id"),
+        Index("idx_parsed_symbols_repo_kind_name", "repository_id", "kind", "name"),
+        # pg_trgm GIN index for substring searches (LIKE '%q%')
+        Index(
+            "idx_parsed_symbols_name_lower_trgm",
+            "name_lower",
+            postgresql_using="gin",
+            postgresql_ops={"name_lower": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -2360,3 +2442,48 @@ class CodeFactCache(Base):
         Index("idx_code_facts_repo_path", "repository_id", "file_path"),
         Index("idx_code_facts_content_hash", "repository_id", "content_hash"),
     )
+
+
+class GapVerdictCache(Base):
+    """
+    Cached verification verdicts for detected gaps.
+
+    Keyed by gap fingerprint plus the content hashes of the gap's affected
+    files and the infrastructure context version, so a gap whose code and
+    surrounding infrastructure are unchanged reuses its previous verdict
+    instead of being re-verified by the LLM agent.
+    This is a cache — if corrupted, delete the rows and re-verify.
+    """
+
+    __tablename__ = "gap_verdict_cache"
+
+    id = Column(String, primary_key=True)  # UUID
+    workspace_id = Column(
+        String, ForeignKey("workspaces.id", ondelete="CASCADE"), nullable=False
+    )
+    repo_full_name = Column(String(255), nullable=False)
+    rule_id = Column(String(50), nullable=False)
+    gap_fingerprint = Column(String(64), nullable=False)
+    cache_key = Column(
+        String(64), nullable=False
+    )  # SHA-256 of fingerprint + file hashes + context version
+    verdict_json = Column(JSON, nullable=False)  # Serialized GapVerdictResult
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    workspace = relationship(
+        "Workspace", backref=backref("gap_verdict_cache", cascade="all, delete-orphan")
+    )
+
+    __table_args__ = (
+        Index("idx_gap_verdict_cache_workspace", "workspace_id"),
+        Index(
+            "idx_gap_verdict_cache_lookup",
+            "workspace_id",
+            "repo_full_name",
+            "cache_key",
+        ),
+        Index("idx_gap_verdict_cache_created_at", "created_at"),
+    )
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import RefreshToken, User
 
+from ...auth.principal_cache import get_principal_user
 from ...core.config import settings
 from ...core.database import get_db
 from ...email.service import email_service
@@ -275,9 +276,8 @@ class AuthService:
                 detail="Could not validate credentials",
             )
 
-        # Get user from database
-        result = await db.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        # User and memberships, from the principal cache when fresh
+        user = await get_principal_user(db, user_id)
 
         if user is None:
             raise HTTPException(
@@ -0,0 +1,99 @@
+"""
+Local pre-classifier for the LLM prompt injection guard.
+
+Sorts messages into three buckets before any LLM call:
+- MALICIOUS: matches a well-known injection pattern ("ignore previous
+  instructions", special chat tokens, jailbreak phrases) -> blocked locally
+- SAFE: short plain-ASCII text with none of the vocabulary injections rely on
+  ("prompt", "instructions", "act as", "secret", delimiters...) -> allowed locally
+- AMBIGUOUS: everything else -> sent to the LLM guard
+
+The SAFE bucket is deliberately narrow: any doubt means AMBIGUOUS, so the
+LLM still decides every message that could plausibly be an attack.
+"""
+
+import hashlib
+import re
+from enum import Enum
+
+
+class PrefilterVerdict(str, Enum):
+    SAFE = "safe"
+    MALICIOUS = "malicious"
+    AMBIGUOUS = "ambiguous"
+
+
+_MALICIOUS_PATTERNS = [
+    re.compile(
+        r"\b(?:ignore|disregard|forget|override)\b.{0,40}?"
+        r"\b(?:previous|prior|above|earlier|all|your|the)\b.{0,40}?"
+        r"\b(?:instructions?|prompts?|rules|directions|guidelines)\b",
+        re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+        r"\b(?:reveal|show|print|display|repeat|output|leak|tell me)\b.{0,40}?"
+        r"\b(?:system|hidden|initial|original|internal)\s+(?:prompt|instructions?)",
+        re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+        r"\byou\s+are\s+now\b.{0,40}?"
+        r"\b(?:admin|administrator|developer|dan|unrestricted|root|jailbroken)\b",
+        re.IGNORECASE | re.DOTALL,
+    ),
+    re.compile(
+        r"\b(?:jailbreak|jailbroken|developer\s+mode|dan\s+mode|do\s+anything\s+now)\b",
+        re.IGNORECASE,
+    ),
+    re.compile(r"<\|(?:im_start|im_end|system|endoftext)\|>|\[/?INST\]|<</?SYS>>"),
+]
+
+# Vocabulary and syntax that injections rely on. Any hit sends the message
+# to the LLM guard, even if it is probably harmless ("system load is high").
+_RISKY_PATTERN = re.compile(
+    r"\b(?:ignore|forget|disregard|override|bypass|pretend|roleplay|role|act\s+as|"
+    r"you\s+are|instructions?|prompts?|system|jailbreak|unrestricted|admin|developer|"
+    r"secrets?|passwords?|api\s*keys?|tokens?|credentials?|internal(?:ly)?|config(?:uration)?s?|"
+    r"tools?|rules|restrictions?|reveal|assistant|model|simulate|mode)\b"
+    r"|```|###|---|<|>|\{|\}|\[|\]"
+    r"|[A-Za-z0-9+/=]{40,}",  # Long opaque blobs (base64 etc.)
+    re.IGNORECASE,
+)
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(text: str) -> str:
+    """Lowercase and collapse whitespace so trivial variations share a verdict."""
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+def message_fingerprint(text: str, salt: str = "") -> str:
+    """Stable hash of the normalized message (salted with guard model/prompt)."""
+    return hashlib.sha256(f"{salt}\n{normalize_message(text)}".encode()).hexdigest()
+
+
+def classify_message(text: str, safe_max_chars: int) -> PrefilterVerdict:
+    """
+    Cheaply classify a message before calling the LLM guard.
+
+    Args:
+        text: The (PII-masked) user message
+        safe_max_chars: Longer messages are never classified SAFE locally
+
+    Returns:
+        PrefilterVerdict
+    """
+    for pattern in _MALICIOUS_PATTERNS:
+        if pattern.search(text):
+            return PrefilterVerdict.MALICIOUS
+
+    if len(text) > safe_max_chars:
+        return PrefilterVerdict.AMBIGUOUS
+    # Non-English text could carry an injection the patterns above don't know
+    if _NON_ASCII.search(text):
+        return PrefilterVerdict.AMBIGUOUS
+    if _RISKY_PATTERN.search(text):
+        return PrefilterVerdict.AMBIGUOUS
+
+    return PrefilterVerdict.SAFE
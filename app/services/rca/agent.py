@@ -5,8 +5,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from langchain_groq import ChatGroq
 
 from .graph import create_rca_graph
+from .response_cache import is_cacheable_result, response_cache_key
 from .state import RCAState
 from app.core.config import settings
+from app.core.otel_metrics import AGENT_METRICS
+from app.llm.providers import get_llm_for_workspace
+from app.workspace.context_cache import response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +42,18 @@ class RCAAgentService:
             )
         return self._groq_llm
 
+    async def _get_llm(self, workspace_id: str, db: Optional[AsyncSession]):
+        """
+        The workspace's LLM: its BYOLLM config when one is set, else Groq.
+
+        Clients come from the per-workspace cache in app.llm.providers, so
+        jobs reuse warm connection pools. Without a session there is no
+        config to read, and the default Groq client is used.
+        """
+        if db is None:
+            return self.groq_llm
+        return await get_llm_for_workspace(workspace_id, db)
+
     async def analyze(
         self,
         user_query: str,
@@ -50,31 +66,35 @@ class RCAAgentService:
             if not workspace_id:
                 raise ValueError("workspace_id is required in context")
 
-            graph = create_rca_graph(self.groq_llm, db, workspace_id, callbacks=callbacks)
-            initial_state: RCAState = {
-                "task": user_query,
-                "workspace_id": workspace_id,
-                "context": context or {},
-                "failing_service": (context or {}).get("failing_service"),
-                "timeframe": (context or {}).get("timeframe"),
-                "severity": (context or {}).get("severity"),
-                "environment_name": None,
-                "hypotheses": [],
-                "root_cause": None,
-                "report": None,
-                "trace": [],
-                "history": [],
-                "error": None,
-                "iteration": 0,
-                "max_loops": (context or {}).get("max_loops") or 2,
-            }
-            final_state = await graph.ainvoke(initial_state, config={"callbacks": callbacks or []})
+            cache_key = response_cache_key(user_query, context)
+            if cache_key is None or not response_cache.enabled:
+                return await self._run_graph(user_query, context, callbacks, db)
+
+            # Repeat conversational questions are answered without any LLM call
+            # until the workspace context changes
+            result: Dict[str, Any] = {}
+
+            async def load_answer() -> Optional[str]:
+                result.update(await self._run_graph(user_query, context, callbacks, db))
+                return result["output"] if is_cacheable_result(result) else None
+
+            answer = await response_cache.get_or_load(
+                workspace_id, load_answer, should_cache=bool, key=cache_key
+            )
+            AGENT_METRICS["rca_agent_response_cache_total"].add(
+                1, {"result": "miss" if result else "hit"}
+            )
+            if result:
+                return result
 
+            logger.info(
+                f"Answered query from response cache (workspace: {workspace_id})"
+            )
             return {
-                "output": final_state.get("report"),
-                "intermediate_steps": final_state.get("trace"),
-                "success": final_state.get("error") is None,
-                "error": final_state.get("error"),
+                "output": answer,
+                "intermediate_steps": [{"stage": "response_cache", "details": {}}],
+                "success": True,
+                "error": None,
             }
 
         except Exception as e:
@@ -85,6 +105,44 @@ class RCAAgentService:
                 "error": str(e),
             }
 
+    async def _run_graph(
+        self,
+        user_query: str,
+        context: Dict[str, Any],
+        callbacks: Optional[list],
+        db: Optional[AsyncSession],
+    ) -> Dict[str, Any]:
+        workspace_id = context["workspace_id"]
+        llm = await self._get_llm(workspace_id, db)
+        graph = create_rca_graph(llm, db, workspace_id, callbacks=callbacks)
+        initial_state: RCAState = {
+            "task": user_query,
+            "workspace_id": workspace_id,
+            "context": context,
+            "failing_service": context.get("failing_service"),
+            "timeframe": context.get("timeframe"),
+            "severity": context.get("severity"),
+            "environment_name": None,
+            "hypotheses": [],
+            "root_cause": None,
+            "report": None,
+            "trace": [],
+            "history": [],
+            "error": None,
+            "iteration": 0,
+            "max_loops": context.get("max_loops") or 2,
+        }
+        final_state = await graph.ainvoke(
+            initial_state, config={"callbacks": callbacks or []}
+        )
+
+        return {
+            "output": final_state.get("report"),
+            "intermediate_steps": final_state.get("trace"),
+            "success": final_state.get("error") is None,
+            "error": final_state.get("error"),
+        }
+
     async def analyze_with_retry(
         self,
         user_query: str,
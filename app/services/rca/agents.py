@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from langchain_core.language_models import BaseChatModel
 
 from app.core.config import settings
+from app.core.otel_metrics import AGENT_METRICS
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,8 +21,14 @@ from app.services.rca.context_utils import (
     format_thread_history_for_prompt,
     get_context_summary,
 )
+from app.services.rca.intent_rules import (
+    CONVERSATIONAL,
+    RCA_INVESTIGATION,
+    classify_by_rules,
+)
 from app.services.rca.prompts import CONVERSATIONAL_INTENT_PROMPT, RCA_SYSTEM_PROMPT
 from app.services.rca.state import Hypothesis, RCAState
+from app.services.rca.streaming import FINAL_ANSWER_TAG
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +128,19 @@ async def classify_query_intent(state: RCAState, llm: BaseChatModel) -> RCAState
         state["query_intent"] = "other"
         return state
 
+    # Alerts, stack traces and plain lookups are decided without the LLM
+    if settings.RCA_INTENT_RULES_ENABLED:
+        match = classify_by_rules(query, state.get("context"))
+        if match is not None:
+            state["query_intent"] = match.intent
+            AGENT_METRICS["rca_agent_intent_classifications_total"].add(
+                1, {"source": "rules", "intent": match.intent}
+            )
+            logger.info(
+                f"Classified query '{query[:50]}' as: {match.intent} (rule: {match.rule})"
+            )
+            return state
+
     try:
         # Get thread history for context (helps with vague follow-ups like "check again")
         thread_history_text = format_thread_history_for_prompt(
@@ -139,6 +159,15 @@ async def classify_query_intent(state: RCAState, llm: BaseChatModel) -> RCAState
         intent = getattr(resp, "content", "").strip().lower()
 
         state["query_intent"] = intent
+        AGENT_METRICS["rca_agent_intent_classifications_total"].add(
+            1,
+            {
+                "source": "llm",
+                "intent": RCA_INVESTIGATION
+                if intent == RCA_INVESTIGATION
+                else CONVERSATIONAL,
+            },
+        )
         if thread_history_text:
             logger.info(
                 f"Classified query '{query[:50]}' as: {intent} (with thread history)"
@@ -272,7 +301,10 @@ async def conversational_agent(
         if context_string:
             input_text = f"{query}\n\nContext: {context_string}"
 
-        result = await executor.ainvoke({"input": input_text})
+        # Tagged so progress callbacks stream the answer as it's generated
+        result = await executor.ainvoke(
+            {"input": input_text}, config={"tags": [FINAL_ANSWER_TAG]}
+        )
         output = result.get("output") if isinstance(result, dict) else None
 
         if output:
@@ -280,7 +312,11 @@ async def conversational_agent(
             _add_trace(
                 state,
                 "conversational",
-                {"query": query, "response_length": len(output)},
+                {
+                    "query": query,
+                    "response_length": len(output),
+                    "tools_used": len(result.get("intermediate_steps") or []),
+                },
             )
         else:
             state["report"] = "I apologize, but I couldn't generate a response."
@@ -830,10 +866,14 @@ async def synthesis_agent(state: RCAState, llm: BaseChatModel) -> RCAState:
         # Disable tool calling for synthesis - this agent should only generate text
         # For Groq, we need to use tool_choice="none" instead of bind_tools([])
         llm_no_tools = _disable_tool_calling(llm=llm, stage="synthesis")
-        resp = await llm_no_tools.ainvoke(
-            [SystemMessage(content=RCA_SYSTEM_PROMPT), HumanMessage(content=prompt)]
-        )
-        content = (getattr(resp, "content", None) or "").strip()
+        # Streamed and tagged so progress callbacks can show the report as it's written
+        chunks = []
+        async for chunk in llm_no_tools.astream(
+            [SystemMessage(content=RCA_SYSTEM_PROMPT), HumanMessage(content=prompt)],
+            config={"tags": [FINAL_ANSWER_TAG]},
+        ):
+            chunks.append(getattr(chunk, "content", None) or "")
+        content = "".join(chunks).strip()
         report = (
             content
             if content
@@ -14,6 +14,7 @@ from langchain_core.tools import StructuredTool
 
 from app.core.config import settings
 from app.services.rca.capabilities import Capability, ExecutionContext
+from app.services.rca.scratchpad import ScratchpadManager
 
 logger = logging.getLogger(__name__)
 
@@ -294,11 +295,24 @@ class AgentExecutorBuilder:
         tools_with_workspace = self._bind_workspace_to_tools(
             available_tools, workspace_id
         )
+        # Older tool outputs are summarized in the scratchpad so prompts don't
+        # grow with every tool call; usage goes to ToolMetricsCallback if present
+        on_iteration = next(
+            (
+                callback.record_scratchpad_usage
+                for callback in self._callbacks or []
+                if hasattr(callback, "record_scratchpad_usage")
+            ),
+            None,
+        )
+        scratchpad = ScratchpadManager(on_iteration=on_iteration)
+
         # Create agent
         agent = create_tool_calling_agent(
             llm=self.llm,
             tools=tools_with_workspace,
             prompt=self.prompt,
+            message_formatter=scratchpad.format,
         )
 
         # Build tool name list for error recovery guidance
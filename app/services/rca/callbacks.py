@@ -5,20 +5,23 @@ All sensitive data is masked before logging or sending to Slack.
 """
 
 import ast
+import asyncio
 import json
 import logging
 import re
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from langchain.callbacks.base import AsyncCallbackHandler
 
 from app.core.config import settings
 from app.core.otel_metrics import TOOL_METRICS
 from app.services.rca.get_service_name.enums import TOOL_NAME_TO_MESSAGE
+from app.services.rca.scratchpad import ScratchpadUsage
+from app.services.rca.streaming import AnswerStream, is_final_answer_run
 from app.slack.service import slack_event_service
-from app.utils.data_masker import redact_query_for_log
+from app.utils.data_masker import PIIMapper, redact_query_for_log
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +88,7 @@ class SlackProgressCallback(AsyncCallbackHandler):
         thread_ts: Optional[str] = None,
         send_tool_output: bool = True,
         max_consecutive_failures: Optional[int] = None,
+        pii_mapper: Optional[PIIMapper] = None,
     ):
         """
         Initialize Slack progress callback
@@ -95,6 +99,7 @@ class SlackProgressCallback(AsyncCallbackHandler):
             thread_ts: Thread timestamp (for threaded replies)
             send_tool_output: Whether to send full tool outputs (can be verbose)
             max_consecutive_failures: Max failures before circuit breaker opens (uses config default if None)
+            pii_mapper: Restores PII placeholders in the streamed answer
         """
         self.team_id = team_id
         self.channel_id = channel_id
@@ -118,6 +123,16 @@ class SlackProgressCallback(AsyncCallbackHandler):
         # Track sent messages to avoid duplicates
         self.sent_messages: set = set()
 
+        # Streamed final answer: one message, edited as tokens arrive
+        self.answer_message_ts: Optional[str] = None
+        self._answer_task: Optional[asyncio.Task] = None
+        self._answer_stream: Optional[AnswerStream] = None
+        if settings.RCA_STREAM_FINAL_ANSWER:
+            self._answer_stream = AnswerStream(
+                settings.RCA_SLACK_STREAM_INTERVAL_SECONDS,
+                unmask=pii_mapper.unmask if pii_mapper else None,
+            )
+
     def _record_success(self) -> None:
         """Record successful Slack message send and reset circuit breaker"""
         if self.consecutive_failures > 0:
@@ -386,6 +401,12 @@ class SlackProgressCallback(AsyncCallbackHandler):
     ) -> None:
         """Called when agent finishes"""
         # Update the last hourglass message to checkmark before finishing
+        await self._complete_last_step()
+
+        # Don't send "Analysis complete" message - the final output will be sent separately
+
+    async def _complete_last_step(self) -> None:
+        """Turn the last step message's hourglass into a checkmark."""
         if self.last_message_ts and self.last_message_text:
             try:
                 updated_text = self.last_message_text.replace(
@@ -400,7 +421,83 @@ class SlackProgressCallback(AsyncCallbackHandler):
             except Exception as e:
                 logger.error(f"Failed to update last message on finish: {e}")
 
-        # Don't send "Analysis complete" message - the final output will be sent separately
+    async def on_llm_new_token(
+        self,
+        token: str,
+        *,
+        run_id: uuid.UUID,
+        tags: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Stream final-answer tokens into one Slack message (throttled edits)."""
+        if self._answer_stream is None or not is_final_answer_run(tags):
+            return
+        self._answer_stream.add(run_id, token)
+        if self._answer_task and not self._answer_task.done():
+            return  # An edit is in flight; a later token sends the newer text
+        update = self._answer_stream.take()
+        if update:
+            # Not awaited, so token generation doesn't wait on the Slack API
+            self._answer_task = asyncio.create_task(self._show_answer(update.text))
+
+    async def on_llm_end(
+        self,
+        response: Any,
+        *,
+        tags: Optional[List[str]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Show the rest of a final-answer run."""
+        if self._answer_stream is None or not is_final_answer_run(tags):
+            return
+        await self.finish_answer_stream()
+        update = self._answer_stream.take(final=True) if self._answer_stream else None
+        if update:
+            await self._show_answer(update.text)
+
+    async def _show_answer(self, text: str) -> None:
+        if self.circuit_open:
+            return
+        text = markdown_to_slack(text)
+        try:
+            if self.answer_message_ts is None:
+                await self._complete_last_step()
+                self.last_message_ts = None
+                self.last_message_text = None
+                result = await slack_event_service.send_message(
+                    team_id=self.team_id,
+                    channel=self.channel_id,
+                    text=text,
+                    thread_ts=self.thread_ts,
+                )
+                if not result or not result.get("ts"):
+                    # Don't post a new message per edit; the final answer still arrives
+                    self._answer_stream = None
+                    return
+                self.answer_message_ts = result["ts"]
+            else:
+                await slack_event_service.update_message(
+                    team_id=self.team_id,
+                    channel=self.channel_id,
+                    ts=self.answer_message_ts,
+                    text=text,
+                )
+            self._record_success()
+        except Exception as e:
+            self._record_failure(e, "streamed answer")
+
+    async def finish_answer_stream(self) -> Optional[str]:
+        """
+        Wait for an in-flight streamed edit.
+
+        Returns:
+            ts of the streamed answer message to replace with the final
+            response, or None if nothing was streamed
+        """
+        if self._answer_task is not None:
+            await asyncio.gather(self._answer_task, return_exceptions=True)
+            self._answer_task = None
+        return self.answer_message_ts
 
     async def on_chain_error(
         self,
@@ -576,11 +673,63 @@ class SlackProgressCallback(AsyncCallbackHandler):
 
 
 class ToolMetricsCallback(AsyncCallbackHandler):
-    """Callback handler for recording tool execution metrics"""
+    """
+    Callback handler for recording tool execution metrics.
+
+    Also collects, per agent iteration, the scratchpad token usage reported
+    by ScratchpadManager and each LLM call's latency, so a job can show
+    whether prompts and latency stayed flat as tool calls accumulated.
+    """
 
     def __init__(self):
         super().__init__()
         self.tool_start_times: Dict[str, float] = {}
+        self.llm_start_times: Dict[str, float] = {}
+        self.llm_call_seconds: List[float] = []
+        self.scratchpad_usage: List[ScratchpadUsage] = []
+
+    def record_scratchpad_usage(self, usage: ScratchpadUsage) -> None:
+        """Called by ScratchpadManager once per agent iteration."""
+        self.scratchpad_usage.append(usage)
+        if usage.saved_tokens > 0:
+            TOOL_METRICS["rca_tool_scratchpad_tokens_saved_total"].add(
+                usage.saved_tokens
+            )
+
+    @property
+    def scratchpad_tokens_saved(self) -> int:
+        return sum(usage.saved_tokens for usage in self.scratchpad_usage)
+
+    def summary(self) -> Dict[str, Any]:
+        """Scratchpad savings and LLM latency for the job, for logging."""
+        return {
+            "agent_iterations": len(self.scratchpad_usage),
+            "scratchpad_tokens_sent": sum(u.sent_tokens for u in self.scratchpad_usage),
+            "scratchpad_tokens_saved": self.scratchpad_tokens_saved,
+            "llm_calls": len(self.llm_call_seconds),
+            "llm_seconds_first": round(self.llm_call_seconds[0], 2)
+            if self.llm_call_seconds
+            else None,
+            "llm_seconds_last": round(self.llm_call_seconds[-1], 2)
+            if self.llm_call_seconds
+            else None,
+            "llm_seconds_max": round(max(self.llm_call_seconds), 2)
+            if self.llm_call_seconds
+            else None,
+        }
+
+    async def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List, **kwargs: Any
+    ) -> None:
+        self.llm_start_times[str(kwargs.get("run_id", ""))] = time.time()
+
+    async def on_llm_end(self, response: Any, **kwargs: Any) -> None:
+        started = self.llm_start_times.pop(str(kwargs.get("run_id", "")), None)
+        if started is not None:
+            self.llm_call_seconds.append(time.time() - started)
+
+    async def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        self.llm_start_times.pop(str(kwargs.get("run_id", "")), None)
 
     async def on_tool_start(
         self,
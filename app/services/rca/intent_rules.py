@@ -0,0 +1,171 @@
+"""
+Deterministic fast path for query intent classification.
+
+classify_query_intent asks the LLM whether a query is an RCA investigation
+or a conversational question. Many queries don't need that round trip:
+alerts picked up by AlertDetector, pasted stack traces and "why is X
+failing" reports are investigations; greetings, "show my teams" and "who
+owns X" are conversational. classify_by_rules() decides those and returns
+None for everything else, which still goes to the LLM.
+
+Investigation rules run first, so a query carrying both kinds of cue
+("show me why checkout is failing") is never answered conversationally.
+Accuracy and latency against labeled queries are measured by
+tests/benchmarks/test_intent_benchmark.py; keep it passing when adding rules.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+RCA_INVESTIGATION = "rca_investigation"
+CONVERSATIONAL = "conversational"
+
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+_STACK_TRACE = re.compile(
+    r"Traceback \(most recent call last\)"  # Python
+    r"|^\s*File \"[^\"]+\", line \d+"  # Python frame
+    r"|^\s*at [\w$.<>]+\(.*(?:\.\w+:\d+|Native Method|Unknown Source)\)"  # Java/Kotlin frame
+    r"|^\s*at .+ \(?[^\s()]+\.[jt]sx?:\d+:\d+\)?"  # Node frame
+    r"|^goroutine \d+ \[[\w ]+\]:"  # Go panic
+    r"|^(?:panic|fatal error): "
+    r"|^\w+(?:\.\w+)*(?:Error|Exception): \S",  # Exception line
+    _FLAGS,
+)
+
+_PROBLEM = (
+    r"(?:slow|down|fail(?:s|ed|ing)?|erroring|crash\w*|broken|hanging|stuck"
+    r"|timing out|timeouts?|throwing|unhealthy|degraded|unavailable|unreachable"
+    r"|restarting|oom\w*|returning (?:5\d\d|errors?|\d{3} errors?)|5\d\d)"
+)
+
+_INVESTIGATION_RULES = (
+    (
+        "why_problem",
+        re.compile(
+            r"\bwhy (?:is|are|does|do|did|was|were|has|have)\b[^?\n]*\b"
+            r"(?:" + _PROBLEM + r"|errors?|exceptions?)\b",
+            _FLAGS,
+        ),
+    ),
+    (
+        "reported_problem",
+        re.compile(
+            r"\b(?:is|are|keeps?|kept|started|been|went|going)\s+(?:still\s+)?"
+            + _PROBLEM
+            + r"\b",
+            _FLAGS,
+        ),
+    ),
+    (
+        "error_symptom",
+        re.compile(
+            r"\b(?:returning|throwing|getting|seeing|hitting|spiking with)\s+"
+            r"(?:lots of\s+|a lot of\s+|many\s+)?"
+            r"(?:5\d\d|\d{3} errors?|errors?|exceptions?|timeouts?)\b",
+            _FLAGS,
+        ),
+    ),
+    (
+        "metric_spike",
+        re.compile(
+            r"\b(?:latency|error rate|errors?|cpu|memory|p9\d|response times?)\s+"
+            r"(?:is\s+|are\s+)?(?:spik\w*|surg\w*|jump\w*|through the roof|high|increas\w*)\b"
+            r"|\b(?:spike|surge|jump) in (?:latency|errors?|error rate|5\d\d|cpu|memory)\b",
+            _FLAGS,
+        ),
+    ),
+    (
+        "investigation_request",
+        re.compile(
+            r"\b(?:investigate|debug|troubleshoot|root cause|outage)\b",
+            _FLAGS,
+        ),
+    ),
+)
+
+_ENTITIES = (
+    r"(?:teams?|services?|repos?|repositories|environments?|envs?|commits?|members?"
+    r"|integrations?|prs?|pull requests?|deployments?|branches)"
+)
+
+_CONVERSATIONAL_RULES = (
+    (
+        "greeting",
+        re.compile(
+            r"^(?:hi|hello|hey|yo|hiya|thanks|thank you|thx|ty|cheers"
+            r"|good (?:morning|afternoon|evening))(?:\s+(?:there|team|all|bot))?[\s!.,:)]*$",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "capabilities",
+        re.compile(
+            r"^(?:help|what can you do|what do you do|how (?:do|does) (?:you|this) work"
+            r"|who are you)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "list_entities",
+        re.compile(
+            r"^(?:show|list|get|give|display|what are)(?: me)?(?: (?:all|my|our|the|of))*"
+            r"(?: (?:recent|latest|last \d+|\d+))? " + _ENTITIES + r"\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "which_entities",
+        re.compile(
+            r"^(?:what|which) " + _ENTITIES + r" (?:do|does|are|is)\b"
+            r"|^what(?:'s| is) (?:deployed|running) (?:in|on|to)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "ownership",
+        re.compile(
+            r"^(?:who|which team)\b[^?\n]*\b(?:owns?|manages?|maintains?|responsible for"
+            r"|belongs? to|member of|works on)\b"
+            r"|^which team (?:is|does)\b",
+            re.IGNORECASE,
+        ),
+    ),
+)
+
+# Slack mentions (e.g. the bot's own "<@U123>") carry no intent
+_MENTION = re.compile(r"<[@#!][^>]*>")
+
+
+@dataclass
+class IntentMatch:
+    intent: str
+    rule: str  # Name of the rule that decided, for logs and metrics
+
+
+def classify_by_rules(
+    query: str, context: Optional[Dict[str, Any]] = None
+) -> Optional[IntentMatch]:
+    """Classify unambiguous queries; None means the LLM should decide."""
+    context = context or {}
+    if context.get("auto_detected") or context.get("alert_info"):
+        return IntentMatch(RCA_INVESTIGATION, "alert")
+
+    if _STACK_TRACE.search(query):
+        return IntentMatch(RCA_INVESTIGATION, "stack_trace")
+
+    text = _MENTION.sub(" ", query).strip()
+    for rule, pattern in _INVESTIGATION_RULES:
+        if pattern.search(text):
+            return IntentMatch(RCA_INVESTIGATION, rule)
+
+    # Conversational phrasings are only trusted on a single-line question;
+    # anything longer may describe a problem in words the rules above miss
+    if "\n" in text or len(text) > 200:
+        return None
+    for rule, pattern in _CONVERSATIONAL_RULES:
+        if pattern.search(text):
+            return IntentMatch(CONVERSATIONAL, rule)
+
+    return None
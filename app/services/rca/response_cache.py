@@ -0,0 +1,55 @@
+"""
+Response cache for conversational RCA queries.
+
+Questions like "what services do we have?" or "what's deployed in prod?" are
+answered from the workspace context alone (services, teams, environments,
+deployments, integrations). Their answers are cached per workspace under the
+normalized question text, in a VersionedCache that is part of
+WORKSPACE_CACHES, so any write to that context invalidates every cached
+answer for the workspace.
+
+Only answers the conversational agent produced without calling tools are
+stored; tool output (repositories, commits, code) changes independently of
+workspace state. Follow-ups in a thread, PII-masked queries and queries with
+attachments are never cached, since their answers depend on more than the
+question.
+"""
+
+import hashlib
+import re
+from typing import Any, Dict, Optional
+
+# Slack user/channel mentions (e.g. the bot's own "<@U123>")
+_MENTION = re.compile(r"<[@#!][^>]*>")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase, drop mentions and punctuation, collapse whitespace."""
+    query = _MENTION.sub(" ", query or "")
+    return _NON_WORD.sub(" ", query.lower()).strip()
+
+
+def response_cache_key(query: str, context: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Cache key for query, or None when its answer must not be cached."""
+    context = context or {}
+    if (
+        context.get("thread_history")
+        or context.get("pii_mapping")
+        or context.get("files")
+    ):
+        return None
+    normalized = normalize_query(query)
+    if not normalized:
+        return None
+    return hashlib.sha256(normalized.encode()).hexdigest()[:32]
+
+
+def is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """True for a successful conversational answer that used no tools."""
+    if not result.get("success") or not result.get("output"):
+        return False
+    for step in result.get("intermediate_steps") or []:
+        if isinstance(step, dict) and step.get("stage") == "conversational":
+            return step.get("details", {}).get("tools_used") == 0
+    return False
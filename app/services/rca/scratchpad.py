@@ -0,0 +1,129 @@
+"""
+Context-window management for the tool-calling agent's scratchpad.
+
+AgentExecutor resends every earlier tool call and its full output on each
+iteration, so prompts (and LLM latency) grow with every tool call.
+ScratchpadManager is the agent's message formatter: the most recent
+observations go out verbatim, older ones are replaced by a short
+structured summary (the result's first line, its error/failure lines and
+its closing remark). The tool calls themselves are kept, so the agent
+still sees what it already asked for and doesn't repeat it.
+
+Token use is estimated per iteration and reported to on_iteration
+(ToolMetricsCallback.record_scratchpad_usage when that callback is in use).
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from langchain.agents.format_scratchpad.tools import format_to_tool_messages
+from langchain_core.agents import AgentAction
+from langchain_core.messages import BaseMessage
+
+from app.core.config import settings
+from app.services.rca.tools.compaction import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Lines worth keeping from an older observation
+_SIGNAL = re.compile(
+    r"error|exception|fail|fatal|panic|timeout|timed out|refused|denied|killed|oom|\b5\d\d\b",
+    re.IGNORECASE,
+)
+_SIGNAL_LINES = 5
+
+
+@dataclass
+class ScratchpadUsage:
+    iteration: int  # 1 for the first LLM call after a tool result
+    steps: int  # Tool calls in the scratchpad
+    compressed_steps: int
+    raw_tokens: int  # Observation tokens if everything were sent verbatim
+    sent_tokens: int
+
+    @property
+    def saved_tokens(self) -> int:
+        return self.raw_tokens - self.sent_tokens
+
+
+def summarize_observation(tool: str, observation: str, max_chars: int) -> str:
+    """Structured summary of an older tool result."""
+    lines = [line.strip() for line in observation.splitlines() if line.strip()]
+    if not lines:
+        return observation
+
+    kept = [lines[0]]
+    signal = [line for line in lines[1:-1] if _SIGNAL.search(line)][:_SIGNAL_LINES]
+    kept += [f"- {line}" for line in signal]
+    if len(lines) > 1 and lines[-1].startswith("("):
+        kept.append(lines[-1])
+
+    header = (
+        f"[Earlier {tool} result, summarized from ~{estimate_tokens(observation)} tokens; "
+        "call the tool again if the full output is needed]"
+    )
+    summary = "\n".join([header] + kept)
+    return summary if len(summary) <= max_chars else summary[: max_chars - 3] + "..."
+
+
+class ScratchpadManager:
+    """Formats intermediate steps for the agent, compressing older observations."""
+
+    def __init__(
+        self,
+        keep_recent: Optional[int] = None,
+        summary_max_chars: Optional[int] = None,
+        on_iteration: Optional[Callable[[ScratchpadUsage], None]] = None,
+    ):
+        self.keep_recent = (
+            settings.RCA_SCRATCHPAD_KEEP_RECENT if keep_recent is None else keep_recent
+        )
+        self.summary_max_chars = (
+            summary_max_chars or settings.RCA_SCRATCHPAD_SUMMARY_MAX_CHARS
+        )
+        self.on_iteration = on_iteration
+        self.usage: List[ScratchpadUsage] = []
+        self._summaries = {}
+
+    def _summary(self, action: AgentAction, observation: str) -> str:
+        key = (getattr(action, "tool_call_id", None) or action.log, len(observation))
+        if key not in self._summaries:
+            self._summaries[key] = summarize_observation(
+                action.tool, observation, self.summary_max_chars
+            )
+        return self._summaries[key]
+
+    def format(
+        self, intermediate_steps: Sequence[Tuple[AgentAction, str]]
+    ) -> List[BaseMessage]:
+        steps = []
+        raw_tokens = sent_tokens = compressed = 0
+        older = len(intermediate_steps) - self.keep_recent
+
+        for index, (action, observation) in enumerate(intermediate_steps):
+            text = observation if isinstance(observation, str) else str(observation)
+            raw_tokens += estimate_tokens(text)
+            if index < older and len(text) > self.summary_max_chars:
+                text = self._summary(action, text)
+                compressed += 1
+            sent_tokens += estimate_tokens(text)
+            steps.append((action, text))
+
+        if steps:
+            usage = ScratchpadUsage(
+                iteration=len(self.usage) + 1,
+                steps=len(steps),
+                compressed_steps=compressed,
+                raw_tokens=raw_tokens,
+                sent_tokens=sent_tokens,
+            )
+            self.usage.append(usage)
+            if self.on_iteration is not None:
+                try:
+                    self.on_iteration(usage)
+                except Exception:
+                    logger.debug("Scratchpad usage callback failed", exc_info=True)
+
+        return format_to_tool_messages(steps)
@@ -0,0 +1,104 @@
+"""
+Token streaming of the final RCA answer.
+
+The synthesis and conversational agents tag their answer-producing LLM runs
+with FINAL_ANSWER_TAG; progress callbacks collect those runs' tokens in an
+AnswerStream and deliver throttled updates (SSE delta events for web chat,
+chat.update edits for Slack). Other streamed LLM runs, such as the evidence
+agent's, are ignored.
+
+The final response is still delivered as before once the job completes; the
+stream only shows it early.
+"""
+
+import re
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+from uuid import UUID
+
+FINAL_ANSWER_TAG = "rca_final_answer"
+
+# A trailing run of word characters might be the start of a PII placeholder
+# ("email1" vs "email12"), so it is held back until the word is complete
+_TRAILING_WORD = re.compile(r"\w*\Z")
+
+
+def is_final_answer_run(tags: Optional[list]) -> bool:
+    return bool(tags) and FINAL_ANSWER_TAG in tags
+
+
+@dataclass
+class AnswerUpdate:
+    text: str  # Full answer text so far
+    delta: str  # Text added since the previous update
+    reset: bool  # The answer restarted (new LLM run); text replaces earlier updates
+
+
+class AnswerStream:
+    """
+    Accumulates final-answer tokens and hands out throttled updates.
+
+    Tokens from a new LLM run (the agent's next turn, or a retry) restart the
+    answer. With an unmask function, placeholders are restored before text
+    is handed out.
+    """
+
+    def __init__(
+        self,
+        min_interval_seconds: float,
+        unmask: Optional[Callable[[str], str]] = None,
+    ):
+        self.min_interval_seconds = min_interval_seconds
+        self.unmask = unmask
+        self._run_id: Optional[UUID] = None
+        self._raw = ""
+        self._sent = ""
+        self._reset_pending = False
+        self._last_update = 0.0
+
+    def add(self, run_id: UUID, token: str) -> None:
+        if run_id != self._run_id:
+            self._run_id = run_id
+            self._raw = ""
+            if self._sent:
+                self._sent = ""
+                self._reset_pending = True
+        self._raw += token
+
+    def _visible_text(self, final: bool) -> str:
+        if self.unmask is None:
+            return self._raw
+        raw = (
+            self._raw
+            if final
+            else self._raw[: _TRAILING_WORD.search(self._raw).start()]
+        )
+        return self.unmask(raw)
+
+    def take(self, final: bool = False) -> Optional[AnswerUpdate]:
+        """
+        Return an update if there is new text and one is due.
+
+        final=True (the LLM run ended) ignores the throttle and releases any
+        held-back text.
+        """
+        now = time.monotonic()
+        if not final and now - self._last_update < self.min_interval_seconds:
+            return None
+
+        text = self._visible_text(final)
+        if not text or (text == self._sent and not self._reset_pending):
+            return None
+        if not text.startswith(self._sent):
+            # Unmasking changed earlier text; resend it whole
+            self._sent = ""
+            self._reset_pending = True
+
+        update = AnswerUpdate(
+            text=text, delta=text[len(self._sent) :], reset=self._reset_pending
+        )
+        self._sent = text
+        self._reset_pending = False
+        self._last_update = now
+        return update
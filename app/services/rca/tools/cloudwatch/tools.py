@@ -21,6 +21,7 @@ from app.aws.cloudwatch.Metrics.schemas import (
 )
 from app.aws.cloudwatch.Metrics.service import cloudwatch_metrics_service
 from app.core.database import AsyncSessionLocal
+from app.services.rca.tools.compaction import compact_rows
 
 logger = logging.getLogger(__name__)
 
@@ -69,38 +70,44 @@ def _format_log_groups_response(response) -> str:
         return f"Error parsing log groups: {str(e)}"
 
 
-def _format_log_events_response(response, limit: int = 50) -> str:
+def _format_log_events_response(
+    response,
+    tool: str = "filter_cloudwatch_log_events_tool",
+    max_tokens: Optional[int] = None,
+) -> str:
     """Format CloudWatch log events response for LLM consumption"""
     try:
         if not response.events:
             return "No log events found for the specified criteria."
 
-        logs = []
-        for event in response.events[:limit]:
+        rows = []
+        for event in response.events:
             # Convert timestamp from milliseconds to datetime
             timestamp = datetime.fromtimestamp(event.timestamp / 1000, tz=timezone.utc)
-            timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-            message = event.message.strip()
-
-            logs.append(f"[{timestamp_str}] {message}")
+            rows.append(
+                (timestamp.strftime("%Y-%m-%d %H:%M:%S"), event.message.strip())
+            )
 
-        count = len(logs)
-        summary = (
-            f"Found {response.totalCount} log entries (showing {count}):\n\n"
-            + "\n".join(logs)
+        return compact_rows(
+            tool,
+            f"Found {response.totalCount} log entries (times UTC):",
+            ("time", "message"),
+            rows,
+            total=response.totalCount,
+            max_tokens=max_tokens,
+            key_columns=(1,),
         )
 
-        if response.totalCount > limit:
-            summary += f"\n\n(Showing first {limit} entries. {response.totalCount - limit} more logs available.)"
-
-        return summary
-
     except Exception as e:
         logger.debug(f"Error formatting log events: {e}")
         return f"Error parsing log events: {str(e)}"
 
 
-def _format_insights_query_response(response) -> str:
+def _format_insights_query_response(
+    response,
+    tool: str = "execute_cloudwatch_insights_query_tool",
+    max_tokens: Optional[int] = None,
+) -> str:
     """Format CloudWatch Insights query results for LLM consumption"""
     try:
         if response.status != "Complete":
@@ -109,64 +116,68 @@ def _format_insights_query_response(response) -> str:
         if not response.results:
             return "Query completed but no results found."
 
-        # Format results as table
-        formatted_rows = []
-        for row in response.results[:50]:  # Limit to first 50 results
-            fields = {}
-            for field in row:
-                fields[field.field] = field.value or ""
-
-            # Create a formatted row
-            row_str = " | ".join([f"{k}: {v}" for k, v in fields.items()])
-            formatted_rows.append(row_str)
-
-        summary = (
-            f"Query completed successfully. Found {len(response.results)} results:\n\n"
-        )
-        summary += "\n".join(formatted_rows)
+        # Columns in first-seen order; rows may omit fields
+        records = [
+            {field.field: field.value or "" for field in row}
+            for row in response.results
+        ]
+        columns = list(dict.fromkeys(name for record in records for name in record))
 
+        notes = []
         if response.statistics:
-            summary += "\n\n📊 **Statistics:**\n"
-            summary += f"   Records matched: {response.statistics.recordsMatched}\n"
-            summary += f"   Records scanned: {response.statistics.recordsScanned}\n"
-            summary += f"   Bytes scanned: {response.statistics.bytesScanned}"
-
-        if len(response.results) > 50:
-            summary += f"\n\n(Showing first 50 results. Total: {len(response.results)})"
+            notes.append(
+                f"Records matched: {response.statistics.recordsMatched}, "
+                f"scanned: {response.statistics.recordsScanned}, "
+                f"bytes scanned: {response.statistics.bytesScanned}"
+            )
 
-        return summary
+        return compact_rows(
+            tool,
+            f"Query completed successfully. Found {len(response.results)} results:",
+            columns,
+            [[record.get(name, "") for name in columns] for record in records],
+            max_tokens=max_tokens,
+            notes=notes,
+            fold=False,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting insights query: {e}")
         return f"Error parsing query results: {str(e)}"
 
 
-def _format_metrics_response(response) -> str:
+def _format_metrics_response(
+    response,
+    tool: str = "list_cloudwatch_metrics_tool",
+    max_tokens: Optional[int] = None,
+) -> str:
     """Format CloudWatch metrics list response for LLM consumption"""
     try:
         if not response.Metrics:
             return "No metrics found for the specified criteria."
 
-        formatted = []
-        for metric in response.Metrics[:30]:  # Limit to first 30
-            namespace = metric.Namespace or "Unknown"
-            metric_name = metric.MetricName or "Unknown"
-
-            dimensions_str = ""
-            if metric.Dimensions:
-                dims = [f"{d.get('Name')}={d.get('Value')}" for d in metric.Dimensions]
-                dimensions_str = f"\n   Dimensions: {', '.join(dims)}"
-
-            formatted.append(
-                f"📊 **{metric_name}**\n   Namespace: {namespace}{dimensions_str}"
+        rows = []
+        for metric in response.Metrics:
+            dims = [
+                f"{d.get('Name')}={d.get('Value')}" for d in metric.Dimensions or []
+            ]
+            rows.append(
+                (
+                    metric.MetricName or "Unknown",
+                    metric.Namespace or "Unknown",
+                    ",".join(dims),
+                )
             )
 
-        summary = f"Found {response.TotalCount} metrics:\n\n" + "\n\n".join(formatted)
-
-        if response.TotalCount > 30:
-            summary += f"\n\n(Showing first 30 metrics. Total: {response.TotalCount})"
-
-        return summary
+        return compact_rows(
+            tool,
+            f"Found {response.TotalCount} metrics:",
+            ("metric", "namespace", "dimensions"),
+            rows,
+            total=response.TotalCount,
+            max_tokens=max_tokens,
+            fold=False,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting metrics response: {e}")
@@ -339,7 +350,9 @@ async def filter_cloudwatch_log_events_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_log_events_response(response, limit=limit)
+        return _format_log_events_response(
+            response, tool="filter_cloudwatch_log_events_tool"
+        )
 
     except Exception as e:
         logger.exception(f"Error in filter_cloudwatch_log_events_tool: {e}")
@@ -396,7 +409,7 @@ async def search_cloudwatch_logs_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_log_events_response(response, limit=limit)
+        return _format_log_events_response(response, tool="search_cloudwatch_logs_tool")
 
     except Exception as e:
         logger.exception(f"Error in search_cloudwatch_logs_tool: {e}")
@@ -461,7 +474,9 @@ async def execute_cloudwatch_insights_query_tool(
                 max_wait_seconds=max_wait_seconds,
             )
 
-        return _format_insights_query_response(response)
+        return _format_insights_query_response(
+            response, tool="execute_cloudwatch_insights_query_tool"
+        )
 
     except Exception as e:
         logger.exception(f"Error in execute_cloudwatch_insights_query_tool: {e}")
@@ -517,7 +532,7 @@ async def list_cloudwatch_metrics_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="list_cloudwatch_metrics_tool")
 
     except Exception as e:
         logger.exception(f"Error in list_cloudwatch_metrics_tool: {e}")
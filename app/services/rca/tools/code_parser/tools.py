@@ -1,30 +1,36 @@
-import json
+import functools
 import logging
+from typing import Callable, Optional, Tuple
 
 from langchain_core.tools import tool
 
+from app.services.rca.tools.compaction import compact_json
+
 logger = logging.getLogger(__name__)
 
 # Maximum code size to parse (1 MB). Larger inputs are rejected to prevent DoS.
 MAX_CODE_SIZE = 1_000_000
 
-# Workaround for tree-sitter-languages bug with Python 3.12
-TREE_SITTER_AVAILABLE = False
-get_parser = None
-_TREE_SITTER_ERROR = None
 
-try:
-    from tree_sitter_languages import get_parser as _get_parser_tsl
+@functools.lru_cache(maxsize=1)
+def _tree_sitter() -> Tuple[Optional[Callable], Optional[str]]:
+    """
+    Return (get_parser, None), or (None, reason) if tree-sitter is unusable.
 
-    _test_parser = _get_parser_tsl("python")
-    TREE_SITTER_AVAILABLE = True
-    get_parser = _get_parser_tsl
-except Exception as e:
-    get_parser = None
-    _TREE_SITTER_ERROR = (
-        "tree-sitter-languages unavailable or incompatible with current Python runtime: "
-        + str(e)
-    )
+    Resolved on first parse rather than at import, since building the test
+    parser loads the grammar bundle.
+    """
+    # Workaround for tree-sitter-languages bug with Python 3.12
+    try:
+        from tree_sitter_languages import get_parser
+
+        get_parser("python")
+        return get_parser, None
+    except Exception as e:
+        return None, (
+            "tree-sitter-languages unavailable or incompatible with current Python runtime: "
+            + str(e)
+        )
 
 
 @tool
@@ -39,7 +45,7 @@ async def parse_code_tool(code: str, language: str = "python") -> str:
     Returns:
         JSON string with language, has_error flag, and AST sexp representation
     """
-    return json.dumps(parse_code(code=code, language=language), indent=2)
+    return compact_json("parse_code_tool", parse_code(code=code, language=language))
 
 
 def parse_code(code: str, language: str = "python") -> dict:
@@ -160,6 +166,7 @@ def _parse_python(code: str) -> dict:
 
 
 def _parse_with_tree_sitter_or_fallback(code: str, language: str) -> dict:
+    get_parser, unavailable_reason = _tree_sitter()
     if get_parser is not None:
         try:
             parser = get_parser(language)
@@ -174,11 +181,7 @@ def _parse_with_tree_sitter_or_fallback(code: str, language: str) -> dict:
         except Exception as e:
             error_msg = f"tree-sitter parsing failed: {str(e)}"
     else:
-        error_msg = getattr(
-            globals(),
-            "_TREE_SITTER_ERROR",
-            "tree-sitter-languages package not available",
-        )
+        error_msg = unavailable_reason
 
     return {
         "language": language,
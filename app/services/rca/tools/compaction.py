@@ -0,0 +1,233 @@
+"""
+Shared compaction of RCA tool output.
+
+Tool results go straight into the agent's context window, so formatters
+render them through this module instead of capping entries ad hoc:
+
+- compact_rows() renders records as one pipe-separated table (a header
+  line, then one line per row), folds rows that repeat the same message
+  (ignoring ids and timestamps, but not other numbers) into a single row
+  with a count, and adds rows only while the output fits the token budget;
+- compact_json() renders structured results without indentation and trims
+  the longest lists, then the longest strings, until they fit.
+
+Both count the tokens saved against a plain rendering of everything the
+tool received (rca_tool_output_tokens_saved_total, per tool). Token counts
+are estimated at CHARS_PER_TOKEN characters per token.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Iterable, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.otel_metrics import TOOL_METRICS
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN = 4
+
+# Budget kept free for the closing "(N more rows not shown ...)" line
+_REMARK_RESERVE_CHARS = 160
+
+# Parts of a line that differ between repeats of the same event: UUIDs,
+# hex ids (0x..., or 8+ hex digits) and timestamps. Other numbers (status
+# codes, durations, counts) are kept, so "returned 500" and "returned 200"
+# stay separate rows.
+_VOLATILE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}(?::\d{2}(?:[.,]\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?"
+    r"|\b\d{2}:\d{2}:\d{2}(?:[.,]\d+)?\b"
+    r"|\b0x[0-9a-f]+\b|\b(?=[0-9a-f]*\d)[0-9a-f]{8,}\b",
+    re.IGNORECASE,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def _record_savings(tool: str, raw_tokens: int, emitted: str) -> None:
+    saved = max(0, raw_tokens - estimate_tokens(emitted))
+    TOOL_METRICS["rca_tool_output_tokens_saved_total"].add(saved, {"tool": tool})
+    logger.debug(
+        f"{tool} output compacted: ~{raw_tokens} -> ~{raw_tokens - saved} tokens"
+    )
+
+
+def _cell(value: Any) -> str:
+    text = "" if value is None else str(value)
+    text = " ".join(text.split())  # One line per row
+    text = text.replace("|", "/")
+    limit = settings.RCA_TOOL_OUTPUT_MAX_CELL_CHARS
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+def _repeat_key(row: Sequence[str], key_columns: Sequence[int]) -> tuple:
+    return tuple(_VOLATILE.sub("#", row[i]) for i in key_columns)
+
+
+def compact_rows(
+    tool: str,
+    title: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+    total: Optional[int] = None,
+    max_tokens: Optional[int] = None,
+    key_columns: Optional[Sequence[int]] = None,
+    notes: Sequence[str] = (),
+    fold: bool = True,
+) -> str:
+    """
+    Render rows as a compact table within max_tokens.
+
+    Args:
+        tool: Tool name, for the savings metric
+        title: First line, e.g. "Found 120 log entries"
+        columns: Column names
+        rows: One sequence of cell values per record
+        total: Records matching upstream, when more than len(rows)
+        max_tokens: Budget for the whole output (default RCA_TOOL_OUTPUT_MAX_TOKENS)
+        key_columns: Columns identifying a repeated row (default: all); a
+            timestamp column is usually left out so repeats fold together
+        notes: Lines appended after the table (they count towards the budget)
+        fold: Fold repeated rows; pass False for aggregates (query results,
+            metric series), where every row is a distinct result
+    """
+    max_tokens = max_tokens or settings.RCA_TOOL_OUTPUT_MAX_TOKENS
+    key_columns = range(len(columns)) if key_columns is None else key_columns
+
+    raw_chars = 0
+    grouped = {}
+    for values in rows:
+        raw_chars += sum(
+            len(f"{name}: {value}") + 3 for name, value in zip(columns, values)
+        )
+        row = [_cell(value) for value in values]
+        key = _repeat_key(row, key_columns) if fold else len(grouped)
+        if key in grouped:
+            grouped[key][1] += 1
+        else:
+            grouped[key] = [row, 1]
+    received = sum(count for _, count in grouped.values())
+
+    repeated = any(count > 1 for _, count in grouped.values())
+    header = list(columns) + (["n"] if repeated else [])
+    lines: List[str] = [title, "|".join(header)]
+
+    footer = list(notes)
+    budget_chars = max_tokens * CHARS_PER_TOKEN - sum(len(line) + 1 for line in footer)
+    used = sum(len(line) + 1 for line in lines)
+    shown = 0
+    for row, count in grouped.values():
+        line = "|".join(row + ([str(count)] if repeated else []))
+        if used + len(line) + 1 > budget_chars - _REMARK_RESERVE_CHARS and shown:
+            break
+        lines.append(line)
+        used += len(line) + 1
+        shown += 1
+
+    omitted = len(grouped) - shown
+    total = max(total or 0, received)
+    remarks = []
+    if repeated:
+        remarks.append(f"{received} rows folded into {len(grouped)}, n = occurrences")
+    if omitted:
+        remarks.append(f"{omitted} more distinct rows not shown")
+    if total > received:
+        remarks.append(f"{total} matched in total")
+    if omitted or total > received:
+        remarks.append("narrow the query or time range for more")
+    if remarks:
+        lines.append(f"({'; '.join(remarks)})")
+
+    output = "\n".join(lines + footer)
+    _record_savings(tool, raw_chars // CHARS_PER_TOKEN + estimate_tokens(title), output)
+    return output
+
+
+def _longest_list(value: Any, path: tuple = ()) -> tuple:
+    """Return (path, length) of the longest list inside value."""
+    best = (None, 0)
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        if len(value) > 1:
+            best = (path, len(value))
+        items = enumerate(value)
+    else:
+        return best
+    for key, child in items:
+        found = _longest_list(child, path + (key,))
+        if found[1] > best[1]:
+            best = found
+    return best
+
+
+def _longest_string(value: Any, path: tuple = ()) -> tuple:
+    """Return (path, length) of the longest string stored under a dict key."""
+    best = (None, 0)
+    if isinstance(value, dict):
+        items = value.items()
+    elif isinstance(value, list):
+        items = enumerate(value)
+    else:
+        return best
+    for key, child in items:
+        if isinstance(child, str) and isinstance(key, str):
+            found = (path + (key,), len(child))
+        else:
+            found = _longest_string(child, path + (key,))
+        if found[1] > best[1]:
+            best = found
+    return best
+
+
+def _parent(value: Any, path: tuple) -> Any:
+    for key in path[:-1]:
+        value = value[key]
+    return value
+
+
+def compact_json(tool: str, value: Any, max_tokens: Optional[int] = None) -> str:
+    """
+    Render value as single-line JSON within max_tokens.
+
+    Oversized results have their longest list halved until they fit; the
+    number of dropped items is reported next to the list as "<key>_omitted".
+    If that isn't enough, the longest strings are shortened, with the number
+    of dropped characters reported as "<key>_truncated". The output is
+    always valid JSON.
+    """
+    max_tokens = max_tokens or settings.RCA_TOOL_OUTPUT_MAX_TOKENS
+    raw_tokens = estimate_tokens(json.dumps(value, indent=2, default=str))
+    value = json.loads(json.dumps(value, default=str))  # Private copy to trim
+
+    output = json.dumps(value, separators=(",", ":"))
+    while estimate_tokens(output) > max_tokens:
+        path, length = _longest_list(value)
+        if path is None or not path or not isinstance(path[-1], str):
+            break
+        parent = _parent(value, path)
+        keep = length // 2
+        parent[path[-1]] = parent[path[-1]][:keep]
+        omitted_key = f"{path[-1]}_omitted"
+        parent[omitted_key] = parent.get(omitted_key, 0) + length - keep
+        output = json.dumps(value, separators=(",", ":"))
+
+    while estimate_tokens(output) > max_tokens:
+        path, length = _longest_string(value)
+        if path is None:
+            break
+        parent = _parent(value, path)
+        truncated_key = f"{path[-1]}_truncated"
+        # Room for the marker; escaping makes this approximate, so loop
+        excess = len(output) - max_tokens * CHARS_PER_TOKEN + len(truncated_key) + 8
+        keep = max(0, length - excess)
+        parent[path[-1]] = parent[path[-1]][:keep]
+        parent[truncated_key] = parent.get(truncated_key, 0) + length - keep
+        output = json.dumps(value, separators=(",", ":"))
+
+    _record_savings(tool, raw_tokens, output)
+    return output
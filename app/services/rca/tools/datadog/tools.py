@@ -21,6 +21,7 @@ from app.datadog.Metrics.schemas import (
     SimpleQueryRequest,
 )
 from app.datadog.Metrics.service import datadog_metrics_service
+from app.services.rca.tools.compaction import compact_rows
 
 logger = logging.getLogger(__name__)
 
@@ -30,89 +31,87 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-def _format_logs_search_response(response, limit: int = 50) -> str:
+def _format_logs_search_response(
+    response, tool: str = "search_datadog_logs_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format Datadog logs search response for LLM consumption"""
     try:
         if not response.data:
             return "No log entries found for the specified query."
 
-        logs = []
-        for log in response.data[:limit]:
-            # Extract timestamp and message
+        rows = []
+        for log in response.data:
+            attributes = log.attributes
             timestamp_str = "N/A"
-            if log.attributes and log.attributes.timestamp:
+            if attributes and attributes.timestamp:
                 timestamp = datetime.fromisoformat(
-                    log.attributes.timestamp.replace("Z", "+00:00")
+                    attributes.timestamp.replace("Z", "+00:00")
+                )
+                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+            rows.append(
+                (
+                    timestamp_str,
+                    ((attributes and attributes.status) or "info").upper(),
+                    (attributes and attributes.service) or "unknown",
+                    (attributes and attributes.message) or "No message",
                 )
-                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-            message = "No message"
-            if log.attributes and log.attributes.message:
-                message = log.attributes.message
-
-            # Include service and status if available
-            service = (
-                log.attributes.service
-                if log.attributes and log.attributes.service
-                else "unknown"
-            )
-            status = (
-                log.attributes.status
-                if log.attributes and log.attributes.status
-                else "info"
             )
 
-            logs.append(f"[{timestamp_str}] [{status.upper()}] [{service}] {message}")
-
-        count = len(logs)
-        summary = (
-            f"Found {response.totalCount} log entries (showing {count}):\n\n"
-            + "\n".join(logs)
-        )
-
-        if response.totalCount > limit:
-            summary += f"\n\n(Showing first {limit} entries. {response.totalCount - limit} more logs available.)"
-
+        notes = []
         if response.meta:
-            summary += f"\n\nQuery elapsed time: {response.meta.elapsed}ms"
-
-        return summary
+            notes.append(f"Query elapsed time: {response.meta.elapsed}ms")
+
+        return compact_rows(
+            tool,
+            f"Found {response.totalCount} log entries (times UTC):",
+            ("time", "status", "service", "message"),
+            rows,
+            total=response.totalCount,
+            max_tokens=max_tokens,
+            key_columns=(1, 2, 3),
+            notes=notes,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting logs search response: {e}")
         return f"Error parsing log entries: {str(e)}"
 
 
-def _format_logs_list_response(response, limit: int = 50) -> str:
+def _format_logs_list_response(
+    response, tool: str = "list_datadog_logs_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format Datadog simplified logs list response for LLM consumption"""
     try:
         if not response.logs:
             return "No log entries found for the specified criteria."
 
-        logs = []
-        for log in response.logs[:limit]:
+        rows = []
+        for log in response.logs:
             timestamp_str = "N/A"
             if log.timestamp:
                 timestamp = datetime.fromisoformat(log.timestamp.replace("Z", "+00:00"))
-                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-            message = log.message or "No message"
-            service = log.service or "unknown"
-            status = log.status or "info"
-
-            logs.append(f"[{timestamp_str}] [{status.upper()}] [{service}] {message}")
+                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+            rows.append(
+                (
+                    timestamp_str,
+                    (log.status or "info").upper(),
+                    log.service or "unknown",
+                    log.message or "No message",
+                )
+            )
 
-        count = len(logs)
-        summary = (
-            f"Found {response.totalCount} log entries (showing {count}):\n\n"
-            + "\n".join(logs)
+        return compact_rows(
+            tool,
+            f"Found {response.totalCount} log entries (times UTC):",
+            ("time", "status", "service", "message"),
+            rows,
+            total=response.totalCount,
+            max_tokens=max_tokens,
+            key_columns=(1, 2, 3),
         )
 
-        if response.totalCount > limit:
-            summary += f"\n\n(Showing first {limit} entries. {response.totalCount - limit} more logs available.)"
-
-        return summary
-
     except Exception as e:
         logger.debug(f"Error formatting logs list response: {e}")
         return f"Error parsing log entries: {str(e)}"
@@ -249,43 +248,41 @@ def _format_timeseries_response(response) -> str:
         return f"Error parsing timeseries data: {str(e)}"
 
 
-def _format_events_response(response, limit: int = 20) -> str:
+def _format_events_response(
+    response, tool: str = "search_datadog_events_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format Datadog events search response for LLM consumption"""
     try:
         if not response.events:
             return "No events found for the specified time range."
 
-        events = []
-        for event in response.events[:limit]:
+        rows = []
+        for event in response.events:
             timestamp_str = "N/A"
             if event.date_happened:
                 timestamp = datetime.fromtimestamp(event.date_happened, tz=timezone.utc)
-                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-            title = event.title or "No title"
-            text = event.text or "No description"
-            alert_type = event.alert_type or "info"
-            source = event.source or "unknown"
-
-            # Truncate long event text
-            if len(text) > 200:
-                text = text[:200] + "..."
-
-            events.append(
-                f"[{timestamp_str}] [{alert_type.upper()}] {title}\n  Source: {source}\n  {text}"
+                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+            rows.append(
+                (
+                    timestamp_str,
+                    (event.alert_type or "info").upper(),
+                    event.source or "unknown",
+                    event.title or "No title",
+                    event.text or "",
+                )
             )
 
-        count = len(events)
-        summary = (
-            f"Found {response.totalCount} events (showing {count}):\n\n"
-            + "\n\n".join(events)
+        return compact_rows(
+            tool,
+            f"Found {response.totalCount} events (times UTC):",
+            ("time", "type", "source", "title", "text"),
+            rows,
+            total=response.totalCount,
+            max_tokens=max_tokens,
+            key_columns=(1, 2, 3, 4),
         )
 
-        if response.totalCount > limit:
-            summary += f"\n\n(Showing first {limit} events. {response.totalCount - limit} more events available.)"
-
-        return summary
-
     except Exception as e:
         logger.debug(f"Error formatting events response: {e}")
         return f"Error parsing events: {str(e)}"
@@ -382,7 +379,7 @@ async def search_datadog_logs_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_logs_search_response(response, limit=limit)
+        return _format_logs_search_response(response, tool="search_datadog_logs_tool")
 
     except Exception as e:
         logger.exception(f"Error in search_datadog_logs_tool: {e}")
@@ -442,7 +439,7 @@ async def list_datadog_logs_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_logs_list_response(response, limit=limit)
+        return _format_logs_list_response(response, tool="list_datadog_logs_tool")
 
     except Exception as e:
         logger.exception(f"Error in list_datadog_logs_tool: {e}")
@@ -666,7 +663,7 @@ async def search_datadog_events_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_events_response(response)
+        return _format_events_response(response, tool="search_datadog_events_tool")
 
     except Exception as e:
         logger.exception(f"Error in search_datadog_events_tool: {e}")
@@ -0,0 +1,262 @@
+"""
+Read-through code content layer for the RCA GitHub tools.
+
+File reads pinned to a commit SHA never change, so they are served from,
+in order:
+
+1. parsed_files, when the repository was parsed at that commit;
+2. an in-process LRU of recent GitHub blob contents, keyed by blob SHA (plus
+   an index from (workspace, repo, commit, path) to blob SHA);
+3. the GitHub API, whose result then goes into the LRU.
+
+Only full 40-character SHAs count as pinned: an abbreviated SHA can't be
+told apart from a hex-only branch or tag name. Reads of moving refs (HEAD,
+branch and tag names) always go to GitHub. Every read
+counts towards rca_tool_code_reads_total by source, which gives the hit rate.
+"""
+
+import logging
+import re
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.code_parser.repository import ParsedFileRepository
+from app.core.config import settings
+from app.core.otel_metrics import TOOL_METRICS
+from app.github.tools.router import (
+    download_file_by_path,
+    get_repository_tree,
+    read_repository_file,
+)
+from app.github.tools.service import (
+    get_default_branch,
+    get_github_integration_with_token,
+    get_owner_or_default,
+)
+from app.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_COMMIT_SHA = re.compile(r"[0-9a-fA-F]{40}")
+
+# Blobs are content-addressed, so entries never go stale; the TTL and size
+# bound only limit memory
+_blobs = TTLCache(
+    settings.RCA_CODE_CACHE_TTL_SECONDS, maxsize=settings.RCA_CODE_CACHE_MAXSIZE
+)
+_blob_index = TTLCache(
+    settings.RCA_CODE_CACHE_TTL_SECONDS, maxsize=settings.RCA_CODE_CACHE_MAXSIZE * 4
+)
+_trees = TTLCache(
+    settings.RCA_CODE_CACHE_TTL_SECONDS, maxsize=settings.RCA_CODE_CACHE_MAXSIZE
+)
+
+
+def is_commit_sha(ref: Optional[str]) -> bool:
+    return bool(ref) and bool(_COMMIT_SHA.fullmatch(ref))
+
+
+def _record(kind: str, source: str) -> None:
+    TOOL_METRICS["rca_tool_code_reads_total"].add(1, {"kind": kind, "source": source})
+    logger.debug(f"RCA code {kind} read served from {source}")
+
+
+def clear_caches() -> None:
+    _blobs.clear()
+    _blob_index.clear()
+    _trees.clear()
+
+
+async def _read_from_parsed_store(
+    db: AsyncSession,
+    workspace_id: str,
+    repo_name: str,
+    file_path: str,
+    owner: Optional[str],
+    commit_sha: str,
+) -> Optional[dict]:
+    stored = await ParsedFileRepository(db).get_at_commit(
+        workspace_id, repo_name, commit_sha, file_path, owner=owner
+    )
+    if not stored or not stored["content"]:
+        return None
+    stored_owner = stored["repo_full_name"].split("/", 1)[0]
+    return {
+        "success": True,
+        "owner": stored_owner,
+        "name": repo_name,
+        "branch": commit_sha,
+        "file_path": file_path,
+        "expression": f"{commit_sha}:{file_path}",
+        "byte_size": stored["size_bytes"],
+        "content": stored["content"],
+    }
+
+
+async def _read_from_github(
+    db: AsyncSession,
+    workspace_id: str,
+    repo_name: str,
+    file_path: str,
+    owner: Optional[str],
+    ref: str,
+) -> dict:
+    response = await read_repository_file(
+        workspace_id=workspace_id,
+        name=repo_name,
+        file_path=file_path,
+        owner=owner,
+        branch=ref,  # 'branch' parameter accepts commit SHA too
+        user_id="rca-agent",
+        db=db,
+    )
+
+    content = response.get("content")
+    byte_size = response.get("byte_size")
+    if (content is None or content == "") and int(byte_size or 0) > 0:
+        integration, _ = await get_github_integration_with_token(workspace_id, db)
+        resolved_owner = get_owner_or_default(owner, integration)
+        fallback_ref = ref
+        if not fallback_ref or str(fallback_ref).upper() == "HEAD":
+            fallback_ref = await get_default_branch(
+                workspace_id, repo_name, resolved_owner, db
+            )
+
+        response = await download_file_by_path(
+            workspace_id=workspace_id,
+            repo=repo_name,
+            file_path=file_path,
+            owner=owner,
+            ref=str(fallback_ref),
+            user_id="rca-agent",
+            db=db,
+        )
+        response["note"] = "GraphQL blob text unavailable; used Contents API fallback"
+    return response
+
+
+async def read_file(
+    db: AsyncSession,
+    workspace_id: str,
+    repo_name: str,
+    file_path: str,
+    owner: Optional[str] = None,
+    ref: str = "HEAD",
+) -> dict:
+    """
+    Read a file at ref, shaped like read_repository_file's response.
+
+    Raises whatever the GitHub layer raises when the file has to be fetched.
+    """
+    if not is_commit_sha(ref):
+        response = await _read_from_github(
+            db, workspace_id, repo_name, file_path, owner, ref
+        )
+        _record("file", "github")
+        return response
+
+    response = await _read_from_parsed_store(
+        db, workspace_id, repo_name, file_path, owner, ref
+    )
+    if response is not None:
+        _record("file", "parsed_store")
+        return response
+
+    # The blob holds only content; identical files at other paths share it,
+    # so the response is rebuilt for the path that was asked for
+    index_key = (workspace_id, owner, repo_name, ref, file_path)
+    indexed = _blob_index.get(index_key)
+    blob = _blobs.get(indexed[0]) if indexed else None
+    if blob is not None:
+        _record("file", "cache")
+        blob_sha, resolved_owner = indexed
+        return {
+            "success": True,
+            "owner": resolved_owner,
+            "name": repo_name,
+            "branch": ref,
+            "file_path": file_path,
+            "expression": f"{ref}:{file_path}",
+            "byte_size": blob["byte_size"],
+            "content": blob["content"],
+            "sha": blob_sha,
+        }
+
+    response = await _read_from_github(
+        db, workspace_id, repo_name, file_path, owner, ref
+    )
+    _record("file", "github")
+    blob_sha = response.get("sha")
+    if response.get("success") and blob_sha and response.get("content"):
+        _blob_index.set(index_key, (blob_sha, response.get("owner") or owner))
+        _blobs.set(
+            blob_sha,
+            {"content": response["content"], "byte_size": response.get("byte_size")},
+        )
+    return response
+
+
+async def read_tree(
+    db: AsyncSession,
+    workspace_id: str,
+    repo_name: str,
+    expression: str,
+    owner: Optional[str] = None,
+) -> dict:
+    """
+    Resolve a git expression ("<ref>:<path>"), shaped like get_repository_tree's response.
+
+    A commit-pinned expression naming a stored file is answered from
+    parsed_files; other commit-pinned expressions are cached after the
+    first GitHub read.
+    """
+    ref, _, path = expression.partition(":")
+    if not is_commit_sha(ref):
+        response = await get_repository_tree(
+            workspace_id=workspace_id,
+            name=repo_name,
+            expression=expression,
+            owner=owner,
+            user_id="rca-agent",
+            db=db,
+        )
+        _record("tree", "github")
+        return response
+
+    if path and not path.endswith("/"):
+        stored = await _read_from_parsed_store(
+            db, workspace_id, repo_name, path, owner, ref
+        )
+        if stored is not None:
+            _record("tree", "parsed_store")
+            return {
+                "success": True,
+                "owner": stored["owner"],
+                "name": repo_name,
+                "expression": expression,
+                "data": {
+                    "__typename": "Blob",
+                    "byteSize": stored["byte_size"],
+                    "text": stored["content"],
+                },
+            }
+
+    cache_key = (workspace_id, owner, repo_name, expression)
+    cached = _trees.get(cache_key)
+    if cached is not None:
+        _record("tree", "cache")
+        return cached
+
+    response = await get_repository_tree(
+        workspace_id=workspace_id,
+        name=repo_name,
+        expression=expression,
+        owner=owner,
+        user_id="rca-agent",
+        db=db,
+    )
+    _record("tree", "github")
+    if response.get("success"):
+        _trees.set(cache_key, response)
+    return response
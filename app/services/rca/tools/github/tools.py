@@ -10,20 +10,13 @@ from langchain.tools import tool
 
 from app.core.database import AsyncSessionLocal
 from app.github.tools.router import (
-    download_file_by_path,
     get_branch_recent_commits,
     get_repository_commits,
     get_repository_metadata,
-    get_repository_tree,
     list_pull_requests,
-    read_repository_file,
     search_code,
 )
-from app.github.tools.service import (
-    get_default_branch,
-    get_github_integration_with_token,
-    get_owner_or_default,
-)
+from app.services.rca.tools.github import content as code_content
 
 logger = logging.getLogger(__name__)
 
@@ -380,43 +373,10 @@ async def read_repository_file_tool(
         async with AsyncSessionLocal() as db:
             # Use commit_sha if provided, otherwise default to HEAD
             ref = commit_sha if commit_sha else "HEAD"
-
-            response = await read_repository_file(
-                workspace_id=workspace_id,
-                name=repo_name,
-                file_path=file_path,
-                owner=owner,
-                branch=ref,  # 'branch' parameter accepts commit SHA too
-                user_id="rca-agent",
-                db=db,
+            response = await code_content.read_file(
+                db, workspace_id, repo_name, file_path, owner=owner, ref=ref
             )
 
-            content = response.get("content")
-            byte_size = response.get("byte_size")
-            if (content is None or content == "") and int(byte_size or 0) > 0:
-                integration, _ = await get_github_integration_with_token(
-                    workspace_id, db
-                )
-                resolved_owner = get_owner_or_default(owner, integration)
-                fallback_ref = ref
-                if not fallback_ref or str(fallback_ref).upper() == "HEAD":
-                    fallback_ref = await get_default_branch(
-                        workspace_id, repo_name, resolved_owner, db
-                    )
-
-                response = await download_file_by_path(
-                    workspace_id=workspace_id,
-                    repo=repo_name,
-                    file_path=file_path,
-                    owner=owner,
-                    ref=str(fallback_ref),
-                    user_id="rca-agent",
-                    db=db,
-                )
-                response["note"] = (
-                    "GraphQL blob text unavailable; used Contents API fallback"
-                )
-
         return _format_file_content_response(response)
 
     except Exception as e:
@@ -724,13 +684,8 @@ async def get_repository_tree_tool(
     """
     try:
         async with AsyncSessionLocal() as db:
-            response = await get_repository_tree(
-                workspace_id=workspace_id,
-                name=repo_name,
-                expression=expression,
-                owner=owner,
-                user_id="rca-agent",
-                db=db,
+            response = await code_content.read_tree(
+                db, workspace_id, repo_name, expression, owner=owner
             )
 
         return _format_tree_response(response)
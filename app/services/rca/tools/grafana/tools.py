@@ -12,48 +12,47 @@ from app.log.models import TimeRange as LogTimeRange
 from app.log.service import logs_service
 from app.metrics.models import TimeRange as MetricTimeRange
 from app.metrics.service import metrics_service
+from app.services.rca.tools.compaction import compact_rows
 
 logger = logging.getLogger(__name__)
 
 
-def _format_logs_response(response, limit: int = 50) -> str:
+def _format_logs_response(
+    response, tool: str = "fetch_logs_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format log query response for LLM consumption."""
     try:
         # Response is already a LogQueryResponse object
         if not response.data or not response.data.result:
             return "No logs found for the specified criteria."
 
-        logs = []
-        count = 0
+        rows = []
         for stream in response.data.result:
             stream_labels = stream.stream or {}
             service = stream_labels.get("job", "unknown")
 
             for timestamp, message in stream.values or []:
-                if count >= limit:
-                    break
-                # Format timestamp (Loki returns nanosecond precision)
+                # Loki returns nanosecond precision
                 ts_seconds = int(timestamp) // 1_000_000_000
-                logs.append(f"[{service}] [{ts_seconds}] {message}")
-                count += 1
-
-            if count >= limit:
-                break
-
-        summary = f"Found {count} log entries:\n\n" + "\n".join(logs)
-        if count >= limit:
-            summary += (
-                f"\n\n(Showing first {limit} entries. More logs may be available.)"
-            )
-
-        return summary
+                rows.append((ts_seconds, service, message))
+
+        return compact_rows(
+            tool,
+            f"Found {len(rows)} log entries (ts = unix seconds):",
+            ("ts", "service", "message"),
+            rows,
+            max_tokens=max_tokens,
+            key_columns=(1, 2),
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting logs: {e}")
         return f"Error parsing log response: {str(e)}"
 
 
-def _format_metrics_response(response) -> str:
+def _format_metrics_response(
+    response, tool: str = "fetch_metrics_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format metrics query response for LLM consumption"""
     try:
         # Response is a RangeMetricResponse object
@@ -62,38 +61,33 @@ def _format_metrics_response(response) -> str:
 
         metric_name = response.metric_name or "metric"
 
-        formatted = []
+        rows = []
         for series in response.result:
             labels = series.metric or {}
-            values = series.values or []
-
-            if not values:
-                continue
-
-            # Extract service/job label
-            service = labels.get("job", "unknown")
-
             # Calculate statistics from MetricValue objects
-            vals = [float(v.value) for v in values if v.value is not None]
+            vals = [float(v.value) for v in series.values or [] if v.value is not None]
             if vals:
-                latest = vals[-1]
-                avg = sum(vals) / len(vals)
-                max_val = max(vals)
-                min_val = min(vals)
-
-                formatted.append(
-                    f"Service: {service}\n"
-                    f"  Latest: {latest:.2f}\n"
-                    f"  Average: {avg:.2f}\n"
-                    f"  Max: {max_val:.2f}\n"
-                    f"  Min: {min_val:.2f}\n"
-                    f"  Data points: {len(vals)}"
+                rows.append(
+                    (
+                        labels.get("job", "unknown"),
+                        f"{vals[-1]:.2f}",
+                        f"{sum(vals) / len(vals):.2f}",
+                        f"{max(vals):.2f}",
+                        f"{min(vals):.2f}",
+                        len(vals),
+                    )
                 )
 
-        if formatted:
-            return f"Metrics for '{metric_name}':\n\n" + "\n\n".join(formatted)
-        else:
+        if not rows:
             return "Metrics data is empty or invalid."
+        return compact_rows(
+            tool,
+            f"Metrics for '{metric_name}' ({len(rows)} series):",
+            ("service", "latest", "avg", "max", "min", "points"),
+            rows,
+            max_tokens=max_tokens,
+            fold=False,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting metrics: {e}")
@@ -154,7 +148,7 @@ async def fetch_logs_tool(
                 service_label_key=service_label_key,
             )
 
-        return _format_logs_response(response, limit=50)
+        return _format_logs_response(response, tool="fetch_logs_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -204,7 +198,7 @@ async def fetch_error_logs_tool(
             service_label_key=service_label_key,
         )
 
-        return _format_logs_response(response, limit=50)
+        return _format_logs_response(response, tool="fetch_error_logs_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -249,7 +243,7 @@ async def fetch_cpu_metrics_tool(
             time_range=time_range,
         )
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="fetch_cpu_metrics_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -294,7 +288,7 @@ async def fetch_memory_metrics_tool(
             time_range=time_range,
         )
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="fetch_memory_metrics_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -341,7 +335,7 @@ async def fetch_http_latency_tool(
             percentile=percentile,
         )
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="fetch_http_latency_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
@@ -409,7 +403,7 @@ async def fetch_metrics_tool(
         else:
             return f"Unknown metric_type '{metric_type}'. Valid types: http_requests, errors, throughput, availability"
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="fetch_metrics_tool")
 
     except ValueError as e:
         return f"Configuration error: {str(e)}"
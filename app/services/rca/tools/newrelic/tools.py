@@ -17,6 +17,7 @@ from app.newrelic.Metrics.schemas import (
     QueryMetricsRequest,
 )
 from app.newrelic.Metrics.service import newrelic_metrics_service
+from app.services.rca.tools.compaction import compact_rows
 
 logger = logging.getLogger(__name__)
 
@@ -26,96 +27,103 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-def _format_logs_response(response, limit: int = 50) -> str:
+def _format_logs_response(
+    response, tool: str = "search_newrelic_logs_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format New Relic logs response for LLM consumption"""
     try:
         if not response.logs:
             return "No log entries found for the specified query."
 
-        logs = []
-        for log in response.logs[:limit]:
+        rows = []
+        for log in response.logs:
             # Convert timestamp from milliseconds to datetime if available
             timestamp_str = "N/A"
             if log.timestamp:
                 timestamp = datetime.fromtimestamp(
                     log.timestamp / 1000, tz=timezone.utc
                 )
-                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S UTC")
-
-            message = log.message or "No message"
-            logs.append(f"[{timestamp_str}] {message}")
-
-        count = len(logs)
-        summary = (
-            f"Found {response.totalCount} log entries (showing {count}):\n\n"
-            + "\n".join(logs)
+                timestamp_str = timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+            rows.append((timestamp_str, log.message or "No message"))
+
+        return compact_rows(
+            tool,
+            f"Found {response.totalCount} log entries (times UTC):",
+            ("time", "message"),
+            rows,
+            total=response.totalCount,
+            max_tokens=max_tokens,
+            key_columns=(1,),
         )
 
-        if response.totalCount > limit:
-            summary += f"\n\n(Showing first {limit} entries. {response.totalCount - limit} more logs available.)"
-
-        return summary
-
     except Exception as e:
         logger.debug(f"Error formatting logs response: {e}")
         return f"Error parsing log entries: {str(e)}"
 
 
-def _format_query_logs_response(response, limit: int = 50) -> str:
+def _results_table(
+    tool: str, title: str, results: list, total: int, max_tokens, notes=()
+):
+    """Render NRQL result rows (dicts) as one table; columns in first-seen order."""
+    columns = list(dict.fromkeys(name for row in results for name in row))
+    return compact_rows(
+        tool,
+        title,
+        columns,
+        [[row.get(name, "") for name in columns] for row in results],
+        total=total,
+        max_tokens=max_tokens,
+        notes=notes,
+        fold=False,
+    )
+
+
+def _format_query_logs_response(
+    response, tool: str = "query_newrelic_logs_tool", max_tokens: Optional[int] = None
+) -> str:
     """Format New Relic query logs response for LLM consumption"""
     try:
         if not response.results:
             return "Query completed but no results found."
 
-        formatted_rows = []
-        for row in response.results[:limit]:
-            # Format each result as key-value pairs
-            row_str = " | ".join([f"{k}: {v}" for k, v in row.items()])
-            formatted_rows.append(row_str)
-
-        summary = (
-            f"Query completed successfully. Found {response.totalCount} results:\n\n"
-        )
-        summary += "\n".join(formatted_rows)
-
-        if response.totalCount > limit:
-            summary += (
-                f"\n\n(Showing first {limit} results. Total: {response.totalCount})"
-            )
-
+        notes = []
         if response.metadata:
             event_types = response.metadata.get("eventTypes", [])
             if event_types:
-                summary += f"\n\nEvent types: {', '.join(event_types)}"
-
-        return summary
+                notes.append(f"Event types: {', '.join(event_types)}")
+
+        return _results_table(
+            tool,
+            f"Query completed successfully. Found {response.totalCount} results:",
+            response.results,
+            response.totalCount,
+            max_tokens,
+            notes,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting query logs: {e}")
         return f"Error parsing query results: {str(e)}"
 
 
-def _format_metrics_response(response, limit: int = 50) -> str:
+def _format_metrics_response(
+    response,
+    tool: str = "query_newrelic_metrics_tool",
+    max_tokens: Optional[int] = None,
+) -> str:
     """Format New Relic metrics response for LLM consumption"""
     try:
         if not response.results:
             return "Query completed but no metric results found."
 
-        formatted_rows = []
-        for row in response.results[:limit]:
-            # Format each metric result as key-value pairs
-            row_str = " | ".join([f"{k}: {v}" for k, v in row.items()])
-            formatted_rows.append(row_str)
-
-        summary = f"Query completed successfully. Found {response.totalCount} metric results:\n\n"
-        summary += "\n".join(formatted_rows)
-
-        if response.totalCount > limit:
-            summary += (
-                f"\n\n(Showing first {limit} results. Total: {response.totalCount})"
-            )
-
-        return summary
+        return _results_table(
+            tool,
+            f"Query completed successfully. Found {response.totalCount} metric results:",
+            response.results,
+            response.totalCount,
+            max_tokens,
+        )
 
     except Exception as e:
         logger.debug(f"Error formatting metrics response: {e}")
@@ -214,7 +222,7 @@ async def query_newrelic_logs_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_query_logs_response(response)
+        return _format_query_logs_response(response, tool="query_newrelic_logs_tool")
 
     except Exception as e:
         logger.exception(f"Error in query_newrelic_logs_tool: {e}")
@@ -267,7 +275,7 @@ async def search_newrelic_logs_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_logs_response(response, limit=limit)
+        return _format_logs_response(response, tool="search_newrelic_logs_tool")
 
     except Exception as e:
         logger.exception(f"Error in search_newrelic_logs_tool: {e}")
@@ -316,7 +324,7 @@ async def query_newrelic_metrics_tool(
                 db=db, workspace_id=workspace_id, request=request
             )
 
-        return _format_metrics_response(response)
+        return _format_metrics_response(response, tool="query_newrelic_metrics_tool")
 
     except Exception as e:
         logger.exception(f"Error in query_newrelic_metrics_tool: {e}")
@@ -36,18 +36,31 @@ class S3Client:
         return self._s3
 
     async def generate_upload_url(
-        self, key: str, content_type: str = "application/octet-stream"
+        self,
+        key: str,
+        content_type: str = "application/octet-stream",
+        content_length: Optional[int] = None,
     ) -> Optional[str]:
-        """Generate a presigned URL for uploading a file."""
+        """Generate a presigned URL for uploading a file.
+
+        Args:
+            key: S3 object key
+            content_type: Content-Type the client must send
+            content_length: If set, signed into the URL so S3 rejects bodies
+                of any other size
+        """
         try:
             s3 = await self._get_s3_client()
+            params = {
+                "Bucket": self.bucket,
+                "Key": key,
+                "ContentType": content_type,
+            }
+            if content_length is not None:
+                params["ContentLength"] = content_length
             url = await s3.generate_presigned_url(
                 "put_object",
-                Params={
-                    "Bucket": self.bucket,
-                    "Key": key,
-                    "ContentType": content_type,
-                },
+                Params=params,
                 ExpiresIn=settings.CHAT_UPLOADS_URL_EXPIRY_SECONDS,
             )
             return url
@@ -133,15 +146,39 @@ class S3Client:
                 span.record_exception(e)
                 return False
 
-    async def download_file(self, key: str) -> Optional[bytes]:
-        """Download file from S3 (for worker image processing)."""
+    async def head_file(self, key: str) -> Optional[dict]:
+        """Return size, content type and ETag of an object, or None if missing."""
+        try:
+            s3 = await self._get_s3_client()
+            response = await s3.head_object(Bucket=self.bucket, Key=key)
+            return {
+                "size_bytes": response["ContentLength"],
+                "content_type": response.get("ContentType"),
+                "etag": response.get("ETag", "").strip('"'),
+            }
+        except (ClientError, BotoCoreError):
+            logger.warning(f"Object not found or unreadable: {key}")
+            return None
+
+    async def download_file(
+        self, key: str, max_bytes: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Download file from S3 (for worker image processing).
+
+        Args:
+            key: S3 object key
+            max_bytes: If set, fetch only the first max_bytes bytes (ranged GET)
+        """
         with tracer.start_as_current_span(
             "s3.download_file",
             attributes={"s3.bucket": self.bucket, "s3.key": key},
         ) as span:
             try:
                 s3 = await self._get_s3_client()
-                response = await s3.get_object(Bucket=self.bucket, Key=key)
+                kwargs = {"Bucket": self.bucket, "Key": key}
+                if max_bytes is not None:
+                    kwargs["Range"] = f"bytes=0-{max_bytes - 1}"
+                response = await s3.get_object(**kwargs)
                 content = await response["Body"].read()
                 logger.info(f"Downloaded from S3: {key} ({len(content)} bytes)")
                 span.set_attribute("s3.size_bytes", len(content))
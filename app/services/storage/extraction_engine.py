@@ -0,0 +1,95 @@
+"""
+Process pool for CPU-bound text extraction.
+
+PDF parsing and large JSON/YAML decoding hold the GIL, so running them in
+asyncio.to_thread stalls every other request in the process. Large files
+go to a small spawn-based process pool instead; small files stay in a
+thread, where the IPC round trip would cost more than the parse.
+
+Each pooled call gets a wall-clock budget. A call that overruns it is
+abandoned and the pool is recycled, which kills the stuck worker; other
+calls caught in the recycle are retried once on the fresh pool.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from app.core.config import settings
+from app.services.storage.extractors import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionTimeoutError(Exception):
+    """Extraction exceeded TEXT_EXTRACTION_TIMEOUT_SECONDS."""
+
+
+class ExtractionEngine:
+    def __init__(self):
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process with live event loop/threads is unsafe,
+            # and max_tasks_per_child requires a non-fork start method
+            self._pool = ProcessPoolExecutor(
+                max_workers=settings.TEXT_EXTRACTION_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=settings.TEXT_EXTRACTION_POOL_MAX_TASKS_PER_CHILD,
+            )
+        return self._pool
+
+    def _recycle_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Kill pool's workers (including stuck ones) and drop it."""
+        if self._pool is pool:
+            self._pool = None
+        for process in list((pool._processes or {}).values()):
+            process.terminate()
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    async def run(
+        self, func: Callable[..., ExtractionResult], file_content: bytes, *args
+    ) -> ExtractionResult:
+        """
+        Run an extractor from app.services.storage.extractors.
+
+        Raises:
+            ExtractionTimeoutError: If the pooled call overran its time budget
+        """
+        if (
+            not settings.TEXT_EXTRACTION_POOL_ENABLED
+            or len(file_content) <= settings.TEXT_EXTRACTION_INLINE_MAX_BYTES
+        ):
+            return await asyncio.to_thread(func, file_content, *args)
+
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            pool = self._get_pool()
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(pool, func, file_content, *args),
+                    timeout=settings.TEXT_EXTRACTION_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                self._recycle_pool(pool)
+                raise ExtractionTimeoutError(
+                    f"exceeded {settings.TEXT_EXTRACTION_TIMEOUT_SECONDS}s"
+                )
+            except BrokenProcessPool:
+                # Another call's timeout recycled the pool under us
+                self._recycle_pool(pool)
+                if attempt:
+                    raise
+                logger.warning("Extraction pool was recycled, retrying on a new pool")
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+extraction_engine = ExtractionEngine()
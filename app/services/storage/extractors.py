@@ -0,0 +1,124 @@
+"""
+Pure text extractors for uploaded files.
+
+These functions run inside extraction pool worker processes, so they take
+only picklable arguments, return an ExtractionResult instead of logging,
+and stop producing output as soon as the character budget is reached.
+"""
+
+import codecs
+import json
+import time
+from dataclasses import dataclass
+from io import BytesIO
+from typing import Optional
+
+import yaml
+from PyPDF2 import PdfReader
+
+TRUNCATION_MARKER = "\n[... truncated ...]"
+
+
+@dataclass
+class ExtractionResult:
+    text: Optional[str]
+    detail: str = ""  # Human-readable stats for the caller's log line
+
+
+def extract_pdf(
+    file_content: bytes, max_chars: int, cpu_budget_seconds: float
+) -> ExtractionResult:
+    """
+    Extract page text until max_chars or the CPU budget is used up.
+
+    Pages are parsed lazily, so nothing past the stopping page is decoded.
+    """
+    reader = PdfReader(BytesIO(file_content))
+    total_pages = len(reader.pages)
+    started = time.process_time()
+
+    text_parts = []
+    total_chars = 0
+    pages_read = 0
+    stop_reason = None
+
+    for page_index in range(total_pages):
+        if total_chars >= max_chars:
+            stop_reason = "char budget"
+            break
+        if pages_read and time.process_time() - started >= cpu_budget_seconds:
+            stop_reason = "CPU budget"
+            break
+
+        page_text = reader.pages[page_index].extract_text()
+        pages_read += 1
+        if not page_text:
+            continue
+
+        remaining_chars = max_chars - total_chars
+        if len(page_text) > remaining_chars:
+            page_text = page_text[:remaining_chars] + TRUNCATION_MARKER
+
+        text_parts.append(f"--- Page {page_index + 1} ---\n{page_text}")
+        total_chars += len(page_text)
+
+    detail = f"{pages_read}/{total_pages} pages"
+    if stop_reason:
+        detail += f", stopped at {stop_reason}"
+    if not text_parts:
+        return ExtractionResult(None, detail)
+
+    extracted = "\n\n".join(text_parts)
+    if stop_reason == "CPU budget":
+        extracted += "\n[... truncated: extraction time limit reached ...]"
+    return ExtractionResult(extracted, detail)
+
+
+def extract_json(file_content: bytes, max_chars: int) -> ExtractionResult:
+    """Pretty-print JSON, encoding only as much output as the budget needs."""
+    data = json.loads(file_content.decode("utf-8"))
+
+    parts = []
+    size = 0
+    for chunk in json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(data):
+        parts.append(chunk)
+        size += len(chunk)
+        if size > max_chars:
+            break
+
+    formatted = "".join(parts)
+    if len(formatted) > max_chars:
+        formatted = formatted[:max_chars] + TRUNCATION_MARKER
+    return ExtractionResult(formatted)
+
+
+def extract_yaml(file_content: bytes, max_chars: int) -> ExtractionResult:
+    """Re-dump YAML with safe_dump to normalize it and prevent injection."""
+    data = yaml.safe_load(file_content.decode("utf-8"))
+    formatted = yaml.safe_dump(data, default_flow_style=False, allow_unicode=True)
+    if len(formatted) > max_chars:
+        formatted = formatted[:max_chars] + TRUNCATION_MARKER
+    return ExtractionResult(formatted)
+
+
+def extract_plain_text(file_content: bytes, max_chars: int) -> ExtractionResult:
+    """
+    Decode only the prefix that can hold max_chars characters.
+
+    UTF-8 uses at most 4 bytes per character; an incremental decoder keeps a
+    character split at the cut from being treated as invalid UTF-8.
+    """
+    prefix = file_content[: max_chars * 4]
+    is_whole = len(prefix) == len(file_content)
+    detail = ""
+    try:
+        text = codecs.getincrementaldecoder("utf-8")().decode(prefix, final=is_whole)
+    except UnicodeDecodeError:
+        prefix = file_content[:max_chars]
+        is_whole = len(prefix) == len(file_content)
+        text = prefix.decode("latin-1")
+        detail = "decoded as latin-1"
+
+    if len(text) > max_chars or not is_whole:
+        text = text[:max_chars] + TRUNCATION_MARKER
+    return ExtractionResult(text, detail)
@@ -133,8 +133,31 @@ class FileValidator:
         max_size_bytes: int,
         allowed_extensions: list[str],
     ) -> Tuple[str, str]:
+        file_category = FileValidator.validate_metadata(
+            filename=filename,
+            file_size=len(file_content),
+            max_size_bytes=max_size_bytes,
+            allowed_extensions=allowed_extensions,
+        )
+        mime = FileValidator.validate_content(filename, file_content, file_category)
+        return mime, file_category
+
+    @staticmethod
+    def validate_metadata(
+        filename: str,
+        file_size: int,
+        max_size_bytes: int,
+        allowed_extensions: list[str],
+    ) -> str:
+        """Validate size and extension without the file content.
+
+        Used on its own when issuing presigned upload URLs, before the
+        bytes exist anywhere we can read them.
+
+        Returns:
+            The file category for the extension
+        """
         # Check file size
-        file_size = len(file_content)
         if file_size == 0:
             raise FileValidationError(f"File '{filename}' is empty.")
         if file_size > max_size_bytes:
@@ -156,6 +179,25 @@ class FileValidator:
                 f"Allowed types: {', '.join(allowed_extensions)}"
             )
 
+        file_category = FileValidator.EXTENSION_TO_CATEGORY.get(file_ext)
+
+        if not file_category:
+            raise FileValidationError(
+                f"Unknown file category for extension '{file_ext}'"
+            )
+
+        return file_category
+
+    @staticmethod
+    def validate_content(filename: str, file_content: bytes, file_category: str) -> str:
+        """Detect the MIME type and check it matches the extension's category.
+
+        Only the leading bytes are inspected, so a ranged prefix of the
+        object is enough.
+
+        Returns:
+            The detected MIME type
+        """
         # Detect MIME type
         try:
             mime = magic.from_buffer(file_content, mime=True)
@@ -164,14 +206,6 @@ class FileValidator:
                 f"Failed to detect MIME type for '{filename}': {str(e)}"
             )
 
-        # Verify MIME type
-        file_category = FileValidator.EXTENSION_TO_CATEGORY.get(file_ext)
-
-        if not file_category:
-            raise FileValidationError(
-                f"Unknown file category for extension '{file_ext}'"
-            )
-
         # Validate MIME type matches file category for security
         # This prevents attackers from uploading malicious executables with fake extensions
         category_mimes = {
@@ -189,11 +223,12 @@ class FileValidator:
                 pass  # Allow text/plain as valid MIME for code/data files
             else:
                 raise FileValidationError(
-                    f"File '{filename}' has extension '{file_ext}' but MIME type is '{mime}'. "
+                    f"File '{filename}' has extension '.{filename.rsplit('.', 1)[-1].lower()}' "
+                    f"but MIME type is '{mime}'. "
                     f"Expected a {file_category} MIME type."
                 )
 
-        return mime, file_category
+        return mime
 
     @staticmethod
     def get_category_from_mime(mime_type: str) -> str:
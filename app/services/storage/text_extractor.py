@@ -1,13 +1,21 @@
 import asyncio
 import json
 import logging
-from io import BytesIO
 from typing import Optional
 
 import yaml
-from PyPDF2 import PdfReader
 
 from app.core.config import settings
+from app.services.storage.extraction_engine import (
+    ExtractionTimeoutError,
+    extraction_engine,
+)
+from app.services.storage.extractors import (
+    extract_json,
+    extract_pdf,
+    extract_plain_text,
+    extract_yaml,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -78,77 +86,40 @@ class TextExtractor:
             return None
 
     @staticmethod
-    def _sync_extract_from_pdf(
+    async def _extract_from_pdf(
         file_content: bytes, filename: str, max_chars: int
     ) -> Optional[str]:
-        """Synchronous PDF text extraction (runs in thread pool)."""
+        """Extract text from PDF files using PyPDF2 (off the event loop and the GIL)."""
         try:
-            pdf_file = BytesIO(file_content)
-            pdf_reader = PdfReader(pdf_file)
-
-            text_parts = []
-            total_chars = 0
-
-            for page_num, page in enumerate(pdf_reader.pages, start=1):
-                page_text = page.extract_text()
-
-                if page_text:
-                    remaining_chars = max_chars - total_chars
-                    if remaining_chars <= 0:
-                        break
-
-                    # Truncate page text if needed
-                    if len(page_text) > remaining_chars:
-                        page_text = (
-                            page_text[:remaining_chars] + "\n[... truncated ...]"
-                        )
-
-                    text_parts.append(f"--- Page {page_num} ---\n{page_text}")
-                    total_chars += len(page_text)
-
-            if not text_parts:
-                logger.warning(f"No text extracted from PDF '{filename}'")
-                return None
-
-            extracted = "\n\n".join(text_parts)
-            logger.info(
-                f"Extracted {total_chars} chars from PDF '{filename}' ({len(pdf_reader.pages)} pages)"
+            result = await extraction_engine.run(
+                extract_pdf,
+                file_content,
+                max_chars,
+                settings.TEXT_EXTRACTION_CPU_SECONDS,
             )
-
-            return extracted
-
+        except ExtractionTimeoutError as e:
+            logger.error(f"PDF extraction timed out for '{filename}': {e}")
+            return None
         except Exception as e:
             logger.error(f"PDF extraction failed for '{filename}': {str(e)}")
             return None
 
-    @staticmethod
-    async def _extract_from_pdf(
-        file_content: bytes, filename: str, max_chars: int
-    ) -> Optional[str]:
-        """Extract text from PDF files using PyPDF2 (non-blocking)."""
-        # Run blocking PDF parsing in thread pool to avoid blocking event loop
-        return await asyncio.to_thread(
-            TextExtractor._sync_extract_from_pdf, file_content, filename, max_chars
+        if result.text is None:
+            logger.warning(f"No text extracted from PDF '{filename}' ({result.detail})")
+            return None
+
+        logger.info(
+            f"Extracted {len(result.text)} chars from PDF '{filename}' ({result.detail})"
         )
+        return result.text
 
     @staticmethod
-    def _sync_extract_from_json(
+    async def _extract_from_json(
         file_content: bytes, filename: str, max_chars: int
     ) -> Optional[str]:
-        """Synchronous JSON extraction (runs in thread pool)."""
+        """Extract and format JSON files (non-blocking)."""
         try:
-            text = file_content.decode("utf-8")
-            data = json.loads(text)
-
-            # Pretty-print JSON with indentation
-            formatted = json.dumps(data, indent=2, ensure_ascii=False)
-
-            if len(formatted) > max_chars:
-                formatted = formatted[:max_chars] + "\n[... truncated ...]"
-
-            logger.info(f"Extracted {len(formatted)} chars from JSON '{filename}'")
-            return formatted
-
+            result = await extraction_engine.run(extract_json, file_content, max_chars)
         except UnicodeDecodeError:
             logger.error(f"Failed to decode JSON file '{filename}' as UTF-8")
             return None
@@ -156,35 +127,16 @@ class TextExtractor:
             logger.error(f"Invalid JSON in file '{filename}': {str(e)}")
             return None
 
-    @staticmethod
-    async def _extract_from_json(
-        file_content: bytes, filename: str, max_chars: int
-    ) -> Optional[str]:
-        """Extract and format JSON files (non-blocking)."""
-        return await asyncio.to_thread(
-            TextExtractor._sync_extract_from_json, file_content, filename, max_chars
-        )
+        logger.info(f"Extracted {len(result.text)} chars from JSON '{filename}'")
+        return result.text
 
     @staticmethod
-    def _sync_extract_from_yaml(
+    async def _extract_from_yaml(
         file_content: bytes, filename: str, max_chars: int
     ) -> Optional[str]:
-        """Synchronous YAML extraction (runs in thread pool)."""
+        """Extract and format YAML files (non-blocking)."""
         try:
-            text = file_content.decode("utf-8")
-            data = yaml.safe_load(text)
-
-            # Convert to formatted YAML string using safe_dump to prevent injection
-            formatted = yaml.safe_dump(
-                data, default_flow_style=False, allow_unicode=True
-            )
-
-            if len(formatted) > max_chars:
-                formatted = formatted[:max_chars] + "\n[... truncated ...]"
-
-            logger.info(f"Extracted {len(formatted)} chars from YAML '{filename}'")
-            return formatted
-
+            result = await extraction_engine.run(extract_yaml, file_content, max_chars)
         except UnicodeDecodeError:
             logger.error(f"Failed to decode YAML file '{filename}' as UTF-8")
             return None
@@ -192,44 +144,19 @@ class TextExtractor:
             logger.error(f"Invalid YAML in file '{filename}': {str(e)}")
             return None
 
-    @staticmethod
-    async def _extract_from_yaml(
-        file_content: bytes, filename: str, max_chars: int
-    ) -> Optional[str]:
-        """Extract and format YAML files (non-blocking)."""
-        return await asyncio.to_thread(
-            TextExtractor._sync_extract_from_yaml, file_content, filename, max_chars
-        )
-
-    @staticmethod
-    def _sync_extract_from_text(
-        file_content: bytes, filename: str, max_chars: int
-    ) -> Optional[str]:
-        """Synchronous text extraction (runs in thread pool)."""
-        try:
-            # Try UTF-8 first
-            text = file_content.decode("utf-8")
-
-        except UnicodeDecodeError:
-            # Fallback to latin-1
-            try:
-                text = file_content.decode("latin-1")
-                logger.warning(f"File '{filename}' decoded as latin-1 (UTF-8 failed)")
-            except Exception as e:
-                logger.error(f"Failed to decode text file '{filename}': {str(e)}")
-                return None
-
-        if len(text) > max_chars:
-            text = text[:max_chars] + "\n[... truncated ...]"
-
-        logger.info(f"Extracted {len(text)} chars from text file '{filename}'")
-        return text
+        logger.info(f"Extracted {len(result.text)} chars from YAML '{filename}'")
+        return result.text
 
     @staticmethod
     async def _extract_from_text(
         file_content: bytes, filename: str, max_chars: int
     ) -> Optional[str]:
-        """Extract text from plain text files (non-blocking)."""
-        return await asyncio.to_thread(
-            TextExtractor._sync_extract_from_text, file_content, filename, max_chars
-        )
+        """Extract text from plain text files (non-blocking).
+
+        Only a bounded prefix is decoded, so this stays in a thread.
+        """
+        result = await asyncio.to_thread(extract_plain_text, file_content, max_chars)
+        if result.detail:
+            logger.warning(f"File '{filename}' {result.detail} (UTF-8 failed)")
+        logger.info(f"Extracted {len(result.text)} chars from text file '{filename}'")
+        return result.text
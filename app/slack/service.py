@@ -354,7 +354,7 @@ class SlackEventService:
         # Creates reversible placeholders like email1, ip1, user1, etc.
         try:
             pii_mapper = PIIMapper()
-            masked_message = pii_mapper.mask(clean_message)
+            masked_message = await pii_mapper.mask_async(clean_message)
             pii_mapping = pii_mapper.get_reverse_mapping()
 
             if pii_mapping:
@@ -590,9 +590,13 @@ class SlackEventService:
                     # Mask thread history with same PIIMapper for consistent placeholders
                     if thread_history:
                         try:
+                            texts = [
+                                msg["text"] for msg in thread_history if msg.get("text")
+                            ]
+                            masked_texts = iter(await pii_mapper.mask_many_async(texts))
                             for msg in thread_history:
                                 if msg.get("text"):
-                                    msg["text"] = pii_mapper.mask(msg["text"])
+                                    msg["text"] = next(masked_texts)
                             # Update pii_mapping after masking thread history (may have new PII)
                             job_context["pii_mapping"] = (
                                 pii_mapper.get_reverse_mapping()
@@ -1149,6 +1153,7 @@ class SlackEventService:
         text: str,
         turn_id: str,
         thread_ts: Optional[str] = None,
+        ts: Optional[str] = None,
     ) -> Optional[dict]:
         """
         Send RCA response with a feedback button.
@@ -1159,6 +1164,8 @@ class SlackEventService:
             text: Message text (RCA response)
             turn_id: Turn ID to pass to feedback modal
             thread_ts: Thread timestamp for reply
+            ts: Existing message to replace (e.g. the streamed answer) instead
+                of posting a new one
 
         Returns:
             Dict with 'ok' status and 'ts' if successful, None if failed
@@ -1246,11 +1253,16 @@ class SlackEventService:
                     "text": text,  # Fallback for notifications
                     "blocks": blocks,
                 }
-                if thread_ts:
-                    payload["thread_ts"] = thread_ts
+                if ts:
+                    payload["ts"] = ts
+                    method = "chat.update"
+                else:
+                    method = "chat.postMessage"
+                    if thread_ts:
+                        payload["thread_ts"] = thread_ts
 
                 response = await client.post(
-                    f"{settings.SLACK_API_BASE_URL}/chat.postMessage",
+                    f"{settings.SLACK_API_BASE_URL}/{method}",
                     headers={
                         "Authorization": f"Bearer {access_token}",
                         "Content-Type": "application/json",
@@ -1262,7 +1274,7 @@ class SlackEventService:
                 data = response.json()
                 if data.get("ok"):
                     logger.info(f"Message with feedback buttons sent to {channel}")
-                    return {"ok": True, "ts": data.get("ts")}
+                    return {"ok": True, "ts": data.get("ts") or ts}
                 else:
                     logger.error(f"Failed to send message: {data.get('error')}")
                     return None
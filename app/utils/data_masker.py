@@ -5,13 +5,25 @@ Components:
 - mask_secrets(): Fast regex for secrets in logs (AWS keys, tokens, etc.)
 - redact_query_for_log(): Shows "[QUERY: X chars]" for safe logging
 - PIIMapper: Reversible Presidio masking for customer queries
+
+Presidio analysis (spaCy NER) is CPU-bound, so the async masking path runs it
+on a dedicated thread pool and batches concurrent requests into one
+nlp.pipe() call. warm_pii_analyzer() loads the model at startup. Presidio
+itself is imported on first use, so the regex helpers (used by logging
+everywhere) don't pull spaCy into every process's import graph.
 """
 
+import asyncio
 import functools
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Optional
+
+from app.core.config import settings
 
-from presidio_analyzer import AnalyzerEngine
+if TYPE_CHECKING:
+    from presidio_analyzer import AnalyzerEngine, RecognizerResult
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +41,26 @@ SAFETY_NET_PATTERNS = {
 }
 
 
+def _combine_patterns(patterns: dict) -> "re.Pattern[str]":
+    """Combine patterns into one alternation with a named group per pattern."""
+    parts = []
+    for name, pattern in patterns.items():
+        body = pattern.pattern
+        if pattern.flags & re.IGNORECASE:
+            body = f"(?i:{body})"
+        parts.append(f"(?P<{name}>{body})")
+    return re.compile("|".join(parts))
+
+
+# Single-pass version of SAFETY_NET_PATTERNS (one scan instead of five)
+_SAFETY_NET_REGEX = _combine_patterns(SAFETY_NET_PATTERNS)
+_SAFETY_NET_REPLACEMENTS = {name: f"[{name.upper()}]" for name in SAFETY_NET_PATTERNS}
+
+
+def _safety_net_replacement(match: "re.Match[str]") -> str:
+    return _SAFETY_NET_REPLACEMENTS[match.lastgroup]
+
+
 def mask_secrets(text: str) -> str:
     """
     Fast regex-only masking for secrets in logs.
@@ -45,11 +77,7 @@ def mask_secrets(text: str) -> str:
     if not text or not isinstance(text, str):
         return text
 
-    masked = text
-    for name, pattern in SAFETY_NET_PATTERNS.items():
-        masked = pattern.sub(f"[{name.upper()}]", masked)
-
-    return masked
+    return _SAFETY_NET_REGEX.sub(_safety_net_replacement, text)
 
 
 # Alias for backward compatibility
@@ -59,17 +87,128 @@ def mask_log_message(message: str) -> str:
 
 
 @functools.lru_cache(maxsize=1)
-def _get_analyzer() -> AnalyzerEngine:
+def _get_analyzer() -> "AnalyzerEngine":
     """
     Thread-safe lazy initialization of Presidio analyzer.
 
     Uses @lru_cache for thread-safe singleton pattern.
     This is safer than double-checked locking which has race conditions in Python.
     """
+    from presidio_analyzer import AnalyzerEngine
+
     logger.info("Presidio AnalyzerEngine initialized")
     return AnalyzerEngine()
 
 
+# Text without any of these can't contain an email, IP, phone, card or SSN,
+# and spaCy's PERSON entities are (in practice) capitalized tokens.
+_PII_CANDIDATE_PATTERN = re.compile(r"[0-9@A-Z]")
+
+_PII_SCORE_THRESHOLD = 0.5
+
+
+def has_pii_candidates(text: str) -> bool:
+    """Return True if the text could contain an entity PIIMapper masks."""
+    return bool(_PII_CANDIDATE_PATTERN.search(text))
+
+
+def _analyze_batch(texts: List[str]) -> List[List["RecognizerResult"]]:
+    """Analyze several texts in one spaCy nlp.pipe() pass (runs in the PII pool)."""
+    from presidio_analyzer import BatchAnalyzerEngine
+
+    batch_analyzer = BatchAnalyzerEngine(analyzer_engine=_get_analyzer())
+    return batch_analyzer.analyze_iterator(
+        texts,
+        language="en",
+        batch_size=len(texts),
+        entities=list(PIIMapper.ENTITY_PREFIXES.keys()),
+        score_threshold=_PII_SCORE_THRESHOLD,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """Dedicated pool so NER never blocks the event loop or the default executor."""
+    return ThreadPoolExecutor(
+        max_workers=max(1, settings.PII_ANALYZER_THREADS),
+        thread_name_prefix="pii-analyzer",
+    )
+
+
+class _PIIAnalysisBatcher:
+    """
+    Coalesces concurrent analysis requests into a single batch.
+
+    The first request in a window schedules a flush after PII_BATCH_MAX_WAIT_MS;
+    requests arriving before then (up to PII_BATCH_MAX_SIZE) share one
+    _analyze_batch() call on the PII thread pool.
+    """
+
+    def __init__(self):
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def analyze(self, text: str) -> List["RecognizerResult"]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # New event loop (e.g. tests); anything pending belonged to the old one
+            self._loop = loop
+            self._pending = []
+            self._flush_handle = None
+
+        future = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= max(1, settings.PII_BATCH_MAX_SIZE):
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                settings.PII_BATCH_MAX_WAIT_MS / 1000, self._flush
+            )
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            self._loop.create_task(self._run(batch))
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future]]) -> None:
+        try:
+            results = await self._loop.run_in_executor(
+                _get_executor(), _analyze_batch, [text for text, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_batcher = _PIIAnalysisBatcher()
+
+
+async def warm_pii_analyzer() -> None:
+    """
+    Load the Presidio analyzer (and spaCy model) and run one analysis.
+
+    Called at startup so the first masked request doesn't pay model-load time.
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        _get_executor(), _analyze_batch, ["Warm up for Jane Doe at jane@example.com"]
+    )
+    logger.info("Presidio analyzer preloaded")
+
+
 def redact_query_for_log(query: str) -> str:
     """
     Redact a user query for safe logging.
@@ -179,6 +318,8 @@ class PIIMapper:
         """
         Mask PII in text with numbered placeholders.
 
+        Runs Presidio synchronously; async callers should use mask_async().
+
         Args:
             text: Text that may contain PII
 
@@ -202,39 +343,98 @@ class PIIMapper:
                 text=masked_text,
                 entities=list(self.ENTITY_PREFIXES.keys()),
                 language="en",
-                score_threshold=0.5,
+                score_threshold=_PII_SCORE_THRESHOLD,
             )
 
-            if not results:
-                return masked_text
+            return self._replace_entities(masked_text, results)
+
+        except Exception as e:
+            self._raise_masking_failed(e)
+
+    async def mask_async(self, text: str) -> str:
+        """
+        Mask PII without blocking the event loop.
+
+        Text with no PII candidates skips NER entirely; otherwise analysis
+        is batched with concurrent requests and run on the PII thread pool.
+
+        Args:
+            text: Text that may contain PII
+
+        Returns:
+            Text with PII replaced by placeholders (email1, ip1, etc.)
 
-            # Sort results by start position in reverse order
-            # (so we can replace from end to start without messing up positions)
-            sorted_results = sorted(results, key=lambda x: x.start, reverse=True)
+        Raises:
+            RuntimeError: If PII masking fails (fail-closed for security)
+        """
+        return (await self.mask_many_async([text]))[0]
 
-            # Replace each detected entity with a placeholder
-            result_text = masked_text
-            for result in sorted_results:
-                original_value = masked_text[result.start : result.end]
-                placeholder = self._get_placeholder(result.entity_type, original_value)
-                result_text = (
-                    result_text[: result.start]
-                    + placeholder
-                    + result_text[result.end :]
-                )
+    async def mask_many_async(self, texts: List[str]) -> List[str]:
+        """
+        Mask several texts with this mapper (consistent placeholders).
 
-            return result_text
+        Texts are analyzed concurrently (so they share a batch) and
+        placeholders are assigned in input order.
 
+        Raises:
+            RuntimeError: If PII masking fails (fail-closed for security)
+        """
+        try:
+            prepared = [
+                mask_secrets(text) if text and isinstance(text, str) else text
+                for text in texts
+            ]
+            analyses = await asyncio.gather(
+                *(self._analyze_async(text) for text in prepared)
+            )
+            return [
+                self._replace_entities(text, results) if results else text
+                for text, results in zip(prepared, analyses)
+            ]
         except Exception as e:
-            logger.error(
-                f"CRITICAL: PII masking failed - cannot process query safely: {e}",
-                exc_info=True,
+            self._raise_masking_failed(e)
+
+    @staticmethod
+    async def _analyze_async(text) -> List["RecognizerResult"]:
+        if not text or not isinstance(text, str):
+            return []
+        if settings.PII_FAST_PATH_ENABLED and not has_pii_candidates(text):
+            return []
+        return await _batcher.analyze(text)
+
+    def _replace_entities(
+        self, masked_text: str, results: List["RecognizerResult"]
+    ) -> str:
+        """Replace detected entities with placeholders."""
+        if not results:
+            return masked_text
+
+        # Sort results by start position in reverse order
+        # (so we can replace from end to start without messing up positions)
+        sorted_results = sorted(results, key=lambda x: x.start, reverse=True)
+
+        # Replace each detected entity with a placeholder
+        result_text = masked_text
+        for result in sorted_results:
+            original_value = masked_text[result.start : result.end]
+            placeholder = self._get_placeholder(result.entity_type, original_value)
+            result_text = (
+                result_text[: result.start] + placeholder + result_text[result.end :]
             )
-            # FAIL CLOSED - raise exception instead of returning unmasked text
-            # This prevents PII from leaking through if Presidio is unavailable
-            raise RuntimeError(
-                "PII masking is currently unavailable. Cannot process query safely."
-            ) from e
+
+        return result_text
+
+    @staticmethod
+    def _raise_masking_failed(e: Exception):
+        logger.error(
+            f"CRITICAL: PII masking failed - cannot process query safely: {e}",
+            exc_info=True,
+        )
+        # FAIL CLOSED - raise exception instead of returning unmasked text
+        # This prevents PII from leaking through if Presidio is unavailable
+        raise RuntimeError(
+            "PII masking is currently unavailable. Cannot process query safely."
+        ) from e
 
     def unmask(self, text: str) -> str:
         """
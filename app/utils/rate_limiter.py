@@ -5,23 +5,119 @@ Check if request is allowed, increment if yes.
 BYOLLM Support:
 - Workspaces with custom LLM configuration bypass rate limiting
 - Only VibeMonitor AI (default Groq) users are rate limited
+
+Counters:
+- Live counts are Redis keys updated by one Lua script (check-and-increment
+  in a single round trip, no row locks)
+- Every increment is also added to a pending-deltas hash, which
+  flush_pending_usage() writes to rate_limit_tracking every few seconds,
+  so billing and usage pages keep reading the database
+- A counter is seeded from the database only when no flush is in flight
+  and none started since the count was read, so deltas that are between
+  Redis and the database are never lost
+- Without Redis (or if it errors) the row-locked database path is used
 """
 
+import asyncio
 import logging
 import os
 import uuid
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Tuple
+from typing import Dict, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.redis import get_redis
 from app.models import LLMProvider, LLMProviderConfig, RateLimitTracking, Workspace
 
 logger = logging.getLogger(__name__)
 
+PENDING_USAGE_KEY = "ratelimit:pending"
+# Deltas taken by a flush and not yet committed, and a count of flushes started
+FLUSHING_USAGE_KEY = "ratelimit:flushing"
+DRAIN_EPOCH_KEY = "ratelimit:drain_epoch"
+
+# Counter keys outlive their window so late flushes and reads still find them
+DAILY_WINDOW_TTL_SECONDS = 2 * 24 * 3600
+WEEKLY_WINDOW_TTL_SECONDS = 8 * 24 * 3600
+
+# In-flight deltas of a flusher that died are given up after this long
+FLUSHING_TTL_SECONDS = 60
+
+# Seeding waits this long for in-flight flushes before using the database path
+SEED_ATTEMPTS = 20
+SEED_RETRY_SECONDS = 0.05
+
+# KEYS[1]: live counter, KEYS[2]: pending deltas hash, KEYS[3]: in-flight
+# deltas hash, KEYS[4]: drain epoch
+# ARGV: increment, limit (-1 = unlimited), ttl, pending field,
+#       seed ('' = unknown), drain epoch the seed was read at
+# Returns {allowed (1/0), count}, {-1, epoch} if the counter must be seeded
+# (read the database, then call again with the seed and that epoch), or
+# {-2, 0} if a flush may be writing this field's deltas (retry shortly)
+_CHECK_AND_INCREMENT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    local epoch = redis.call('GET', KEYS[4]) or '0'
+    if redis.call('HEXISTS', KEYS[3], ARGV[4]) == 1 then
+        return {-2, 0}
+    end
+    if ARGV[5] == '' then
+        return {-1, tonumber(epoch)}
+    end
+    if ARGV[6] ~= epoch then
+        return {-2, 0}
+    end
+    local unflushed = tonumber(redis.call('HGET', KEYS[2], ARGV[4]) or '0')
+    redis.call('SET', KEYS[1], tonumber(ARGV[5]) + unflushed, 'EX', ARGV[3])
+end
+local current = tonumber(redis.call('GET', KEYS[1]))
+local increment = tonumber(ARGV[1])
+local limit = tonumber(ARGV[2])
+if limit >= 0 and current + increment > limit then
+    return {0, current}
+end
+current = redis.call('INCRBY', KEYS[1], increment)
+redis.call('HINCRBY', KEYS[2], ARGV[4], increment)
+return {1, current}
+"""
+
+# Atomically move all pending deltas to the in-flight hash
+# KEYS[1]: pending, KEYS[2]: in-flight, KEYS[3]: drain epoch; ARGV[1]: in-flight ttl
+_DRAIN_PENDING = """
+local entries = redis.call('HGETALL', KEYS[1])
+if #entries == 0 then
+    return entries
+end
+redis.call('DEL', KEYS[1])
+for i = 1, #entries, 2 do
+    redis.call('HINCRBY', KEYS[2], entries[i], entries[i + 1])
+end
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+redis.call('INCR', KEYS[3])
+return entries
+"""
+
+# Clear flushed deltas from the in-flight hash, putting them back in the
+# pending hash when the database write failed
+# KEYS[1]: in-flight, KEYS[2]: pending; ARGV: requeue (1/0), field, delta, ...
+_SETTLE_FLUSHED = """
+for i = 2, #ARGV, 2 do
+    if redis.call('HINCRBY', KEYS[1], ARGV[i], -tonumber(ARGV[i + 1])) <= 0 then
+        redis.call('HDEL', KEYS[1], ARGV[i])
+    end
+    if ARGV[1] == '1' then
+        redis.call('HINCRBY', KEYS[2], ARGV[i], ARGV[i + 1])
+    end
+end
+return 0
+"""
+
 
 class ResourceType(str, Enum):
     """Types of rate-limited resources."""
@@ -49,6 +145,117 @@ def get_weekly_window_key() -> str:
     return f"{iso_year}-W{iso_week:02d}"
 
 
+def _redis_counters_enabled() -> bool:
+    return settings.RATE_LIMIT_REDIS_ENABLED and bool(settings.REDIS_URL)
+
+
+def _counter_key(workspace_id: str, resource_type: str, window_key: str) -> str:
+    return f"ratelimit:{workspace_id}:{resource_type}:{window_key}"
+
+
+def _pending_field(workspace_id: str, resource_type: str, window_key: str) -> str:
+    return f"{workspace_id}|{resource_type}|{window_key}"
+
+
+async def _get_db_count(
+    session: AsyncSession, workspace_id: str, resource_type: str, window_key: str
+) -> int:
+    result = await session.execute(
+        select(RateLimitTracking.count).where(
+            RateLimitTracking.workspace_id == workspace_id,
+            RateLimitTracking.resource_type == resource_type,
+            RateLimitTracking.window_key == window_key,
+        )
+    )
+    return result.scalar() or 0
+
+
+async def _redis_check_and_increment(
+    session: AsyncSession,
+    workspace_id: str,
+    resource_type: str,
+    window_key: str,
+    limit: int,
+    increment: int,
+    ttl_seconds: int,
+) -> Tuple[bool, int]:
+    """
+    Check-and-increment the Redis counter in one script call.
+
+    The first call in a window (or after Redis lost the key) seeds the
+    counter from rate_limit_tracking. The seed is only accepted if no
+    flush was writing this counter's deltas while the count was read;
+    otherwise it is retried, and after SEED_ATTEMPTS the caller falls back
+    to the database path.
+    """
+    redis_client = await get_redis()
+    script = redis_client.register_script(_CHECK_AND_INCREMENT)
+    keys = [
+        _counter_key(workspace_id, resource_type, window_key),
+        PENDING_USAGE_KEY,
+        FLUSHING_USAGE_KEY,
+        DRAIN_EPOCH_KEY,
+    ]
+    field = _pending_field(workspace_id, resource_type, window_key)
+
+    for _ in range(SEED_ATTEMPTS):
+        allowed, count = await script(
+            keys=keys, args=[increment, limit, ttl_seconds, field, "", ""]
+        )
+        if allowed == -1:
+            seed = await _get_db_count(session, workspace_id, resource_type, window_key)
+            allowed, count = await script(
+                keys=keys, args=[increment, limit, ttl_seconds, field, seed, count]
+            )
+        if allowed != -2:
+            return allowed == 1, int(count)
+        await asyncio.sleep(SEED_RETRY_SECONDS)
+
+    raise RuntimeError(f"Rate limit counter {field} could not be seeded during a flush")
+
+
+async def get_current_usage(
+    session: AsyncSession,
+    workspace_id: str,
+    resource_type: ResourceType,
+    window_key: str,
+) -> int:
+    """Current count for a window: the live Redis counter if present, else the database."""
+    if _redis_counters_enabled():
+        try:
+            redis_client = await get_redis()
+            count = await redis_client.get(
+                _counter_key(workspace_id, resource_type.value, window_key)
+            )
+            if count is not None:
+                return int(count)
+        except Exception as e:
+            logger.warning(f"Rate limit counter read failed, using database: {e}")
+    return await _get_db_count(session, workspace_id, resource_type.value, window_key)
+
+
+def _record_rate_limit_exceeded(
+    workspace_id: str,
+    resource_type: ResourceType,
+    count: int,
+    limit: int,
+    increment: int,
+) -> None:
+    logger.warning(
+        f"Rate limit: Workspace {workspace_id} would exceed {resource_type.value} limit. "
+        f"Current: {count}/{limit}, requested: +{increment}"
+    )
+
+    from app.core.otel_metrics import SECURITY_METRICS
+
+    SECURITY_METRICS["rate_limit_exceeded_total"].add(
+        1,
+        {
+            "resource_type": resource_type.value,
+        },
+    )
+
+
 async def check_rate_limit(
     session: AsyncSession,
     workspace_id: str,
@@ -72,6 +279,9 @@ async def check_rate_limit(
         - current_count: Current usage count (after increment if allowed)
         - limit: The rate limit
 
+    Raises:
+        ValueError: If limit is None and the workspace doesn't exist
+
     Example:
         # For request counting
         allowed, count, limit = await check_rate_limit(
@@ -93,21 +303,42 @@ async def check_rate_limit(
             return f"Rate limit exceeded: {count}/{limit}"
     """
     try:
-        # Get workspace and limit
-        stmt = select(Workspace).where(Workspace.id == workspace_id)
-        result = await session.execute(stmt)
-        workspace = result.scalar_one_or_none()
-
-        if not workspace:
-            raise ValueError(f"Workspace {workspace_id} not found")
-
         # Use custom limit or workspace limit
         if limit is None:
-            limit = workspace.daily_request_limit  # Default for RCA
+            stmt = select(Workspace.daily_request_limit).where(
+                Workspace.id == workspace_id
+            )
+            result = await session.execute(stmt)
+            limit = result.scalar_one_or_none()
+
+            if limit is None:
+                raise ValueError(f"Workspace {workspace_id} not found")
 
         # Get today's date (UTC)
         today = datetime.now(timezone.utc).date().isoformat()  # e.g., '2025-10-15'
 
+        if _redis_counters_enabled():
+            try:
+                allowed, count = await _redis_check_and_increment(
+                    session,
+                    workspace_id,
+                    resource_type.value,
+                    today,
+                    limit,
+                    increment,
+                    DAILY_WINDOW_TTL_SECONDS,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Redis rate limit counter unavailable, using database: {e}"
+                )
+            else:
+                if not allowed:
+                    _record_rate_limit_exceeded(
+                        workspace_id, resource_type, count, limit, increment
+                    )
+                return (allowed, count, limit)
+
         # Try to get existing tracking record with lock
         tracking_stmt = (
             select(RateLimitTracking)
@@ -152,20 +383,9 @@ async def check_rate_limit(
 
         # Check if limit would be exceeded after increment
         if tracking.count + increment > limit:
-            logger.warning(
-                f"Rate limit: Workspace {workspace_id} would exceed {resource_type.value} limit. "
-                f"Current: {tracking.count}/{limit}, requested: +{increment}"
+            _record_rate_limit_exceeded(
+                workspace_id, resource_type, tracking.count, limit, increment
             )
-
-            from app.core.otel_metrics import SECURITY_METRICS
-
-            SECURITY_METRICS["rate_limit_exceeded_total"].add(
-                1,
-                {
-                    "resource_type": resource_type.value,
-                },
-            )
-
             return (False, tracking.count, limit)
 
         # Increment and allow
@@ -378,7 +598,7 @@ async def track_aiu_usage(
         )
 
     Storage:
-        - Table: rate_limit_tracking
+        - Table: rate_limit_tracking (written behind from Redis when enabled)
         - resource_type: 'aiu_usage'
         - window_key: '2026-W06' (weekly, resets every Monday)
         - count: Cumulative tokens used this week
@@ -394,6 +614,25 @@ async def track_aiu_usage(
         # Get weekly window key (e.g., '2026-W06')
         week_key = get_weekly_window_key()
 
+        if _redis_counters_enabled():
+            try:
+                _, total = await _redis_check_and_increment(
+                    session,
+                    workspace_id,
+                    ResourceType.AIU_USAGE.value,
+                    week_key,
+                    -1,
+                    token_count,
+                    WEEKLY_WINDOW_TTL_SECONDS,
+                )
+                logger.info(
+                    f"📊 AIU TRACKING - Workspace {workspace_id} used {token_count:,} tokens. "
+                    f"Total this week: {total:,} - Week: {week_key}"
+                )
+                return
+            except Exception as e:
+                logger.warning(f"Redis AIU counter unavailable, using database: {e}")
+
         # Try to get existing tracking record with lock
         tracking_stmt = (
             select(RateLimitTracking)
@@ -454,3 +693,109 @@ async def track_aiu_usage(
         # Don't raise - tracking failure shouldn't break the main flow
 
 
+async def _upsert_counts(session: AsyncSession, rows: list) -> None:
+    stmt = insert(RateLimitTracking).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["workspace_id", "resource_type", "window_key"],
+        set_={
+            "count": RateLimitTracking.count + stmt.excluded.count,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+async def _settle_flushed(redis_client, deltas: Dict[str, int], requeue: bool) -> None:
+    args = ["1" if requeue else "0"]
+    for field, delta in deltas.items():
+        args += [field, delta]
+    await redis_client.register_script(_SETTLE_FLUSHED)(
+        keys=[FLUSHING_USAGE_KEY, PENDING_USAGE_KEY], args=args
+    )
+
+
+async def flush_pending_usage() -> int:
+    """
+    Write buffered Redis counter deltas to rate_limit_tracking.
+
+    Deltas are taken atomically, so concurrent flushers (one per API
+    process) never write the same increment twice. Until the write commits
+    they stay in the in-flight hash, which holds off counter seeding for
+    those fields. On a database error the deltas not yet committed are put
+    back for the next flush; rows rejected by a constraint (e.g. the
+    workspace was deleted) are dropped.
+
+    Returns:
+        Number of rate_limit_tracking rows updated
+    """
+    if not _redis_counters_enabled():
+        return 0
+
+    redis_client = await get_redis()
+    entries = await redis_client.register_script(_DRAIN_PENDING)(
+        keys=[PENDING_USAGE_KEY, FLUSHING_USAGE_KEY, DRAIN_EPOCH_KEY],
+        args=[FLUSHING_TTL_SECONDS],
+    )
+    deltas: Dict[str, int] = {
+        field: int(delta) for field, delta in zip(entries[::2], entries[1::2])
+    }
+    if not deltas:
+        return 0
+
+    rows = {}
+    for field, delta in deltas.items():
+        workspace_id, resource_type, window_key = field.split("|", 2)
+        rows[field] = {
+            "id": str(uuid.uuid4()),
+            "workspace_id": workspace_id,
+            "resource_type": resource_type,
+            "window_key": window_key,
+            "count": delta,
+        }
+
+    # Deltas committed (or dropped) so far; only the rest are re-queued
+    settled: Dict[str, int] = {}
+    try:
+        async with AsyncSessionLocal() as session:
+            try:
+                await _upsert_counts(session, list(rows.values()))
+                await session.commit()
+                settled = dict(deltas)
+            except IntegrityError:
+                await session.rollback()
+                for field, row in rows.items():
+                    try:
+                        await _upsert_counts(session, [row])
+                        await session.commit()
+                    except IntegrityError as e:
+                        await session.rollback()
+                        logger.warning(f"Dropping rate limit delta {row}: {e}")
+                    settled[field] = deltas[field]
+    except Exception as e:
+        unsettled = {
+            field: delta for field, delta in deltas.items() if field not in settled
+        }
+        logger.error(
+            f"Rate limit flush failed, re-queuing {len(unsettled)} deltas: {e}"
+        )
+        if settled:
+            await _settle_flushed(redis_client, settled, requeue=False)
+        if unsettled:
+            await _settle_flushed(redis_client, unsettled, requeue=True)
+        return len(settled)
+
+    await _settle_flushed(redis_client, deltas, requeue=False)
+    return len(rows)
+
+
+async def run_usage_flusher() -> None:
+    """Flush pending counter deltas every RATE_LIMIT_FLUSH_INTERVAL_SECONDS until cancelled."""
+    while True:
+        try:
+            await asyncio.sleep(settings.RATE_LIMIT_FLUSH_INTERVAL_SECONDS)
+            await flush_pending_usage()
+        except asyncio.CancelledError:
+            logger.info("Rate limit flusher cancelled")
+            break
+        except Exception as e:
+            logger.error(f"Error in rate limit flusher: {e}")
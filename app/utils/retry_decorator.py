@@ -88,6 +88,32 @@ def _is_retryable_http_error(exception: BaseException) -> bool:
     return False
 
 
+def _is_unsent_request_error(exception: BaseException) -> bool:
+    """
+    Determine if a request failed before the server could act on it.
+
+    Only these are safe to retry for non-idempotent calls (e.g. sending
+    email): connection failures, pool timeouts and 429 Too Many Requests.
+    Read timeouts and 5xx responses may come after the server already
+    processed the request, so they are not retried.
+
+    Args:
+        exception: Exception to check
+
+    Returns:
+        True if nothing was sent and the request can be retried
+    """
+    if isinstance(
+        exception, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    ):
+        return True
+
+    if isinstance(exception, httpx.HTTPStatusError):
+        return exception.response.status_code == 429
+
+    return False
+
+
 def _log_retry_attempt(retry_state: RetryCallState):
     """Log retry attempts with service context."""
     exception = retry_state.outcome.exception()
@@ -154,3 +180,30 @@ def retry_external_api(service_name: str = "external_api"):
         # Don't reraise on final failure (let the exception propagate naturally)
         reraise=True,
     )
+
+
+def retry_unsent_request(service_name: str = "external_api"):
+    """
+    Create a tenacity AsyncRetrying instance for non-idempotent API calls.
+
+    Like retry_external_api, but retries only when the request was never
+    processed (see _is_unsent_request_error), so a retry can't repeat a
+    side effect such as sending a batch of emails twice.
+
+    Args:
+        service_name: Name of the external service (for logging)
+
+    Returns:
+        AsyncRetrying instance configured with retry logic
+    """
+    return AsyncRetrying(
+        stop=stop_after_attempt(settings.EXTERNAL_API_RETRY_ATTEMPTS),
+        wait=wait_exponential(
+            multiplier=settings.EXTERNAL_API_RETRY_MULTIPLIER,
+            min=settings.EXTERNAL_API_RETRY_MIN_WAIT,
+            max=settings.EXTERNAL_API_RETRY_MAX_WAIT,
+        ),
+        retry=tenacity_retry_if_exception(_is_unsent_request_error),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
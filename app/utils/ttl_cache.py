@@ -47,6 +47,11 @@ class TTLCache:
             self._data.popitem(last=False)  # evict oldest
         self._data[key] = (value, time.monotonic() + self._ttl)
 
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """Remove *key* and return its value (even if expired), else *default*."""
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[0]
+
     def clear(self) -> None:
         """Remove all entries."""
         self._data.clear()
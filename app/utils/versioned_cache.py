@@ -0,0 +1,127 @@
+"""
+Redis-backed cache for per-scope (usually per-workspace) read models.
+
+Entries live under a version number that writers bump to invalidate. A
+reader that loaded old rows while a writer was committing stores them
+under the old version, where no one looks any more, so a racing reader
+can't undo an invalidation.
+
+Writers call invalidate_on_commit() inside their transaction; the bump
+happens only once the session commits, never for rolled-back changes.
+Redis errors fail open: reads fall through to the loader.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+_PENDING_INVALIDATIONS = "pending_cache_invalidations"
+_background_tasks: Set[asyncio.Task] = set()
+
+
+class VersionedCache:
+    def __init__(self, namespace: str, ttl_seconds: int, enabled: bool = True):
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+    def _version_key(self, scope_id: str) -> str:
+        return f"{self.namespace}:version:{scope_id}"
+
+    def _value_key(self, scope_id: str, version: str, key: Optional[str] = None) -> str:
+        value_key = f"{self.namespace}:{scope_id}:{version}"
+        return f"{value_key}:{key}" if key else value_key
+
+    async def get_or_load(
+        self,
+        scope_id: str,
+        loader: Callable[[], Awaitable[Any]],
+        should_cache: Optional[Callable[[Any], bool]] = None,
+        key: Optional[str] = None,
+    ) -> Any:
+        """Return the cached JSON value for scope_id, or load and cache it.
+
+        should_cache can veto storing a loaded value (e.g. a degraded result).
+        key selects one of several entries per scope; invalidating the scope
+        drops all of them.
+        """
+        if not self.enabled or not settings.REDIS_URL:
+            return await loader()
+
+        try:
+            redis_client = await get_redis()
+            version = await redis_client.get(self._version_key(scope_id)) or "0"
+            cached = await redis_client.get(self._value_key(scope_id, version, key))
+        except Exception as e:
+            logger.warning(f"{self.namespace} cache read failed: {e}")
+            return await loader()
+
+        if cached is not None:
+            return json.loads(cached)
+
+        value = await loader()
+        if should_cache is not None and not should_cache(value):
+            return value
+        try:
+            await redis_client.set(
+                self._value_key(scope_id, version, key),
+                json.dumps(value),
+                ex=self.ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning(f"{self.namespace} cache write failed: {e}")
+        return value
+
+    async def invalidate(self, scope_id: str) -> None:
+        if not self.enabled or not settings.REDIS_URL:
+            return
+        try:
+            redis_client = await get_redis()
+            await redis_client.incr(self._version_key(scope_id))
+        except Exception as e:
+            logger.warning(
+                f"{self.namespace} cache invalidation failed for {scope_id}: {e}"
+            )
+
+    def invalidate_on_commit(self, db: AsyncSession, scope_id: str) -> None:
+        """Invalidate scope_id once db's current transaction commits."""
+        pending = db.info.setdefault(_PENDING_INVALIDATIONS, set())
+        pending.add((self, scope_id))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_pending_invalidations(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if not pending:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Sync session outside the event loop; TTL bounds staleness
+    for cache, scope_id in pending:
+        task = loop.create_task(cache.invalidate(scope_id))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _drop_pending_invalidations(session: Session, previous_transaction) -> None:
+    # Savepoint rollbacks keep the outer transaction's invalidations
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_INVALIDATIONS, None)
+
+
+async def drain_pending_invalidations() -> None:
+    """Wait for scheduled invalidations (shutdown and tests)."""
+    if _background_tasks:
+        await asyncio.gather(*list(_background_tasks), return_exceptions=True)
@@ -3,11 +3,13 @@ import logging
 import signal
 import time
 from datetime import datetime, timezone
+from typing import Optional
 
 from dotenv import load_dotenv
 from sqlalchemy import select
 
 from app.chat.notifiers import WebProgressCallback
+from app.chat.uploads import process_uploaded_files
 from app.chat.service import ChatService
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal
@@ -27,8 +29,13 @@ from app.services.rca.callbacks import (
 from app.services.rca.get_service_name.service import extract_service_names_from_repo
 from app.services.sqs.client import sqs_client
 from app.slack.service import slack_event_service
+from app.utils.ttl_cache import TTLCache
 from app.utils.data_masker import PIIMapper, mask_email_for_context, redact_query_for_log
 from app.workers.base_worker import BaseWorker
+from app.workspace.context_cache import (
+    environment_context_cache,
+    workspace_context_cache,
+)
 from app.services.rca.langfuse_handler import get_langfuse_callback
 
 logger = logging.getLogger(__name__)
@@ -195,6 +202,9 @@ async def fetch_environment_context(workspace_id: str, db: AsyncSessionLocal) ->
     This function queries the database directly (bypassing service layer membership checks)
     since it runs in the internal RCA agent context where the job has already been authenticated.
 
+    Served from the per-workspace environment context cache when enabled;
+    otherwise two queries regardless of environment and repository count.
+
     Args:
         workspace_id: Workspace identifier
         db: Database session
@@ -202,13 +212,28 @@ async def fetch_environment_context(workspace_id: str, db: AsyncSessionLocal) ->
     Returns:
         Dictionary with environment context for the RCA agent
     """
+    try:
+        return await environment_context_cache.get_or_load(
+            workspace_id, lambda: _load_environment_context(workspace_id, db)
+        )
+    except Exception as e:
+        logger.error(f"Error fetching environment context: {e}", exc_info=True)
+        return {
+            "environments": [],
+            "default_environment": None,
+            "deployed_commits_by_environment": {},
+        }
+
+
+async def _load_environment_context(workspace_id: str, db: AsyncSessionLocal) -> dict:
+    """Load environment context from the database (environments + latest deployments)."""
     from sqlalchemy import select
-    from sqlalchemy.orm import selectinload
 
     from app.models import (
         Deployment,
         DeploymentStatus,
         Environment,
+        EnvironmentRepository,
     )
 
     environment_context = {
@@ -217,98 +242,83 @@ async def fetch_environment_context(workspace_id: str, db: AsyncSessionLocal) ->
         "deployed_commits_by_environment": {},
     }
 
-    try:
-        # Fetch all environments for the workspace (direct query, no membership check)
-        result = await db.execute(
-            select(Environment)
-            .options(selectinload(Environment.repository_configs))
-            .where(Environment.workspace_id == workspace_id)
-            .order_by(Environment.created_at)
+    # Fetch all environments for the workspace (direct query, no membership check)
+    result = await db.execute(
+        select(Environment.id, Environment.name, Environment.is_default)
+        .where(Environment.workspace_id == workspace_id)
+        .order_by(Environment.created_at)
+    )
+    environments = result.all()
+
+    if not environments:
+        logger.info(f"No environments configured for workspace {workspace_id}")
+        return environment_context
+
+    # Build environment list and find default
+    env_names = {}
+    for env in environments:
+        env_names[env.id] = env.name
+        environment_context["environments"].append(
+            {"name": env.name, "is_default": env.is_default}
         )
-        environments = list(result.scalars().all())
+        environment_context["deployed_commits_by_environment"][env.name] = {}
 
-        if not environments:
-            logger.info(f"No environments configured for workspace {workspace_id}")
-            return environment_context
+        if env.is_default:
+            environment_context["default_environment"] = env.name
 
-        # Build environment list and find default
-        for env in environments:
-            env_info = {"name": env.name, "is_default": env.is_default}
-            environment_context["environments"].append(env_info)
-
-            if env.is_default:
-                environment_context["default_environment"] = env.name
+    logger.info(
+        f"Found {len(environments)} environments for workspace {workspace_id}, "
+        f"default: {environment_context['default_environment']}"
+    )
 
-        logger.info(
-            f"Found {len(environments)} environments for workspace {workspace_id}, "
-            f"default: {environment_context['default_environment']}"
+    # Latest successful deployment per (environment, enabled repository) in one
+    # query; served by the ix_deployments_latest_success partial index
+    result = await db.execute(
+        select(
+            Deployment.environment_id,
+            Deployment.repo_full_name,
+            Deployment.commit_sha,
+            Deployment.deployed_at,
         )
-
-        # Fetch deployed commits for each environment
-        for env in environments:
-            env_commits = {}
-
-            # Get repository configs (already loaded via selectinload)
-            repo_configs = env.repository_configs or []
-
-            if not repo_configs:
-                logger.debug(f"No repositories configured for environment {env.name}")
-                environment_context["deployed_commits_by_environment"][env.name] = {}
-                continue
-
-            # For each repository, get the latest successful deployment
-            for repo_config in repo_configs:
-                if not repo_config.is_enabled:
-                    continue
-
-                try:
-                    # Get latest successful deployment for this repo in this environment
-                    result = await db.execute(
-                        select(Deployment)
-                        .where(
-                            Deployment.environment_id == env.id,
-                            Deployment.repo_full_name == repo_config.repo_full_name,
-                            Deployment.status == DeploymentStatus.SUCCESS,
-                        )
-                        .order_by(Deployment.deployed_at.desc())
-                        .limit(1)
-                    )
-                    latest_deployment = result.scalar_one_or_none()
-
-                    if latest_deployment and latest_deployment.commit_sha:
-                        deployed_at = (
-                            latest_deployment.deployed_at.isoformat()
-                            if latest_deployment.deployed_at
-                            else "unknown"
-                        )
-                        env_commits[repo_config.repo_full_name] = {
-                            "commit_sha": latest_deployment.commit_sha,
-                            "deployed_at": deployed_at,
-                        }
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to fetch latest deployment for {repo_config.repo_full_name} "
-                        f"in environment {env.name}: {e}"
-                    )
-
-            environment_context["deployed_commits_by_environment"][env.name] = (
-                env_commits
-            )
-            logger.info(f"Environment {env.name}: {len(env_commits)} deployed commits")
-
-        total_commits = sum(
-            len(commits)
-            for commits in environment_context[
-                "deployed_commits_by_environment"
-            ].values()
+        .join(Environment, Environment.id == Deployment.environment_id)
+        .join(
+            EnvironmentRepository,
+            (EnvironmentRepository.environment_id == Deployment.environment_id)
+            & (EnvironmentRepository.repo_full_name == Deployment.repo_full_name),
         )
-        logger.info(
-            f"✅ Environment context complete: {len(environments)} environments, "
-            f"{total_commits} total deployed commits"
+        .where(
+            Environment.workspace_id == workspace_id,
+            EnvironmentRepository.is_enabled.is_(True),
+            Deployment.status == DeploymentStatus.SUCCESS,
+        )
+        .distinct(Deployment.environment_id, Deployment.repo_full_name)
+        .order_by(
+            Deployment.environment_id,
+            Deployment.repo_full_name,
+            Deployment.deployed_at.desc(),
         )
+    )
 
-    except Exception as e:
-        logger.error(f"Error fetching environment context: {e}", exc_info=True)
+    for deployment in result.all():
+        if not deployment.commit_sha:
+            continue
+        environment_context["deployed_commits_by_environment"][
+            env_names[deployment.environment_id]
+        ][deployment.repo_full_name] = {
+            "commit_sha": deployment.commit_sha,
+            "deployed_at": deployment.deployed_at.isoformat()
+            if deployment.deployed_at
+            else "unknown",
+        }
+
+    total_commits = sum(
+        len(commits)
+        for commits in environment_context["deployed_commits_by_environment"].values()
+    )
+    logger.info(
+        f"✅ Environment context complete: {len(environments)} environments, "
+        f"{total_commits} total deployed commits"
+    )
 
     return environment_context
 
@@ -407,6 +417,110 @@ async def fetch_team_context(workspace_id: str, db: AsyncSessionLocal) -> dict:
     return team_context
 
 
+async def load_service_repo_mapping(workspace_id: str, db: AsyncSessionLocal) -> dict:
+    """Map each enabled user-configured service to its repository name (without org)."""
+    from app.models import Service
+
+    service_repo_mapping = {}
+    try:
+        result = await db.execute(
+            select(Service.name, Service.repository_name)
+            .where(Service.workspace_id == workspace_id)
+            .where(Service.enabled.is_(True))
+        )
+        for name, repository_name in result.all():
+            if repository_name:
+                # Extract repo name without org prefix (Vibe-Monitor/auth -> auth)
+                service_repo_mapping[name] = repository_name.split("/")[-1]
+
+        logger.info(f"✅ Loaded {len(service_repo_mapping)} user-configured services")
+
+        if len(service_repo_mapping) == 0:
+            logger.warning(
+                "⚠️ No services configured in workspace. User should add services in the UI."
+            )
+    except Exception as e:
+        logger.error(f"Failed to load user-configured services: {e}")
+        service_repo_mapping = {}
+
+    return service_repo_mapping
+
+
+async def build_workspace_context_snapshot(
+    workspace_id: str, db: AsyncSessionLocal
+) -> dict:
+    """
+    Build everything an RCA job needs about its workspace before the agent runs.
+
+    Returns:
+        {
+            "integrations": [{"id", "provider", "health_status"}, ...],
+            "service_repo_mapping": {...},
+            "environment_context": {...},
+            "team_context": {...},
+        }
+    """
+    integrations = await get_workspace_integrations(workspace_id, db)
+    logger.info(
+        f"🔍 Pre-processing: Loading service mappings for workspace {workspace_id}"
+    )
+    service_repo_mapping = await load_service_repo_mapping(workspace_id, db)
+    logger.info(
+        f"🌍 Pre-processing: Fetching environment context for workspace {workspace_id}"
+    )
+    environment_context = await fetch_environment_context(
+        workspace_id=workspace_id, db=db
+    )
+    logger.info(
+        f"👥 Pre-processing: Fetching team context for workspace {workspace_id}"
+    )
+    team_context = await fetch_team_context(workspace_id=workspace_id, db=db)
+
+    return {
+        "integrations": [
+            {"id": i.id, "provider": i.provider, "health_status": i.health_status}
+            for i in integrations
+        ],
+        "service_repo_mapping": service_repo_mapping,
+        "environment_context": environment_context,
+        "team_context": team_context,
+    }
+
+
+async def get_workspace_context_snapshot(
+    workspace_id: str, db: AsyncSessionLocal
+) -> dict:
+    """Workspace context snapshot, served from the versioned cache when fresh."""
+    return await workspace_context_cache.get_or_load(
+        workspace_id,
+        lambda: build_workspace_context_snapshot(workspace_id, db),
+        # Don't pin a degraded team context for the snapshot's lifetime
+        should_cache=lambda snapshot: "error" not in snapshot["team_context"],
+    )
+
+
+async def record_github_health(
+    db: AsyncSessionLocal, integration_id: str, error: Optional[str] = None
+) -> None:
+    """Persist the outcome of a GitHub liveness probe (healthy if no error)."""
+    from app.models import Integration
+
+    integration = await db.get(Integration, integration_id)
+    if not integration:
+        return
+    integration.health_status = "failed" if error else "healthy"
+    integration.status = "error" if error else "active"
+    integration.last_error = error
+    integration.last_verified_at = datetime.now(timezone.utc)
+    await db.commit()
+
+
+# Workspaces whose GitHub probe succeeded recently (per process)
+_github_probe_ok = TTLCache(
+    ttl_seconds=settings.RCA_GITHUB_PROBE_TTL_SECONDS, maxsize=10000
+)
+
+
 class RCAOrchestratorWorker(BaseWorker):
     def __init__(self):
         """
@@ -525,12 +639,16 @@ class RCAOrchestratorWorker(BaseWorker):
                     else:
                         logger.info("📝 No thread history - this is a new conversation")
 
-                    # Get integrations for health tracking
-                    all_integrations = await get_workspace_integrations(
-                        workspace_id, db
-                    )
+                    # Integrations, service mappings, environment and team context:
+                    # one cache lookup when the workspace hasn't changed since the last job
+                    snapshot = await get_workspace_context_snapshot(workspace_id, db)
+                    all_integrations = snapshot["integrations"]
+                    service_repo_mapping = snapshot["service_repo_mapping"]
+                    environment_context = snapshot["environment_context"]
+                    team_context = snapshot["team_context"]
+
                     github_integration = next(
-                        (i for i in all_integrations if i.provider == "github"), None
+                        (i for i in all_integrations if i["provider"] == "github"), None
                     )
 
                     if not github_integration:
@@ -575,128 +693,81 @@ class RCAOrchestratorWorker(BaseWorker):
 
                     # Log warning if health_status is not healthy, but proceed anyway
                     # The actual API call will determine real health status
-                    if github_integration.health_status not in ("healthy", None):
+                    github_healthy = github_integration["health_status"] == "healthy"
+                    if github_integration["health_status"] not in ("healthy", None):
                         logger.info(
-                            f"GitHub integration has health_status={github_integration.health_status}, "
+                            f"GitHub integration has health_status={github_integration['health_status']}, "
                             f"will verify with actual API call for workspace {workspace_id}"
                         )
 
-                    # PRE-PROCESSING: Fetch user-configured service→repo mappings
-                    logger.info(
-                        f"🔍 Pre-processing: Loading service mappings for workspace {workspace_id}"
-                    )
-
-                    service_repo_mapping = {}
-
-                    # Fetch user-configured services from database
-                    try:
-                        from app.models import Service
-
-                        result = await db.execute(
-                            select(Service)
-                            .where(Service.workspace_id == workspace_id)
-                            .where(Service.enabled.is_(True))
-                        )
-                        user_services = list(result.scalars().all())
-
-                        for service in user_services:
-                            if service.repository_name:
-                                # Extract repo name without org prefix (Vibe-Monitor/auth -> auth)
-                                repo_name = (
-                                    service.repository_name.split("/")[-1]
-                                    if "/" in service.repository_name
-                                    else service.repository_name
-                                )
-                                service_repo_mapping[service.name] = repo_name
-
+                    # Verify GitHub integration health with a lightweight check,
+                    # unless it already passed recently in this process
+                    if github_healthy and workspace_id in _github_probe_ok:
                         logger.info(
-                            f"✅ Loaded {len(service_repo_mapping)} user-configured services"
+                            "✅ GitHub integration verified recently, skipping probe"
                         )
-
-                        if len(service_repo_mapping) == 0:
-                            logger.warning(
-                                "⚠️ No services configured in workspace. User should add services in the UI."
+                    else:
+                        try:
+                            repos_response = await list_repositories_graphql(
+                                workspace_id=workspace_id,
+                                first=1,  # Just check if API works, don't fetch all repos
+                                after=None,
+                                user_id="rca-agent",
+                                db=db,
                             )
-                    except Exception as e:
-                        logger.error(f"Failed to load user-configured services: {e}")
-                        service_repo_mapping = {}
-
-                    # Verify GitHub integration health with a lightweight check
-                    try:
-                        repos_response = await list_repositories_graphql(
-                            workspace_id=workspace_id,
-                            first=1,  # Just check if API works, don't fetch all repos
-                            after=None,
-                            user_id="rca-agent",
-                            db=db,
-                        )
 
-                        if repos_response.get("success"):
-                            # GitHub API succeeded - mark integration as healthy
-                            if (
-                                github_integration
-                                and github_integration.health_status != "healthy"
-                            ):
-                                github_integration.health_status = "healthy"
-                                github_integration.status = "active"
-                                github_integration.last_error = None
-                                github_integration.last_verified_at = datetime.now(
-                                    timezone.utc
-                                )
-                                await db.commit()
-                                logger.info("✅ GitHub integration verified as healthy")
-                        else:
-                            # GitHub API call failed - mark integration as unhealthy
-                            if github_integration:
-                                github_integration.health_status = "failed"
-                                github_integration.status = "error"
-                                github_integration.last_error = (
-                                    "Failed to connect to GitHub"
+                            if repos_response.get("success"):
+                                # GitHub API succeeded - mark integration as healthy
+                                _github_probe_ok.set(workspace_id, True)
+                                if not github_healthy:
+                                    await record_github_health(
+                                        db, github_integration["id"]
+                                    )
+                                    logger.info(
+                                        "✅ GitHub integration verified as healthy"
+                                    )
+                            else:
+                                # GitHub API call failed - mark integration as unhealthy
+                                await record_github_health(
+                                    db,
+                                    github_integration["id"],
+                                    error="Failed to connect to GitHub",
                                 )
-                                github_integration.last_verified_at = datetime.now(
-                                    timezone.utc
+                                logger.warning(
+                                    f"⚠️ GitHub integration marked as unhealthy: workspace_id={workspace_id}"
                                 )
-                                await db.commit()
-                            logger.warning(
-                                f"⚠️ GitHub integration marked as unhealthy: workspace_id={workspace_id}"
-                            )
 
-                    except Exception as e:
-                        # GitHub API call threw exception - mark integration as unhealthy
-                        if github_integration:
-                            github_integration.health_status = "failed"
-                            github_integration.status = "error"
-                            github_integration.last_error = str(e)
-                            github_integration.last_verified_at = datetime.now(
-                                timezone.utc
+                        except Exception as e:
+                            # GitHub API call threw exception - mark integration as unhealthy
+                            await record_github_health(
+                                db, github_integration["id"], error=str(e)
                             )
-                            await db.commit()
 
-                        logger.error(
-                            f"Error during service discovery pre-processing: {e}",
-                            exc_info=True,
-                        )
+                            logger.error(
+                                f"Error during service discovery pre-processing: {e}",
+                                exc_info=True,
+                            )
 
-                        await fail_and_notify_job(
-                            db=db,
-                            job=job,
-                            requested_context=requested_context,
-                            error_message=f"Service discovery failed: {str(e)}",
-                            error_type="ServiceDiscoveryError",
-                            team_id=team_id,
-                            channel_id=channel_id,
-                            thread_ts=thread_ts,
-                        )
-                        return
+                            await fail_and_notify_job(
+                                db=db,
+                                job=job,
+                                requested_context=requested_context,
+                                error_message=f"Service discovery failed: {str(e)}",
+                                error_type="ServiceDiscoveryError",
+                                team_id=team_id,
+                                channel_id=channel_id,
+                                thread_ts=thread_ts,
+                            )
+                            return
 
                     # Check for unhealthy optional integrations (exclude slack and github)
                     # GitHub is already checked before service discovery
                     # Other integrations are optional - warn but proceed with RCA
                     unhealthy_optional = [
-                        i.provider
+                        i["provider"]
                         for i in all_integrations
-                        if i.provider not in ("slack", "github")
-                        and i.health_status not in ("healthy", None)
+                        if i["provider"] not in ("slack", "github")
+                        and i["health_status"] not in ("healthy", None)
                     ]
 
                     if unhealthy_optional:
@@ -715,26 +786,26 @@ class RCAOrchestratorWorker(BaseWorker):
                                 unhealthy_providers=unhealthy_optional
                             )
 
-                    # PRE-PROCESSING: Fetch environment context (environments + deployed commits)
-                    logger.info(
-                        f"🌍 Pre-processing: Fetching environment context for workspace {workspace_id}"
-                    )
-                    environment_context = await fetch_environment_context(
-                        workspace_id=workspace_id, db=db
-                    )
-
-                    # PRE-PROCESSING: Fetch team context (teams + members + services)
-                    logger.info(
-                        f"👥 Pre-processing: Fetching team context for workspace {workspace_id}"
-                    )
-                    team_context = await fetch_team_context(
-                        workspace_id=workspace_id, db=db
-                    )
+                    # PRE-PROCESSING: Validate and extract files uploaded directly to S3
+                    files = job.requested_context.get("files", [])
+                    if any(f.get("pending_extraction") for f in files):
+                        logger.info(
+                            f"📎 Pre-processing: Extracting {len(files)} uploaded file(s) for job {job_id}"
+                        )
+                        files = await process_uploaded_files(db, files)
+                        job.requested_context = {
+                            **job.requested_context,
+                            "files": files,
+                            "has_files": bool(files),
+                            "has_images": any(
+                                f.get("file_type") in ("image", "video") for f in files
+                            ),
+                        }
+                        await db.commit()
 
                     # Perform RCA analysis using LangGraph agent
                     # LangGraph now handles both text and multimodal inputs
                     has_images = job.requested_context.get("has_images", False)
-                    files = job.requested_context.get("files", [])
 
                     if has_images:
                         # Count images and videos
@@ -776,6 +847,19 @@ class RCAOrchestratorWorker(BaseWorker):
                     progress_callback = None
                     web_callback = None  # Keep reference for web-specific methods
 
+                    # Streamed answer text is unmasked as it goes out
+                    stream_pii_mapper = None
+                    if requested_context.get("pii_mapping"):
+                        try:
+                            stream_pii_mapper = PIIMapper.from_mapping(
+                                requested_context["pii_mapping"]
+                            )
+                        except Exception:
+                            logger.debug(
+                                "Failed to load PII mapping for streaming",
+                                exc_info=True,
+                            )
+
                     if job.source == JobSource.WEB:
                         # Web chat: use WebProgressCallback for SSE streaming
                         turn_id = requested_context.get("turn_id")
@@ -783,6 +867,7 @@ class RCAOrchestratorWorker(BaseWorker):
                             web_callback = WebProgressCallback(
                                 turn_id=turn_id,
                                 db=db,
+                                pii_mapper=stream_pii_mapper,
                             )
                             progress_callback = web_callback
                             logger.info(f"🌐 Using web callback for turn {turn_id}")
@@ -798,6 +883,7 @@ class RCAOrchestratorWorker(BaseWorker):
                                 channel_id=channel_id,
                                 thread_ts=thread_ts,
                                 send_tool_output=False,
+                                pii_mapper=stream_pii_mapper,
                             )
 
                     # Create metrics callback for tool execution tracking
@@ -827,6 +913,10 @@ class RCAOrchestratorWorker(BaseWorker):
                         db=db,  # Pass db session for capability-based tool resolution
                     )
 
+                    logger.info(
+                        f"Agent usage for job {job_id}: {metrics_callback.summary()}"
+                    )
+
                     # Process result with null safety
                     if result and result.get("success"):
                         logger.info(f"✅ Job {job_id} completed successfully")
@@ -914,6 +1004,13 @@ class RCAOrchestratorWorker(BaseWorker):
                             # Convert Markdown to Slack format
                             slack_output = markdown_to_slack(final_output)
 
+                            # The streamed answer message becomes the final message
+                            streamed_ts = None
+                            if isinstance(progress_callback, SlackProgressCallback):
+                                streamed_ts = (
+                                    await progress_callback.finish_answer_stream()
+                                )
+
                             turn_id = requested_context.get("turn_id")
                             if turn_id:
                                 # Update turn status and response
@@ -926,24 +1023,44 @@ class RCAOrchestratorWorker(BaseWorker):
                                 await db.commit()
 
                                 # Send with feedback buttons
-                                await slack_event_service.send_message_with_feedback_button(
+                                sent = await slack_event_service.send_message_with_feedback_button(
                                     team_id=team_id,
                                     channel=channel_id,
                                     text=slack_output,
                                     turn_id=turn_id,
                                     thread_ts=thread_ts,
+                                    ts=streamed_ts,
                                 )
+                                if sent is None and streamed_ts:
+                                    # Replacing the streamed message failed; post it fresh
+                                    await slack_event_service.send_message_with_feedback_button(
+                                        team_id=team_id,
+                                        channel=channel_id,
+                                        text=slack_output,
+                                        turn_id=turn_id,
+                                        thread_ts=thread_ts,
+                                    )
                                 logger.info(
                                     f"📤 Job {job_id} result sent to Slack with feedback buttons"
                                 )
                             else:
                                 # Fallback: send without feedback button
-                                await slack_event_service.send_message(
-                                    team_id=team_id,
-                                    channel=channel_id,
-                                    text=slack_output,
-                                    thread_ts=thread_ts,
+                                updated = (
+                                    streamed_ts
+                                    and await slack_event_service.update_message(
+                                        team_id=team_id,
+                                        channel=channel_id,
+                                        ts=streamed_ts,
+                                        text=slack_output,
+                                    )
                                 )
+                                if not updated:
+                                    await slack_event_service.send_message(
+                                        team_id=team_id,
+                                        channel=channel_id,
+                                        text=slack_output,
+                                        thread_ts=thread_ts,
+                                    )
                                 logger.info(f"📤 Job {job_id} result sent to Slack")
 
                         # Record job-level RCA + LLM metrics in a single helper.
@@ -7,7 +7,7 @@ import json
 import logging
 import signal
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, List, Set
 
 import aioboto3
 from botocore.exceptions import (
@@ -29,6 +29,8 @@ from app.models import ReviewStatus, ServiceReview
 
 logger = logging.getLogger(__name__)
 
+SQS_BATCH_SIZE = 10  # SendMessageBatch accepts at most 10 entries
+
 
 class HealthReviewSQSClient:
     """SQS client for health review queue."""
@@ -93,6 +95,60 @@ class HealthReviewSQSClient:
             )
             return False
 
+    async def send_message_batch(self, entries: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Send messages with SendMessageBatch, 10 per call (the SQS maximum).
+
+        Args:
+            entries: List of {"id", "message_body", "delay_seconds"} dicts.
+                Ids must be unique within the call.
+
+        Returns:
+            Set of entry ids that SQS accepted
+        """
+        if not self.queue_url:
+            logger.error("HEALTH_REVIEW_QUEUE_URL not configured")
+            return set()
+
+        sent: Set[str] = set()
+        for i in range(0, len(entries), SQS_BATCH_SIZE):
+            chunk = entries[i : i + SQS_BATCH_SIZE]
+            try:
+                sqs = await self._get_sqs_client()
+
+                response = await sqs.send_message_batch(
+                    QueueUrl=self.queue_url,
+                    Entries=[
+                        {
+                            "Id": entry["id"],
+                            "MessageBody": json.dumps(entry["message_body"]),
+                            "DelaySeconds": entry.get("delay_seconds", 0),
+                        }
+                        for entry in chunk
+                    ],
+                )
+
+                sent.update(item["Id"] for item in response.get("Successful", []))
+                for failure in response.get("Failed", []):
+                    logger.error(
+                        f"Health review message {failure.get('Id')} rejected by SQS: "
+                        f"{failure.get('Code')} {failure.get('Message')}"
+                    )
+
+            except (
+                ClientError,
+                EndpointConnectionError,
+                NoCredentialsError,
+                BotoCoreError,
+            ):
+                logger.exception("Failed to send message batch to health review SQS")
+            except Exception:
+                logger.exception(
+                    "Unexpected error while sending message batch to health review SQS"
+                )
+
+        return sent
+
     async def receive_messages(
         self, max_messages: int = 1, wait_time: int = 20
     ) -> list:
@@ -382,6 +438,31 @@ async def publish_health_review_job(
     )
 
 
+async def publish_health_review_jobs(jobs: List[Dict[str, Any]]) -> Set[str]:
+    """
+    Publish many health review jobs using SQS batch sends.
+
+    Args:
+        jobs: List of {"review_id", "workspace_id", "service_id", "delay_seconds"}
+
+    Returns:
+        Set of review IDs that were published successfully
+    """
+    entries = [
+        {
+            "id": job["review_id"],
+            "message_body": {
+                "review_id": job["review_id"],
+                "workspace_id": job["workspace_id"],
+                "service_id": job["service_id"],
+            },
+            "delay_seconds": job.get("delay_seconds", 0),
+        }
+        for job in jobs
+    ]
+    return await health_review_sqs_client.send_message_batch(entries)
+
+
 # Entry point for running the worker directly
 async def main():
     """Run the health review worker."""
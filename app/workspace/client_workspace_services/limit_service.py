@@ -12,7 +12,12 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Plan, PlanType, Service, Subscription
-from app.utils.rate_limiter import is_byollm_workspace, get_weekly_window_key
+from app.utils.rate_limiter import (
+    ResourceType,
+    get_current_usage,
+    get_weekly_window_key,
+    is_byollm_workspace,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -71,26 +76,16 @@ class LimitService:
         """
         Get AIU (AI Units) consumed this week for a workspace.
 
-        Uses RateLimitTracking table with weekly window_key (e.g., '2026-W06').
+        Uses RateLimitTracking table with weekly window_key (e.g., '2026-W06'),
+        or the live Redis counter when it is ahead of the last write-behind flush.
         For VibeMonitor users only - BYOLLM users are unlimited.
 
         Returns:
             int: Total AIU consumed this week (0 if no usage or BYOLLM)
         """
-        from app.models import RateLimitTracking
-        from app.utils.rate_limiter import ResourceType
-
-        week_key = get_weekly_window_key()
-
-        result = await db.execute(
-            select(RateLimitTracking.count)
-            .where(
-                RateLimitTracking.workspace_id == workspace_id,
-                RateLimitTracking.resource_type == ResourceType.AIU_USAGE.value,
-                RateLimitTracking.window_key == week_key,
-            )
+        return await get_current_usage(
+            db, workspace_id, ResourceType.AIU_USAGE, get_weekly_window_key()
         )
-        return result.scalar() or 0
 
     async def check_can_add_service(
         self, db: AsyncSession, workspace_id: str
@@ -0,0 +1,92 @@
+"""
+Per-workspace caches of the context RCA jobs load before the first LLM call.
+
+- environment_context_cache: environments + latest deployed commit per repo
+- workspace_context_cache: the full snapshot (integrations, service→repo
+  mapping, environment and team context)
+- response_cache: answers to conversational questions, which are built from
+  that same context (see app.services.rca.response_cache)
+
+All are invalidated automatically: an after_flush listener watches ORM
+writes to the models the snapshot is built from and bumps the affected
+workspace's cache version when the transaction commits. That covers every
+writer (CRUD routers, OAuth flows, health checks, deployment webhooks)
+without each one having to remember to invalidate. Bulk UPDATE/DELETE
+statements bypass the listener; the TTLs bound staleness for those.
+"""
+
+import itertools
+from collections import defaultdict
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import (
+    Deployment,
+    Environment,
+    EnvironmentRepository,
+    Integration,
+    Service,
+    Team,
+    TeamMembership,
+)
+from app.utils.versioned_cache import VersionedCache
+
+environment_context_cache = VersionedCache(
+    "rca:environment_context",
+    ttl_seconds=settings.ENVIRONMENT_CONTEXT_CACHE_TTL_SECONDS,
+    enabled=settings.ENVIRONMENT_CONTEXT_CACHE_ENABLED,
+)
+
+workspace_context_cache = VersionedCache(
+    "rca:workspace_context",
+    ttl_seconds=settings.RCA_CONTEXT_SNAPSHOT_TTL_SECONDS,
+    enabled=settings.RCA_CONTEXT_SNAPSHOT_ENABLED,
+)
+
+response_cache = VersionedCache(
+    "rca:conversational_response",
+    ttl_seconds=settings.RCA_RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RCA_RESPONSE_CACHE_ENABLED,
+)
+
+WORKSPACE_CACHES = (environment_context_cache, workspace_context_cache, response_cache)
+
+# Models carrying workspace_id directly
+_WORKSPACE_MODELS = (Integration, Service, Team, Environment)
+
+# Models reaching the workspace through a parent: model -> (fk attribute, parent)
+_CHILD_MODELS = {
+    TeamMembership: ("team_id", Team),
+    EnvironmentRepository: ("environment_id", Environment),
+    Deployment: ("environment_id", Environment),
+}
+
+
+def invalidate_workspace_context(session, workspace_id: str) -> None:
+    """Invalidate all workspace context caches when session commits."""
+    for cache in WORKSPACE_CACHES:
+        cache.invalidate_on_commit(session, workspace_id)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_workspace_context_changes(session: Session, flush_context) -> None:
+    workspace_ids = set()
+    parent_ids = defaultdict(set)
+
+    for instance in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(instance, _WORKSPACE_MODELS):
+            workspace_ids.add(instance.workspace_id)
+        elif type(instance) in _CHILD_MODELS:
+            fk_attr, parent = _CHILD_MODELS[type(instance)]
+            parent_ids[parent].add(getattr(instance, fk_attr))
+
+    for parent, ids in parent_ids.items():
+        # A parent deleted in this same flush is already in workspace_ids
+        result = session.execute(select(parent.workspace_id).where(parent.id.in_(ids)))
+        workspace_ids.update(result.scalars())
+
+    for workspace_id in workspace_ids:
+        if workspace_id:
+            invalidate_workspace_context(session, workspace_id)
@@ -9,7 +9,6 @@ from sqlalchemy.orm import selectinload
 
 from app.models import ChatFile, ChatSession, ChatTurn, GitHubIntegration, Membership, PlanType, Role, SlackInstallation, User, Workspace
 from app.core.otel_metrics import WORKSPACE_METRICS
-from app.billing.services.subscription_service import SubscriptionService
 
 from ..schemas import (
     WorkspaceCreate,
@@ -22,6 +21,10 @@ logger = logging.getLogger(__name__)
 
 class WorkspaceService:
     def __init__(self):
+        # Imported here: the billing services load the Stripe SDK, which the
+        # worker reaches through this module but never uses
+        from app.billing.services.subscription_service import SubscriptionService
+
         self.subscription_service = SubscriptionService()
 
     async def create_workspace(
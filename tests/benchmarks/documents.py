@@ -0,0 +1,72 @@
+"""
+Synthetic documents for text extraction tests and benchmarks.
+"""
+
+import json
+
+
+def make_text_pdf(pages: int, lines_per_page: int = 40) -> bytes:
+    """Build a minimal valid PDF with `pages` pages of Helvetica text."""
+    font_id = 3
+    first_page_id = 4
+    objects = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        font_id: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    for page in range(pages):
+        page_id = first_page_id + 2 * page
+        content_id = page_id + 1
+        kids.append(f"{page_id} 0 R")
+        lines = " T* ".join(
+            f"(Page {page + 1} line {line}: ERROR upstream timeout in checkout-service) Tj"
+            for line in range(lines_per_page)
+        )
+        stream = f"BT /F1 10 Tf 12 TL 40 760 Td {lines} ET"
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font_id} 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        objects[content_id] = (
+            f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+        )
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n".encode("latin-1")
+
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += f"xref\n0 {size}\n0000000000 65535 f \n".encode()
+    for obj_id in range(1, size):
+        out += f"{offsets[obj_id]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {size} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def make_json(records: int) -> bytes:
+    return json.dumps(
+        [
+            {
+                "id": i,
+                "service": "checkout",
+                "level": "error" if i % 7 == 0 else "info",
+                "attributes": {
+                    "latency_ms": i % 900,
+                    "region": "us-east-1",
+                    "tags": ["a", "b"],
+                },
+            }
+            for i in range(records)
+        ]
+    ).encode()
+
+
+def make_log(lines: int) -> bytes:
+    return "".join(
+        f"2026-01-01T00:00:{i % 60:02d}Z ERROR checkout-service request_id={i} upstream timeout ✓\n"
+        for i in range(lines)
+    ).encode()
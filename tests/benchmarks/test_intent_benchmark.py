@@ -0,0 +1,121 @@
+"""
+Intent classification evaluation.
+
+Runs the rule-based pre-classifier over labeled queries and reports its
+coverage (share decided without the LLM), accuracy on the queries it
+decides, and per-query latency. Fails if a rule misclassifies more than
+the allowed share or gets slow.
+
+The bundled set is tests/benchmarks/data/intent_queries.jsonl. Point
+INTENT_EVAL_FILE at an export of labeled historical queries (JSONL with
+"query", "intent" and optional "context") to evaluate on real traffic.
+With INTENT_EVAL_LLM=1 and GROQ_API_KEY set, the LLM classifier is run on
+the same queries for comparison.
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_intent_benchmark.py -s
+"""
+
+import json
+import os
+import statistics
+import time
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from app.services.rca.intent_rules import RCA_INVESTIGATION, classify_by_rules
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="Benchmarks only run with RUN_BENCHMARKS=1",
+)
+
+DATASET = Path(
+    os.environ.get("INTENT_EVAL_FILE")
+    or Path(__file__).parent / "data" / "intent_queries.jsonl"
+)
+
+MIN_RULE_ACCURACY = 0.98  # On the queries the rules decide
+MAX_RULE_P99_MS = 1.0
+
+
+def _load_dataset() -> list:
+    with DATASET.open() as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _route(intent: str) -> str:
+    # The graph sends everything that isn't an investigation to the conversational agent
+    return RCA_INVESTIGATION if intent == RCA_INVESTIGATION else "conversational"
+
+
+def _percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def test_rule_classifier_accuracy_and_latency():
+    examples = _load_dataset()
+    latencies_ms = []
+    decided = 0
+    wrong = []
+    rules = Counter()
+
+    for example in examples:
+        started = time.perf_counter()
+        match = classify_by_rules(example["query"], example.get("context"))
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+        if match is None:
+            continue
+        decided += 1
+        rules[match.rule] += 1
+        if match.intent != _route(example["intent"]):
+            wrong.append((example["query"][:60], match.rule, example["intent"]))
+
+    accuracy = 1 - len(wrong) / decided if decided else 1.0
+    print(f"\n{DATASET.name}: {len(examples)} queries")
+    print(
+        f"  rules decided  {decided / len(examples):6.1%}  ({decided}, rest go to the LLM)"
+    )
+    print(f"  rule accuracy  {accuracy:6.1%}")
+    print(
+        f"  rule latency   p50={statistics.median(latencies_ms):.3f}ms "
+        f"p99={_percentile(latencies_ms, 0.99):.3f}ms"
+    )
+    for rule, count in rules.most_common():
+        print(f"    {rule:<24} {count}")
+    for query, rule, expected in wrong:
+        print(f"  MISS {rule} -> expected {expected}: {query!r}")
+
+    assert accuracy >= MIN_RULE_ACCURACY
+    assert _percentile(latencies_ms, 0.99) <= MAX_RULE_P99_MS
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(
+    not (os.environ.get("INTENT_EVAL_LLM") and os.environ.get("GROQ_API_KEY")),
+    reason="LLM comparison needs INTENT_EVAL_LLM=1 and GROQ_API_KEY",
+)
+async def test_llm_classifier_accuracy_and_latency():
+    from app.services.rca.agent import rca_agent_service
+    from app.services.rca.agents import classify_query_intent
+
+    examples = _load_dataset()
+    latencies_ms = []
+    correct = 0
+
+    with patch("app.services.rca.agents.settings.RCA_INTENT_RULES_ENABLED", False):
+        for example in examples:
+            state = {"task": example["query"], "context": example.get("context") or {}}
+            started = time.perf_counter()
+            state = await classify_query_intent(state, rca_agent_service.groq_llm)
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+            correct += _route(state["query_intent"]) == _route(example["intent"])
+
+    print(f"\nLLM on {DATASET.name}: accuracy={correct / len(examples):.1%}")
+    print(
+        f"  latency p50={statistics.median(latencies_ms):.0f}ms "
+        f"p99={_percentile(latencies_ms, 0.99):.0f}ms"
+    )
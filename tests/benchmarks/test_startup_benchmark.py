@@ -0,0 +1,96 @@
+"""
+Startup import-time benchmarks for the API and worker entry points.
+
+Imports each entry point in a fresh interpreter under `python -X importtime`,
+reports the cumulative import time with the slowest third-party packages,
+and fails when it exceeds the entry point's budget or when a dependency that
+should be loaded on first use shows up in the import graph.
+
+Opt-in, since each run starts a new interpreter:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks/test_startup_benchmark.py -s
+"""
+
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="Benchmarks only run with RUN_BENCHMARKS=1",
+)
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Cold-import budgets, with headroom over a laptop measurement (API ~7s,
+# worker ~3.5s); tighten them as the import graph slims down
+BUDGET_SECONDS = {
+    "app.main": 9.0,
+    "app.worker": 4.5,
+}
+
+# Packages each entry point must not import eagerly
+DEFERRED_PACKAGES = {
+    "app.main": {
+        "presidio_analyzer",
+        "spacy",
+        "langchain_openai",
+        "langchain_google_genai",
+        "tree_sitter_languages",
+    },
+    "app.worker": {
+        "stripe",
+        "presidio_analyzer",
+        "spacy",
+        "langchain_openai",
+        "langchain_google_genai",
+        "tree_sitter_languages",
+    },
+}
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)")
+
+
+def _profile_import(module: str) -> tuple:
+    """Return (cumulative seconds, {module: self microseconds}) for a cold import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT,
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    self_times = {}
+    cumulative = 0
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, name = match.groups()
+        self_times[name] = int(self_us)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative / 1e6, self_times
+
+
+@pytest.mark.parametrize("module", list(BUDGET_SECONDS))
+def test_startup_import_time(module):
+    seconds, self_times = _profile_import(module)
+
+    by_package = defaultdict(int)
+    for name, self_us in self_times.items():
+        by_package[name.split(".")[0]] += self_us
+    slowest = sorted(by_package.items(), key=lambda item: -item[1])[:10]
+    print(f"\n{module:<12} import={seconds:6.2f}s budget={BUDGET_SECONDS[module]:.1f}s")
+    for package, self_us in slowest:
+        print(f"  {package:<28} {self_us / 1e6:6.2f}s")
+
+    loaded_packages = {name.split(".")[0] for name in self_times}
+    assert not DEFERRED_PACKAGES[module] & loaded_packages
+    assert seconds <= BUDGET_SECONDS[module]
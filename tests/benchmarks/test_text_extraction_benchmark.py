@@ -0,0 +1,88 @@
+"""
+Text extraction benchmarks.
+
+Measures extraction wall time and event-loop stall (the longest gap seen by
+a 5ms ticker coroutine running alongside) for large PDFs, JSON and logs,
+comparing the thread path with the process pool path.
+
+Opt-in, since they take tens of seconds:
+
+    RUN_BENCHMARKS=1 pytest tests/benchmarks -s
+"""
+
+import asyncio
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.storage import TextExtractor
+from app.services.storage.extraction_engine import extraction_engine
+from tests.benchmarks.documents import make_json, make_log, make_text_pdf
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("RUN_BENCHMARKS"),
+    reason="Benchmarks only run with RUN_BENCHMARKS=1",
+)
+
+DOCUMENTS = {
+    "pdf_300_pages": (lambda: make_text_pdf(pages=300), "application/pdf", "big.pdf"),
+    "json_200k_records": (
+        lambda: make_json(records=200_000),
+        "application/json",
+        "big.json",
+    ),
+    "log_40mb": (lambda: make_log(lines=400_000), "text/plain", "big.log"),
+}
+
+
+async def _measure(file_content: bytes, mime_type: str, filename: str) -> tuple:
+    """Return (extraction seconds, max event loop stall seconds, chars)."""
+    stop = asyncio.Event()
+    max_stall = 0.0
+
+    async def ticker():
+        nonlocal max_stall
+        last = time.perf_counter()
+        while not stop.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            max_stall = max(max_stall, now - last - 0.005)
+            last = now
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.perf_counter()
+    text = await TextExtractor.extract_text(file_content, mime_type, filename)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker_task
+    return elapsed, max_stall, len(text or "")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", list(DOCUMENTS))
+@pytest.mark.parametrize("pool_enabled", [False, True], ids=["thread", "process_pool"])
+async def test_extraction_benchmark(name, pool_enabled):
+    build, mime_type, filename = DOCUMENTS[name]
+    file_content = build()
+
+    with patch(
+        "app.services.storage.extraction_engine.settings.TEXT_EXTRACTION_POOL_ENABLED",
+        pool_enabled,
+    ):
+        # Warm the pool so worker start-up isn't billed to the first document
+        if pool_enabled:
+            await _measure(make_json(records=20_000), "application/json", "warm.json")
+        elapsed, max_stall, chars = await _measure(file_content, mime_type, filename)
+
+    print(
+        f"\n{name:<20} {'pool' if pool_enabled else 'thread':<7} "
+        f"size={len(file_content) / 1e6:6.1f}MB extract={elapsed * 1000:8.1f}ms "
+        f"max_loop_stall={max_stall * 1000:7.1f}ms chars={chars}"
+    )
+    assert chars > 0
+
+
+def teardown_module():
+    extraction_engine.shutdown()
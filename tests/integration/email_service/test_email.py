@@ -166,6 +166,11 @@ async def create_test_slack_installation(
     return installation
 
 
+async def _postmark_batch_ok(messages):
+    """Postmark batch response accepting every message."""
+    return [{"ErrorCode": 0, "MessageID": f"msg-{i}"} for i in range(len(messages))]
+
+
 # =============================================================================
 # POST /api/v1/email/nudge-email Tests
 # =============================================================================
@@ -334,9 +339,10 @@ async def test_send_user_help_emails_with_scheduler_token(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_user_help_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-user-help-emails",
                 headers={
@@ -366,9 +372,10 @@ async def test_send_user_help_emails_skips_already_sent(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_user_help_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-user-help-emails",
                 headers={
@@ -408,9 +415,10 @@ async def test_send_usage_feedback_emails_with_scheduler_token(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_usage_feedback_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-usage-feedback-emails",
                 headers={
@@ -433,9 +441,10 @@ async def test_send_usage_feedback_emails_skips_inactive_users(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_usage_feedback_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-usage-feedback-emails",
                 headers={
@@ -461,9 +470,10 @@ async def test_send_usage_feedback_emails_skips_recent_users(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_usage_feedback_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-usage-feedback-emails",
                 headers={
@@ -497,9 +507,10 @@ async def test_send_usage_feedback_emails_skips_already_sent(client, test_db):
     with patch("app.email_service.router.verify_scheduler_token") as mock_verify:
         mock_verify.return_value = True
 
-        with patch("app.email_service.router.email_service") as mock_email:
-            mock_email.send_usage_feedback_email = AsyncMock(return_value=None)
-
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=_postmark_batch_ok),
+        ):
             response = await client.post(
                 f"{API_PREFIX}/send-usage-feedback-emails",
                 headers={
@@ -522,6 +522,9 @@ class TestGetWorkspaceReviewsEndpoint:
                 status=ReviewStatus.COMPLETED,
                 review_week_start=week_start,
                 review_week_end=week_end,
+                logging_gaps_count=i,
+                metrics_gaps_count=i + 1,
+                slis_count=i + 2,
             )
             test_db.add(review)
         await test_db.commit()
@@ -535,6 +538,11 @@ class TestGetWorkspaceReviewsEndpoint:
         data = response.json()
         assert data["services_with_reviews"] == 1
         assert len(data["reviews"]) == 1  # Only latest review returned
+        # Counts come from the stored counters of the newest week
+        latest = data["reviews"][0]
+        assert latest["logging_gaps_count"] == 0
+        assert latest["metrics_gaps_count"] == 1
+        assert latest["slis_count"] == 2
 
     @pytest.mark.asyncio
     async def test_get_workspace_reviews_unauthorized(self, client, test_workspace):
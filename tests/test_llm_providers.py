@@ -27,10 +27,12 @@ os.environ.setdefault("AWS_REGION", "us-east-1")
 import json
 import pytest
 import uuid
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from app.llm import providers
 from app.llm.providers import (
     get_llm_for_workspace,
+    invalidate_workspace_llm,
     is_byollm_workspace,
     _create_groq_llm,
     _create_openai_llm,
@@ -40,6 +42,16 @@ from app.llm.providers import (
 from app.models import LLMProviderConfig, LLMProvider, LLMConfigStatus
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_client_cache():
+    """Each test builds its clients from scratch."""
+    providers._workspace_clients.clear()
+    providers._default_clients.clear()
+    yield
+    providers._workspace_clients.clear()
+    providers._default_clients.clear()
+
+
 class TestGetLlmForWorkspace:
     """Tests for get_llm_for_workspace() factory function."""
 
@@ -98,7 +110,7 @@ class TestGetLlmForWorkspace:
         mock_result.scalar_one_or_none.return_value = config
         mock_db.execute.return_value = mock_result
 
-        with patch("app.llm.providers.ChatOpenAI") as mock_openai:
+        with patch("langchain_openai.ChatOpenAI") as mock_openai:
             mock_openai.return_value = MagicMock()
 
             await get_llm_for_workspace(sample_workspace.id, mock_db)
@@ -136,7 +148,7 @@ class TestGetLlmForWorkspace:
         with patch("app.llm.providers.token_processor") as mock_tp:
             mock_tp.decrypt.return_value = json.dumps(azure_config)
 
-            with patch("app.llm.providers.AzureChatOpenAI") as mock_azure:
+            with patch("langchain_openai.AzureChatOpenAI") as mock_azure:
                 mock_azure.return_value = MagicMock()
 
                 await get_llm_for_workspace(sample_workspace.id, mock_db)
@@ -165,7 +177,7 @@ class TestGetLlmForWorkspace:
         mock_result.scalar_one_or_none.return_value = config
         mock_db.execute.return_value = mock_result
 
-        with patch("app.llm.providers.ChatGoogleGenerativeAI") as mock_gemini:
+        with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_gemini:
             mock_gemini.return_value = MagicMock()
 
             await get_llm_for_workspace(sample_workspace.id, mock_db)
@@ -253,6 +265,119 @@ class TestGetLlmForWorkspace:
             mock_groq.assert_called_once()
 
 
+class TestLlmClientCache:
+    """Clients are reused until the workspace's config changes."""
+
+    @staticmethod
+    def _openai_config(
+        workspace_id, model_name="gpt-4-turbo", encrypted="encrypted_config"
+    ):
+        return LLMProviderConfig(
+            id=str(uuid.uuid4()),
+            workspace_id=workspace_id,
+            provider=LLMProvider.OPENAI,
+            model_name=model_name,
+            config_encrypted=encrypted,
+            status=LLMConfigStatus.ACTIVE,
+        )
+
+    @staticmethod
+    def _returning(mock_db, config):
+        mock_result = MagicMock()
+        mock_result.scalar_one_or_none.return_value = config
+        mock_db.execute.return_value = mock_result
+
+    @pytest.mark.asyncio
+    async def test_same_config_reuses_client(
+        self, mock_db, mock_settings, mock_token_processor_providers, sample_workspace
+    ):
+        self._returning(mock_db, self._openai_config(sample_workspace.id))
+
+        with patch("langchain_openai.ChatOpenAI") as mock_openai:
+            mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+            first = await get_llm_for_workspace(sample_workspace.id, mock_db)
+            second = await get_llm_for_workspace(sample_workspace.id, mock_db)
+            other_temperature = await get_llm_for_workspace(
+                sample_workspace.id, mock_db, temperature=0.9
+            )
+
+        assert first is second
+        assert other_temperature is not first
+        assert mock_openai.call_count == 2
+        assert mock_token_processor_providers.decrypt.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_config_builds_new_client(
+        self, mock_db, mock_settings, mock_token_processor_providers, sample_workspace
+    ):
+        with patch("langchain_openai.ChatOpenAI") as mock_openai:
+            mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+            self._returning(mock_db, self._openai_config(sample_workspace.id))
+            first = await get_llm_for_workspace(sample_workspace.id, mock_db)
+            self._returning(
+                mock_db, self._openai_config(sample_workspace.id, model_name="gpt-4o")
+            )
+            second = await get_llm_for_workspace(sample_workspace.id, mock_db)
+
+        assert first is not second
+        assert mock_openai.call_args[1]["model"] == "gpt-4o"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_clients(
+        self, mock_db, mock_settings, mock_token_processor_providers, sample_workspace
+    ):
+        self._returning(mock_db, self._openai_config(sample_workspace.id))
+
+        with patch("langchain_openai.ChatOpenAI") as mock_openai:
+            mock_openai.side_effect = lambda **kwargs: MagicMock()
+
+            first = await get_llm_for_workspace(sample_workspace.id, mock_db)
+            invalidate_workspace_llm(sample_workspace.id)
+            second = await get_llm_for_workspace(sample_workspace.id, mock_db)
+
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_default_client_shared_across_workspaces(
+        self, mock_db, mock_settings
+    ):
+        self._returning(mock_db, None)
+
+        with patch("app.llm.providers.ChatGroq") as mock_groq:
+            mock_groq.side_effect = lambda **kwargs: MagicMock()
+
+            first = await get_llm_for_workspace("workspace-1", mock_db)
+            second = await get_llm_for_workspace("workspace-2", mock_db)
+
+        assert first is second
+        mock_groq.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rca_agent_runs_on_cached_workspace_client(
+        self, mock_db, mock_settings, mock_token_processor_providers, sample_workspace
+    ):
+        from app.services.rca.agent import RCAAgentService
+
+        self._returning(mock_db, self._openai_config(sample_workspace.id))
+        context = {"workspace_id": sample_workspace.id}
+
+        with patch("langchain_openai.ChatOpenAI") as mock_openai, patch(
+            "app.services.rca.agent.create_rca_graph"
+        ) as mock_graph:
+            mock_openai.side_effect = lambda **kwargs: MagicMock()
+            mock_graph.return_value.ainvoke = AsyncMock(return_value={})
+
+            await RCAAgentService()._run_graph("q", context, None, mock_db)
+            await RCAAgentService()._run_graph("q", context, None, mock_db)
+
+        mock_openai.assert_called_once()
+        llm = mock_graph.call_args_list[0].args[0]
+        assert llm is mock_graph.call_args_list[1].args[0]
+        assert llm is await get_llm_for_workspace(sample_workspace.id, mock_db)
+
+
 class TestIsByollmWorkspace:
     """Tests for is_byollm_workspace() helper function."""
 
@@ -341,7 +466,7 @@ class TestCreateLlmFunctions:
         """Should create OpenAI LLM with correct settings."""
         config = {"api_key": "sk-test-key"}
 
-        with patch("app.llm.providers.ChatOpenAI") as mock_openai:
+        with patch("langchain_openai.ChatOpenAI") as mock_openai:
             mock_openai.return_value = MagicMock()
 
             _create_openai_llm(config, "gpt-4-turbo", 0.1, 4096)
@@ -369,7 +494,7 @@ class TestCreateLlmFunctions:
             "api_version": "2024-02-01",
         }
 
-        with patch("app.llm.providers.AzureChatOpenAI") as mock_azure:
+        with patch("langchain_openai.AzureChatOpenAI") as mock_azure:
             mock_azure.return_value = MagicMock()
 
             _create_azure_openai_llm(config, None, 0.1, 4096)
@@ -410,7 +535,7 @@ class TestCreateLlmFunctions:
         """Should create Gemini LLM with correct settings."""
         config = {"api_key": "gemini-key"}
 
-        with patch("app.llm.providers.ChatGoogleGenerativeAI") as mock_gemini:
+        with patch("langchain_google_genai.ChatGoogleGenerativeAI") as mock_gemini:
             mock_gemini.return_value = MagicMock()
 
             _create_gemini_llm(config, "gemini-1.5-pro", 0.1, 4096)
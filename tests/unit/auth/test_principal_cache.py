@@ -0,0 +1,175 @@
+"""
+Tests for the authenticated-principal cache.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.auth.principal_cache import get_membership_role, get_principal_user
+from app.models import Base, Membership, Role, User, Workspace
+from app.utils.versioned_cache import drain_pending_invalidations
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch(
+        "app.utils.versioned_cache.get_redis", AsyncMock(return_value=fake)
+    ), patch("app.utils.versioned_cache.settings.REDIS_URL", "redis://test"):
+        yield fake
+
+
+@pytest_asyncio.fixture
+async def make_session(redis):
+    """Factory for fresh sessions (one per simulated request) on a seeded DB."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    statements = []
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    async with session_factory() as session:
+        session.add(Workspace(id="ws-1", name="Acme"))
+        session.add(User(id="u1", name="Ada", email="ada@example.com"))
+        session.add(
+            Membership(id="m1", user_id="u1", workspace_id="ws-1", role=Role.OWNER)
+        )
+        await session.commit()
+    await drain_pending_invalidations()
+    redis.data.clear()
+    statements.clear()
+
+    yield session_factory, statements
+    await engine.dispose()
+
+
+class TestGetPrincipalUser:
+    """Token subjects resolve to users from the cache after the first request."""
+
+    @pytest.mark.asyncio
+    async def test_second_request_runs_no_queries(self, make_session):
+        session_factory, statements = make_session
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+        assert len(statements) == 1
+
+        statements.clear()
+        async with session_factory() as db:
+            user = await get_principal_user(db, "u1")
+            role = await get_membership_role(db, "u1", "ws-1")
+
+        assert statements == []
+        assert (user.id, user.email, user.created_at is not None) == (
+            "u1",
+            "ada@example.com",
+            True,
+        )
+        assert role == Role.OWNER
+
+    @pytest.mark.asyncio
+    async def test_cached_user_can_be_updated(self, make_session):
+        session_factory, _ = make_session
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+
+        async with session_factory() as db:
+            user = await get_principal_user(db, "u1")
+            user.name = "Ada L."
+            await db.commit()
+        await drain_pending_invalidations()
+
+        async with session_factory() as db:
+            assert (await get_principal_user(db, "u1")).name == "Ada L."
+
+    @pytest.mark.asyncio
+    async def test_credentials_are_never_cached(self, make_session, redis):
+        session_factory, _ = make_session
+        async with session_factory() as db:
+            user = await db.get(User, "u1")
+            user.password_hash = "$2b$12$secret"
+            await db.commit()
+        await drain_pending_invalidations()
+
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+        assert not any(
+            "password_hash" in v or "secret" in v for v in redis.data.values()
+        )
+
+        # A cached principal loads the hash on demand when a route needs it
+        async with session_factory() as db:
+            user = await get_principal_user(db, "u1")
+            await db.refresh(user, ["password_hash"])
+            assert user.password_hash == "$2b$12$secret"
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_is_not_cached(self, make_session, redis):
+        session_factory, _ = make_session
+        async with session_factory() as db:
+            assert await get_principal_user(db, "missing") is None
+
+        assert redis.data == {}
+
+
+class TestInvalidation:
+    """Membership changes are visible on the next request."""
+
+    @pytest.mark.asyncio
+    async def test_role_change_invalidates(self, make_session):
+        session_factory, _ = make_session
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+
+        async with session_factory() as db:
+            membership = await db.get(Membership, "m1")
+            membership.role = Role.USER
+            await db.commit()
+        await drain_pending_invalidations()
+
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+            assert await get_membership_role(db, "u1", "ws-1") == Role.USER
+
+    @pytest.mark.asyncio
+    async def test_new_membership_visible_within_same_request(self, make_session):
+        session_factory, _ = make_session
+        async with session_factory() as db:
+            await get_principal_user(db, "u1")
+            db.add(Workspace(id="ws-2", name="Other"))
+            db.add(
+                Membership(id="m2", user_id="u1", workspace_id="ws-2", role=Role.USER)
+            )
+            await db.flush()
+
+            assert await get_membership_role(db, "u1", "ws-2") == Role.USER
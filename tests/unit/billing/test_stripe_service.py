@@ -4,6 +4,8 @@ Tests initialization, webhook validation, and error handling.
 Note: These tests mock Stripe API calls - they don't hit real Stripe endpoints.
 """
 
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -280,3 +282,77 @@ class TestReactivateSubscription:
             mock_stripe.Subscription.modify.assert_called_once_with(
                 "sub_123", cancel_at_period_end=False
             )
+
+
+class TestStripeCalls:
+    """SDK calls run off the event loop, and read-only lookups are cached."""
+
+    @pytest.fixture
+    def stripe_service(self):
+        return StripeService()
+
+    @pytest.mark.asyncio
+    async def test_sdk_calls_run_on_stripe_thread_pool(self, stripe_service):
+        """Blocking SDK calls should not run on the event loop thread."""
+        threads = []
+
+        def retrieve(subscription_id):
+            threads.append(threading.current_thread().name)
+            return MagicMock(id=subscription_id)
+
+        with patch("app.billing.services.stripe_service.stripe") as mock_stripe:
+            mock_stripe.Subscription.retrieve.side_effect = retrieve
+            await stripe_service.get_subscription("sub_123")
+
+        assert threads[0].startswith("stripe-api")
+
+    @pytest.mark.asyncio
+    async def test_get_subscription_is_cached(self, stripe_service):
+        """Repeated lookups within the TTL should hit Stripe once."""
+        with patch("app.billing.services.stripe_service.stripe") as mock_stripe:
+            mock_stripe.Subscription.retrieve.return_value = MagicMock(id="sub_123")
+
+            first = await stripe_service.get_subscription("sub_123")
+            second = await stripe_service.get_subscription("sub_123")
+
+        assert first is second
+        mock_stripe.Subscription.retrieve.assert_called_once_with("sub_123")
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_cached(self, stripe_service):
+        """A missing customer should be looked up again next time."""
+        with patch("app.billing.services.stripe_service.stripe") as mock_stripe:
+            mock_stripe.error = stripe.error
+            mock_stripe.Customer.retrieve.side_effect = (
+                stripe.error.InvalidRequestError("No such customer", "id")
+            )
+
+            assert await stripe_service.get_customer("cus_missing") is None
+            assert await stripe_service.get_customer("cus_missing") is None
+
+        assert mock_stripe.Customer.retrieve.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_expiring_during_lookup_is_retrieved(self, stripe_service):
+        """A cached customer that expires mid-lookup should be fetched, not None."""
+        stripe_service._customers = MagicMock()
+        stripe_service._customers.__contains__.return_value = True
+        stripe_service._customers.get.return_value = None  # Expired since the check
+        with patch("app.billing.services.stripe_service.stripe") as mock_stripe:
+            mock_stripe.Customer.retrieve.return_value = MagicMock(id="cus_123")
+
+            customer = await stripe_service.get_customer("cus_123")
+
+        assert customer.id == "cus_123"
+
+    @pytest.mark.asyncio
+    async def test_writes_evict_cached_subscription(self, stripe_service):
+        """Modifying a subscription should drop its cached copy."""
+        with patch("app.billing.services.stripe_service.stripe") as mock_stripe:
+            mock_stripe.Subscription.retrieve.return_value = MagicMock(id="sub_123")
+            await stripe_service.get_subscription("sub_123")
+
+            await stripe_service.reactivate_subscription("sub_123")
+            await stripe_service.get_subscription("sub_123")
+
+        assert mock_stripe.Subscription.retrieve.call_count == 2
@@ -0,0 +1,271 @@
+"""
+Tests for direct-to-S3 chat uploads: key helpers and the worker
+validation/extraction stage.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.chat.router import _parse_uploaded_files, create_uploads
+from app.chat.schemas import CreateUploadsRequest, UploadFileSpec
+from app.chat.uploads import (
+    build_upload_key,
+    is_workspace_upload_key,
+    process_uploaded_files,
+    sanitize_upload_filename,
+)
+from app.models import Base, ChatFile, Membership, Role, User
+from app.services.storage import FileValidationError
+
+PNG_HEADER = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06"
+)
+
+
+class TestUploadKeys:
+    """Key construction and validation."""
+
+    def test_built_key_is_accepted_for_own_workspace_only(self):
+        key = build_upload_key("ws-1", "trace.log")
+        assert key.startswith("ws-1/uploads/") and key.endswith("/trace.log")
+        assert is_workspace_upload_key("ws-1", key)
+        assert not is_workspace_upload_key("ws-2", key)
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            "ws-1/turn-1/trace.log",
+            "ws-1/uploads/trace.log",
+            "ws-1/uploads/abc/../trace.log",
+            "ws-1/uploads/abc/nested/trace.log",
+        ],
+    )
+    def test_rejects_foreign_or_malformed_keys(self, key):
+        assert not is_workspace_upload_key("ws-1", key)
+
+    def test_sanitize_strips_directories(self):
+        assert sanitize_upload_filename("../../etc/app.log") == "app.log"
+        assert sanitize_upload_filename("C:\\logs\\app.log") == "app.log"
+        with pytest.raises(FileValidationError):
+            sanitize_upload_filename("logs/..")
+
+
+class TestParseUploadedFiles:
+    """send_message's uploaded_files form field."""
+
+    def test_builds_provisional_entries(self):
+        key = build_upload_key("ws-1", "app.log")
+        entries = _parse_uploaded_files(
+            "ws-1",
+            f'[{{"s3_key": "{key}", "size_bytes": 12, "relative_path": "logs/app.log"}}]',
+        )
+        assert entries == [
+            {
+                "s3_key": key,
+                "filename": "app.log",
+                "file_type": "data",
+                "mime_type": "application/octet-stream",
+                "size": 12,
+                "relative_path": "logs/app.log",
+            }
+        ]
+
+    def test_rejects_other_workspace_key(self):
+        key = build_upload_key("ws-2", "app.log")
+        with pytest.raises(Exception) as exc_info:
+            _parse_uploaded_files("ws-1", f'[{{"s3_key": "{key}", "size_bytes": 12}}]')
+        assert exc_info.value.status_code == 400
+
+    def test_rejects_disallowed_extension(self):
+        key = build_upload_key("ws-1", "run.exe")
+        with pytest.raises(FileValidationError):
+            _parse_uploaded_files("ws-1", f'[{{"s3_key": "{key}", "size_bytes": 12}}]')
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _pending_file(db, filename: str) -> dict:
+    file_id = str(uuid.uuid4())
+    s3_key = build_upload_key("ws-1", filename)
+    db.add(
+        ChatFile(
+            id=file_id,
+            turn_id="turn-1",
+            s3_bucket="bucket",
+            s3_key=s3_key,
+            filename=filename,
+            file_type="data",
+            mime_type="application/octet-stream",
+            size_bytes=1,
+            uploaded_by="user-1",
+        )
+    )
+    await db.flush()
+    return {
+        "file_id": file_id,
+        "s3_key": s3_key,
+        "filename": filename,
+        "file_type": "data",
+        "mime_type": "application/octet-stream",
+        "size": 1,
+        "relative_path": None,
+        "extracted_text": None,
+        "pending_extraction": True,
+    }
+
+
+class TestProcessUploadedFiles:
+    """Worker stage for files uploaded straight to S3."""
+
+    @pytest.fixture
+    def s3(self):
+        objects = {}
+
+        async def head_file(key):
+            if key not in objects:
+                return None
+            return {"size_bytes": len(objects[key]), "content_type": None, "etag": "e1"}
+
+        async def download_file(key, max_bytes=None):
+            return objects[key][:max_bytes] if max_bytes else objects[key]
+
+        with patch("app.chat.uploads.s3_client") as mock_s3, patch(
+            "app.chat.uploads.settings.REDIS_URL", None
+        ):
+            mock_s3.head_file = AsyncMock(side_effect=head_file)
+            mock_s3.download_file = AsyncMock(side_effect=download_file)
+            mock_s3.delete_files = AsyncMock(return_value=True)
+            mock_s3.objects = objects
+            yield mock_s3
+
+    @pytest.mark.asyncio
+    async def test_extracts_text_and_updates_chat_file(self, sqlite_db, s3):
+        entry = await _pending_file(sqlite_db, "app.log")
+        s3.objects[entry["s3_key"]] = b"ERROR connection refused\n"
+
+        files = await process_uploaded_files(sqlite_db, [entry])
+
+        assert files[0]["pending_extraction"] is False
+        assert files[0]["mime_type"] == "text/plain"
+        assert "connection refused" in files[0]["extracted_text"]
+        chat_file = await sqlite_db.get(ChatFile, entry["file_id"])
+        assert chat_file.size_bytes == 25
+        assert "connection refused" in chat_file.extracted_text
+
+    @pytest.mark.asyncio
+    async def test_media_is_only_sniffed(self, sqlite_db, s3):
+        entry = await _pending_file(sqlite_db, "screen.png")
+        s3.objects[entry["s3_key"]] = PNG_HEADER + b"\x00" * 100_000
+
+        files = await process_uploaded_files(sqlite_db, [entry])
+
+        assert files[0]["file_type"] == "image"
+        assert files[0]["mime_type"] == "image/png"
+        assert files[0]["extracted_text"] is None
+        assert s3.download_file.await_args.kwargs["max_bytes"] == 8192
+
+    @pytest.mark.asyncio
+    async def test_drops_spoofed_and_missing_files(self, sqlite_db, s3):
+        spoofed = await _pending_file(sqlite_db, "screen.png")
+        s3.objects[spoofed["s3_key"]] = b"just text, not an image"
+        missing = await _pending_file(sqlite_db, "never-uploaded.log")
+        legacy = {
+            "file_id": "f-legacy",
+            "s3_key": "ws-1/turn-1/a.txt",
+            "file_type": "document",
+        }
+
+        files = await process_uploaded_files(sqlite_db, [spoofed, legacy, missing])
+
+        assert files == [legacy]
+        remaining = (await sqlite_db.execute(select(ChatFile))).scalars().all()
+        assert remaining == []
+        s3.delete_files.assert_awaited_once_with([spoofed["s3_key"], missing["s3_key"]])
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_download(self, sqlite_db, s3):
+        entry = await _pending_file(sqlite_db, "app.log")
+        s3.objects[entry["s3_key"]] = b"cached object"
+        cached = {
+            "file_type": "data",
+            "mime_type": "text/plain",
+            "size": 13,
+            "extracted_text": "hit",
+        }
+
+        with patch(
+            "app.chat.uploads._get_cached_extraction", AsyncMock(return_value=cached)
+        ):
+            files = await process_uploaded_files(sqlite_db, [entry])
+
+        s3.download_file.assert_not_awaited()
+        assert files[0]["extracted_text"] == "hit"
+
+
+class TestCreateUploads:
+    """Presigned upload URLs are only issued to workspace members."""
+
+    @pytest.fixture
+    def request_body(self):
+        return CreateUploadsRequest(
+            files=[UploadFileSpec(filename="notes.txt", size_bytes=12)]
+        )
+
+    @pytest.fixture(autouse=True)
+    def uploads_bucket(self):
+        with patch("app.chat.router.settings.CHAT_UPLOADS_BUCKET", "bucket"):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_non_member_is_rejected_before_quota_and_signing(
+        self, sqlite_db, request_body
+    ):
+        with patch("app.chat.router._check_upload_quota", AsyncMock()) as quota, patch(
+            "app.chat.router.s3_client"
+        ) as mock_s3:
+            with pytest.raises(HTTPException) as exc_info:
+                await create_uploads(
+                    "ws-1", request_body, db=sqlite_db, current_user=User(id="user-2")
+                )
+
+        assert exc_info.value.status_code == 403
+        quota.assert_not_called()
+        mock_s3.generate_upload_url.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_member_gets_upload_urls(self, sqlite_db, request_body):
+        sqlite_db.add(
+            Membership(id="m1", user_id="user-1", workspace_id="ws-1", role=Role.USER)
+        )
+        await sqlite_db.flush()
+
+        with patch("app.chat.router._check_upload_quota", AsyncMock()), patch(
+            "app.chat.router.s3_client"
+        ) as mock_s3:
+            mock_s3.generate_upload_url = AsyncMock(return_value="https://s3/put")
+            response = await create_uploads(
+                "ws-1", request_body, db=sqlite_db, current_user=User(id="user-1")
+            )
+
+        assert [u["upload_url"] for u in response["uploads"]] == ["https://s3/put"]
@@ -1,10 +1,13 @@
-"""Unit tests for WebProgressCallback.on_chain_error suppression logic."""
+"""Unit tests for WebProgressCallback: chain error suppression and answer streaming."""
 
+import uuid
 from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.chat.notifiers.web_callback import WebProgressCallback
+from app.services.rca.streaming import FINAL_ANSWER_TAG
+from app.utils.data_masker import PIIMapper
 
 
 @pytest.fixture
@@ -110,3 +113,43 @@ class TestOnChainErrorSuppression:
 
         call_args = callback.notifier.on_error.call_args[0][0]
         assert len(call_args) == 500
+
+
+class TestAnswerStreaming:
+    """Final-answer tokens go out as SSE delta events."""
+
+    @pytest.fixture
+    def streaming_callback(self):
+        with patch("app.chat.notifiers.web_callback.WebNotifier") as notifier_cls:
+            notifier_cls.return_value = AsyncMock()
+            cb = WebProgressCallback(
+                turn_id="turn-123",
+                db=AsyncMock(),
+                pii_mapper=PIIMapper.from_mapping({"person1": "Alice"}),
+            )
+        cb._answer_stream.min_interval_seconds = 0
+        return cb
+
+    @pytest.mark.asyncio
+    async def test_tagged_tokens_published_as_unmasked_deltas(self, streaming_callback):
+        run_id = uuid.uuid4()
+        tags = [FINAL_ANSWER_TAG]
+
+        await streaming_callback.on_llm_new_token(
+            "Ask person1", run_id=run_id, tags=tags
+        )
+        await streaming_callback.on_llm_new_token(" about it", run_id=run_id, tags=tags)
+        await streaming_callback.on_llm_end(None, run_id=run_id, tags=tags)
+
+        deltas = [
+            c.args[0] for c in streaming_callback.notifier.on_delta.await_args_list
+        ]
+        assert "".join(deltas) == "Ask Alice about it"
+
+    @pytest.mark.asyncio
+    async def test_untagged_tokens_ignored(self, streaming_callback):
+        await streaming_callback.on_llm_new_token(
+            "draft", run_id=uuid.uuid4(), tags=["other"]
+        )
+
+        streaming_callback.notifier.on_delta.assert_not_awaited()
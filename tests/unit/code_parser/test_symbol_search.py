@@ -0,0 +1,126 @@
+"""
+Tests for symbol search backed by the parsed_symbols table.
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.code_parser.repository import ParsedFileRepository
+from app.models import Base, ParsedSymbol
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def repository_id(sqlite_db):
+    repository_id = str(uuid.uuid4())
+    await ParsedFileRepository(sqlite_db).create_batch(
+        repository_id,
+        [
+            {
+                "file_path": "app/users/service.py",
+                "language": "python",
+                "content": "class UserService: ...",
+                "functions": [
+                    {
+                        "name": "get_user",
+                        "line_start": 10,
+                        "line_end": 20,
+                        "params": ["id"],
+                    },
+                    {"name": "get_user_by_email", "line_start": 22, "line_end": 30},
+                ],
+                "classes": [{"name": "UserService", "line_start": 1, "line_end": 40}],
+            },
+            {
+                "file_path": "app/auth/router.py",
+                "language": "python",
+                "functions": [{"name": "login_user", "line_start": 5, "line_end": 15}],
+                "classes": [],
+            },
+            {"file_path": "README.md", "language": "markdown", "is_parsed": False},
+        ],
+    )
+    return repository_id
+
+
+class TestCreateBatchSymbols:
+    """create_batch populates parsed_symbols."""
+
+    @pytest.mark.asyncio
+    async def test_one_row_per_function_and_class(self, sqlite_db, repository_id):
+        result = await sqlite_db.execute(
+            select(ParsedSymbol.kind, ParsedSymbol.name, ParsedSymbol.name_lower)
+            .where(ParsedSymbol.repository_id == repository_id)
+            .order_by(ParsedSymbol.kind, ParsedSymbol.name)
+        )
+        assert result.all() == [
+            ("class", "UserService", "userservice"),
+            ("function", "get_user", "get_user"),
+            ("function", "get_user_by_email", "get_user_by_email"),
+            ("function", "login_user", "login_user"),
+        ]
+
+
+class TestSearchSymbols:
+    """search_functions / search_classes keep their result shape."""
+
+    @pytest.mark.asyncio
+    async def test_substring_search_is_case_insensitive(self, sqlite_db, repository_id):
+        results = await ParsedFileRepository(sqlite_db).search_functions(
+            repository_id, "USER"
+        )
+        assert [(r["file_path"], r["function"]["name"]) for r in results] == [
+            ("app/auth/router.py", "login_user"),
+            ("app/users/service.py", "get_user"),
+            ("app/users/service.py", "get_user_by_email"),
+        ]
+        assert results[1]["function"]["params"] == ["id"]
+        assert results[1]["language"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_exact_match(self, sqlite_db, repository_id):
+        results = await ParsedFileRepository(sqlite_db).search_functions(
+            repository_id, "get_user", exact_match=True
+        )
+        assert [r["function"]["name"] for r in results] == ["get_user"]
+
+    @pytest.mark.asyncio
+    async def test_underscore_is_literal(self, sqlite_db, repository_id):
+        # Unescaped, "user_" would match "userservice" as a LIKE wildcard
+        results = await ParsedFileRepository(sqlite_db).search_classes(
+            repository_id, "user_"
+        )
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_search_classes(self, sqlite_db, repository_id):
+        results = await ParsedFileRepository(sqlite_db).search_classes(
+            repository_id, "service"
+        )
+        assert results == [
+            {
+                "file_path": "app/users/service.py",
+                "language": "python",
+                "class": {"name": "UserService", "line_start": 1, "line_end": 40},
+            }
+        ]
@@ -0,0 +1,99 @@
+"""
+Tests for set-based RCA environment context loading.
+"""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.worker import fetch_environment_context
+
+
+def _result(rows):
+    result = MagicMock()
+    result.all.return_value = rows
+    return result
+
+
+def _env(env_id, name, is_default=False):
+    return SimpleNamespace(id=env_id, name=name, is_default=is_default)
+
+
+def _deployment(env_id, repo, sha, deployed_at=None):
+    return SimpleNamespace(
+        environment_id=env_id,
+        repo_full_name=repo,
+        commit_sha=sha,
+        deployed_at=deployed_at,
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_cache():
+    with patch("app.workspace.context_cache.environment_context_cache.enabled", False):
+        yield
+
+
+class TestFetchEnvironmentContext:
+    """fetch_environment_context issues a fixed number of queries."""
+
+    @pytest.mark.asyncio
+    async def test_two_queries_for_any_number_of_environments(self):
+        deployed_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        envs = [_env(f"e{i}", f"env-{i}", is_default=i == 0) for i in range(20)]
+        deployments = [
+            _deployment(f"e{i}", "acme/api", f"sha{i}", deployed_at) for i in range(20)
+        ]
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result(envs), _result(deployments)])
+
+        context = await fetch_environment_context("ws-1", db)
+
+        assert db.execute.await_count == 2
+        assert context["default_environment"] == "env-0"
+        assert len(context["environments"]) == 20
+        assert context["deployed_commits_by_environment"]["env-7"] == {
+            "acme/api": {"commit_sha": "sha7", "deployed_at": deployed_at.isoformat()}
+        }
+
+    @pytest.mark.asyncio
+    async def test_latest_deployment_query_uses_distinct_on(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=[_result([_env("e1", "prod")]), _result([])])
+
+        await fetch_environment_context("ws-1", db)
+
+        statement = db.execute.await_args_list[1].args[0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert (
+            "DISTINCT ON (deployments.environment_id, deployments.repo_full_name)"
+            in sql
+        )
+        assert "deployments.deployed_at DESC" in sql
+
+    @pytest.mark.asyncio
+    async def test_environments_without_deployments_and_null_shas(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(
+            side_effect=[
+                _result([_env("e1", "prod", True), _env("e2", "staging")]),
+                _result([_deployment("e1", "acme/api", None)]),
+            ]
+        )
+
+        context = await fetch_environment_context("ws-1", db)
+
+        assert context["deployed_commits_by_environment"] == {"prod": {}, "staging": {}}
+
+    @pytest.mark.asyncio
+    async def test_no_environments_skips_deployment_query(self):
+        db = AsyncMock()
+        db.execute = AsyncMock(return_value=_result([]))
+
+        context = await fetch_environment_context("ws-1", db)
+
+        assert db.execute.await_count == 1
+        assert context["environments"] == []
@@ -0,0 +1,298 @@
+"""
+Unit tests for lifecycle email campaigns: set-based eligibility queries and
+batched sending with bulk Email inserts.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.email_service.campaigns import (
+    ONBOARDING_REMINDER,
+    USAGE_FEEDBACK,
+    USER_HELP,
+    onboarding_reminder_recipients,
+    run_campaign,
+    usage_feedback_recipients,
+    user_help_recipients,
+)
+from app.email_service.service import EmailService
+from app.models import Base, Email, RefreshToken, User
+
+NOW = datetime.now(timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    async with session_factory() as session:
+        session.statements = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: session.statements.append(statement),
+        )
+        yield session
+    await engine.dispose()
+
+
+def add_user(db, user_id, created_days_ago, onboarded=False, subscribed=True):
+    db.add(
+        User(
+            id=user_id,
+            name=user_id,
+            email=f"{user_id}@example.com",
+            is_onboarded=onboarded,
+            newsletter_subscribed=subscribed,
+            created_at=NOW - timedelta(days=created_days_ago),
+        )
+    )
+
+
+def add_email(db, user_id, subject, days_ago=0, status="sent"):
+    db.add(
+        Email(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            subject=subject,
+            status=status,
+            sent_at=NOW - timedelta(days=days_ago),
+        )
+    )
+
+
+def add_login(db, user_id, created_days_ago, minutes_after_signup):
+    db.add(
+        RefreshToken(
+            token=f"refresh-{uuid.uuid4()}",
+            user_id=user_id,
+            expires_at=NOW + timedelta(days=7),
+            created_at=NOW
+            - timedelta(days=created_days_ago)
+            + timedelta(minutes=minutes_after_signup),
+        )
+    )
+
+
+async def ids(users):
+    return sorted(user.id for user in users)
+
+
+class TestEligibility:
+    """Each campaign selects its recipients in a single query."""
+
+    @pytest.mark.asyncio
+    async def test_onboarding_reminder_recipients(self, db):
+        subject = settings.ONBOARDING_REMINDER_EMAIL_SUBJECT
+        add_user(db, "new", created_days_ago=1)  # Too soon for a first reminder
+        add_user(db, "first", created_days_ago=10)
+        add_user(db, "due", created_days_ago=30)
+        add_email(db, "due", subject, days_ago=6)
+        add_user(db, "recent", created_days_ago=30)
+        add_email(db, "recent", subject, days_ago=1)
+        add_user(db, "maxed", created_days_ago=60)
+        for days_ago in (40, 30, 20):
+            add_email(db, "maxed", subject, days_ago=days_ago)
+        add_user(db, "failed_only", created_days_ago=10)
+        add_email(db, "failed_only", subject, days_ago=1, status="failed")
+        add_user(db, "onboarded", created_days_ago=10, onboarded=True)
+        add_user(db, "unsubscribed", created_days_ago=10, subscribed=False)
+        await db.commit()
+        db.statements.clear()
+
+        users = await onboarding_reminder_recipients(db)
+
+        assert await ids(users) == ["due", "failed_only", "first"]
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_user_help_recipients(self, db):
+        add_user(db, "new", created_days_ago=0)
+        add_user(db, "helped", created_days_ago=0)
+        add_email(db, "helped", settings.USER_HELP_EMAIL_SUBJECT)
+        add_user(db, "other_email", created_days_ago=0)
+        add_email(db, "other_email", settings.USAGE_FEEDBACK_EMAIL_SUBJECT)
+        add_user(db, "old", created_days_ago=3)
+        await db.commit()
+        db.statements.clear()
+
+        users = await user_help_recipients(db)
+
+        assert await ids(users) == ["new", "other_email"]
+        assert len(db.statements) == 1
+
+    @pytest.mark.asyncio
+    async def test_usage_feedback_recipients(self, db):
+        add_user(db, "active", created_days_ago=8)
+        add_login(db, "active", 8, minutes_after_signup=60)
+        add_user(db, "signup_only", created_days_ago=8)
+        add_login(db, "signup_only", 8, minutes_after_signup=1)
+        add_user(db, "never", created_days_ago=8)
+        add_user(db, "recent", created_days_ago=3)
+        add_login(db, "recent", 3, minutes_after_signup=60)
+        add_user(db, "asked", created_days_ago=8)
+        add_login(db, "asked", 8, minutes_after_signup=60)
+        add_email(db, "asked", settings.USAGE_FEEDBACK_EMAIL_SUBJECT)
+        await db.commit()
+        db.statements.clear()
+
+        users = await usage_feedback_recipients(db)
+
+        assert await ids(users) == ["active"]
+        assert len(db.statements) == 1
+
+
+class TestRunCampaign:
+    """Campaigns send in batches and record outcomes with bulk inserts."""
+
+    @pytest.mark.asyncio
+    async def test_records_sent_and_failed_emails(self, db):
+        for user_id in ("a", "b", "c"):
+            add_user(db, user_id, created_days_ago=0)
+        await db.commit()
+
+        async def send_batch(messages):
+            return [
+                {"ErrorCode": 0, "MessageID": f"msg-{m['To']}"}
+                if not m["To"].startswith("b")
+                else {"ErrorCode": 300, "Message": "Invalid email"}
+                for m in messages
+            ]
+
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(side_effect=send_batch),
+        ) as mock_send:
+            result = await run_campaign(db, USER_HELP)
+
+        assert result == {"sent": 2, "failed": 1, "total_eligible": 3}
+        messages = mock_send.call_args.args[0]
+        assert len(messages) == 3
+        assert all(m["Subject"] == settings.USER_HELP_EMAIL_SUBJECT for m in messages)
+        assert all(m["Headers"][0]["Name"] == "List-Unsubscribe" for m in messages)
+
+        emails = (
+            (await db.execute(select(Email).order_by(Email.user_id))).scalars().all()
+        )
+        assert [(e.user_id, e.status, e.message_id) for e in emails] == [
+            ("a", "sent", "msg-a@example.com"),
+            ("b", "failed", None),
+            ("c", "sent", "msg-c@example.com"),
+        ]
+
+        # Sent users aren't eligible on the next run; the failed one is retried
+        assert await ids(await USER_HELP.recipients(db)) == ["b"]
+
+    @pytest.mark.asyncio
+    async def test_onboarding_reminder_sends_html_without_unsubscribe_header(self, db):
+        add_user(db, "a", created_days_ago=10)
+        await db.commit()
+
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch",
+            AsyncMock(return_value=[{"ErrorCode": 0, "MessageID": "m1"}]),
+        ) as mock_send:
+            await run_campaign(db, ONBOARDING_REMINDER)
+
+        (message,) = mock_send.call_args.args[0]
+        assert "HtmlBody" in message and "TextBody" not in message
+        assert "Headers" not in message
+
+    @pytest.mark.asyncio
+    async def test_no_recipients_sends_nothing(self, db):
+        with patch(
+            "app.email_service.campaigns.email_service.send_email_batch", AsyncMock()
+        ) as mock_send:
+            result = await run_campaign(db, USAGE_FEEDBACK)
+
+        assert result == {"sent": 0, "failed": 0, "total_eligible": 0}
+        mock_send.assert_not_called()
+
+
+class TestSendEmailBatch:
+    """Postmark batch requests are chunked and failures are per message."""
+
+    @pytest.fixture
+    def service(self):
+        service = EmailService()
+        service.server_token = "pm-token"
+        return service
+
+    @pytest.mark.asyncio
+    async def test_chunks_at_postmark_limit(self, service):
+        posted = []
+
+        async def post(url, json, headers):
+            posted.append(len(json))
+            response = MagicMock()
+            response.json.return_value = [
+                {"ErrorCode": 0, "MessageID": "m"} for _ in json
+            ]
+            return response
+
+        client = MagicMock(post=AsyncMock(side_effect=post))
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+        with patch("app.email_service.service.httpx.AsyncClient", return_value=client):
+            results = await service.send_email_batch([{"To": "x"}] * 1200)
+
+        assert sorted(posted) == [200, 500, 500]
+        assert len(results) == 1200
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_each_message(self, service):
+        client = MagicMock(post=AsyncMock(side_effect=httpx.HTTPError("boom")))
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+        with patch("app.email_service.service.httpx.AsyncClient", return_value=client):
+            results = await service.send_email_batch([{"To": "x"}, {"To": "y"}])
+
+        assert [r["ErrorCode"] for r in results] == [-1, -1]
+
+    @pytest.mark.asyncio
+    async def test_read_timeout_is_not_retried(self, service):
+        # Postmark may have accepted the batch; a retry would send it twice
+        client = MagicMock(post=AsyncMock(side_effect=httpx.ReadTimeout("slow")))
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+        with patch("app.email_service.service.httpx.AsyncClient", return_value=client):
+            results = await service.send_email_batch([{"To": "x"}])
+
+        client.post.assert_awaited_once()
+        assert [r["ErrorCode"] for r in results] == [-1]
+
+    @pytest.mark.asyncio
+    async def test_connect_error_is_retried(self, service):
+        response = MagicMock()
+        response.json.return_value = [{"ErrorCode": 0, "MessageID": "m"}]
+        client = MagicMock(
+            post=AsyncMock(side_effect=[httpx.ConnectError("refused"), response])
+        )
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=False)
+        with patch(
+            "app.email_service.service.httpx.AsyncClient", return_value=client
+        ), patch(
+            "app.utils.retry_decorator.settings.EXTERNAL_API_RETRY_MIN_WAIT", 0
+        ), patch("app.utils.retry_decorator.settings.EXTERNAL_API_RETRY_MAX_WAIT", 0):
+            results = await service.send_email_batch([{"To": "x"}])
+
+        assert client.post.await_count == 2
+        assert [r["ErrorCode"] for r in results] == [0]
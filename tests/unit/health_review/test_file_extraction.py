@@ -0,0 +1,111 @@
+"""
+Tests for parallel candidate-file extraction in the health review graph.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.health_review_system.graph import extract_config_files_node
+from app.health_review_system.llm_budget import LLMBudgetCallback, LLMBudgetExceeded
+from app.health_review_system.rule_engine.schemas import RuleEngineResult
+from app.health_review_system.verification.service import VerificationService
+
+
+def _service(contents: dict):
+    service = VerificationService(
+        llm=MagicMock(), db=AsyncMock(), repository_id="repo-1"
+    )
+    file_crud = MagicMock()
+    file_crud.get_contents = AsyncMock(return_value=contents)
+    return service, file_crud
+
+
+class TestExtractFromFiles:
+    """VerificationService.extract_from_files."""
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently_up_to_limit_and_keeps_order(self):
+        paths = [f"f{i}.py" for i in range(6)]
+        service, file_crud = _service({p: f"content {p}" for p in paths})
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_extract(file_path, gap_rule_ids, callbacks=None, content=None):
+            nonlocal in_flight, peak
+            assert content == f"content {file_path}"
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [{"file_path": file_path, "type": "tracing"}]
+
+        service.extract_from_single_file = fake_extract
+
+        with patch(
+            "app.code_parser.repository.ParsedFileRepository", return_value=file_crud
+        ):
+            extractions = await service.extract_from_files(
+                file_paths=paths, gap_rule_ids=["MET_001"], max_concurrency=3
+            )
+
+        assert peak == 3
+        assert [e["file_path"] for e in extractions] == paths
+        file_crud.get_contents.assert_awaited_once_with("repo-1", paths)
+
+    @pytest.mark.asyncio
+    async def test_skips_files_once_budget_exhausted(self):
+        paths = ["a.py", "b.py", "c.py"]
+        service, file_crud = _service({p: "x" for p in paths})
+        budget = LLMBudgetCallback(max_iterations=1, max_tokens=1000)
+
+        async def fake_extract(file_path, gap_rule_ids, callbacks=None, content=None):
+            budget.iteration_count += 1
+            return [{"file_path": file_path}]
+
+        service.extract_from_single_file = fake_extract
+
+        with patch(
+            "app.code_parser.repository.ParsedFileRepository", return_value=file_crud
+        ):
+            extractions = await service.extract_from_files(
+                file_paths=paths, gap_rule_ids=[], budget=budget, max_concurrency=1
+            )
+
+        assert [e["file_path"] for e in extractions] == ["a.py"]
+
+
+class TestExtractConfigFilesNode:
+    """Graph map node over candidate files."""
+
+    @pytest.mark.asyncio
+    async def test_no_candidates_returns_empty(self):
+        state = {
+            "db": AsyncMock(),
+            "repository_id": "repo-1",
+            "rule_result": RuleEngineResult(),
+            "candidate_config_files": [],
+        }
+        assert await extract_config_files_node(state) == {"file_extractions": []}
+
+    @pytest.mark.asyncio
+    async def test_raises_when_budget_exhausted(self):
+        budget = LLMBudgetCallback(max_iterations=1, max_tokens=1000)
+        budget.iteration_count = 1
+        state = {
+            "db": AsyncMock(),
+            "repository_id": "repo-1",
+            "rule_result": RuleEngineResult(),
+            "candidate_config_files": ["a.py"],
+            "llm_budget": budget,
+        }
+
+        with patch(
+            "app.health_review_system.llm_analyzer.providers.get_default_provider"
+        ), patch.object(
+            VerificationService, "extract_from_files", AsyncMock(return_value=[])
+        ):
+            with pytest.raises(LLMBudgetExceeded):
+                await extract_config_files_node(state)
@@ -0,0 +1,96 @@
+"""
+Tests for the health review file search tools.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.code_parser.repository import escape_like
+from app.health_review_system.tools import list_files, search_files
+
+
+class TestEscapeLike:
+    """Wildcards in user queries match literally."""
+
+    def test_escapes_wildcards_and_backslash(self):
+        assert escape_like("a_b%c\\d") == "a\\_b\\%c\\\\d"
+
+    def test_plain_text_unchanged(self):
+        assert escape_like("HTTPMetrics") == "HTTPMetrics"
+
+
+class TestSearchFiles:
+    """search_files formats line-accurate matches from the repository."""
+
+    @pytest.mark.asyncio
+    async def test_reports_line_number_and_text(self):
+        file_crud = MagicMock()
+        file_crud.search_content = AsyncMock(
+            return_value=[
+                {
+                    "file_path": "app/main.py",
+                    "language": "python",
+                    "line_count": 120,
+                    "line_number": 42,
+                    "line": "    app.add_middleware(HTTPMetrics)",
+                }
+            ]
+        )
+
+        with patch(
+            "app.health_review_system.tools.ParsedFileRepository",
+            return_value=file_crud,
+        ):
+            output = await search_files.coroutine(
+                query="add_middleware", repository_id="repo-1", db=AsyncMock()
+            )
+
+        assert "app/main.py (python, 120 lines)" in output
+        assert "L42: app.add_middleware(HTTPMetrics)" in output
+        assert file_crud.search_content.await_args.args == ("repo-1", "add_middleware")
+
+    @pytest.mark.asyncio
+    async def test_no_matches(self):
+        file_crud = MagicMock()
+        file_crud.search_content = AsyncMock(return_value=[])
+
+        with patch(
+            "app.health_review_system.tools.ParsedFileRepository",
+            return_value=file_crud,
+        ):
+            output = await search_files.coroutine(
+                query="missing", repository_id="repo-1", db=AsyncMock()
+            )
+
+        assert output == "No files found containing 'missing'"
+
+
+class TestListFiles:
+    """list_files delegates to the repository path search."""
+
+    @pytest.mark.asyncio
+    async def test_lists_matching_paths(self):
+        file_crud = MagicMock()
+        file_crud.list_paths = AsyncMock(
+            return_value=[
+                {
+                    "file_path": "app/middleware.py",
+                    "language": "python",
+                    "line_count": 30,
+                }
+            ]
+        )
+
+        with patch(
+            "app.health_review_system.tools.ParsedFileRepository",
+            return_value=file_crud,
+        ):
+            output = await list_files.coroutine(
+                pattern="*middleware*", repository_id="repo-1", db=AsyncMock()
+            )
+
+        assert "app/middleware.py (python, 30 lines)" in output
+        file_crud.list_paths.assert_awaited_once_with(
+            "repo-1", "*middleware*", limit=50
+        )
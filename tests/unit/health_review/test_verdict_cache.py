@@ -0,0 +1,358 @@
+"""
+Tests for the gap verification verdict cache.
+
+Covers cache key stability, context versioning, and how verify_gaps
+splits gaps between cached verdicts and LLM verification.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.health_review_system.rule_engine.schemas import DetectedProblem
+from app.health_review_system.verification.cache import (
+    VerdictCache,
+    compute_context_version,
+    compute_verdict_cache_key,
+)
+from app.health_review_system.verification.schemas import (
+    CodebaseContext,
+    GapVerdict,
+    GapVerdictResult,
+    GlobalInstrumentation,
+    VerificationResult,
+)
+from app.health_review_system.verification.service import (
+    VerificationService,
+    compute_gap_fingerprint,
+)
+from app.models import Base, ParsedFile
+
+
+def _gap(rule_id: str, file_path: str, function: str) -> DetectedProblem:
+    return DetectedProblem(
+        rule_id=rule_id,
+        problem_type="metrics_gap",
+        severity="MEDIUM",
+        title=f"{rule_id}: {function} in {file_path}",
+        category="observability",
+        affected_files=[file_path],
+        affected_functions=[function],
+    )
+
+
+def _context(description: str = "HTTP middleware") -> CodebaseContext:
+    return CodebaseContext(
+        global_http_metrics=[
+            GlobalInstrumentation(
+                file_path="app/middleware.py",
+                instrumentation_type="http_metrics",
+                coverage="all_routes",
+                registration_file="app/main.py",
+                description=description,
+            )
+        ],
+        infrastructure_files=["app/middleware.py", "app/main.py"],
+        summary=description,
+    )
+
+
+class FakeVerdictCache:
+    """In-memory stand-in for VerdictCache (keys are gap fingerprints)."""
+
+    def __init__(self, cached: dict):
+        self.cached = cached
+        self.stored: list = []
+
+    async def prepare(self, gaps, codebase_context):
+        pass
+
+    def key_for(self, gap):
+        return compute_gap_fingerprint(gap)
+
+    async def lookup(self, gaps):
+        return {
+            k: v for k, v in self.cached.items() if k in {self.key_for(g) for g in gaps}
+        }
+
+    async def store(self, gaps, verdicts):
+        self.stored.append(([g.title for g in gaps], verdicts))
+        return len(gaps)
+
+
+class TestCacheKeys:
+    """Cache key and context version computation."""
+
+    def test_key_stable_for_unchanged_inputs(self):
+        hashes = {"a.py": "h1", "b.py": "h2"}
+        key1 = compute_verdict_cache_key("fp", ["b.py", "a.py"], hashes, "v1")
+        key2 = compute_verdict_cache_key("fp", ["a.py", "b.py"], hashes, "v1")
+        assert key1 == key2
+
+    def test_key_changes_when_file_content_changes(self):
+        key1 = compute_verdict_cache_key("fp", ["a.py"], {"a.py": "h1"}, "v1")
+        key2 = compute_verdict_cache_key("fp", ["a.py"], {"a.py": "h2"}, "v1")
+        assert key1 != key2
+
+    def test_key_changes_when_context_version_changes(self):
+        hashes = {"a.py": "h1"}
+        assert compute_verdict_cache_key("fp", ["a.py"], hashes, "v1") != (
+            compute_verdict_cache_key("fp", ["a.py"], hashes, "v2")
+        )
+
+    def test_context_version_ignores_llm_prose(self):
+        hashes = {"app/middleware.py": "m1", "app/main.py": "x1"}
+        assert compute_context_version(_context("one"), hashes) == (
+            compute_context_version(_context("two"), hashes)
+        )
+
+    def test_context_version_tracks_infra_file_hashes(self):
+        v1 = compute_context_version(_context(), {"app/middleware.py": "m1"})
+        v2 = compute_context_version(_context(), {"app/middleware.py": "m2"})
+        assert v1 != v2
+
+
+class TestVerifyGapsWithCache:
+    """verify_gaps only sends uncached gaps to the agent."""
+
+    @pytest.fixture
+    def service(self):
+        return VerificationService(
+            llm=MagicMock(), db=AsyncMock(), repository_id="repo-1"
+        )
+
+    @pytest.fixture(autouse=True)
+    def no_delay(self):
+        with patch(
+            "app.health_review_system.verification.service.settings"
+        ) as mock_settings:
+            mock_settings.HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE = 20
+            mock_settings.HEALTH_REVIEW_VERIFICATION_CONFIDENCE_THRESHOLD = 0.75
+            mock_settings.HEALTH_REVIEW_VERIFICATION_DELAY_SECONDS = 0
+            yield mock_settings
+
+    @pytest.mark.asyncio
+    async def test_all_cached_skips_agent(self, service):
+        gaps = [_gap("MET_001", "a.py", "f"), _gap("MET_001", "b.py", "g")]
+        cache = FakeVerdictCache(
+            {
+                compute_gap_fingerprint(g): GapVerdictResult(
+                    gap_title="old title",
+                    rule_id="MET_001",
+                    verdict=GapVerdict.FALSE_ALARM,
+                )
+                for g in gaps
+            }
+        )
+        service._verify_rule_group = AsyncMock()
+
+        results = await service.verify_gaps(gaps, _context(), verdict_cache=cache)
+
+        service._verify_rule_group.assert_not_called()
+        assert results["MET_001"].cache_hits == 2
+        assert {v.gap_title for v in results["MET_001"].verdicts} == {
+            g.title for g in gaps
+        }
+        assert cache.stored == []
+
+    @pytest.mark.asyncio
+    async def test_partial_hit_verifies_only_changed_gaps(self, service):
+        cached_gap = _gap("MET_001", "a.py", "f")
+        changed_gap = _gap("MET_001", "b.py", "g")
+        cache = FakeVerdictCache(
+            {
+                compute_gap_fingerprint(cached_gap): GapVerdictResult(
+                    gap_title=cached_gap.title,
+                    rule_id="MET_001",
+                    verdict=GapVerdict.FALSE_ALARM,
+                )
+            }
+        )
+        service._verify_rule_group = AsyncMock(
+            return_value=VerificationResult(
+                rule_id="MET_001",
+                verdicts=[
+                    GapVerdictResult(
+                        gap_title=changed_gap.title,
+                        rule_id="MET_001",
+                        verdict=GapVerdict.GENUINE,
+                    )
+                ],
+            )
+        )
+
+        results = await service.verify_gaps(
+            [cached_gap, changed_gap], _context(), verdict_cache=cache
+        )
+
+        sample = service._verify_rule_group.call_args.kwargs["sample_gaps"]
+        assert [g.title for g in sample] == [changed_gap.title]
+        assert cache.stored[0][0] == [changed_gap.title]
+        result = results["MET_001"]
+        assert result.cache_hits == 1
+        assert len(result.verdicts) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_verification_is_not_cached(self, service):
+        gap = _gap("LOG_001", "a.py", "f")
+        cache = FakeVerdictCache({})
+        service._verify_rule_group = AsyncMock(
+            return_value=VerificationResult(
+                rule_id="LOG_001",
+                verdicts=[
+                    GapVerdictResult(
+                        gap_title=gap.title,
+                        rule_id="LOG_001",
+                        verdict=GapVerdict.GENUINE,
+                    )
+                ],
+                error="boom",
+            )
+        )
+
+        await service.verify_gaps([gap], _context(), verdict_cache=cache)
+
+        assert cache.stored == []
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestVerdictCachePersistence:
+    """Round-trip through the gap_verdict_cache table."""
+
+    @pytest.mark.asyncio
+    async def test_store_then_lookup(self, sqlite_db):
+        repository_id = str(uuid.uuid4())
+        sqlite_db.add(
+            ParsedFile(
+                id=str(uuid.uuid4()),
+                repository_id=repository_id,
+                file_path="a.py",
+                language="python",
+                content_hash="h1",
+            )
+        )
+        await sqlite_db.flush()
+
+        gap = _gap("MET_001", "a.py", "f")
+        verdict = GapVerdictResult(
+            gap_title=gap.title,
+            rule_id="MET_001",
+            verdict=GapVerdict.FALSE_ALARM,
+            reason="covered by middleware",
+        )
+
+        cache = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+        await cache.prepare([gap], _context())
+        assert await cache.lookup([gap]) == {}
+        assert await cache.store([gap], [verdict]) == 1
+
+        # A later review with the same file content hits the cache
+        next_review = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+        await next_review.prepare([gap], _context())
+        cached = await next_review.lookup([gap])
+        assert list(cached.values()) == [verdict]
+
+    @pytest.mark.asyncio
+    async def test_changed_file_misses(self, sqlite_db):
+        repository_id = str(uuid.uuid4())
+        parsed = ParsedFile(
+            id=str(uuid.uuid4()),
+            repository_id=repository_id,
+            file_path="a.py",
+            language="python",
+            content_hash="h1",
+        )
+        sqlite_db.add(parsed)
+        await sqlite_db.flush()
+
+        gap = _gap("MET_001", "a.py", "f")
+        cache = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+        await cache.prepare([gap], _context())
+        await cache.store(
+            [gap],
+            [
+                GapVerdictResult(
+                    gap_title=gap.title,
+                    rule_id="MET_001",
+                    verdict=GapVerdict.GENUINE,
+                )
+            ],
+        )
+
+        parsed.content_hash = "h2"
+        await sqlite_db.flush()
+
+        next_review = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+        await next_review.prepare([gap], _context())
+        assert await next_review.lookup([gap]) == {}
+
+    @pytest.mark.asyncio
+    async def test_extended_verdicts_are_not_cached(self, sqlite_db):
+        repository_id = str(uuid.uuid4())
+        for path in ("a.py", "b.py"):
+            sqlite_db.add(
+                ParsedFile(
+                    id=str(uuid.uuid4()),
+                    repository_id=repository_id,
+                    file_path=path,
+                    language="python",
+                    content_hash="h1",
+                )
+            )
+        await sqlite_db.flush()
+
+        sampled, extended = _gap("MET_001", "a.py", "f"), _gap("MET_001", "b.py", "g")
+        service = VerificationService(
+            llm=MagicMock(), db=sqlite_db, repository_id=repository_id
+        )
+        service._verify_rule_group = AsyncMock(
+            return_value=VerificationResult(
+                rule_id="MET_001",
+                verdicts=[
+                    GapVerdictResult(
+                        gap_title=sampled.title,
+                        rule_id="MET_001",
+                        verdict=GapVerdict.FALSE_ALARM,
+                        reason="covered by middleware",
+                    )
+                ],
+            )
+        )
+
+        with patch(
+            "app.health_review_system.verification.service.settings"
+        ) as mock_settings:
+            mock_settings.HEALTH_REVIEW_VERIFICATION_SAMPLE_SIZE = 1
+            mock_settings.HEALTH_REVIEW_VERIFICATION_DELAY_SECONDS = 0
+            cache = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+            results = await service.verify_gaps(
+                [sampled, extended], _context(), verdict_cache=cache
+            )
+
+        assert len(results["MET_001"].verdicts) == 2
+
+        # Only the sampled gap was judged; the extended one is verified again next run
+        next_review = VerdictCache(sqlite_db, "ws-1", "owner/repo", repository_id)
+        await next_review.prepare([sampled, extended], _context())
+        cached = await next_review.lookup([sampled, extended])
+        assert [v.gap_title for v in cached.values()] == [sampled.title]
+        assert next_review.key_for(extended) not in cached
@@ -0,0 +1,279 @@
+"""
+Tests for the RCA read-through code content layer: commit-pinned reads come
+from parsed_files, then the in-process blob cache, then GitHub.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.code_parser.repository import ParsedFileRepository
+from app.models import Base, ParsedRepository, ParsingStatus
+from app.services.rca.tools.github import content
+
+COMMIT = "ab2f9b1c" + "0" * 32
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    content.clear_caches()
+    yield
+    content.clear_caches()
+
+
+async def add_parsed_repo(
+    db, status=ParsingStatus.COMPLETED, full_name="acme/marketplace"
+):
+    repository_id = str(uuid.uuid4())
+    db.add(
+        ParsedRepository(
+            id=repository_id,
+            workspace_id="ws",
+            repo_full_name=full_name,
+            commit_sha=COMMIT,
+            status=status,
+        )
+    )
+    await db.commit()
+    await ParsedFileRepository(db).create_batch(
+        repository_id,
+        [
+            {
+                "file_path": "app.py",
+                "language": "python",
+                "content": "print('parsed')",
+                "size_bytes": 15,
+            },
+        ],
+    )
+    return repository_id
+
+
+def github_file(sha="blob-1", text="print('github')", path="app.py"):
+    return {
+        "success": True,
+        "owner": "acme",
+        "name": "marketplace",
+        "branch": COMMIT,
+        "file_path": path,
+        "expression": f"{COMMIT}:{path}",
+        "byte_size": len(text),
+        "content": text,
+        "sha": sha,
+    }
+
+
+class TestGetAtCommit:
+    """ParsedFileRepository.get_at_commit matches repos and abbreviated SHAs."""
+
+    @pytest.mark.asyncio
+    async def test_short_sha_and_any_owner(self, sqlite_db):
+        await add_parsed_repo(sqlite_db)
+        repo = ParsedFileRepository(sqlite_db)
+
+        stored = await repo.get_at_commit("ws", "marketplace", "ab2f9b1c", "app.py")
+
+        assert stored["repo_full_name"] == "acme/marketplace"
+        assert stored["commit_sha"] == COMMIT
+        assert stored["content"] == "print('parsed')"
+        assert await repo.get_at_commit(
+            "ws", "marketplace", COMMIT, "app.py", owner="acme"
+        )
+        assert (
+            await repo.get_at_commit(
+                "ws", "marketplace", COMMIT, "app.py", owner="other"
+            )
+            is None
+        )
+        assert (
+            await repo.get_at_commit("ws", "marketplace", "ffffffff", "app.py") is None
+        )
+        assert (
+            await repo.get_at_commit("other-ws", "marketplace", COMMIT, "app.py")
+            is None
+        )
+
+    @pytest.mark.asyncio
+    async def test_ignores_incomplete_parses(self, sqlite_db):
+        await add_parsed_repo(sqlite_db, status=ParsingStatus.IN_PROGRESS)
+
+        stored = await ParsedFileRepository(sqlite_db).get_at_commit(
+            "ws", "marketplace", COMMIT, "app.py"
+        )
+
+        assert stored is None
+
+
+class TestReadFile:
+    """read_file lookup order."""
+
+    @pytest.mark.asyncio
+    async def test_parsed_store_hit_skips_github(self, sqlite_db):
+        await add_parsed_repo(sqlite_db)
+
+        with patch.object(content, "read_repository_file", AsyncMock()) as mock_read:
+            response = await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref=COMMIT
+            )
+
+        mock_read.assert_not_called()
+        assert response["content"] == "print('parsed')"
+        assert response["owner"] == "acme"
+        assert response["byte_size"] == 15
+
+    @pytest.mark.asyncio
+    async def test_pinned_github_read_is_cached(self, sqlite_db):
+        with patch.object(
+            content, "read_repository_file", AsyncMock(return_value=github_file())
+        ) as mock_read:
+            first = await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref=COMMIT
+            )
+            second = await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref=COMMIT
+            )
+
+        assert mock_read.await_count == 1
+        assert first == second
+        assert second["content"] == "print('github')"
+
+    @pytest.mark.asyncio
+    async def test_moving_ref_always_reads_github(self, sqlite_db):
+        await add_parsed_repo(sqlite_db)
+
+        with patch.object(
+            content, "read_repository_file", AsyncMock(return_value=github_file())
+        ) as mock_read:
+            await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref="HEAD"
+            )
+            await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref="main"
+            )
+
+        assert mock_read.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_blob_keeps_each_paths_metadata(self, sqlite_db):
+        responses = [
+            github_file(path="vendor/a/util.py"),
+            github_file(path="vendor/b/util.py"),
+        ]
+        with patch.object(
+            content, "read_repository_file", AsyncMock(side_effect=responses)
+        ) as mock_read:
+            for path in ("vendor/a/util.py", "vendor/b/util.py"):
+                await content.read_file(
+                    sqlite_db, "ws", "marketplace", path, ref=COMMIT
+                )
+            cached = await content.read_file(
+                sqlite_db, "ws", "marketplace", "vendor/b/util.py", ref=COMMIT
+            )
+
+        assert mock_read.await_count == 2
+        assert cached["file_path"] == "vendor/b/util.py"
+        assert cached["expression"] == f"{COMMIT}:vendor/b/util.py"
+        assert cached["content"] == "print('github')"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("ref", ["1234567", "deadbeef", COMMIT[:12]])
+    async def test_hex_branch_names_and_short_shas_are_not_pinned(self, sqlite_db, ref):
+        await add_parsed_repo(sqlite_db)
+
+        with patch.object(
+            content, "read_repository_file", AsyncMock(return_value=github_file())
+        ) as mock_read:
+            await content.read_file(sqlite_db, "ws", "marketplace", "app.py", ref=ref)
+            await content.read_file(sqlite_db, "ws", "marketplace", "app.py", ref=ref)
+
+        assert mock_read.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_read_is_not_cached(self, sqlite_db):
+        with patch.object(
+            content,
+            "read_repository_file",
+            AsyncMock(
+                return_value={
+                    "success": True,
+                    "content": "",
+                    "byte_size": 0,
+                    "sha": "b",
+                }
+            ),
+        ) as mock_read:
+            await content.read_file(
+                sqlite_db, "ws", "marketplace", "empty.py", ref=COMMIT
+            )
+            await content.read_file(
+                sqlite_db, "ws", "marketplace", "empty.py", ref=COMMIT
+            )
+
+        assert mock_read.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_records_read_source(self, sqlite_db):
+        await add_parsed_repo(sqlite_db)
+
+        counter = MagicMock()
+        with patch.dict(content.TOOL_METRICS, {"rca_tool_code_reads_total": counter}):
+            await content.read_file(
+                sqlite_db, "ws", "marketplace", "app.py", ref=COMMIT
+            )
+
+        counter.add.assert_called_once_with(
+            1, {"kind": "file", "source": "parsed_store"}
+        )
+
+
+class TestReadTree:
+    """read_tree serves pinned file expressions without GitHub."""
+
+    @pytest.mark.asyncio
+    async def test_pinned_file_expression_from_parsed_store(self, sqlite_db):
+        await add_parsed_repo(sqlite_db)
+
+        with patch.object(content, "get_repository_tree", AsyncMock()) as mock_tree:
+            response = await content.read_tree(
+                sqlite_db, "ws", "marketplace", f"{COMMIT}:app.py"
+            )
+
+        mock_tree.assert_not_called()
+        assert response["data"] == {
+            "__typename": "Blob",
+            "byteSize": 15,
+            "text": "print('parsed')",
+        }
+
+    @pytest.mark.asyncio
+    async def test_pinned_directory_is_cached(self, sqlite_db):
+        tree = {"success": True, "data": {"__typename": "Tree", "entries": []}}
+        with patch.object(
+            content, "get_repository_tree", AsyncMock(return_value=tree)
+        ) as mock_tree:
+            await content.read_tree(sqlite_db, "ws", "marketplace", f"{COMMIT}:src/")
+            await content.read_tree(sqlite_db, "ws", "marketplace", f"{COMMIT}:src/")
+            await content.read_tree(sqlite_db, "ws", "marketplace", "HEAD:src/")
+            await content.read_tree(sqlite_db, "ws", "marketplace", "HEAD:src/")
+
+        assert mock_tree.await_count == 3
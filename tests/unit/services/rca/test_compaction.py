@@ -0,0 +1,207 @@
+"""
+Tests for RCA tool output compaction: repeated-row folding, token budgets,
+compact JSON and the per-tool savings metric.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.services.rca.tools import compaction
+from app.services.rca.tools.cloudwatch.tools import _format_insights_query_response
+from app.services.rca.tools.compaction import (
+    compact_json,
+    compact_rows,
+    estimate_tokens,
+)
+from app.services.rca.tools.datadog.tools import _format_logs_list_response
+
+
+@pytest.fixture
+def saved_counter():
+    counter = MagicMock()
+    with patch.dict(
+        compaction.TOOL_METRICS, {"rca_tool_output_tokens_saved_total": counter}
+    ):
+        yield counter
+
+
+class TestCompactRows:
+    """Rows become one table; repeats fold; the budget bounds the output."""
+
+    def test_folds_repeats_ignoring_ids_and_times(self, saved_counter):
+        rows = [
+            ("10:00:01", "ERROR", "timeout at 2026-01-01T10:00:01Z req=9f8e7d6c"),
+            ("10:00:02", "INFO", "request ok"),
+            ("10:00:03", "ERROR", "timeout at 2026-01-01T10:00:03Z req=1a2b3c4d"),
+        ]
+
+        output = compact_rows(
+            "t",
+            "Found 3 log entries:",
+            ("time", "level", "msg"),
+            rows,
+            key_columns=(1, 2),
+        )
+
+        assert output.splitlines() == [
+            "Found 3 log entries:",
+            "time|level|msg|n",
+            "10:00:01|ERROR|timeout at 2026-01-01T10:00:01Z req=9f8e7d6c|2",
+            "10:00:02|INFO|request ok|1",
+            "(3 rows folded into 2, n = occurrences)",
+        ]
+
+    def test_keeps_rows_differing_by_status_code(self, saved_counter):
+        rows = [
+            ("10:00:01", "GET /orders returned 500"),
+            ("10:00:02", "GET /orders returned 200"),
+            ("10:00:03", "GET /orders returned 500"),
+        ]
+
+        output = compact_rows("t", "Logs:", ("time", "msg"), rows, key_columns=(1,))
+
+        assert output.splitlines()[1:4] == [
+            "time|msg|n",
+            "10:00:01|GET /orders returned 500|2",
+            "10:00:02|GET /orders returned 200|1",
+        ]
+
+    def test_fold_disabled_keeps_every_row(self, saved_counter):
+        rows = [
+            ("2026-01-01 10:00", "200", "1523"),
+            ("2026-01-01 10:00", "500", "12"),
+        ] * 2
+
+        output = compact_rows(
+            "t", "Results:", ("bin", "status", "count"), rows, fold=False
+        )
+
+        assert output.splitlines()[1:] == [
+            "bin|status|count",
+            "2026-01-01 10:00|200|1523",
+            "2026-01-01 10:00|500|12",
+            "2026-01-01 10:00|200|1523",
+            "2026-01-01 10:00|500|12",
+        ]
+
+    def test_respects_token_budget(self, saved_counter):
+        rows = [(i, f"distinct message {'x' * i}") for i in range(200)]
+
+        output = compact_rows(
+            "t", "Logs:", ("i", "msg"), rows, total=500, max_tokens=300
+        )
+
+        assert estimate_tokens(output) <= 300
+        assert "more distinct rows not shown; 500 matched in total" in output
+
+    def test_cells_stay_on_one_line(self, saved_counter):
+        output = compact_rows("t", "Logs:", ("msg",), [("line one\n  line | two",)])
+
+        assert output.splitlines()[2] == "line one line / two"
+
+    def test_records_tokens_saved_per_tool(self, saved_counter):
+        rows = [("10:00:00", "connection refused")] * 50
+
+        compact_rows(
+            "search_datadog_logs_tool", "Logs:", ("time", "msg"), rows, key_columns=(1,)
+        )
+
+        saved, attributes = saved_counter.add.call_args.args
+        assert saved > 0
+        assert attributes == {"tool": "search_datadog_logs_tool"}
+
+
+class TestCompactJson:
+    """Structured results render on one line and shed list items to fit."""
+
+    def test_small_value_is_unchanged(self, saved_counter):
+        value = {"language": "python", "functions": [{"name": "a", "line": 1}]}
+
+        assert json.loads(compact_json("parse_code_tool", value)) == value
+
+    def test_trims_longest_list(self, saved_counter):
+        value = {
+            "language": "python",
+            "functions": [{"name": f"func_{i}", "line": i} for i in range(400)],
+            "classes": [{"name": "A", "line": 1}],
+        }
+
+        output = compact_json("parse_code_tool", value, max_tokens=500)
+        trimmed = json.loads(output)
+
+        assert estimate_tokens(output) <= 500
+        assert trimmed["classes"] == value["classes"]
+        assert len(trimmed["functions"]) + trimmed["functions_omitted"] == 400
+        assert trimmed["functions"][0] == {"name": "func_0", "line": 0}
+
+    def test_shortens_dominant_string_and_stays_valid_json(self, saved_counter):
+        value = {"language": "python", "source": "x = 1\n" * 2000, "functions": []}
+
+        output = compact_json("parse_code_tool", value, max_tokens=200)
+        trimmed = json.loads(output)
+
+        assert estimate_tokens(output) <= 200
+        assert trimmed["language"] == "python"
+        assert value["source"].startswith(trimmed["source"])
+        assert len(trimmed["source"]) + trimmed["source_truncated"] == 12000
+
+    def test_small_budget_still_parses(self, saved_counter):
+        value = {
+            "functions": [{"name": f"func_{i}", "doc": "d" * 300} for i in range(50)],
+            "error": None,
+        }
+
+        output = compact_json("parse_code_tool", value, max_tokens=40)
+
+        assert estimate_tokens(output) <= 40
+        assert json.loads(output)["functions_omitted"] == 49
+
+
+class TestFormatterIntegration:
+    """Tool formatters render through compact_rows."""
+
+    def test_datadog_logs_list(self, saved_counter):
+        log = SimpleNamespace(
+            timestamp="2026-01-01T10:00:00Z",
+            status="error",
+            service="api",
+            message="boom",
+        )
+        response = SimpleNamespace(logs=[log, log], totalCount=2)
+
+        output = _format_logs_list_response(response, tool="list_datadog_logs_tool")
+
+        assert output.splitlines()[1:3] == [
+            "time|status|service|message|n",
+            "2026-01-01 10:00:00|ERROR|api|boom|2",
+        ]
+        assert saved_counter.add.call_args.args[1] == {"tool": "list_datadog_logs_tool"}
+
+    def test_cloudwatch_insights_results_are_not_folded(self, saved_counter):
+        def field(name, value):
+            return SimpleNamespace(field=name, value=value)
+
+        response = SimpleNamespace(
+            status="Complete",
+            statistics=None,
+            results=[
+                [
+                    field("bin(5m)", "2026-01-01 10:00:00.000"),
+                    field("status", str(status)),
+                    field("count()", str(count)),
+                ]
+                for status, count in ((200, 1523), (500, 12), (503, 340))
+            ],
+        )
+
+        output = _format_insights_query_response(response)
+
+        assert output.splitlines()[1:] == [
+            "bin(5m)|status|count()",
+            "2026-01-01 10:00:00.000|200|1523",
+            "2026-01-01 10:00:00.000|500|12",
+            "2026-01-01 10:00:00.000|503|340",
+        ]
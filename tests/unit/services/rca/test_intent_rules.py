@@ -0,0 +1,111 @@
+"""
+Tests for the rule-based intent pre-classifier and its use in
+classify_query_intent.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from app.services.rca.agents import classify_query_intent
+from app.services.rca.intent_rules import classify_by_rules
+
+
+class TestClassifyByRules:
+    """Unambiguous queries are decided; everything else is left to the LLM."""
+
+    @pytest.mark.parametrize(
+        "query, rule",
+        [
+            ("why is auth-service failing?", "why_problem"),
+            ("payments api is down", "reported_problem"),
+            ("users getting 502 on /api/cart", "error_symptom"),
+            ("latency is high on marketplace", "metric_spike"),
+            ("can you debug the login flow", "investigation_request"),
+            (
+                'Traceback (most recent call last):\n  File "a.py", line 1',
+                "stack_trace",
+            ),
+            ("\tat com.acme.Orders.place(Orders.java:88)", "stack_trace"),
+        ],
+    )
+    def test_investigations(self, query, rule):
+        match = classify_by_rules(query)
+
+        assert (match.intent, match.rule) == ("rca_investigation", rule)
+
+    @pytest.mark.parametrize(
+        "query, rule",
+        [
+            ("hi", "greeting"),
+            ("<@U123> thanks!", "greeting"),
+            ("what can you do?", "capabilities"),
+            ("show me the last 5 commits in marketplace", "list_entities"),
+            ("what services do we have", "which_entities"),
+            ("what's deployed in prod?", "which_entities"),
+            ("who owns the billing service", "ownership"),
+        ],
+    )
+    def test_conversational(self, query, rule):
+        match = classify_by_rules(query)
+
+        assert (match.intent, match.rule) == ("conversational", rule)
+
+    def test_alert_context_is_investigation(self):
+        match = classify_by_rules("[FIRING:1] HighMemory", {"auto_detected": True})
+
+        assert (match.intent, match.rule) == ("rca_investigation", "alert")
+
+    def test_investigation_cues_win(self):
+        assert (
+            classify_by_rules("show me why checkout is failing").intent
+            == "rca_investigation"
+        )
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "check again",
+            "something feels off with payments",
+            "how is error handling done in orders?",
+            "show me teams\nalso, checkout looks weird",
+        ],
+    )
+    def test_ambiguous_queries_are_left_to_llm(self, query):
+        assert classify_by_rules(query) is None
+
+
+class TestClassifyQueryIntent:
+    """classify_query_intent only calls the LLM when the rules abstain."""
+
+    @pytest.fixture
+    def llm(self):
+        llm = MagicMock()
+        llm.bind_tools.return_value.ainvoke = AsyncMock(
+            return_value=AIMessage(content="rca_investigation")
+        )
+        return llm
+
+    @pytest.mark.asyncio
+    async def test_rule_match_skips_llm(self, llm):
+        state = await classify_query_intent(
+            {"task": "show my teams", "context": {}}, llm
+        )
+
+        assert state["query_intent"] == "conversational"
+        llm.bind_tools.return_value.ainvoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_ambiguous_query_uses_llm(self, llm):
+        state = await classify_query_intent({"task": "check again", "context": {}}, llm)
+
+        assert state["query_intent"] == "rca_investigation"
+        llm.bind_tools.return_value.ainvoke.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rules_can_be_disabled(self, llm):
+        with patch("app.services.rca.agents.settings.RCA_INTENT_RULES_ENABLED", False):
+            await classify_query_intent({"task": "show my teams", "context": {}}, llm)
+
+        llm.bind_tools.return_value.ainvoke.assert_awaited_once()
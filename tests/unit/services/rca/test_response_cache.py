@@ -0,0 +1,166 @@
+"""
+Tests for the conversational response cache: key normalization, what gets
+stored, and LLM-free answers until the workspace changes.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, Service, Workspace
+from app.services.rca.agent import RCAAgentService
+from app.services.rca.response_cache import is_cacheable_result, response_cache_key
+from app.utils.versioned_cache import drain_pending_invalidations
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch(
+        "app.utils.versioned_cache.get_redis", AsyncMock(return_value=fake)
+    ), patch("app.utils.versioned_cache.settings.REDIS_URL", "redis://test"):
+        yield fake
+
+
+@pytest_asyncio.fixture
+async def sqlite_db(redis):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        session.add(Workspace(id="ws-1", name="Acme"))
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+def conversational_result(output="We run api and web.", tools_used=0):
+    return {
+        "output": output,
+        "intermediate_steps": [
+            {"stage": "classify_intent", "details": {"intent": "conversational"}},
+            {
+                "stage": "conversational",
+                "details": {
+                    "query": "q",
+                    "response_length": len(output),
+                    "tools_used": tools_used,
+                },
+            },
+        ],
+        "success": True,
+        "error": None,
+    }
+
+
+class TestResponseCacheKey:
+    """Equivalent phrasings share a key; context-dependent queries get none."""
+
+    def test_normalizes_case_punctuation_and_mentions(self):
+        key = response_cache_key("What services do we have?", {})
+
+        assert key == response_cache_key("<@U123>  what services do we HAVE", {})
+        assert key != response_cache_key("what teams do we have", {})
+
+    @pytest.mark.parametrize(
+        "context",
+        [
+            {"thread_history": "user: hi"},
+            {"pii_mapping": {"email1": "a@x.com"}},
+            {"files": [{"file_type": "image"}]},
+        ],
+    )
+    def test_context_dependent_queries_are_not_cached(self, context):
+        assert response_cache_key("what services do we have", context) is None
+
+    def test_empty_query_is_not_cached(self):
+        assert response_cache_key("?! <@U123>", {}) is None
+
+
+class TestIsCacheableResult:
+    """Only tool-free conversational answers are stored."""
+
+    def test_tool_free_conversational_answer(self):
+        assert is_cacheable_result(conversational_result())
+
+    def test_answer_using_tools(self):
+        assert not is_cacheable_result(conversational_result(tools_used=2))
+
+    def test_investigation_report(self):
+        result = {
+            "output": "Root cause: bad deploy",
+            "intermediate_steps": [{"stage": "synthesis", "details": {}}],
+            "success": True,
+        }
+        assert not is_cacheable_result(result)
+
+    def test_failed_run(self):
+        assert not is_cacheable_result({**conversational_result(), "success": False})
+
+
+class TestAnalyzeWithResponseCache:
+    """RCAAgentService.analyze skips the graph on a hit."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_question_skips_graph(self, redis):
+        service = RCAAgentService()
+        run_graph = AsyncMock(return_value=conversational_result())
+        context = {"workspace_id": "ws-1"}
+
+        with patch.object(service, "_run_graph", run_graph):
+            first = await service.analyze("What services do we have?", context)
+            second = await service.analyze("what services do we have", context)
+
+        run_graph.assert_awaited_once()
+        assert first["output"] == second["output"] == "We run api and web."
+        assert second["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_tool_answers_always_run_graph(self, redis):
+        service = RCAAgentService()
+        run_graph = AsyncMock(return_value=conversational_result(tools_used=1))
+
+        with patch.object(service, "_run_graph", run_graph):
+            await service.analyze("list recent commits", {"workspace_id": "ws-1"})
+            await service.analyze("list recent commits", {"workspace_id": "ws-1"})
+
+        assert run_graph.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_workspace_change_invalidates_answers(self, redis, sqlite_db):
+        service = RCAAgentService()
+        run_graph = AsyncMock(return_value=conversational_result())
+        context = {"workspace_id": "ws-1"}
+
+        with patch.object(service, "_run_graph", run_graph):
+            await service.analyze("what services do we have", context)
+            sqlite_db.add(Service(id="svc-1", workspace_id="ws-1", name="billing"))
+            await sqlite_db.commit()
+            await drain_pending_invalidations()
+            await service.analyze("what services do we have", context)
+
+        assert run_graph.await_count == 2
@@ -0,0 +1,156 @@
+"""
+Tests for the agent scratchpad manager: older tool results are summarized,
+recent ones are sent verbatim, and token usage reaches ToolMetricsCallback.
+"""
+
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain.agents.output_parsers.tools import ToolAgentAction
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+from app.services.rca.builder import AgentExecutorBuilder
+from app.services.rca.callbacks import ToolMetricsCallback
+from app.services.rca.capabilities import ExecutionContext
+from app.services.rca.scratchpad import ScratchpadManager, summarize_observation
+
+LOGS = "\n".join(
+    ["Found 200 log entries (times UTC):", "time|message"]
+    + [f"10:00:{i:02d}|request ok id={i}" for i in range(60)]
+    + ["10:01:00|ERROR upstream timeout calling payments"]
+    + ["(200 matched in total; narrow the query or time range for more)"]
+)
+
+
+def step(index, observation):
+    call_id = f"call_{index}"
+    message = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "fetch_logs_tool", "args": {"service_name": "api"}, "id": call_id}
+        ],
+    )
+    action = ToolAgentAction(
+        tool="fetch_logs_tool",
+        tool_input={"service_name": "api"},
+        log="",
+        message_log=[message],
+        tool_call_id=call_id,
+    )
+    return action, observation
+
+
+def tool_contents(messages):
+    return [m.content for m in messages if isinstance(m, ToolMessage)]
+
+
+class TestSummarizeObservation:
+    """Summaries keep the first line, failure lines and the closing remark."""
+
+    def test_structure(self):
+        summary = summarize_observation("fetch_logs_tool", LOGS, max_chars=600)
+
+        lines = summary.splitlines()
+        assert lines[0].startswith("[Earlier fetch_logs_tool result, summarized from ~")
+        assert lines[1] == "Found 200 log entries (times UTC):"
+        assert "- 10:01:00|ERROR upstream timeout calling payments" in lines
+        assert lines[-1].startswith("(200 matched in total")
+        assert "request ok" not in summary
+
+
+class TestScratchpadManager:
+    """Only observations older than keep_recent are compressed."""
+
+    def test_keeps_recent_verbatim(self):
+        manager = ScratchpadManager(keep_recent=2, summary_max_chars=600)
+
+        messages = manager.format([step(i, LOGS) for i in range(3)])
+
+        contents = tool_contents(messages)
+        assert contents[0].startswith("[Earlier fetch_logs_tool result")
+        assert contents[1:] == [LOGS, LOGS]
+        # Tool calls are kept, so the agent knows what it already asked for
+        assert sum(isinstance(m, AIMessage) for m in messages) == 3
+
+    def test_short_outputs_are_not_compressed(self):
+        manager = ScratchpadManager(keep_recent=0, summary_max_chars=600)
+
+        messages = manager.format(
+            [step(0, "No logs found for the specified criteria.")]
+        )
+
+        assert tool_contents(messages) == ["No logs found for the specified criteria."]
+        assert manager.usage[0].saved_tokens == 0
+
+    def test_reports_usage_per_iteration(self):
+        on_iteration = MagicMock()
+        manager = ScratchpadManager(
+            keep_recent=1, summary_max_chars=600, on_iteration=on_iteration
+        )
+        steps = [step(i, LOGS) for i in range(4)]
+
+        manager.format(steps[:1])
+        manager.format(steps)
+
+        first, second = [call.args[0] for call in on_iteration.call_args_list]
+        assert (first.iteration, first.steps, first.compressed_steps) == (1, 1, 0)
+        assert (second.iteration, second.steps, second.compressed_steps) == (2, 4, 3)
+        assert second.raw_tokens == 4 * first.raw_tokens
+        assert second.sent_tokens < 2 * first.raw_tokens
+
+    def test_no_usage_before_first_tool_call(self):
+        manager = ScratchpadManager()
+
+        assert manager.format([]) == []
+        assert manager.usage == []
+
+
+class TestToolMetricsCallback:
+    """ToolMetricsCallback exposes scratchpad savings and LLM latency."""
+
+    @pytest.mark.asyncio
+    async def test_records_savings_and_latency(self):
+        callback = ToolMetricsCallback()
+        manager = ScratchpadManager(
+            keep_recent=1,
+            summary_max_chars=600,
+            on_iteration=callback.record_scratchpad_usage,
+        )
+        counter = MagicMock()
+        run_id = uuid.uuid4()
+
+        with patch.dict(
+            "app.services.rca.callbacks.TOOL_METRICS",
+            {"rca_tool_scratchpad_tokens_saved_total": counter},
+        ):
+            manager.format([step(i, LOGS) for i in range(3)])
+        await callback.on_chat_model_start({}, [], run_id=run_id)
+        await callback.on_llm_end(None, run_id=run_id)
+
+        assert callback.scratchpad_tokens_saved > 0
+        counter.add.assert_called_once_with(callback.scratchpad_tokens_saved)
+        summary = callback.summary()
+        assert summary["agent_iterations"] == 1
+        assert summary["llm_calls"] == 1
+
+    def test_builder_wires_callback_into_scratchpad(self):
+        callback = ToolMetricsCallback()
+        prompt = ChatPromptTemplate.from_messages(
+            [("human", "{input}"), MessagesPlaceholder("agent_scratchpad")]
+        )
+        context = ExecutionContext(
+            workspace_id="ws", capabilities=set(), integrations={}, service_mapping={}
+        )
+
+        with patch(
+            "app.services.rca.builder.create_tool_calling_agent"
+        ) as create_agent, patch("app.services.rca.builder.AgentExecutor"):
+            AgentExecutorBuilder(MagicMock(), prompt).with_context(
+                context
+            ).with_callbacks([callback]).build()
+
+        formatter = create_agent.call_args.kwargs["message_formatter"]
+        formatter([step(0, LOGS)])
+        assert len(callback.scratchpad_usage) == 1
@@ -0,0 +1,146 @@
+"""
+Tests for final-answer token streaming: AnswerStream throttling and PII
+handling, the tagged synthesis run, and streamed Slack edits.
+"""
+
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from app.services.rca.agents import synthesis_agent
+from app.services.rca.callbacks import SlackProgressCallback
+from app.services.rca.streaming import FINAL_ANSWER_TAG, AnswerStream
+from app.utils.data_masker import PIIMapper
+
+RUN_1 = uuid.uuid4()
+RUN_2 = uuid.uuid4()
+
+
+class TestAnswerStream:
+    """Updates are throttled, restart on a new run and never split placeholders."""
+
+    def test_throttles_until_final(self):
+        stream = AnswerStream(min_interval_seconds=60)
+        stream.add(RUN_1, "Root ")
+        first = stream.take()
+        stream.add(RUN_1, "cause")
+
+        assert (first.text, first.delta, first.reset) == ("Root ", "Root ", False)
+        assert stream.take() is None
+        final = stream.take(final=True)
+        assert (final.text, final.delta) == ("Root cause", "cause")
+        assert stream.take(final=True) is None
+
+    def test_new_run_resets(self):
+        stream = AnswerStream(min_interval_seconds=0)
+        stream.add(RUN_1, "Let me check the logs.")
+        stream.take()
+        stream.add(RUN_2, "")
+        assert stream.take() is None  # Nothing to replace it with yet
+
+        stream.add(RUN_2, "The deploy broke it.")
+        update = stream.take()
+
+        assert (update.text, update.delta, update.reset) == (
+            "The deploy broke it.",
+            "The deploy broke it.",
+            True,
+        )
+
+    def test_holds_back_partial_placeholders(self):
+        mapper = PIIMapper.from_mapping({"email1": "a@x.com", "email12": "b@x.com"})
+        stream = AnswerStream(min_interval_seconds=0, unmask=mapper.unmask)
+
+        stream.add(RUN_1, "Contact email1")
+        assert stream.take().text == "Contact "
+        stream.add(RUN_1, "2 today")
+        assert stream.take().delta == "b@x.com "
+        assert stream.take(final=True).text == "Contact b@x.com today"
+
+
+class _TokenRecorder(AsyncCallbackHandler):
+    def __init__(self):
+        self.tokens = []
+
+    async def on_llm_new_token(self, token, *, tags=None, **kwargs):
+        self.tokens.append((token, FINAL_ANSWER_TAG in (tags or [])))
+
+
+class TestSynthesisStreaming:
+    """The synthesis report is generated as a tagged, streamed run."""
+
+    @pytest.mark.asyncio
+    async def test_report_tokens_are_tagged(self):
+        llm = GenericFakeChatModel(
+            messages=iter([AIMessage(content="Root cause: bad deploy")])
+        )
+        recorder = _TokenRecorder()
+        state = {"task": "why is checkout down", "hypotheses": [], "trace": []}
+
+        with patch(
+            "app.services.rca.agents._disable_tool_calling", lambda llm, stage: llm
+        ):
+            result = await synthesis_agent(state, llm.with_config(callbacks=[recorder]))
+
+        assert result["report"] == "Root cause: bad deploy"
+        assert (
+            "".join(token for token, _ in recorder.tokens) == "Root cause: bad deploy"
+        )
+        assert all(tagged for _, tagged in recorder.tokens)
+
+
+class TestSlackAnswerStreaming:
+    """Slack shows the answer in one message edited as tokens arrive."""
+
+    @pytest.fixture
+    def slack(self):
+        with patch("app.services.rca.callbacks.slack_event_service") as service:
+            service.send_message = AsyncMock(return_value={"ok": True, "ts": "111.1"})
+            service.update_message = AsyncMock(return_value=True)
+            yield service
+
+    @pytest.mark.asyncio
+    async def test_posts_then_edits_one_message(self, slack):
+        callback = SlackProgressCallback(
+            team_id="T1", channel_id="C1", thread_ts="100.0"
+        )
+        callback._answer_stream.min_interval_seconds = 0
+        tags = [FINAL_ANSWER_TAG]
+
+        await callback.on_llm_new_token("**Root** ", run_id=RUN_1, tags=tags)
+        await callback.finish_answer_stream()
+        await callback.on_llm_new_token("cause", run_id=RUN_1, tags=tags)
+        await callback.on_llm_end(None, run_id=RUN_1, tags=tags)
+
+        slack.send_message.assert_awaited_once_with(
+            team_id="T1", channel="C1", text="*Root* ", thread_ts="100.0"
+        )
+        assert slack.update_message.await_args.kwargs["ts"] == "111.1"
+        assert slack.update_message.await_args.kwargs["text"] == "*Root* cause"
+        assert await callback.finish_answer_stream() == "111.1"
+
+    @pytest.mark.asyncio
+    async def test_ignores_untagged_runs(self, slack):
+        callback = SlackProgressCallback(team_id="T1", channel_id="C1")
+
+        await callback.on_llm_new_token("thinking", run_id=RUN_1, tags=[])
+        await callback.on_llm_end(None, run_id=RUN_1, tags=[])
+
+        slack.send_message.assert_not_awaited()
+        assert await callback.finish_answer_stream() is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_setting(self, slack):
+        with patch(
+            "app.services.rca.callbacks.settings.RCA_STREAM_FINAL_ANSWER", False
+        ):
+            callback = SlackProgressCallback(team_id="T1", channel_id="C1")
+
+        await callback.on_llm_new_token("Root", run_id=RUN_1, tags=[FINAL_ANSWER_TAG])
+        await callback.on_llm_end(None, run_id=RUN_1, tags=[FINAL_ANSWER_TAG])
+
+        slack.send_message.assert_not_awaited()
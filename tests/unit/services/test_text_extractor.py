@@ -0,0 +1,145 @@
+"""
+Tests for text extraction: budgeted extractors and the process pool engine.
+"""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.services.storage import TextExtractor
+from app.services.storage.extraction_engine import (
+    ExtractionEngine,
+    ExtractionTimeoutError,
+)
+from app.services.storage.extractors import (
+    TRUNCATION_MARKER,
+    ExtractionResult,
+    extract_json,
+    extract_pdf,
+    extract_plain_text,
+)
+from tests.benchmarks.documents import make_json, make_text_pdf
+
+
+def _sleep_then_echo(file_content: bytes, seconds: float) -> ExtractionResult:
+    """Module-level so the spawn pool can pickle it."""
+    time.sleep(seconds)
+    return ExtractionResult(file_content.decode())
+
+
+class TestExtractors:
+    """Extractors stop as soon as their budget is reached."""
+
+    def test_pdf_stops_reading_pages_at_char_budget(self):
+        result = extract_pdf(
+            make_text_pdf(pages=50), max_chars=500, cpu_budget_seconds=10
+        )
+
+        assert result.detail == "1/50 pages, stopped at char budget"
+        assert result.text.startswith("--- Page 1 ---")
+        assert result.text.endswith(TRUNCATION_MARKER)
+
+    def test_pdf_reads_all_pages_within_budget(self):
+        result = extract_pdf(
+            make_text_pdf(pages=3), max_chars=100_000, cpu_budget_seconds=10
+        )
+
+        assert result.detail == "3/3 pages"
+        assert "--- Page 3 ---" in result.text
+
+    def test_pdf_stops_at_cpu_budget(self):
+        result = extract_pdf(
+            make_text_pdf(pages=5), max_chars=100_000, cpu_budget_seconds=0
+        )
+
+        assert result.detail == "1/5 pages, stopped at CPU budget"
+        assert result.text.endswith("extraction time limit reached ...]")
+
+    def test_json_matches_pretty_print_when_small(self):
+        content = make_json(records=5)
+        expected = json.dumps(json.loads(content), indent=2, ensure_ascii=False)
+
+        assert extract_json(content, max_chars=100_000).text == expected
+
+    def test_json_truncates_large_documents(self):
+        result = extract_json(make_json(records=50_000), max_chars=1000)
+
+        assert len(result.text) == 1000 + len(TRUNCATION_MARKER)
+
+    def test_plain_text_keeps_multibyte_char_split_at_prefix_cut(self):
+        result = extract_plain_text("é".encode() * 10, max_chars=3)
+
+        assert result.text == "ééé" + TRUNCATION_MARKER
+        assert result.detail == ""
+
+    def test_plain_text_falls_back_to_latin1(self):
+        result = extract_plain_text(b"\xff\xfe log line", max_chars=100)
+
+        assert result.text == "ÿþ log line"
+        assert result.detail == "decoded as latin-1"
+
+
+class TestExtractionEngine:
+    """Process pool dispatch, time budget and pool recycling."""
+
+    @pytest.fixture
+    def engine(self):
+        engine = ExtractionEngine()
+        with patch("app.services.storage.extraction_engine.settings") as mock_settings:
+            mock_settings.TEXT_EXTRACTION_POOL_ENABLED = True
+            mock_settings.TEXT_EXTRACTION_POOL_WORKERS = 1
+            mock_settings.TEXT_EXTRACTION_POOL_MAX_TASKS_PER_CHILD = 10
+            mock_settings.TEXT_EXTRACTION_INLINE_MAX_BYTES = 4
+            mock_settings.TEXT_EXTRACTION_TIMEOUT_SECONDS = 20
+            yield engine, mock_settings
+        engine.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_small_files_skip_the_pool(self, engine):
+        engine, _ = engine
+
+        result = await engine.run(_sleep_then_echo, b"tiny", 0)
+
+        assert result.text == "tiny"
+        assert engine._pool is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_recycles_pool(self, engine):
+        engine, mock_settings = engine
+        result = await engine.run(_sleep_then_echo, b"large file", 0)
+        assert result.text == "large file"
+        first_pool = engine._pool
+
+        mock_settings.TEXT_EXTRACTION_TIMEOUT_SECONDS = 0.5
+        with pytest.raises(ExtractionTimeoutError):
+            await engine.run(_sleep_then_echo, b"stuck file", 30)
+        assert engine._pool is None
+
+        mock_settings.TEXT_EXTRACTION_TIMEOUT_SECONDS = 20
+        result = await engine.run(_sleep_then_echo, b"next file", 0)
+        assert result.text == "next file"
+        assert engine._pool is not first_pool
+
+
+class TestTextExtractor:
+    """TextExtractor routes by type and turns failures into None."""
+
+    @pytest.mark.asyncio
+    async def test_pdf_timeout_returns_none(self):
+        with patch(
+            "app.services.storage.text_extractor.extraction_engine.run",
+            side_effect=ExtractionTimeoutError("exceeded 30s"),
+        ):
+            assert (
+                await TextExtractor.extract_text(b"%PDF", "application/pdf", "a.pdf")
+                is None
+            )
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_returns_none(self):
+        assert (
+            await TextExtractor.extract_text(b"{oops", "application/json", "a.json")
+            is None
+        )
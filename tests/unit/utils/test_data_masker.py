@@ -4,8 +4,16 @@ Unit tests for PIIMapper and data masking utilities.
 Tests the masking and unmasking functionality for PII data.
 """
 
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+from presidio_analyzer import RecognizerResult
+
 from app.utils.data_masker import (
     PIIMapper,
+    has_pii_candidates,
     mask_email_for_context,
     mask_log_message,
     mask_secrets,
@@ -478,3 +486,98 @@ class TestMaskEmailForContext:
         """Test masking non-string input."""
         masked = mask_email_for_context(123)
         assert masked == 123
+
+
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.]+")
+
+
+def _fake_analyze_batch(calls):
+    """Stand-in for Presidio: detects emails only, records each batch."""
+
+    def analyze(texts):
+        calls.append(list(texts))
+        return [
+            [
+                RecognizerResult("EMAIL_ADDRESS", m.start(), m.end(), 1.0)
+                for m in EMAIL_RE.finditer(text)
+            ]
+            for text in texts
+        ]
+
+    return analyze
+
+
+class TestPIIMapperAsync:
+    """Off-loop, batched masking path."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        calls = []
+        with patch("app.utils.data_masker._analyze_batch", _fake_analyze_batch(calls)):
+            mappers = [PIIMapper() for _ in range(5)]
+            masked = await asyncio.gather(
+                *(
+                    mapper.mask_async(f"User u{i}@acme.com can't log in")
+                    for i, mapper in enumerate(mappers)
+                )
+            )
+
+        assert len(calls) == 1
+        assert len(calls[0]) == 5
+        assert masked == ["User email1 can't log in"] * 5
+        assert mappers[3].get_reverse_mapping() == {"email1": "u3@acme.com"}
+
+    @pytest.mark.asyncio
+    async def test_fast_path_skips_analyzer(self):
+        calls = []
+        with patch("app.utils.data_masker._analyze_batch", _fake_analyze_batch(calls)):
+            masked = await PIIMapper().mask_async("why is checkout failing today?")
+
+        assert masked == "why is checkout failing today?"
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_mask_many_keeps_placeholders_consistent(self):
+        calls = []
+        mapper = PIIMapper()
+        with patch("app.utils.data_masker._analyze_batch", _fake_analyze_batch(calls)):
+            masked = await mapper.mask_many_async(
+                [
+                    "a@x.io reported it",
+                    "no pii here",
+                    "b@x.io and a@x.io too",
+                ]
+            )
+
+        assert masked == ["email1 reported it", "no pii here", "email2 and email1 too"]
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_analyzer_failure_fails_closed(self):
+        def boom(texts):
+            raise OSError("model not loaded")
+
+        with patch("app.utils.data_masker._analyze_batch", boom):
+            with pytest.raises(
+                RuntimeError, match="PII masking is currently unavailable"
+            ):
+                await PIIMapper().mask_async("Contact Jane at jane@acme.com")
+
+    @pytest.mark.asyncio
+    async def test_secrets_masked_even_on_fast_path(self):
+        with patch("app.utils.data_masker._analyze_batch", _fake_analyze_batch([])):
+            masked = await PIIMapper().mask_async("token xoxb-abc-def leaked")
+
+        assert "xoxb-abc-def" not in masked
+
+
+class TestHasPiiCandidates:
+    """Regex pre-check for the fast path."""
+
+    def test_lowercase_words_have_no_candidates(self):
+        assert not has_pii_candidates("why is the api slow")
+
+    def test_digits_at_sign_and_capitals_are_candidates(self):
+        assert has_pii_candidates("error on 10.0.0.1")
+        assert has_pii_candidates("mail me at a@b.co")
+        assert has_pii_candidates("ask John about it")
@@ -0,0 +1,274 @@
+"""
+Tests for Redis-backed rate limit counters and their write-behind flush.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.exc import IntegrityError
+
+from app.utils import rate_limiter
+from app.utils.rate_limiter import (
+    FLUSHING_USAGE_KEY,
+    PENDING_USAGE_KEY,
+    ResourceType,
+    check_rate_limit,
+    flush_pending_usage,
+    get_current_usage,
+)
+
+
+class FakeRedis:
+    """In-memory Redis; scripts are emulated in Python by their source."""
+
+    def __init__(self):
+        self.data = {}
+        self.hashes = {}
+        self.script_calls = 0
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    def register_script(self, source):
+        async def check_and_increment(keys, args):
+            counter, pending, flushing, epoch_key = keys
+            increment, limit, _ttl, field, seed, seed_epoch = args
+            if counter not in self.data:
+                epoch = self.data.get(epoch_key, 0)
+                if field in self.hashes.get(flushing, {}):
+                    return [-2, 0]
+                if seed == "":
+                    return [-1, epoch]
+                if seed_epoch != epoch:
+                    return [-2, 0]
+                self.data[counter] = int(seed) + self.hashes.get(pending, {}).get(
+                    field, 0
+                )
+            current = self.data[counter]
+            if limit >= 0 and current + increment > limit:
+                return [0, current]
+            self.data[counter] = current + increment
+            deltas = self.hashes.setdefault(pending, {})
+            deltas[field] = deltas.get(field, 0) + increment
+            return [1, self.data[counter]]
+
+        async def drain(keys, args):
+            pending, flushing, epoch_key = keys
+            entries = self.hashes.pop(pending, {})
+            if entries:
+                in_flight = self.hashes.setdefault(flushing, {})
+                for field, delta in entries.items():
+                    in_flight[field] = in_flight.get(field, 0) + delta
+                self.data[epoch_key] = self.data.get(epoch_key, 0) + 1
+            return [str(x) for item in entries.items() for x in item]
+
+        async def settle(keys, args):
+            flushing, pending = keys
+            requeue, pairs = args[0], args[1:]
+            in_flight = self.hashes.setdefault(flushing, {})
+            for field, delta in zip(pairs[::2], pairs[1::2]):
+                in_flight[field] = in_flight.get(field, 0) - delta
+                if in_flight[field] <= 0:
+                    del in_flight[field]
+                if requeue == "1":
+                    deltas = self.hashes.setdefault(pending, {})
+                    deltas[field] = deltas.get(field, 0) + delta
+            if not in_flight:
+                del self.hashes[flushing]
+            return 0
+
+        async def call(keys, args=None):
+            self.script_calls += 1
+            if source == rate_limiter._DRAIN_PENDING:
+                return await drain(keys, args)
+            if source == rate_limiter._SETTLE_FLUSHED:
+                return await settle(keys, args)
+            return await check_and_increment(keys, args)
+
+        return call
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch("app.utils.rate_limiter.get_redis", AsyncMock(return_value=fake)), patch(
+        "app.utils.rate_limiter.settings"
+    ) as mock_settings:
+        mock_settings.REDIS_URL = "redis://test"
+        mock_settings.RATE_LIMIT_REDIS_ENABLED = True
+        yield fake
+
+
+def _db_with_count(count):
+    db = AsyncMock()
+    result = MagicMock()
+    result.scalar.return_value = count
+    db.execute = AsyncMock(return_value=result)
+    return db
+
+
+class TestRedisCheckRateLimit:
+    """check_rate_limit uses one script call per request once seeded."""
+
+    @pytest.mark.asyncio
+    async def test_seeds_from_database_once_then_counts_in_redis(self, redis):
+        db = _db_with_count(7)
+
+        first = await check_rate_limit(db, "ws-1", ResourceType.API_CALL, limit=10)
+        second = await check_rate_limit(db, "ws-1", ResourceType.API_CALL, limit=10)
+
+        assert first == (True, 8, 10)
+        assert second == (True, 9, 10)
+        db.execute.assert_awaited_once()  # Seed read only, no row locks
+        db.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_rejects_without_incrementing(self, redis):
+        db = _db_with_count(0)
+
+        allowed, count, limit = await check_rate_limit(
+            db, "ws-1", ResourceType.FILE_UPLOAD_BYTES, limit=100, increment=80
+        )
+        assert allowed
+        allowed, count, limit = await check_rate_limit(
+            db, "ws-1", ResourceType.FILE_UPLOAD_BYTES, limit=100, increment=30
+        )
+
+        assert (allowed, count, limit) == (False, 80, 100)
+        assert list(redis.hashes[PENDING_USAGE_KEY].values()) == [80]
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_falls_back_to_database(self, redis):
+        db = AsyncMock()
+        with patch(
+            "app.utils.rate_limiter._redis_check_and_increment",
+            AsyncMock(side_effect=ConnectionError("down")),
+        ):
+            tracking_result = MagicMock()
+            tracking_result.scalar_one_or_none.return_value = MagicMock(count=2)
+            db.execute = AsyncMock(return_value=tracking_result)
+
+            result = await check_rate_limit(db, "ws-1", ResourceType.API_CALL, limit=10)
+
+        assert result == (True, 3, 10)
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_seed_waits_for_in_flight_flush(self, redis):
+        field = f"ws-1|api_call|{datetime.now(timezone.utc).date().isoformat()}"
+        redis.hashes[FLUSHING_USAGE_KEY] = {field: 5}
+        db = _db_with_count(10)
+
+        with patch("app.utils.rate_limiter.SEED_RETRY_SECONDS", 0), pytest.raises(
+            RuntimeError
+        ):
+            await rate_limiter._redis_check_and_increment(
+                db, "ws-1", "api_call", field.split("|")[2], 100, 1, 60
+            )
+
+        db.execute.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_seed_read_during_flush_is_retried(self, redis):
+        # The counter expired with 5 unflushed; a flush commits them between
+        # the seed's database read and its script call
+        today = datetime.now(timezone.utc).date().isoformat()
+        redis.hashes[PENDING_USAGE_KEY] = {f"ws-1|api_call|{today}": 5}
+        db_counts = iter([10, 15])
+
+        async def read_count(*args):
+            count = next(db_counts)
+            if count == 10:
+                with patch("app.utils.rate_limiter.AsyncSessionLocal"):
+                    await flush_pending_usage()
+            result = MagicMock()
+            result.scalar.return_value = count
+            return result
+
+        db = AsyncMock()
+        db.execute = AsyncMock(side_effect=read_count)
+
+        with patch("app.utils.rate_limiter.SEED_RETRY_SECONDS", 0):
+            result = await check_rate_limit(
+                db, "ws-1", ResourceType.API_CALL, limit=100
+            )
+
+        assert result == (True, 16, 100)
+
+    @pytest.mark.asyncio
+    async def test_live_usage_read_prefers_redis(self, redis):
+        db = _db_with_count(0)
+        await check_rate_limit(
+            db, "ws-1", ResourceType.AIU_USAGE, limit=1000, increment=40
+        )
+
+        usage = await get_current_usage(
+            db,
+            "ws-1",
+            ResourceType.AIU_USAGE,
+            datetime.now(timezone.utc).date().isoformat(),
+        )
+
+        assert usage == 40
+
+
+class TestFlushPendingUsage:
+    """Buffered deltas are written behind to rate_limit_tracking."""
+
+    @pytest.fixture
+    def session(self):
+        session = AsyncMock()
+        session_cm = MagicMock()
+        session_cm.__aenter__ = AsyncMock(return_value=session)
+        session_cm.__aexit__ = AsyncMock(return_value=False)
+        with patch("app.utils.rate_limiter.AsyncSessionLocal", return_value=session_cm):
+            yield session
+
+    @pytest.mark.asyncio
+    async def test_drains_and_upserts(self, redis, session):
+        redis.hashes[PENDING_USAGE_KEY] = {"ws-1|aiu_usage|2026-W42": 500}
+
+        assert await flush_pending_usage() == 1
+
+        statement = session.execute.await_args.args[0]
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+        assert (
+            "ON CONFLICT (workspace_id, resource_type, window_key) DO UPDATE"
+            in compiled
+        )
+        assert "rate_limit_tracking.count + excluded.count" in compiled
+        session.commit.assert_awaited_once()
+        assert PENDING_USAGE_KEY not in redis.hashes
+        assert FLUSHING_USAGE_KEY not in redis.hashes
+
+    @pytest.mark.asyncio
+    async def test_database_error_requeues_deltas(self, redis, session):
+        redis.hashes[PENDING_USAGE_KEY] = {"ws-1|aiu_usage|2026-W42": 500}
+        session.execute.side_effect = OSError("db down")
+
+        assert await flush_pending_usage() == 0
+
+        assert redis.hashes[PENDING_USAGE_KEY] == {"ws-1|aiu_usage|2026-W42": 500}
+        assert FLUSHING_USAGE_KEY not in redis.hashes
+
+    @pytest.mark.asyncio
+    async def test_error_after_row_by_row_commits_requeues_only_the_rest(
+        self, redis, session
+    ):
+        redis.hashes[PENDING_USAGE_KEY] = {
+            "ws-1|aiu_usage|2026-W42": 500,
+            "ws-2|aiu_usage|2026-W42": 300,
+        }
+        # Batch hits a constraint; ws-1 then commits alone and ws-2 fails
+        session.execute.side_effect = [
+            IntegrityError("upsert", {}, Exception("fk")),
+            None,
+            OSError("db down"),
+        ]
+
+        assert await flush_pending_usage() == 1
+
+        assert redis.hashes[PENDING_USAGE_KEY] == {"ws-2|aiu_usage|2026-W42": 300}
+        assert FLUSHING_USAGE_KEY not in redis.hashes
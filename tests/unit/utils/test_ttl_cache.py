@@ -128,3 +128,10 @@ class TestTTLCache:
             # Entry is already gone — second caller must not crash
             assert cache.get("key") is None
             assert "key" not in cache
+
+    def test_pop_removes_and_returns(self, cache: TTLCache):
+        cache.set("key", "value")
+
+        assert cache.pop("key") == "value"
+        assert "key" not in cache
+        assert cache.pop("key", "gone") == "gone"
@@ -0,0 +1,128 @@
+"""
+Tests for the versioned Redis cache and commit-time invalidation.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base
+from app.utils.versioned_cache import VersionedCache, drain_pending_invalidations
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch(
+        "app.utils.versioned_cache.get_redis", AsyncMock(return_value=fake)
+    ), patch("app.utils.versioned_cache.settings.REDIS_URL", "redis://test"):
+        yield fake
+
+
+class TestVersionedCache:
+    """Read-through caching and version-based invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_miss_loads_then_hit_skips_loader(self, redis):
+        cache = VersionedCache("test", ttl_seconds=60)
+        loader = AsyncMock(return_value={"envs": ["prod"]})
+
+        assert await cache.get_or_load("ws-1", loader) == {"envs": ["prod"]}
+        assert await cache.get_or_load("ws-1", loader) == {"envs": ["prod"]}
+        loader.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self, redis):
+        cache = VersionedCache("test", ttl_seconds=60)
+        await cache.get_or_load("ws-1", AsyncMock(return_value="old"))
+
+        await cache.invalidate("ws-1")
+
+        assert await cache.get_or_load("ws-1", AsyncMock(return_value="new")) == "new"
+
+    @pytest.mark.asyncio
+    async def test_racing_stale_write_is_not_served(self, redis):
+        cache = VersionedCache("test", ttl_seconds=60)
+
+        async def stale_loader():
+            # A writer commits and invalidates while this reader is loading
+            await cache.invalidate("ws-1")
+            return "stale"
+
+        assert await cache.get_or_load("ws-1", stale_loader) == "stale"
+        assert (
+            await cache.get_or_load("ws-1", AsyncMock(return_value="fresh")) == "fresh"
+        )
+
+    @pytest.mark.asyncio
+    async def test_disabled_always_loads(self, redis):
+        cache = VersionedCache("test", ttl_seconds=60, enabled=False)
+        loader = AsyncMock(return_value=1)
+
+        await cache.get_or_load("ws-1", loader)
+        await cache.get_or_load("ws-1", loader)
+
+        assert loader.await_count == 2
+        assert redis.data == {}
+
+
+@pytest_asyncio.fixture
+async def sqlite_db():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestInvalidateOnCommit:
+    """Invalidation is deferred to commit and dropped on rollback."""
+
+    @pytest.mark.asyncio
+    async def test_commit_invalidates(self, redis, sqlite_db):
+        cache = VersionedCache("test", ttl_seconds=60)
+
+        cache.invalidate_on_commit(sqlite_db, "ws-1")
+        assert redis.data == {}
+        await sqlite_db.commit()
+        await drain_pending_invalidations()
+
+        assert redis.data == {"test:version:ws-1": "1"}
+
+    @pytest.mark.asyncio
+    async def test_rollback_discards(self, redis, sqlite_db):
+        cache = VersionedCache("test", ttl_seconds=60)
+
+        await sqlite_db.execute(text("SELECT 1"))
+        cache.invalidate_on_commit(sqlite_db, "ws-1")
+        await sqlite_db.rollback()
+        await sqlite_db.commit()
+        await drain_pending_invalidations()
+
+        assert redis.data == {}
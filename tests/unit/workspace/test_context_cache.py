@@ -0,0 +1,159 @@
+"""
+Tests for the RCA workspace context snapshot and its automatic invalidation.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.models import (
+    Base,
+    Deployment,
+    Environment,
+    EnvironmentRepository,
+    Integration,
+    Workspace,
+)
+from app.utils.versioned_cache import drain_pending_invalidations
+from app.worker import get_workspace_context_snapshot
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, "0")) + 1)
+        return int(self.data[key])
+
+
+@pytest.fixture
+def redis():
+    fake = FakeRedis()
+    with patch(
+        "app.utils.versioned_cache.get_redis", AsyncMock(return_value=fake)
+    ), patch("app.utils.versioned_cache.settings.REDIS_URL", "redis://test"):
+        yield fake
+
+
+@pytest_asyncio.fixture
+async def sqlite_db(redis):
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )() as session:
+        session.add(Workspace(id="ws-1", name="Acme"))
+        session.add(Environment(id="env-1", workspace_id="ws-1", name="prod"))
+        await session.commit()
+        await drain_pending_invalidations()
+        redis.data.clear()
+        yield session
+    await engine.dispose()
+
+
+def _snapshot(team_context=None):
+    return {
+        "integrations": [
+            {"id": "i1", "provider": "github", "health_status": "healthy"}
+        ],
+        "service_repo_mapping": {"api": "api"},
+        "environment_context": {"environments": []},
+        "team_context": team_context or {"teams": []},
+    }
+
+
+class TestWorkspaceContextSnapshot:
+    """The snapshot is served from cache until the workspace changes."""
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_all_loaders(self, redis):
+        build = AsyncMock(return_value=_snapshot())
+        with patch("app.worker.build_workspace_context_snapshot", build):
+            first = await get_workspace_context_snapshot("ws-1", AsyncMock())
+            second = await get_workspace_context_snapshot("ws-1", AsyncMock())
+
+        assert first == second == _snapshot()
+        build.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_degraded_team_context_is_not_cached(self, redis):
+        build = AsyncMock(
+            return_value=_snapshot(team_context={"teams": [], "error": "boom"})
+        )
+        with patch("app.worker.build_workspace_context_snapshot", build):
+            await get_workspace_context_snapshot("ws-1", AsyncMock())
+            await get_workspace_context_snapshot("ws-1", AsyncMock())
+
+        assert build.await_count == 2
+
+
+class TestAutomaticInvalidation:
+    """ORM writes to snapshot models bump the workspace's cache versions."""
+
+    @pytest.mark.asyncio
+    async def test_integration_write_invalidates_on_commit(self, redis, sqlite_db):
+        sqlite_db.add(Integration(id="i1", workspace_id="ws-1", provider="github"))
+        await sqlite_db.flush()
+        assert redis.data == {}
+
+        await sqlite_db.commit()
+        await drain_pending_invalidations()
+
+        assert redis.data == {
+            "rca:environment_context:version:ws-1": "1",
+            "rca:workspace_context:version:ws-1": "1",
+            "rca:conversational_response:version:ws-1": "1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_deployment_resolves_workspace_through_environment(
+        self, redis, sqlite_db
+    ):
+        sqlite_db.add(
+            Deployment(
+                id="d1",
+                environment_id="env-1",
+                repo_full_name="acme/api",
+                commit_sha="abc",
+            )
+        )
+        await sqlite_db.commit()
+        await drain_pending_invalidations()
+
+        assert redis.data["rca:workspace_context:version:ws-1"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_repository_config_write_invalidates(self, redis, sqlite_db):
+        sqlite_db.add(
+            EnvironmentRepository(
+                id="r1", environment_id="env-1", repo_full_name="acme/api"
+            )
+        )
+        await sqlite_db.commit()
+        await drain_pending_invalidations()
+
+        assert redis.data["rca:environment_context:version:ws-1"] == "1"
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_write_does_not_invalidate(self, redis, sqlite_db):
+        sqlite_db.add(Integration(id="i1", workspace_id="ws-1", provider="github"))
+        await sqlite_db.flush()
+        await sqlite_db.rollback()
+        await drain_pending_invalidations()
+
+        assert redis.data == {}